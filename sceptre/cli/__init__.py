@@ -13,6 +13,7 @@ import colorama
 
 from sceptre import __version__
 from sceptre.cli.create import create_command
+from sceptre.cli.daemon import daemon_group
 from sceptre.cli.delete import delete_command
 from sceptre.cli.describe import describe_group
 from sceptre.cli.diff import diff_command
@@ -25,6 +26,7 @@ from sceptre.cli.list import list_group
 from sceptre.cli.new import new_group
 from sceptre.cli.policy import set_policy_command
 from sceptre.cli.prune import prune_command
+from sceptre.cli.run import run_command
 from sceptre.cli.status import status_command
 from sceptre.cli.template import (
     validate_command,
@@ -33,6 +35,7 @@ from sceptre.cli.template import (
     fetch_remote_template_command,
 )
 from sceptre.cli.update import update_command
+from sceptre.config import cache
 
 
 @click.group()
@@ -68,6 +71,25 @@ from sceptre.cli.update import update_command
     default=False,
     help="Merge variables from successive --vars and var files",
 )
+@click.option(
+    "--config-cache",
+    is_flag=True,
+    default=False,
+    help="Keep the configs read from config files in the .sceptre directory, "
+    "and reuse them while the files they are rendered from are unchanged.",
+)
+@click.option(
+    "--jinja-cache",
+    is_flag=True,
+    default=False,
+    help="Keep the compiled Jinja templates of config files and templates in the "
+    ".sceptre directory, and reuse them while the templates are unchanged.",
+)
+@click.option(
+    "--config-processes",
+    type=click.IntRange(min=1),
+    help="Read the config files of the stacks in parallel in this many processes.",
+)
 @click.pass_context
 @catch_exceptions
 def cli(
@@ -80,6 +102,9 @@ def cli(
     var_file,
     ignore_dependencies,
     merge_vars,
+    config_cache,
+    jinja_cache,
+    config_processes,
 ):
     """
     Sceptre is a tool to manage your cloud native infrastructure deployments.
@@ -90,6 +115,13 @@ def cli(
         "output_format": output,
         "no_colour": no_colour,
         "ignore_dependencies": ignore_dependencies,
+        # The daemon keeps the config cache in memory between the commands it runs, so
+        # the cache is always used there.
+        "config_cache": config_cache or cache.caches.keep,
+        "jinja_cache": jinja_cache,
+        "config_processes": config_processes,
+        # Var files read from stdin have no path.
+        "var_files": [f.name for f in var_file if f.name != "<stdin>"],
         "project_path": directory if directory else os.getcwd(),
     }
 
@@ -112,3 +144,5 @@ cli.add_command(fetch_remote_template_command)
 cli.add_command(diff_command)
 cli.add_command(drift_group)
 cli.add_command(prune_command)
+cli.add_command(run_command)
+cli.add_command(daemon_group)
@@ -22,6 +22,60 @@ from sceptre.cli.helpers import stack_status_exit_code
     default=None,
     help="Maximum number of stacks to create concurrently (minimum: 1)",
 )
+@click.option(
+    "--max-concurrency-per-account-region",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of stacks to create concurrently for each account and region, "
+    "where the account is the stack's sceptre_role or profile (minimum: 1)",
+)
+@click.option(
+    "--scheduler",
+    type=click.Choice(["batch", "stream"]),
+    default="batch",
+    help="Run stacks in dependency batches, or stream each stack as soon as its own "
+    "dependencies have completed.",
+)
+@click.option(
+    "--continue-on-failure",
+    is_flag=True,
+    help="If a stack fails, only skip the stacks that depend on it and carry on with "
+    "every other stack, then report which stacks succeeded, failed or were skipped.",
+)
+@click.option(
+    "--engine",
+    type=click.Choice(["threads", "asyncio"]),
+    default="threads",
+    help="Run each stack in its own thread, or run stacks as coroutines that do not "
+    "hold a thread while waiting on CloudFormation.",
+)
+@click.option(
+    "--trace-file",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="Export a trace of the creation, with the time each stack spent queued, in hooks, "
+    "resolvers and templates and waiting on CloudFormation, to this Chrome trace-event "
+    "JSON file, and log its critical path and slowest stacks.",
+)
+@click.option(
+    "--adaptive-concurrency",
+    is_flag=True,
+    help="Halve the number of stacks in flight whenever AWS throttles an API call, and "
+    "grow it back one at a time while calls succeed, up to --max-concurrency.",
+)
+@click.option(
+    "--prefetch",
+    is_flag=True,
+    help="While stacks wait for their dependencies, render and upload their templates "
+    "and resolve the values that do not depend on other stacks in the background.",
+)
+@click.option(
+    "--deadline",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Minutes after which no more stacks are started, sceptre stops waiting on the "
+    "stacks in flight and the creation fails (minimum: 1).",
+)
 @click.pass_context
 @catch_exceptions
 def create_command(
@@ -31,6 +85,14 @@ def create_command(
     yes,
     disable_rollback: Optional[bool],
     max_concurrency: Optional[int],
+    max_concurrency_per_account_region: Optional[int],
+    scheduler: str,
+    continue_on_failure: bool,
+    engine: str,
+    trace_file: Optional[str],
+    adaptive_concurrency: bool,
+    prefetch: bool,
+    deadline: Optional[int],
 ):
     """
     Creates a stack for a given config PATH. Or if CHANGE_SET_NAME is specified
@@ -52,7 +114,18 @@ def create_command(
         user_variables=ctx.obj.get("user_variables"),
         options=ctx.obj.get("options"),
         ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
         max_concurrency=max_concurrency,
+        max_concurrency_per_account_region=max_concurrency_per_account_region,
+        scheduler=scheduler,
+        continue_on_failure=continue_on_failure,
+        engine=engine,
+        trace_file=trace_file,
+        adaptive_concurrency=adaptive_concurrency,
+        prefetch=prefetch,
+        deadline=deadline,
     )
 
     action = "create"
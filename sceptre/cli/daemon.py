@@ -0,0 +1,54 @@
+import click
+
+from sceptre import daemon
+from sceptre.cli.helpers import catch_exceptions, write
+
+
+@click.group(name="daemon")
+def daemon_group():
+    """
+    Commands for the Sceptre daemon, which runs Sceptre commands sent to it by
+    sceptre-client, keeping what each command loads warm between commands.
+    """
+    pass
+
+
+@daemon_group.command(name="start")
+@click.pass_context
+@catch_exceptions
+def start_daemon(ctx):
+    """
+    Starts the Sceptre daemon, serving commands until it is stopped. The
+    commands run in the daemon always use the config cache, as if they were
+    given --config-cache, and keep it in memory between commands.
+    \f
+
+    The daemon listens on the socket given by SCEPTRE_DAEMON_SOCKET, or else on a
+    socket in a directory of the user's own in the temporary directory.
+    """
+    daemon.Daemon().serve()
+
+
+@daemon_group.command(name="stop")
+@click.pass_context
+@catch_exceptions
+def stop_daemon(ctx):
+    """
+    Stops the Sceptre daemon, once the command it is running completes.
+    """
+    daemon.stop()
+
+
+@daemon_group.command(name="status")
+@click.pass_context
+@catch_exceptions
+def daemon_status(ctx):
+    """
+    Prints the process id of the Sceptre daemon, or exits with a non-zero exit code if no
+    daemon is running.
+    """
+    pid = daemon.status()
+    write(
+        f"The Sceptre daemon is running at {daemon.socket_path()} with pid {pid}.",
+        ctx.obj.get("output_format"),
+    )
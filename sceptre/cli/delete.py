@@ -13,9 +13,69 @@ from colorama import Fore, Style
 @click.argument("path")
 @click.argument("change-set-name", required=False)
 @click.option("-y", "--yes", is_flag=True, help="Assume yes to all questions.")
+@click.option(
+    "--max-concurrency-per-account-region",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of stacks to delete concurrently for each account and region, "
+    "where the account is the stack's sceptre_role or profile (minimum: 1)",
+)
+@click.option(
+    "--scheduler",
+    type=click.Choice(["batch", "stream"]),
+    default="batch",
+    help="Run stacks in dependency batches, or stream each stack as soon as its own "
+    "dependencies have completed.",
+)
+@click.option(
+    "--continue-on-failure",
+    is_flag=True,
+    help="If a stack fails, only skip the stacks that depend on it and carry on with "
+    "every other stack, then report which stacks succeeded, failed or were skipped.",
+)
+@click.option(
+    "--engine",
+    type=click.Choice(["threads", "asyncio"]),
+    default="threads",
+    help="Run each stack in its own thread, or run stacks as coroutines that do not "
+    "hold a thread while waiting on CloudFormation.",
+)
+@click.option(
+    "--trace-file",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="Export a trace of the deletion, with the time each stack spent queued, in hooks, "
+    "resolvers and templates and waiting on CloudFormation, to this Chrome trace-event "
+    "JSON file, and log its critical path and slowest stacks.",
+)
+@click.option(
+    "--adaptive-concurrency",
+    is_flag=True,
+    help="Halve the number of stacks in flight whenever AWS throttles an API call, and "
+    "grow it back one at a time while calls succeed, up to the number of stacks that can be deleted at once.",
+)
+@click.option(
+    "--deadline",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Minutes after which no more stacks are started, sceptre stops waiting on the "
+    "stacks in flight and the deletion fails (minimum: 1).",
+)
 @click.pass_context
 @catch_exceptions
-def delete_command(ctx, path, change_set_name, yes):
+def delete_command(
+    ctx,
+    path,
+    change_set_name,
+    yes,
+    max_concurrency_per_account_region,
+    scheduler,
+    continue_on_failure,
+    engine,
+    trace_file,
+    adaptive_concurrency,
+    deadline,
+):
     """
     Deletes a stack for a given config PATH. Or if CHANGE_SET_NAME is specified
     deletes a change set for stack in PATH.
@@ -27,6 +87,22 @@ def delete_command(ctx, path, change_set_name, yes):
     :type change_set_name: str
     :param yes: Flag to answer yes to all CLI questions.
     :type yes: bool
+    :param max_concurrency_per_account_region: Maximum number of stacks to delete
+        concurrently for each account and region.
+    :type max_concurrency_per_account_region: int
+    :param scheduler: How stacks are scheduled for deletion.
+    :type scheduler: str
+    :param continue_on_failure: Flag to only skip the stacks depending on a failed stack.
+    :type continue_on_failure: bool
+    :param engine: How stacks are executed.
+    :type engine: str
+    :param trace_file: Path of a file to export a trace of the deletion to.
+    :type trace_file: str
+    :param adaptive_concurrency: Flag to reduce the number of stacks in flight when
+        AWS API calls are throttled.
+    :type adaptive_concurrency: bool
+    :param deadline: Minutes after which the deletion stops and fails.
+    :type deadline: int
     """
     context = SceptreContext(
         command_path=path,
@@ -35,7 +111,17 @@ def delete_command(ctx, path, change_set_name, yes):
         user_variables=ctx.obj.get("user_variables"),
         options=ctx.obj.get("options"),
         ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
         full_scan=True,
+        max_concurrency_per_account_region=max_concurrency_per_account_region,
+        scheduler=scheduler,
+        continue_on_failure=continue_on_failure,
+        engine=engine,
+        trace_file=trace_file,
+        adaptive_concurrency=adaptive_concurrency,
+        deadline=deadline,
     )
 
     plan = SceptrePlan(context)
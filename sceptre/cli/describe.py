@@ -41,6 +41,9 @@ def describe_change_set(ctx, path, change_set_name, verbose):
         output_format=ctx.obj.get("output_format"),
         no_colour=ctx.obj.get("no_colour"),
         ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
     )
 
     plan = SceptrePlan(context)
@@ -74,6 +77,9 @@ def describe_policy(ctx, path):
         output_format=ctx.obj.get("output_format"),
         no_colour=ctx.obj.get("no_colour"),
         ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
     )
 
     plan = SceptrePlan(context)
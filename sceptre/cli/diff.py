@@ -116,11 +116,34 @@ def diff_command(
         user_variables=ctx.obj.get("user_variables"),
         options=ctx.obj.get("options"),
         ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
         output_format=ctx.obj.get("output_format"),
         no_colour=no_colour,
     )
-    output_format = context.output_format
     plan = SceptrePlan(context)
+    diff_plan(plan, differ, show_no_echo, no_placeholders, all_)
+
+
+def diff_plan(
+    plan: SceptrePlan,
+    differ: str,
+    show_no_echo: bool,
+    no_placeholders: bool,
+    all_: bool,
+):
+    """Prints the difference between the deployed Stacks in the plan and their Stack Configs.
+
+    :param plan: The plan of the Stacks to diff.
+    :param differ: The type of differ to use, "deepdiff" or "difflib".
+    :param show_no_echo: If True, the values of NoEcho parameters are shown.
+    :param no_placeholders: If True, no placeholder values are supplied for resolvers that
+        cannot be resolved.
+    :param all_: If True, ignored and obsolete Stacks are diffed too.
+    """
+    no_colour = plan.context.no_colour
+    output_format = plan.context.output_format
     if not all_:
         filter_plan_for_launchable(plan)
 
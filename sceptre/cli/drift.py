@@ -43,6 +43,9 @@ def drift_detect(ctx: Context, path: str):
         options=ctx.obj.get("options"),
         output_format=ctx.obj.get("output_format"),
         ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
     )
 
     plan = SceptrePlan(context)
@@ -91,6 +94,9 @@ def drift_show(ctx, path, drifted):
         options=ctx.obj.get("options"),
         output_format=ctx.obj.get("output_format"),
         ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
     )
 
     plan = SceptrePlan(context)
@@ -42,6 +42,9 @@ def dump_config(ctx, to_file, path):
         output_format=ctx.obj.get("output_format"),
         options=ctx.obj.get("options"),
         ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
     )
     plan = SceptrePlan(context)
     responses = plan.dump_config()
@@ -72,13 +75,19 @@ def dump_config(ctx, to_file, path):
 @click.option(
     "--to-file", is_flag=True, help="If True, also dump the template to a local file."
 )
+@click.option(
+    "--render-processes",
+    type=click.IntRange(min=1),
+    help="Render the templates in parallel in this many processes before running the command.",
+)
 @click.pass_context
 @catch_exceptions
-def dump_template(ctx, to_file, no_placeholders, path):
+def dump_template(ctx, to_file, no_placeholders, render_processes, path):
     """
     Prints the template used for stack in PATH.
     \f
 
+    :param render_processes: The number of processes to render the templates in.
     :param path: Path to execute the command on.
     :type path: str
     """
@@ -90,6 +99,10 @@ def dump_template(ctx, to_file, no_placeholders, path):
         options=ctx.obj.get("options"),
         output_format=ctx.obj.get("output_format"),
         ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
+        render_processes=render_processes,
     )
     plan = SceptrePlan(context)
 
@@ -36,6 +36,9 @@ def execute_command(ctx, path, change_set_name, yes, disable_rollback: Optional[
         user_variables=ctx.obj.get("user_variables"),
         options=ctx.obj.get("options"),
         ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
     )
 
     plan = SceptrePlan(context)
@@ -1,5 +1,6 @@
+import contextlib
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import click
 from click import Context
@@ -9,8 +10,11 @@ from sceptre.cli.helpers import catch_exceptions, confirmation, stack_status_exi
 from sceptre.cli.prune import Pruner
 from sceptre.context import SceptreContext
 from sceptre.exceptions import DependencyDoesNotExistError
+from sceptre.plan.cancellation import use_cancellation
+from sceptre.plan.impact import changed_files_since
 from sceptre.plan.plan import SceptrePlan
 from sceptre.stack import Stack
+from sceptre.tracing import Tracer, use_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -29,12 +33,108 @@ logger = logging.getLogger(__name__)
     default=None,
     help="Disable or enable the cloudformation automatic rollback",
 )
+@click.option(
+    "--skip-unchanged/--no-skip-unchanged",
+    default=None,
+    help="Skip, or do not skip, updating stacks whose template and configuration are "
+    "unchanged since they were last launched with this option.",
+)
 @click.option(
     "--max-concurrency",
     type=click.IntRange(min=1),
     default=None,
     help="Maximum number of stacks to launch concurrently (minimum: 1)",
 )
+@click.option(
+    "--max-concurrency-per-account-region",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of stacks to launch concurrently for each account and region, "
+    "where the account is the stack's sceptre_role or profile (minimum: 1)",
+)
+@click.option(
+    "--scheduler",
+    type=click.Choice(["batch", "stream"]),
+    default="batch",
+    help="Run stacks in dependency batches, or stream each stack as soon as its own "
+    "dependencies have completed.",
+)
+@click.option(
+    "--continue-on-failure",
+    is_flag=True,
+    help="If a stack fails, only skip the stacks that depend on it and carry on with "
+    "every other stack, then report which stacks succeeded, failed or were skipped.",
+)
+@click.option(
+    "--engine",
+    type=click.Choice(["threads", "asyncio"]),
+    default="threads",
+    help="Run each stack in its own thread, or run stacks as coroutines that do not "
+    "hold a thread while waiting on CloudFormation.",
+)
+@click.option(
+    "--journal",
+    is_flag=True,
+    help="Record the status every stack completes with in .sceptre/journal in the "
+    "project, so that the launch can be resumed with --resume or --only-failed.",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Resume the previous journaled launch of PATH, skipping the stacks it completed.",
+)
+@click.option(
+    "--only-failed",
+    is_flag=True,
+    help="Only launch the stacks that failed, or were skipped because a dependency "
+    "failed, in the previous launch of PATH.",
+)
+@click.option(
+    "--trace-file",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="Export a trace of the launch, with the time each stack spent queued, in hooks, "
+    "resolvers and templates and waiting on CloudFormation, to this Chrome trace-event "
+    "JSON file, and log its critical path and slowest stacks.",
+)
+@click.option(
+    "--adaptive-concurrency",
+    is_flag=True,
+    help="Halve the number of stacks in flight whenever AWS throttles an API call, and "
+    "grow it back one at a time while calls succeed, up to --max-concurrency.",
+)
+@click.option(
+    "--prefetch",
+    is_flag=True,
+    help="While stacks wait for their dependencies, render and upload their templates "
+    "and resolve the values that do not depend on other stacks in the background.",
+)
+@click.option(
+    "--deadline",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Minutes after which no more stacks are started, sceptre stops waiting on the "
+    "stacks in flight and the launch fails (minimum: 1).",
+)
+@click.option(
+    "--cancel-in-flight",
+    is_flag=True,
+    help="When --deadline expires, cancel the stack updates still in progress, rather "
+    "than leave them to complete in CloudFormation.",
+)
+@click.option(
+    "--changed-since",
+    default=None,
+    help="Only launch the stacks read or rendered from files changed since this git ref, "
+    "and the stacks that depend on them.",
+)
+@click.option(
+    "--changed-files",
+    multiple=True,
+    type=click.Path(),
+    help="Only launch the stacks read or rendered from this file, and the stacks that "
+    "depend on them. Can be used multiple times.",
+)
 @click.pass_context
 @catch_exceptions
 def launch_command(
@@ -43,7 +143,22 @@ def launch_command(
     yes: bool,
     prune: bool,
     disable_rollback: Optional[bool],
+    skip_unchanged: Optional[bool],
     max_concurrency: Optional[int],
+    max_concurrency_per_account_region: Optional[int],
+    scheduler: str,
+    continue_on_failure: bool,
+    engine: str,
+    journal: bool,
+    resume: bool,
+    only_failed: bool,
+    trace_file: Optional[str],
+    adaptive_concurrency: bool,
+    prefetch: bool,
+    deadline: Optional[int],
+    cancel_in_flight: bool,
+    changed_since: Optional[str],
+    changed_files: Tuple[str, ...],
 ):
     """
     Launch a Stack or StackGroup for a given config PATH. This command is intended as a catch-all
@@ -56,15 +171,46 @@ def launch_command(
     * If any stacks are marked with "obsolete: True", those stacks will neither be created nor updated.
     * Furthermore, if the "-p"/"--prune" flag is used, these stacks will be deleted prior to any
       other launch commands
+    * If the "--journal" flag is used, the status every stack completes with is recorded, and
+      if the "--resume" flag is used, stacks that completed in the previous journaled launch of
+      the path will be skipped, and if the "--only-failed" flag is used, only the stacks that failed or
+      were skipped because of a failure in the previous launch will be launched
+    * If the "--changed-since" or "--changed-files" options are used, only the stacks read or
+      rendered from the changed files, and the stacks that depend on them, will be launched
     """
+    project_path = ctx.obj.get("project_path")
+    if changed_since is not None:
+        changed_files = (
+            *changed_files,
+            *changed_files_since(project_path, changed_since),
+        )
     context = SceptreContext(
         command_path=path,
         command_params=ctx.params,
-        project_path=ctx.obj.get("project_path"),
+        project_path=project_path,
         user_variables=ctx.obj.get("user_variables"),
         options=ctx.obj.get("options"),
         ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
         max_concurrency=max_concurrency,
+        max_concurrency_per_account_region=max_concurrency_per_account_region,
+        scheduler=scheduler,
+        continue_on_failure=continue_on_failure,
+        engine=engine,
+        journal=journal,
+        resume=resume,
+        only_failed=only_failed,
+        trace_file=trace_file,
+        adaptive_concurrency=adaptive_concurrency,
+        prefetch=prefetch,
+        deadline=deadline,
+        cancel_in_flight=cancel_in_flight,
+        var_files=ctx.obj.get("var_files"),
+        changed_files=(
+            list(changed_files) if changed_since is not None or changed_files else None
+        ),
     )
     launcher = Launcher(context)
     launcher.print_operations(prune)
@@ -90,6 +236,8 @@ class Launcher:
         self._make_pruner = pruner_factory
 
         self._plan = None
+        self._finished_stacks = []
+        self._unaffected_stacks = []
 
     def confirm(self, prune: bool):
         self._confirm_launch(prune)
@@ -98,6 +246,8 @@ class Launcher:
         deploy_plan = self._create_deploy_plan()
         stacks_to_skip = self._get_stacks_to_skip(deploy_plan, prune)
         self._print_skips(stacks_to_skip)
+        self._print_finished(self._finished_stacks)
+        self._print_unaffected(self._unaffected_stacks)
         if prune:
             pruner = self._make_pruner(self._context, self._make_plan)
             pruner.print_operations()
@@ -110,11 +260,21 @@ class Launcher:
         self._exclude_stacks_from_plan(deploy_plan, *stacks_to_skip, *stacks_to_prune)
         self._validate_launch_for_missing_dependencies(deploy_plan, prune)
 
-        code = 0
-        if prune:
-            code = self._prune()
-
-        code = code or self._deploy(deploy_plan)
+        # The deletions of a pruning launch are traced as part of the launch, and count
+        # towards its deadline.
+        tracer = Tracer("launch") if self._context.trace_file else None
+        tracing = use_tracer(tracer) if tracer else contextlib.nullcontext()
+        cancellation = use_cancellation(deploy_plan.cancellation_token())
+        try:
+            with tracing, cancellation:
+                code = 0
+                if prune:
+                    code = self._prune()
+
+                code = code or self._deploy(deploy_plan)
+        finally:
+            if tracer is not None:
+                deploy_plan.export_trace(tracer, deploy_plan.graph)
         return code
 
     def _create_deploy_plan(self) -> SceptrePlan:
@@ -122,6 +282,14 @@ class Launcher:
             plan = self._make_plan(self._context)
             # The plan must be resolved so we can modify launch order and items before executing it
             plan.resolve(plan.launch.__name__)
+            if self._context.resume or self._context.only_failed:
+                self._finished_stacks = plan.filter_by_journal(
+                    self._context.only_failed
+                )
+            if self._context.changed_files is not None:
+                self._unaffected_stacks = plan.filter_by_changes(
+                    self._context.changed_files
+                )
             self._plan = plan
         return self._plan
 
@@ -178,6 +346,22 @@ class Launcher:
         skip_message = "During launch, the following stacks will be skipped, neither created nor updated:"
         self._print_stacks_with_message(stacks_to_skip, skip_message)
 
+    def _print_finished(self, finished_stacks: List[Stack]):
+        if self._context.only_failed:
+            message = "The following stacks did not fail in the previous launch and will be skipped:"
+        else:
+            message = "The following stacks completed in the previous launch and will be skipped:"
+        self._print_stacks_with_message(finished_stacks, message)
+
+    def _print_unaffected(self, unaffected_stacks: List[Stack]):
+        if not unaffected_stacks:
+            return
+        # Listing every unaffected stack of a large project would bury the stacks launched.
+        click.echo(
+            f"* The changed files do not affect {len(unaffected_stacks)} of the stacks, "
+            "which will be skipped.\n"
+        )
+
     def _print_stacks_with_message(self, stacks: List[Stack], message: str):
         if not len(stacks):
             return
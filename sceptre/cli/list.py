@@ -38,6 +38,9 @@ def list_resources(ctx, path):
         options=ctx.obj.get("options"),
         output_format=ctx.obj.get("output_format"),
         ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
     )
     plan = SceptrePlan(context)
 
@@ -130,6 +133,9 @@ def list_outputs(ctx, path, export):
         options=ctx.obj.get("options", {}),
         output_format=ctx.obj.get("output_format"),
         ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
     )
 
     plan = SceptrePlan(context)
@@ -161,6 +167,9 @@ def list_change_sets(ctx, path, url):
         output_format=ctx.obj.get("output_format"),
         options=ctx.obj.get("options"),
         ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
     )
 
     plan = SceptrePlan(context)
@@ -192,6 +201,9 @@ def list_stacks(ctx, path):
         output_format=ctx.obj.get("output_format"),
         options=ctx.obj.get("options"),
         ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
     )
 
     plan = SceptrePlan(context)
@@ -77,6 +77,11 @@ def new_project(ctx, project_name):
         "region": os.environ.get("AWS_DEFAULT_REGION", ""),
     }
 
+    # Sceptre keeps the state of previous runs, such as journals and caches, in .sceptre,
+    # which belongs to the checkout rather than the project.
+    with open(os.path.join(project_folder, ".gitignore"), "w") as gitignore_file:
+        gitignore_file.write(".sceptre/\n")
+
     config_path = os.path.join(cwd, project_name, "config")
     _create_config_file(config_path, config_path, defaults)
 
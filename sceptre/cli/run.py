@@ -0,0 +1,113 @@
+from typing import List
+
+import click
+from click import Context
+
+from sceptre.cli.diff import diff_plan
+from sceptre.cli.helpers import catch_exceptions
+from sceptre.cli.launch import Launcher
+from sceptre.cli.template import validate_plan
+from sceptre.context import SceptreContext
+from sceptre.plan.plan import SceptrePlan
+
+RUN_COMMANDS = ("validate", "diff", "launch")
+
+
+def parse_commands(ctx: Context, param: click.Parameter, value: str) -> List[str]:
+    """
+    Parses the comma-separated list of commands to run.
+
+    :param value: The comma-separated list of commands.
+    :returns: The commands, in the order they are to run.
+    """
+    commands = [command.strip() for command in value.split(",") if command.strip()]
+    unknown = [command for command in commands if command not in RUN_COMMANDS]
+    if not commands or unknown:
+        raise click.BadParameter(
+            "'{}' must be a comma-separated list of: {}".format(
+                value, ", ".join(RUN_COMMANDS)
+            )
+        )
+    return commands
+
+
+@click.command(
+    name="run", short_help="Runs several commands on a path, reading its configs once."
+)
+@click.argument("commands", callback=parse_commands)
+@click.argument("path")
+@click.option("-y", "--yes", is_flag=True, help="Assume yes to all questions.")
+@click.option(
+    "-n",
+    "--no-placeholders",
+    is_flag=True,
+    help="If set, validate and diff supply no placeholder values for resolvers that "
+    "cannot be resolved.",
+)
+@click.option(
+    "-t",
+    "--type",
+    "differ",
+    type=click.Choice(["deepdiff", "difflib"]),
+    default="deepdiff",
+    help="The type of differ diff uses.",
+)
+@click.pass_context
+@catch_exceptions
+def run_command(
+    ctx: Context,
+    commands: List[str],
+    path: str,
+    yes: bool,
+    no_placeholders: bool,
+    differ: str,
+):
+    """
+    Runs COMMANDS, a comma-separated list of validate, diff and launch, one after the other
+    on the Stacks in PATH, such as "sceptre run validate,diff,launch dev". The config files
+    are read once and the StackGraph is built once for all of the commands, and rendered
+    templates, AWS sessions and clients are shared between them. If a command fails, the
+    commands after it are not run.
+
+    Before and after launch, the Stacks are constructed again from the configs already read,
+    so that resolvers, such as !stack_output, are resolved again rather than reusing values,
+    or placeholders, resolved by the commands before them.
+    \f
+
+    :param commands: The commands to run, in order.
+    :param path: Path to execute the commands on.
+    :param yes: A flag to assume yes to all questions.
+    :param no_placeholders: A flag to supply no placeholders in validate and diff.
+    :param differ: The type of differ diff uses.
+    """
+    context = SceptreContext(
+        command_path=path,
+        command_params=ctx.params,
+        project_path=ctx.obj.get("project_path"),
+        user_variables=ctx.obj.get("user_variables"),
+        options=ctx.obj.get("options"),
+        output_format=ctx.obj.get("output_format"),
+        no_colour=ctx.obj.get("no_colour"),
+        ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
+    )
+    plan = SceptrePlan(context)
+
+    for index, command in enumerate(commands):
+        if index and "launch" in (command, commands[index - 1]):
+            plan.refresh()
+
+        if command == "validate":
+            validate_plan(plan, no_placeholders)
+        elif command == "diff":
+            diff_plan(plan, differ, False, no_placeholders, False)
+        elif command == "launch":
+            launcher = Launcher(context, plan_factory=lambda _: plan)
+            launcher.print_operations(False)
+            if not yes:
+                launcher.confirm(False)
+            exit_code = launcher.launch(False)
+            if exit_code:
+                exit(exit_code)
@@ -27,6 +27,9 @@ def status_command(ctx, path):
         no_colour=ctx.obj.get("no_colour"),
         output_format=ctx.obj.get("output_format"),
         ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
     )
 
     plan = SceptrePlan(context)
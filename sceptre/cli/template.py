@@ -19,14 +19,20 @@ logger = logging.getLogger(__name__)
     is_flag=True,
     help="If True, no placeholder values will be supplied for resolvers that cannot be resolved.",
 )
+@click.option(
+    "--render-processes",
+    type=click.IntRange(min=1),
+    help="Render the templates in parallel in this many processes before running the command.",
+)
 @click.argument("path")
 @click.pass_context
 @catch_exceptions
-def validate_command(ctx, no_placeholders, path):
+def validate_command(ctx, no_placeholders, render_processes, path):
     """
     Validates the template used for stack in PATH.
     \f
 
+    :param render_processes: The number of processes to render the templates in.
     :param path: Path to execute the command on.
     :type path: str
     """
@@ -38,10 +44,24 @@ def validate_command(ctx, no_placeholders, path):
         options=ctx.obj.get("options"),
         output_format=ctx.obj.get("output_format"),
         ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
+        render_processes=render_processes,
     )
 
     plan = SceptrePlan(context)
+    validate_plan(plan, no_placeholders)
+
+
+def validate_plan(plan: SceptrePlan, no_placeholders: bool):
+    """
+    Validates the templates of the Stacks in the plan and prints the results.
 
+    :param plan: The plan of the Stacks to validate.
+    :param no_placeholders: If True, no placeholder values are supplied for resolvers that
+        cannot be resolved.
+    """
     execution_context = (
         null_context() if no_placeholders else use_resolver_placeholders_on_error()
     )
@@ -52,7 +72,7 @@ def validate_command(ctx, no_placeholders, path):
         if response["ResponseMetadata"]["HTTPStatusCode"] == 200:
             del response["ResponseMetadata"]
             click.echo("Template {} is valid. Template details:\n".format(stack.name))
-        write(response, context.output_format)
+        write(response, plan.context.output_format)
 
 
 @click.command(name="generate", short_help="Prints the template.")
@@ -62,10 +82,17 @@ def validate_command(ctx, no_placeholders, path):
     is_flag=True,
     help="If True, no placeholder values will be supplied for resolvers that cannot be resolved.",
 )
+@click.option(
+    "--render-processes",
+    type=click.IntRange(min=1),
+    help="Render the templates in parallel in this many processes before running the command.",
+)
 @click.argument("path")
 @click.pass_context
 @catch_exceptions
-def generate_command(ctx: click.Context, no_placeholders: bool, path: str):
+def generate_command(
+    ctx: click.Context, no_placeholders: bool, render_processes: int, path: str
+):
     """
     Prints the template used for stack in PATH.
 
@@ -75,6 +102,7 @@ def generate_command(ctx: click.Context, no_placeholders: bool, path: str):
     \f
     :param no_placeholders: If True, will disable placeholders for unresolvable resolvers. By
         default, placeholders will be active.
+    :param render_processes: The number of processes to render the templates in.
     :param path: Path to execute the command on.
     """
     ctx.forward(dump_template)
@@ -102,6 +130,9 @@ def estimate_cost_command(ctx, path):
         options=ctx.obj.get("options"),
         output_format=ctx.obj.get("output_format"),
         ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
     )
 
     plan = SceptrePlan(context)
@@ -136,6 +167,9 @@ def fetch_remote_template_command(ctx, path):
         options=ctx.obj.get("options"),
         output_format=ctx.obj.get("output_format"),
         ignore_dependencies=ctx.obj.get("ignore_dependencies"),
+        config_cache=ctx.obj.get("config_cache"),
+        jinja_cache=ctx.obj.get("jinja_cache"),
+        config_processes=ctx.obj.get("config_processes"),
     )
 
     plan = SceptrePlan(context)
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+
+"""
+sceptre.config.cache
+
+This module implements a ConfigCache, which keeps the configs read from a
+project's config files between runs, so they are only rendered again once the
+files they were rendered from change.
+"""
+
+import functools
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from sceptre.resolvers import CustomYamlTagBase
+
+# The key that marks an encoded resolver or hook in the cache file.
+TAG_KEY = "!tag"
+
+
+class UncacheableValueError(Exception):
+    """
+    Error raised when a config holds a value that cannot be written to the cache.
+    """
+
+
+class ConfigCache(object):
+    """
+    ConfigCache keeps configs read from config files in a JSON file, keyed by the path of
+    the config file relative to the config directory. Each entry holds the fingerprint of
+    everything the config was rendered from, and is only returned while the fingerprint
+    is unchanged, so an entry is replaced as soon as any of its inputs change.
+
+    The resolvers and hooks in a config are stored as the name of their YAML tag and their
+    argument, and are constructed again when the entry is read.
+
+    :param path: The path to the JSON file holding the cache.
+    :param node_classes: The resolver and hook classes, keyed by the name of their YAML tag.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, node_classes: Mapping[str, type]):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.node_classes = node_classes
+
+        self._lock = threading.Lock()
+        self._entries: Dict[str, dict] = self._load()
+        self._updated = False
+
+    def get(
+        self, rel_path: str, fingerprint: str
+    ) -> Optional[Tuple[dict, Dict[str, int]]]:
+        """
+        Returns the config read from a config file, if the cache holds it for the given
+        fingerprint.
+
+        :param rel_path: The path of the config file, relative to the config directory.
+        :param fingerprint: The fingerprint of everything the config is rendered from.
+        :returns: The config and the max_concurrency of the StackGroups recorded while
+            reading it, or None if the cache does not hold the config.
+        """
+        if not self.holds(rel_path, fingerprint):
+            return None
+        entry = self._entries[rel_path]
+        try:
+            config = self._decode(entry["config"])
+        except (KeyError, TypeError, ValueError) as err:
+            self.logger.debug("Ignoring unreadable cache entry %s: %s", rel_path, err)
+            return None
+        return config, dict(entry.get("max_concurrency", {}))
+
+    @functools.cached_property
+    def _node_tags(self) -> Dict[type, str]:
+        # Only built once a config is stored, as it imports the class of every tag.
+        return {node_class: tag for tag, node_class in self.node_classes.items()}
+
+    def holds(self, rel_path: str, fingerprint: str) -> bool:
+        """
+        Returns whether the cache holds the config read from a config file for the given
+        fingerprint.
+
+        :param rel_path: The path of the config file, relative to the config directory.
+        :param fingerprint: The fingerprint of everything the config is rendered from.
+        :returns: True if the cache holds the config.
+        """
+        entry = self._entries.get(rel_path)
+        return entry is not None and entry.get("fingerprint") == fingerprint
+
+    def put(
+        self,
+        rel_path: str,
+        fingerprint: str,
+        config: dict,
+        max_concurrency: Dict[str, int],
+    ):
+        """
+        Stores the config read from a config file. A config holding values that cannot be
+        written to the cache is not stored. This method is thread-safe.
+
+        :param rel_path: The path of the config file, relative to the config directory.
+        :param fingerprint: The fingerprint of everything the config was rendered from.
+        :param config: The config read from the config file.
+        :param max_concurrency: The max_concurrency of the StackGroups recorded while
+            reading the config.
+        """
+        try:
+            encoded = self._encode(config)
+        except UncacheableValueError as err:
+            self.logger.debug("Not caching the config of %s: %s", rel_path, err)
+            return
+        with self._lock:
+            self._entries[rel_path] = {
+                "fingerprint": fingerprint,
+                "config": encoded,
+                "max_concurrency": max_concurrency,
+            }
+            self._updated = True
+
+    def save(self):
+        """
+        Writes the cache back to its JSON file, creating the directory if needed.
+        Nothing is written if no entries were stored or dropped.
+        """
+        if not self._updated:
+            return
+
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            content = json.dumps({"version": self.VERSION, "entries": self._entries})
+            self._updated = False
+
+        # Write to a temporary file first so a crash cannot leave a truncated cache behind.
+        with tempfile.NamedTemporaryFile(
+            mode="w", dir=directory, delete=False, suffix=".tmp"
+        ) as temp_file:
+            temp_file.write(content)
+        os.replace(temp_file.name, self.path)
+
+    def prune(self, config_path: str, config_file: str):
+        """
+        Drops the entries of Stack config files that no longer exist, and of StackGroups
+        whose directory no longer exists. A StackGroup need not have a config file of its
+        own, as its config is inherited from the StackGroups above it.
+
+        :param config_path: The absolute path to the config directory.
+        :param config_file: The name of the config file of a StackGroup.
+        """
+        with self._lock:
+            for rel_path in list(self._entries):
+                abs_path = os.path.join(config_path, rel_path)
+                if os.path.basename(rel_path) == config_file:
+                    exists = os.path.isdir(os.path.dirname(abs_path))
+                else:
+                    exists = os.path.isfile(abs_path)
+                if not exists:
+                    del self._entries[rel_path]
+                    self._updated = True
+
+    def _encode(self, value: Any) -> Any:
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, list):
+            return [self._encode(item) for item in value]
+        if isinstance(value, dict):
+            encoded = {}
+            for key, item in value.items():
+                if not isinstance(key, str) or key == TAG_KEY:
+                    raise UncacheableValueError(f"unsupported key {key!r}")
+                encoded[key] = self._encode(item)
+            return encoded
+        if isinstance(value, CustomYamlTagBase) and type(value) in self._node_tags:
+            return {
+                TAG_KEY: self._node_tags[type(value)],
+                "argument": self._encode(value.argument),
+            }
+        raise UncacheableValueError(f"unsupported value {value!r}")
+
+    def _decode(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self._decode(item) for item in value]
+        if isinstance(value, dict):
+            if TAG_KEY in value:
+                node_class = self.node_classes[value[TAG_KEY]]
+                return node_class(self._decode(value["argument"]))
+            return {key: self._decode(item) for key, item in value.items()}
+        return value
+
+    def _load(self) -> Dict[str, dict]:
+        if not os.path.isfile(self.path):
+            return {}
+        try:
+            with open(self.path) as f:
+                cache = json.load(f)
+        except (OSError, ValueError) as err:
+            self.logger.debug("Ignoring unreadable config cache %s: %s", self.path, err)
+            return {}
+        if not isinstance(cache, dict) or cache.get("version") != self.VERSION:
+            return {}
+        entries = cache.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+
+class ConfigCachePool(object):
+    """
+    ConfigCachePool opens the ConfigCache of each project. By default a ConfigCache is read
+    from its file each time it is opened. When ``keep`` is set, as it is in a long-lived
+    process such as the Sceptre daemon, each ConfigCache is kept in memory once read, and is
+    returned each time it is opened again.
+    """
+
+    def __init__(self):
+        self.keep = False
+        self._lock = threading.Lock()
+        self._caches: Dict[str, ConfigCache] = {}
+
+    def open(self, path: str, node_classes: Mapping[str, type]) -> ConfigCache:
+        """
+        Returns the ConfigCache held in a file. This method is thread-safe.
+
+        :param path: The path to the JSON file holding the cache.
+        :param node_classes: The resolver and hook classes, keyed by the name of their YAML tag.
+        :returns: The ConfigCache.
+        """
+        if not self.keep:
+            return ConfigCache(path, node_classes)
+        with self._lock:
+            if path not in self._caches:
+                self._caches[path] = ConfigCache(path, node_classes)
+            return self._caches[path]
+
+    def clear(self):
+        """
+        Drops every ConfigCache kept in memory.
+        """
+        with self._lock:
+            self._caches.clear()
+
+
+# The ConfigCaches of the process.
+caches = ConfigCachePool()
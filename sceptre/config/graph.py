@@ -8,18 +8,26 @@ acyclic graph of a Stack's dependencies.
 """
 
 import logging
-from typing import List
+from array import array
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
 
-import networkx as nx
 from sceptre.exceptions import CircularDependenciesError
 from sceptre.stack import Stack
 
+# An adjacency in compressed sparse row form: the Stacks adjacent to the Stack with id i are
+# the ids in targets[offsets[i]:offsets[i + 1]].
+Adjacency = Tuple[array, array]
+
 
 class StackGraph(object):
     """
     A Directed Acyclic Graph representing the relationship between a Stack
     and its dependencies. Responsible for initalising the graph based on a set
     of Stacks.
+
+    Each Stack is given an integer id, and the edges are held in two compact arrays of ids,
+    one for the successors and one for the predecessors of every Stack. An edge points from
+    a Stack to the Stacks that depend on it.
     """
 
     def __init__(self, stacks):
@@ -30,35 +38,144 @@ class StackGraph(object):
         :type stacks: set
         """
         self.logger = logging.getLogger(__name__)
-        self.graph = nx.DiGraph()
+        self._stacks: List[Stack] = []
+        self._ids: Dict[Stack, int] = {}
+        # Whether each id is still in the graph. remove_stack() clears the flag rather than
+        # compacting the arrays.
+        self._present = bytearray()
+        self._successors: Adjacency = _compress(0, [], [])
+        self._predecessors: Adjacency = _compress(0, [], [])
         self._generate_graph(stacks)
 
     def __repr__(self):
-        return str(nx.convert.to_dict_of_lists(self.graph))
+        return str({stack: list(self.successors(stack)) for stack in self})
 
-    def __iter__(self):
-        return self.graph.__iter__()
+    def __iter__(self) -> Iterator[Stack]:
+        return (
+            stack for index, stack in enumerate(self._stacks) if self._present[index]
+        )
+
+    def __contains__(self, stack):
+        index = self._ids.get(stack)
+        return index is not None and bool(self._present[index])
 
     def filtered(self, source_stacks, reverse=False):
-        graph = (nx.reverse if reverse else nx.DiGraph)(self.graph)
+        """
+        Returns a new StackGraph holding the given Stacks and every Stack they depend on, or,
+        if reverse is True, every Stack that depends on them, with the edges reversed.
 
-        relevant = set(source_stacks)
+        The relevant Stacks are found in a single walk from all of the given Stacks, so the
+        cost is linear in the size of the graph however many Stacks are given.
+        """
+        neighbours = self._successors if reverse else self._predecessors
+
+        relevant = bytearray(len(self._stacks))
+        to_visit = []
         for stack in source_stacks:
-            relevant |= nx.algorithms.dag.ancestors(graph, stack)
-        graph.remove_nodes_from({stack for stack in graph if stack not in relevant})
+            index = self._id(stack)
+            if not relevant[index]:
+                relevant[index] = 1
+                to_visit.append(index)
+        while to_visit:
+            for neighbour in self._adjacent(neighbours, to_visit.pop()):
+                if not relevant[neighbour]:
+                    relevant[neighbour] = 1
+                    to_visit.append(neighbour)
 
-        filtered = StackGraph(set())
-        filtered.graph = graph
+        new_ids = {}
+        for index, is_relevant in enumerate(relevant):
+            if is_relevant:
+                new_ids[index] = len(new_ids)
 
+        sources, targets = array("l"), array("l")
+        for index, new_id in new_ids.items():
+            for successor in self._adjacent(self._successors, index):
+                if relevant[successor]:
+                    sources.append(new_id)
+                    targets.append(new_ids[successor])
+
+        filtered = StackGraph(set())
+        stacks = [self._stacks[index] for index in new_ids]
+        if reverse:
+            filtered._build(stacks, targets, sources)
+        else:
+            filtered._build(stacks, sources, targets)
         return filtered
 
+    def reversed(self) -> "StackGraph":
+        """
+        Returns a view of the StackGraph with every edge reversed. The view shares the
+        arrays of the StackGraph, so it is created in constant time, and removing a Stack
+        from either of them removes it from both.
+        """
+        view = StackGraph(set())
+        view._stacks = self._stacks
+        view._ids = self._ids
+        view._present = self._present
+        view._successors = self._predecessors
+        view._predecessors = self._successors
+        return view
+
+    def generations(self) -> List[Set[Stack]]:
+        """
+        Returns the Stacks in the StackGraph as a list of sets, where each set holds the
+        Stacks whose predecessors are all in the earlier sets. The sets are generated with
+        Kahn's algorithm, keeping a counter of the remaining predecessors of every Stack,
+        so the cost is linear in the size of the graph.
+
+        :raises: sceptre.exceptions.CircularDependenciesError if a cycle prevents some
+            Stacks from being placed in a set.
+        """
+        ids = self._present_ids()
+        remaining = {index: self._degree(self._predecessors, index) for index in ids}
+        generation = [index for index, degree in remaining.items() if degree == 0]
+
+        generations = []
+        while generation:
+            generations.append({self._stacks[index] for index in generation})
+            next_generation = []
+            for index in generation:
+                for successor in self._adjacent(self._successors, index):
+                    remaining[successor] -= 1
+                    if remaining[successor] == 0:
+                        next_generation.append(successor)
+            generation = next_generation
+
+        placed = sum(len(generation) for generation in generations)
+        if placed != len(remaining):
+            raise CircularDependenciesError(
+                "Dependency cycle detected between: "
+                + ", ".join(
+                    sorted(
+                        str(self._stacks[index])
+                        for index, count in remaining.items()
+                        if count
+                    )
+                )
+            )
+        return generations
+
     def count_dependencies(self, stack):
         """
         Returns the number of incoming edges a given Stack has in the
         StackGraph. The number of incoming edge also represents the number
         of Stacks that depend on the given Stack.
         """
-        return self.graph.in_degree(stack)
+        return self._degree(self._predecessors, self._id(stack))
+
+    def predecessors(self, stack) -> Iterator[Stack]:
+        """
+        Returns the Stacks with an edge pointing to the given Stack. In a StackGraph that has
+        not been reversed, these are the Stacks the given Stack depends on.
+        """
+        return self._neighbours(self._predecessors, stack)
+
+    def successors(self, stack) -> Iterator[Stack]:
+        """
+        Returns the Stacks the given Stack has an edge pointing to. In a StackGraph that has not
+        been reversed, these are the Stacks that depend on the given Stack.
+        """
+        return self._neighbours(self._successors, stack)
 
     def remove_stack(self, stack):
         """
@@ -66,42 +183,197 @@ class StackGraph(object):
         all adjecent edges that represent a 'depends on' relationship with
         other Stacks.
         """
-        return self.graph.remove_node(stack)
+        self._present[self._id(stack)] = 0
+
+    def _id(self, stack: Stack) -> int:
+        index = self._ids.get(stack)
+        if index is None or not self._present[index]:
+            raise KeyError(f"{stack} is not in the StackGraph")
+        return index
+
+    def _present_ids(self) -> List[int]:
+        return [index for index, present in enumerate(self._present) if present]
+
+    def _adjacent(self, adjacency: Adjacency, index: int) -> Iterator[int]:
+        offsets, targets = adjacency
+        present = self._present
+        return (
+            target
+            for target in targets[offsets[index] : offsets[index + 1]]
+            if present[target]
+        )
+
+    def _degree(self, adjacency: Adjacency, index: int) -> int:
+        return sum(1 for _ in self._adjacent(adjacency, index))
+
+    def _neighbours(self, adjacency: Adjacency, stack: Stack) -> Iterator[Stack]:
+        stacks = self._stacks
+        return (stacks[index] for index in self._adjacent(adjacency, self._id(stack)))
+
+    def _build(
+        self, stacks: List[Stack], sources: Iterable[int], targets: Iterable[int]
+    ):
+        """
+        Replaces the contents of the StackGraph.
+
+        :param stacks: The Stacks, indexed by their ids.
+        :param sources: The id of the Stack every edge points from.
+        :param targets: The id of the Stack every edge points to, in the same order.
+        """
+        self._stacks = stacks
+        self._ids = {stack: index for index, stack in enumerate(stacks)}
+        self._present = bytearray(b"\x01") * len(stacks)
+        self._successors = _compress(len(stacks), sources, targets)
+        self._predecessors = _compress(len(stacks), targets, sources)
 
     def _generate_graph(self, stacks):
         """
-        Generates the graph for the StackGraph object.
+        Generates the graph for the StackGraph object, and checks it for dependency
+        cycles once every edge has been added.
 
         :param stacks: A set of Stacks
         :type stacks: set
         """
+        ids: Dict[Stack, int] = {}
+        sources, targets = array("l"), array("l")
+
+        def id_of(stack: Stack) -> int:
+            if stack not in ids:
+                ids[stack] = len(ids)
+            return ids[stack]
 
         for stack in stacks:
-            self._generate_edges(stack, stack.dependencies)
-        self.graph.remove_edges_from(nx.selfloop_edges(self.graph))
-
-    def _generate_edges(self, stack: Stack, dependencies: List[Stack]):
-        """
-        Adds edges to the graph based on a list of dependencies that are
-        generated from the initial stack config. Each of the paths
-        in the inital_dependency_paths list are a depency that the inital
-        Stack config depends on.
-
-        :param stack: A Sceptre Stack
-        :param dependencies: a collection of dependency paths
-        """
-        self.logger.debug(f"Generate dependencies for stack {stack}")
-        for dependency in set(dependencies):
-            self.graph.add_edge(dependency, stack)
-            try:
-                cycle = nx.find_cycle(self.graph, orientation="original")
-                cycle_str = ", ".join([f"{edge[0]} -> {edge[1]}" for edge in cycle])
-                raise CircularDependenciesError(
-                    f"Dependency cycle detected: {cycle_str}"
-                )
-            except nx.NetworkXNoCycle:
-                pass  # No cycle, continue
-            self.logger.debug(f"  Added dependency: {dependency}")
+            self.logger.debug(f"Generate dependencies for stack {stack}")
+            index = id_of(stack)
+            for dependency in set(stack.dependencies):
+                sources.append(id_of(dependency))
+                targets.append(index)
+                self.logger.debug(f"  Added dependency: {dependency}")
+
+        self._build(list(ids), sources, targets)
+        self._check_for_cycles()
+
+    def _check_for_cycles(self):
+        """
+        Raises a CircularDependenciesError reporting every dependency cycle in the graph.
+
+        The cycles are found as the strongly connected components of the graph, in a single
+        pass that is linear in the size of the graph. A cycle through each component is
+        reported, along with the other Stacks of the component.
+
+        :raises: sceptre.exceptions.CircularDependenciesError
+        """
+        cycles = []
+        for component in self._strongly_connected_components():
+            start = min(component, key=lambda index: str(self._stacks[index]))
+            if len(component) == 1 and start not in self._adjacent(
+                self._successors, start
+            ):
+                continue
+            cycle = self._find_cycle(start, component)
+            description = " -> ".join(str(self._stacks[index]) for index in cycle)
+            others = sorted(
+                str(self._stacks[index]) for index in component.difference(cycle)
+            )
+            if others:
+                description += f" (also involving {', '.join(others)})"
+            cycles.append(description)
+
+        if cycles:
+            raise CircularDependenciesError(
+                "Dependency cycles detected:\n  " + "\n  ".join(sorted(cycles))
+            )
+
+    def _strongly_connected_components(self) -> Iterator[Set[int]]:
+        """
+        Yields the strongly connected components of the graph, as sets of ids, with an
+        iterative version of Tarjan's algorithm.
+        """
+        node_count = len(self._stacks)
+        order = array("l", [-1]) * node_count
+        lowlink = array("l", [0]) * node_count
+        on_stack = bytearray(node_count)
+        component_stack = []
+        counter = 0
+
+        for root in self._present_ids():
+            if order[root] != -1:
+                continue
+            order[root] = lowlink[root] = counter
+            counter += 1
+            component_stack.append(root)
+            on_stack[root] = 1
+            to_visit = [(root, self._adjacent(self._successors, root))]
+            while to_visit:
+                index, successors = to_visit[-1]
+                for successor in successors:
+                    if order[successor] == -1:
+                        order[successor] = lowlink[successor] = counter
+                        counter += 1
+                        component_stack.append(successor)
+                        on_stack[successor] = 1
+                        to_visit.append(
+                            (successor, self._adjacent(self._successors, successor))
+                        )
+                        break
+                    if on_stack[successor]:
+                        lowlink[index] = min(lowlink[index], order[successor])
+                else:
+                    to_visit.pop()
+                    if to_visit:
+                        parent = to_visit[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[index])
+                    if lowlink[index] == order[index]:
+                        component = set()
+                        while True:
+                            member = component_stack.pop()
+                            on_stack[member] = 0
+                            component.add(member)
+                            if member == index:
+                                break
+                        yield component
+
+    def _find_cycle(self, start: int, component: Set[int]) -> List[int]:
+        """
+        Returns a cycle through the given strongly connected component, as a list of ids
+        that starts and ends with the same id. Every Stack of the component has a
+        successor in the component, so following them must come back to a visited Stack.
+        """
+        path = [start]
+        position = {start: 0}
+        while True:
+            successor = min(
+                (
+                    index
+                    for index in self._adjacent(self._successors, path[-1])
+                    if index in component
+                ),
+                key=lambda index: str(self._stacks[index]),
+            )
+            if successor in position:
+                return path[position[successor] :] + [successor]
+            position[successor] = len(path)
+            path.append(successor)
+
+
+def _compress(node_count: int, sources: Iterable[int], targets: Iterable[int]):
+    """
+    Returns the adjacency of the given edges in compressed sparse row form, built with a
+    counting sort of the edges by their source.
+
+    :param node_count: The number of ids.
+    :param sources: The id every edge points from.
+    :param targets: The id every edge points to, in the same order.
+    """
+    offsets = array("l", [0]) * (node_count + 1)
+    for source in sources:
+        offsets[source + 1] += 1
+    for index in range(node_count):
+        offsets[index + 1] += offsets[index]
 
-        if not dependencies:
-            self.graph.add_node(stack)
+    position = offsets[:-1]
+    adjacent = array("l", [0]) * offsets[-1]
+    for source, target in zip(sources, targets):
+        adjacent[position[source]] = target
+        position[source] += 1
+    return offsets, adjacent
@@ -11,22 +11,28 @@ import collections
 import copy
 import datetime
 import fnmatch
+import functools
+import hashlib
 import logging
-import sys
+import multiprocessing
+import pickle
+import re
 import yaml
 import json
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from os import environ, path, walk
-from typing import Set, Tuple
+from typing import Dict, Iterable, List, Set, Tuple
 from pathlib import Path
-from jinja2 import Environment
-from jinja2 import StrictUndefined
-from jinja2 import FileSystemLoader
-from jinja2 import select_autoescape
+from jinja2 import meta
 from packaging.specifiers import SpecifierSet
 from packaging.version import Version
 
 from sceptre import __version__
+from sceptre import jinja
+from sceptre import plugins
 from sceptre.exceptions import SceptreException
 from sceptre.exceptions import DependencyDoesNotExistError
 from sceptre.exceptions import InvalidConfigFileError
@@ -34,11 +40,23 @@ from sceptre.exceptions import InvalidSceptreDirectoryError
 from sceptre.exceptions import VersionIncompatibleError
 from sceptre.exceptions import ConfigFileNotFoundError
 from sceptre.helpers import sceptreise_path, logging_level, write_debug_file
+from sceptre.resolvers import CustomYamlTagBase
 from sceptre.stack import Stack
 from sceptre.config import strategies
+from sceptre.config import cache
 
 ConfigAttributes = collections.namedtuple("Attributes", "required optional")
 
+# Marks a template variable that is not set, when memoising rendered configs.
+_MISSING = object()
+
+# Matches the names a config file's Jinja template can reference that are not read from
+# config files, and the statements that load other templates.
+JINJA_REFERENCES = re.compile(
+    rb"\b(command_path|environment_variable)\b"
+    rb"|{%[-+]?\s*(include|import|from|extends)\b"
+)
+
 
 CONFIG_MERGE_STRATEGY_OVERRIDES = {
     "dependencies": strategies.LIST_STRATEGIES,
@@ -55,6 +73,7 @@ CONFIG_MERGE_STRATEGIES = {
     "hooks": strategies.child_wins,
     "hooks_inheritance": strategies.child_or_parent,
     "iam_role": strategies.child_wins,
+    "max_concurrency": strategies.child_wins,
     "sceptre_role": strategies.child_wins,
     "iam_role_session_duration": strategies.child_wins,
     "sceptre_role_session_duration": strategies.child_wins,
@@ -82,8 +101,24 @@ CONFIG_MERGE_STRATEGIES = {
     "template_path": strategies.child_wins,
     "ignore": strategies.child_wins,
     "obsolete": strategies.child_wins,
+    "skip_unchanged": strategies.child_wins,
 }
 
+# The merge strategy of each config key, along with the key of the config item that can
+# override the strategy, if there is one.
+CONFIG_MERGE_PLAN = [
+    (
+        config_key,
+        default_strategy,
+        (
+            f"{config_key}_inheritance"
+            if f"{config_key}_inheritance" in CONFIG_MERGE_STRATEGIES
+            else None
+        ),
+    )
+    for config_key, default_strategy in CONFIG_MERGE_STRATEGIES.items()
+]
+
 
 STACK_GROUP_CONFIG_ATTRIBUTES = ConfigAttributes(
     {"project_code", "region"},
@@ -92,6 +127,7 @@ STACK_GROUP_CONFIG_ATTRIBUTES = ConfigAttributes(
         "template_key_prefix",
         "required_version",
         "j2_environment",
+        "max_concurrency",
     },
 )
 
@@ -122,6 +158,7 @@ STACK_CONFIG_ATTRIBUTES = ConfigAttributes(
         "stack_tags",
         "stack_tags_inheritance",
         "stack_timeout",
+        "skip_unchanged",
     },
 )
 
@@ -150,32 +187,47 @@ class ConfigReader(object):
         self._check_valid_project_path(self.full_config_path)
 
         # Add Resolver and Hook classes to PyYAML loader
-        self._add_yaml_constructors(["sceptre.hooks", "sceptre.resolvers"])
+        if self.context.config_cache:
+            plugins.registry.cache_path = path.join(
+                self.context.full_state_path(), "cache", "plugins.json"
+            )
+        self._add_yaml_constructors([plugins.HOOKS, plugins.RESOLVERS])
         if not self.context.user_variables:
             self.context.user_variables = {}
 
         self.templating_vars = {"var": self.context.user_variables}
 
-    @staticmethod
-    def _iterate_entry_points(group):
-        """
-        Helper to determine whether to use pkg_resources or importlib.metadata.
-        https://docs.python.org/3/library/importlib.metadata.html
-        """
-        if sys.version_info < (3, 10):
-            from pkg_resources import iter_entry_points
-
-            return iter_entry_points(group)
-        else:
-            from importlib.metadata import entry_points
+        # The max_concurrency of each StackGroup that sets one, keyed by the path of the
+        # StackGroup relative to the config directory.
+        self._stack_group_max_concurrency = {}
 
-            return entry_points(group=group)
+        self.config_cache = None
+        if self.context.config_cache:
+            self.config_cache = cache.caches.open(
+                path.join(self.context.full_state_path(), "cache", "config.json"),
+                self._node_classes,
+            )
+        jinja.environments.bytecode_cache_path = (
+            path.join(self.context.full_state_path(), "cache", "jinja")
+            if self.context.jinja_cache
+            else None
+        )
+        # The configs rendered from config files so far, and the template variables each
+        # config file references, memoised for the rest of the run.
+        self._rendered_configs = {}
+        self._template_variables = {}
+        # The content hash of each config file read so far, and the names its Jinja
+        # template references, keyed by its path relative to the config directory.
+        self._file_fingerprints = {}
+        # The user-specified items of each StackGroup config, built once for its Stacks.
+        self._parsed_stack_group_configs = {}
 
     def _add_yaml_constructors(self, entry_point_groups):
         """
         Adds PyYAML constructor functions for all classes found registered at
         the given entry point groups. Classes are registered whereby the node
-        tag is the entry point name.
+        tag is the entry point name. A class is only imported once its tag is
+        first used.
 
         :param entry_point_groups: Names of entry point groups.
         :type entry_point_groups: list
@@ -186,40 +238,29 @@ class ConfigReader(object):
             )
         )
 
-        def constructor_factory(node_class):
+        def constructor_factory(name):
             """
-            Returns constructor that will initialise objects from a
-            given node class.
+            Returns constructor that will initialise objects from the
+            node class of a tag.
 
-            :param node_class: Class representing the node.
-            :type node_class: class
+            :param name: The name of the tag.
+            :type name: str
             :returns: Class initialiser.
             :rtype: func
             """
 
             # This function signature is required by PyYAML
             def class_constructor(loader, node):
-                return node_class(
+                return self._node_classes[name](
                     loader.construct_object(self.resolve_node_tag(loader, node))
                 )  # pragma: no cover
 
             return class_constructor
 
-        for group in entry_point_groups:
-            for entry_point in self._iterate_entry_points(group):
-                # Retrieve name and class from entry point
-                node_tag = "!" + entry_point.name
-                node_class = entry_point.load()
-
-                # Add constructor to PyYAML loader
-                yaml.SafeLoader.add_constructor(
-                    node_tag, constructor_factory(node_class)
-                )
-                self.logger.debug(
-                    "Added constructor for %s with node tag %s",
-                    str(node_class),
-                    node_tag,
-                )
+        self._node_classes = plugins.registry.classes(*entry_point_groups)
+        for name in self._node_classes:
+            # Add constructor to PyYAML loader
+            yaml.SafeLoader.add_constructor("!" + name, constructor_factory(name))
 
     def resolve_node_tag(self, loader, node):
         node = copy.copy(node)
@@ -255,48 +296,152 @@ class ConfigReader(object):
                     todo.add(path.join(directory_name, filename))
 
         stack_group_configs = {}
-        full_todo = todo.copy()
-        deps_todo = set()
+        seen = set(todo)
+        full_command_path = self.context.full_command_path()
+
+        with self._config_pool(len(todo)) as pool:
+            # The config files are read in waves: first those under the command path,
+            # then the dependencies found in each wave. The files of a wave are read in
+            # order, so the Stacks and any error raised do not depend on timing.
+            wave = sorted(todo)
+            while wave:
+                rel_paths = [
+                    path.relpath(abs_path, start=self.context.full_config_path())
+                    for abs_path in wave
+                ]
+                wave_stacks = self._construct_wave(rel_paths, stack_group_configs, pool)
+                next_wave = set()
+                for abs_path, rel_path, stack in zip(wave, rel_paths, wave_stacks):
+                    for full_dep in self._dependency_paths(stack):
+                        if full_dep not in seen:
+                            seen.add(full_dep)
+                            next_wave.add(full_dep)
+
+                    stack_map[sceptreise_path(rel_path)] = stack
+
+                    if abs_path == full_command_path or abs_path.startswith(
+                        full_command_path.rstrip(path.sep) + path.sep
+                    ):
+                        command_stacks.add(stack)
+                wave = sorted(next_wave)
 
-        while todo:
-            abs_path = todo.pop()
-            rel_path = path.relpath(abs_path, start=self.context.full_config_path())
-            directory, filename = path.split(rel_path)
+        stacks = self.resolve_stacks(stack_map)
 
-            if directory in stack_group_configs:
-                stack_group_config = stack_group_configs[directory]
-            else:
-                stack_group_config = stack_group_configs[directory] = self._read(
+        self._save_config_cache()
+
+        return stacks, command_stacks
+
+    def _construct_wave(self, rel_paths, stack_group_configs, pool):
+        """
+        Constructs the Stacks of config files. When there is a pool of worker processes,
+        the configs that are not held in the config cache are read in the workers, while
+        the configs of the StackGroups are read here.
+
+        :param rel_paths: The paths of the config files, relative to the config directory.
+        :type rel_paths: list
+        :param stack_group_configs: The configs of the StackGroups read so far, keyed by
+            the path of the StackGroup relative to the config directory.
+        :type stack_group_configs: dict
+        :param pool: The pool of worker processes, or None.
+        :type pool: concurrent.futures.ProcessPoolExecutor
+        :returns: The Stacks, in the order of the paths.
+        :rtype: list
+        """
+        futures = {}
+        if pool is not None:
+            try:
+                for rel_path in rel_paths:
+                    if not self._holds_cached_config(rel_path):
+                        futures[rel_path] = pool.submit(_read_stack_config, rel_path)
+            except BrokenProcessPool as err:
+                self.logger.debug("Reading config files in this process: %s", err)
+
+        stacks = []
+        for rel_path in rel_paths:
+            directory = path.dirname(rel_path)
+            if directory not in stack_group_configs:
+                stack_group_configs[directory] = self._read_cached(
                     path.join(directory, self.context.config_file)
                 )
+            read = self._read
+            if rel_path in futures:
+                read = functools.partial(self._read_in_worker, futures[rel_path])
+            stacks.append(
+                self._construct_stack(rel_path, stack_group_configs[directory], read)
+            )
+        return stacks
 
-            stack = self._construct_stack(rel_path, stack_group_config)
-            for dep in stack.dependencies:
-                full_dep = str(Path(self.context.full_config_path(), dep))
-                if not path.exists(full_dep):
-                    raise DependencyDoesNotExistError(
-                        "{stackname}: Dependency {dep} not found. "
-                        "Please make sure that your dependencies stack_outputs "
-                        "have their full path from `config` defined.".format(
-                            stackname=stack.name, dep=dep
-                        )
+    def _read_in_worker(self, future, rel_path, base_config=None):
+        """
+        Returns the config a worker process read from a config file. If the worker could
+        not read the config, it is read here instead, so any error is raised just as it
+        would be without the workers.
+        """
+        try:
+            return pickle.loads(future.result())
+        except Exception as err:
+            self.logger.debug(
+                "Reading '%s' again after its worker failed: %s", rel_path, err
+            )
+            return self._read(rel_path, base_config)
+
+    def _dependency_paths(self, stack):
+        """
+        Returns the absolute paths of the config files of the dependencies of a Stack.
+
+        :raises: sceptre.exceptions.DependencyDoesNotExistError
+        """
+        dependency_paths = []
+        for dep in stack.dependencies:
+            full_dep = str(Path(self.context.full_config_path(), dep))
+            if not path.exists(full_dep):
+                raise DependencyDoesNotExistError(
+                    "{stackname}: Dependency {dep} not found. "
+                    "Please make sure that your dependencies stack_outputs "
+                    "have their full path from `config` defined.".format(
+                        stackname=stack.name, dep=dep
                     )
+                )
+            dependency_paths.append(full_dep)
+        return dependency_paths
 
-                if full_dep not in full_todo and full_dep not in deps_todo:
-                    todo.add(full_dep)
-                    deps_todo.add(full_dep)
+    @contextmanager
+    def _config_pool(self, file_count):
+        """
+        Yields a pool of worker processes to read config files in, or None if the config
+        files are to be read in this process.
 
-            stack_map[sceptreise_path(rel_path)] = stack
+        :param file_count: The number of config files under the command path.
+        :type file_count: int
+        """
+        processes = self.context.config_processes
+        if not processes or processes < 2 or file_count < 2:
+            yield None
+            return
 
-            full_command_path = self.context.full_command_path()
-            if abs_path == full_command_path or abs_path.startswith(
-                full_command_path.rstrip(path.sep) + path.sep
-            ):
-                command_stacks.add(stack)
+        # The workers do not use the config cache, which is read and written here.
+        worker_context = copy.copy(self.context)
+        worker_context.config_cache = False
+        pool = ProcessPoolExecutor(
+            processes,
+            mp_context=_mp_context(),
+            initializer=_start_worker,
+            initargs=(worker_context,),
+        )
+        try:
+            yield pool
+        finally:
+            # Once an error is raised, the configs still queued are not needed.
+            pool.shutdown(cancel_futures=True)
 
-        stacks = self.resolve_stacks(stack_map)
+    def stack_group_concurrency_limits(self) -> Dict[str, int]:
+        """
+        Returns the max_concurrency set in the config files of the StackGroups read so far,
+        keyed by the path of the StackGroup relative to the config directory.
 
-        return stacks, command_stacks
+        :returns: The StackGroup concurrency limits.
+        """
+        return dict(self._stack_group_max_concurrency)
 
     def resolve_stacks(self, stack_map) -> Set[Stack]:
         """
@@ -383,6 +528,148 @@ class ConfigReader(object):
         self.logger.debug("Config: %s", config)
         return config
 
+    def _read_cached(self, rel_path, base_config=None, read=None):
+        """
+        Reads in configuration in the same way as ``_read()``, but returns the config
+        held in the config cache instead, if the files it is rendered from are unchanged.
+
+        :param rel_path: Relative path to config to read.
+        :type rel_path: str
+        :param base_config: The config read from the config file of the StackGroup.
+        :type base_config: dict
+        :param read: The function that reads the config if the cache does not hold it,
+            which defaults to ``_read()``.
+        :type read: func
+        :returns: Config read from config files.
+        :rtype: dict
+        """
+        read = read or self._read
+        if self.config_cache is None:
+            return read(rel_path, base_config)
+
+        fingerprint = self._config_fingerprint(rel_path)
+        if fingerprint is None:
+            return read(rel_path, base_config)
+
+        cached = self.config_cache.get(rel_path, fingerprint)
+        if cached is not None:
+            self.logger.debug("Using cached config of '%s'", rel_path)
+            config, max_concurrency = cached
+            self._stack_group_max_concurrency.update(max_concurrency)
+            return config
+
+        config = read(rel_path, base_config)
+        directory, filename = path.split(rel_path)
+        max_concurrency = {}
+        if filename == self.context.config_file:
+            max_concurrency = {
+                directory_path: self._stack_group_max_concurrency[directory_path]
+                for directory_path in _ancestor_directories(directory)
+                if directory_path in self._stack_group_max_concurrency
+            }
+        self.config_cache.put(rel_path, fingerprint, config, max_concurrency)
+        return config
+
+    def _holds_cached_config(self, rel_path):
+        """
+        Returns whether the config cache holds the config read from a config file.
+        """
+        if self.config_cache is None:
+            return False
+        fingerprint = self._config_fingerprint(rel_path)
+        return fingerprint is not None and self.config_cache.holds(
+            rel_path, fingerprint
+        )
+
+    def config_file_paths(self, rel_path: str) -> List[str]:
+        """
+        Returns the paths of the files the config read from a config file is rendered
+        from, whether they exist or not: the files with its name and the StackGroup config
+        files in its directory and each of the directories above it.
+
+        :param rel_path: The path of the config file, relative to the config directory.
+        :returns: The paths, relative to the config directory.
+        """
+        directory, filename = path.split(rel_path)
+        return [
+            path.join(directory_path, name)
+            for directory_path in _ancestor_directories(directory)
+            for name in sorted({filename, self.context.config_file})
+        ]
+
+    def _save_config_cache(self):
+        """
+        Writes the config cache back to its file, without the entries of the config files
+        that no longer exist.
+        """
+        if self.config_cache is None:
+            return
+        self.config_cache.prune(self.full_config_path, self.context.config_file)
+        self.config_cache.save()
+
+    def _config_fingerprint(self, rel_path):
+        """
+        Returns a fingerprint of everything the config read from a config file is
+        rendered from: the files with its name and the StackGroup config files in its
+        directory and each of the directories above it, the user variables and the
+        version of Sceptre. The command path and the environment variables are only
+        part of the fingerprint if one of the files references them.
+
+        A config file that includes or imports other templates is rendered from files
+        the fingerprint does not cover, so its config is not cached.
+
+        :param rel_path: Relative path to config to read.
+        :type rel_path: str
+        :returns: The fingerprint, or None if the config should not be cached.
+        :rtype: str
+        """
+        files = []
+        references = set()
+        for file_path in self.config_file_paths(rel_path):
+            digest, file_references = self._file_fingerprint(file_path)
+            if "include" in file_references:
+                return None
+            references.update(file_references)
+            files.append([file_path, digest])
+
+        inputs = {
+            "version": __version__,
+            "project_path": self.context.project_path,
+            "var": self.context.user_variables,
+            "files": files,
+        }
+        if "command_path" in references:
+            inputs["command_path"] = self.context.command_path
+        if "environment_variable" in references:
+            inputs["environment_variable"] = dict(environ)
+        content = json.dumps(inputs, sort_keys=True, default=str)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _file_fingerprint(self, rel_path):
+        """
+        Returns the content hash of a config file, or None if it does not exist, and the
+        names its Jinja template references that are not read from config files.
+
+        :param rel_path: Relative path to the config file.
+        :type rel_path: str
+        :returns: The content hash and the referenced names.
+        :rtype: tuple
+        """
+        if rel_path not in self._file_fingerprints:
+            abs_path = path.join(self.full_config_path, rel_path)
+            if path.isfile(abs_path):
+                with open(abs_path, "rb") as config_file:
+                    content = config_file.read()
+                references = frozenset(
+                    name.decode() if name else "include"
+                    for name, _ in JINJA_REFERENCES.findall(content)
+                )
+                fingerprint = (hashlib.sha256(content).hexdigest(), references)
+            else:
+                fingerprint = (None, frozenset())
+            self._file_fingerprints[rel_path] = fingerprint
+        return self._file_fingerprints[rel_path]
+
     def _recursive_read(
         self, directory_path: str, filename: str, stack_group_config: dict
     ) -> dict:
@@ -409,15 +696,39 @@ class ConfigReader(object):
             )
 
         # Combine the stack_group_config with the nested config dict
-        config_group = stack_group_config.copy()
-        config_group.update(config)
+        config_group = collections.ChainMap(config, stack_group_config)
 
         # Read config file and overwrite inherited properties
         child_config = self._render(directory_path, filename, config_group) or {}
+        if filename == self.context.config_file and "max_concurrency" in child_config:
+            self._record_max_concurrency(
+                directory_path, child_config["max_concurrency"]
+            )
         child_config.update(self._get_merge_with_stratgies(config, child_config))
         config.update(child_config)
         return config
 
+    def _record_max_concurrency(self, directory_path: str, max_concurrency):
+        """
+        Records the max_concurrency set in the config file of a StackGroup.
+
+        :param directory_path: Relative directory path of the StackGroup.
+        :param max_concurrency: The value of max_concurrency in its config file.
+        :raises: sceptre.exceptions.InvalidConfigFileError
+        """
+        if (
+            isinstance(max_concurrency, bool)
+            or not isinstance(max_concurrency, int)
+            or max_concurrency < 1
+        ):
+            raise InvalidConfigFileError(
+                "max_concurrency in '{0}' must be a positive integer, not '{1}'.".format(
+                    path.join(directory_path, self.context.config_file),
+                    max_concurrency,
+                )
+            )
+        self._stack_group_max_concurrency[directory_path] = max_concurrency
+
     def _get_merge_with_stratgies(self, left: dict, right: dict) -> dict:
         """
         Returns a new dict with only the merge values of the two inputs, using the
@@ -426,10 +737,13 @@ class ConfigReader(object):
         merge = {}
 
         # Then apply the merge strategies to each item
-        for config_key, default_strategy in CONFIG_MERGE_STRATEGIES.items():
+        for config_key, default_strategy, override_key in CONFIG_MERGE_PLAN:
+            left_value, right_value = left.get(config_key), right.get(config_key)
+            if left_value is None and right_value is None and override_key is None:
+                # Every strategy merges two missing values into a missing value.
+                continue
             strategy = default_strategy
-            override_key = f"{config_key}_inheritance"
-            if override_key in CONFIG_MERGE_STRATEGIES:
+            if override_key is not None:
                 name = CONFIG_MERGE_STRATEGIES[override_key](
                     left.get(override_key), right.get(override_key)
                 )
@@ -442,7 +756,7 @@ class ConfigReader(object):
                 else:
                     strategy = CONFIG_MERGE_STRATEGY_OVERRIDES[config_key][name]
 
-            value = strategy(left.get(config_key), right.get(config_key))
+            value = strategy(left_value, right_value)
             if value:
                 merge[config_key] = value
 
@@ -462,33 +776,11 @@ class ConfigReader(object):
         :returns: rendered template of config file.
         :rtype: dict
         """
-        config = {}
         abs_directory_path = path.join(self.full_config_path, directory_path)
 
         if not path.isfile(path.join(abs_directory_path, basename)):
             return
 
-        default_j2_environment_config = {
-            "autoescape": select_autoescape(
-                disabled_extensions=("yaml",),
-                default=True,
-            ),
-            "loader": FileSystemLoader(abs_directory_path),
-            "undefined": StrictUndefined,
-        }
-        j2_environment_config = strategies.dict_merge(
-            default_j2_environment_config,
-            stack_group_config.get("j2_environment", {}),
-        )
-        j2_environment = Environment(**j2_environment_config)
-
-        try:
-            template = j2_environment.get_template(basename)
-        except Exception as err:
-            raise SceptreException(
-                f"{Path(directory_path, basename).as_posix()} - {err}"
-            ) from err
-
         # Reset the template cache to avoid leakage between StackGroups (#937)
         template_vars = {"var": self.templating_vars["var"]}
         if "stack_group_config" in self.templating_vars:
@@ -499,6 +791,45 @@ class ConfigReader(object):
 
         self.templating_vars.update(stack_group_config)
 
+        j2_environment_config = stack_group_config.get("j2_environment", {})
+        render_key = None
+        if basename == self.context.config_file:
+            # The config file of a StackGroup is read for every StackGroup below it.
+            render_key = self._render_key(
+                abs_directory_path, basename, j2_environment_config
+            )
+            if render_key in self._rendered_configs:
+                return _copy_config(self._rendered_configs[render_key])
+
+        config = self._render_template(directory_path, basename, j2_environment_config)
+        if render_key is not None:
+            self._rendered_configs[render_key] = config
+        return _copy_config(config)
+
+    def _render_template(self, directory_path, basename, j2_environment_config):
+        """
+        Renders a config file with the current templating vars and loads the config from
+        the rendered template.
+
+        :param directory_path: Relative directory path to config to read.
+        :type directory_path: str
+        :param basename: The filename of the config file
+        :type basename: str
+        :param j2_environment_config: The j2_environment of the StackGroup config.
+        :type j2_environment_config: dict
+        :returns: config loaded from the rendered template.
+        :rtype: dict
+        """
+        abs_directory_path = path.join(self.full_config_path, directory_path)
+        j2_environment = self._j2_environment(abs_directory_path, j2_environment_config)
+
+        try:
+            template = j2_environment.get_template(basename)
+        except Exception as err:
+            raise SceptreException(
+                f"{Path(directory_path, basename).as_posix()} - {err}"
+            ) from err
+
         try:
             rendered_template = template.render(
                 self.templating_vars,
@@ -531,6 +862,81 @@ class ConfigReader(object):
 
         return config
 
+    @staticmethod
+    def _j2_environment(abs_directory_path, j2_environment_config):
+        """
+        Returns the Jinja environment config files in a directory are rendered with.
+
+        :param abs_directory_path: Absolute directory path of the config files.
+        :type abs_directory_path: str
+        :param j2_environment_config: The j2_environment of the StackGroup config.
+        :type j2_environment_config: dict
+        :returns: The Jinja environment.
+        :rtype: jinja2.Environment
+        """
+        return jinja.environments.get(
+            abs_directory_path, j2_environment_config, unescaped_extensions=("yaml",)
+        )
+
+    def _render_key(self, abs_directory_path, basename, j2_environment_config):
+        """
+        Returns the key the config rendered from a config file is memoised with for the
+        rest of the run. A config file is rendered again whenever the values of the
+        template variables it references change, but not when any other part of the
+        StackGroup config it is rendered with does, so the config files of a StackGroup
+        are only rendered once for all of the StackGroups below it.
+
+        :param abs_directory_path: Absolute directory path of the config file.
+        :type abs_directory_path: str
+        :param basename: The filename of the config file.
+        :type basename: str
+        :param j2_environment_config: The j2_environment of the StackGroup config.
+        :type j2_environment_config: dict
+        :returns: The key, or None if the rendered config should not be memoised.
+        :rtype: tuple
+        """
+        try:
+            template_key = (
+                abs_directory_path,
+                basename,
+                _freeze(j2_environment_config),
+            )
+            if template_key not in self._template_variables:
+                self._template_variables[template_key] = self._find_template_variables(
+                    abs_directory_path, basename, j2_environment_config
+                )
+            variables = self._template_variables[template_key]
+            if variables is None:
+                return None
+            values = tuple(
+                _freeze(self.templating_vars.get(name, _MISSING)) for name in variables
+            )
+        except TypeError:
+            return None
+        return template_key + (values,)
+
+    def _find_template_variables(
+        self, abs_directory_path, basename, j2_environment_config
+    ):
+        """
+        Returns the names of the template variables a config file references, other than
+        those that are the same for the whole run, or None if the config file includes or
+        imports other templates or cannot be parsed.
+        """
+        j2_environment = self._j2_environment(abs_directory_path, j2_environment_config)
+        try:
+            source = j2_environment.loader.get_source(j2_environment, basename)[0]
+            parsed = j2_environment.parse(source)
+        except Exception:
+            # The error is raised again when the config file is rendered.
+            return None
+        if any(True for _ in meta.find_referenced_templates(parsed)):
+            return None
+        return sorted(
+            meta.find_undeclared_variables(parsed)
+            - {"command_path", "environment_variable"}
+        )
+
     @staticmethod
     def _check_valid_project_path(config_path):
         """
@@ -598,7 +1004,7 @@ class ConfigReader(object):
             }
         return s3_details
 
-    def _construct_stack(self, rel_path, stack_group_config=None):
+    def _construct_stack(self, rel_path, stack_group_config=None, read=None):
         """
         Constructs an individual Stack object from a config path and a
         base config.
@@ -607,6 +1013,8 @@ class ConfigReader(object):
         :type rel_path: str
         :param stack_group_config: The Stack group config to use as defaults.
         :type stack_group_config: dict
+        :param read: The function that reads the config, which defaults to ``_read()``.
+        :type read: func
         :returns: Stack object
         :rtype: sceptre.stack.Stack
         """
@@ -617,7 +1025,7 @@ class ConfigReader(object):
 
         self.templating_vars["stack_group_config"] = stack_group_config
         parsed_stack_group_config = self._parsed_stack_group_config(stack_group_config)
-        config = self._read(rel_path, stack_group_config)
+        config = self._read_cached(rel_path, stack_group_config, read)
         stack_name = path.splitext(rel_path)[0]
 
         # Check for missing mandatory attributes
@@ -629,14 +1037,70 @@ class ConfigReader(object):
                     )
                 )
 
+        stack = self._stack_from_config(stack_name, config, parsed_stack_group_config)
+
+        del self.templating_vars["stack_group_config"]
+        return stack
+
+    def reconstruct_stacks(self, stacks: Iterable[Stack]) -> Set[Stack]:
+        """
+        Constructs a new Stack from the config of each of the Stacks, without reading the
+        config files again. The new Stacks hold none of the values the resolvers of the given
+        Stacks resolved to, nor their rendered templates, and depend on each other as the
+        given Stacks do.
+
+        :param stacks: The Stacks to construct again, including all of their dependencies.
+        :returns: A set of Stacks.
+        """
+        stack_map = {}
+        for stack in stacks:
+            # The dependencies in a config are replaced with Stacks once they are resolved.
+            config = dict(stack.config)
+            config["dependencies"] = list(config.get("dependencies") or [])
+            stack_map[stack.name] = self._stack_from_config(
+                stack.name, config, stack.stack_group_config
+            )
+
+        for stack in stack_map.values():
+            if self.context.ignore_dependencies:
+                stack.dependencies = []
+                continue
+            stack.dependencies = list(
+                {
+                    stack_map[
+                        (
+                            dependency.name
+                            if isinstance(dependency, Stack)
+                            else path.splitext(sceptreise_path(dependency))[0]
+                        )
+                    ]
+                    for dependency in stack.dependencies
+                }
+            )
+        return set(stack_map.values())
+
+    def _stack_from_config(
+        self, stack_name: str, config: dict, stack_group_config: dict
+    ) -> Stack:
+        """
+        Constructs a Stack from its config.
+
+        :param stack_name: The name of the Stack.
+        :param config: The config of the Stack, as read from its config file.
+        :param stack_group_config: The user-specified items of the StackGroup config.
+        :returns: Stack object
+        """
         s3_details = self._collect_s3_details(stack_name, config)
-        # If disable/enable rollback was specified on the command line, use that. Otherwise,
-        # fall back to the stack config.
+        # If disable/enable rollback or skip unchanged was specified on the command line, use
+        # that. Otherwise, fall back to the stack config.
         disable_rollback = self.context.command_params.get("disable_rollback")
         if disable_rollback is None:
             disable_rollback = config.get("disable_rollback", False)
+        skip_unchanged = self.context.command_params.get("skip_unchanged")
+        if skip_unchanged is None:
+            skip_unchanged = config.get("skip_unchanged", False)
 
-        stack = Stack(
+        return Stack(
             name=stack_name,
             project_code=config["project_code"],
             template_path=config.get("template_path"),
@@ -666,22 +1130,112 @@ class ConfigReader(object):
             stack_timeout=config.get("stack_timeout", 0),
             ignore=config.get("ignore", False),
             obsolete=config.get("obsolete", False),
-            stack_group_config=parsed_stack_group_config,
+            skip_unchanged=skip_unchanged,
+            # The values are shared by the Stacks of the StackGroup, but each Stack has its own
+            # dict, so that setting an item for one Stack does not set it for the others.
+            stack_group_config=dict(stack_group_config),
             config=config,
         )
 
-        del self.templating_vars["stack_group_config"]
-        return stack
-
     def _parsed_stack_group_config(self, stack_group_config):
         """
         Remove all config items that are supported by Sceptre and
         remove the `project_path` and `stack_group_path` added by `read()`.
-        Return a dictionary that has only user-specified config items.
+        Return a dictionary that has only user-specified config items, which is
+        built once for every Stack of the StackGroup.
         """
-        parsed_config = {
-            key: stack_group_config[key]
-            for key in set(stack_group_config) - set(CONFIG_MERGE_STRATEGIES)
-        }
-        parsed_config.pop("stack_group_path")
-        return parsed_config
+        config_id = id(stack_group_config)
+        if config_id not in self._parsed_stack_group_configs:
+            parsed_config = {
+                key: stack_group_config[key]
+                for key in set(stack_group_config) - set(CONFIG_MERGE_STRATEGIES)
+            }
+            parsed_config.pop("stack_group_path")
+            # The StackGroup config is kept so its id is not reused by another config.
+            self._parsed_stack_group_configs[config_id] = (
+                stack_group_config,
+                parsed_config,
+            )
+        return self._parsed_stack_group_configs[config_id][1]
+
+
+def _freeze(value):
+    """
+    Returns a hashable representation of a value read from a config file, in which values
+    of different types never compare equal.
+
+    :raises: TypeError if the value holds an object that cannot be hashed.
+    """
+    if isinstance(value, dict):
+        return dict, tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return list, tuple(_freeze(item) for item in value)
+    if isinstance(value, CustomYamlTagBase):
+        return type(value), _freeze(value.argument)
+    hash(value)
+    return type(value), value
+
+
+def _copy_config(config):
+    """
+    Returns a copy of a rendered config that can be updated without changing the config
+    it was copied from. The values in the config are not copied, as they are not updated
+    in place once read.
+    """
+    return dict(config) if isinstance(config, dict) else config
+
+
+def _ancestor_directories(directory_path):
+    """
+    Returns a directory path relative to the config directory, followed by the paths of
+    each of the directories above it, ending with the config directory itself.
+    """
+    directories = [directory_path]
+    while directory_path:
+        directory_path = path.split(directory_path)[0]
+        directories.append(directory_path)
+    return directories
+
+
+# The ConfigReader of a worker process, and the StackGroup configs it has read.
+_worker_reader = None
+_worker_stack_group_configs = {}
+
+
+def _mp_context():
+    try:
+        context = multiprocessing.get_context("forkserver")
+    except ValueError:
+        return multiprocessing.get_context("spawn")
+    context.set_forkserver_preload(["jinja2", "yaml", "sceptre.config.reader"])
+    return context
+
+
+def _start_worker(context):
+    """
+    Creates the ConfigReader of a worker process.
+    """
+    global _worker_reader
+    _worker_reader = ConfigReader(context)
+    _worker_stack_group_configs.clear()
+
+
+def _read_stack_config(rel_path):
+    """
+    Reads the config of a Stack in a worker process.
+
+    :returns: The pickled config.
+    :rtype: bytes
+    """
+    reader = _worker_reader
+    directory = path.dirname(rel_path)
+    if directory not in _worker_stack_group_configs:
+        _worker_stack_group_configs[directory] = reader._read(
+            path.join(directory, reader.context.config_file)
+        )
+    stack_group_config = _worker_stack_group_configs[directory]
+
+    reader.templating_vars["stack_group_config"] = stack_group_config
+    config = reader._read(rel_path, stack_group_config)
+    del reader.templating_vars["stack_group_config"]
+    return pickle.dumps(config)
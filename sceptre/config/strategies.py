@@ -5,9 +5,14 @@ sceptre.config.strategies
 
 This module contains the implementations of the strategies used to merge config
 attributes.
+
+The merged values are new lists and dicts, but the items in them are shared with the
+configs they were merged from rather than copied. The Stack properties built from them
+copy the nested lists and dicts for each Stack before handing them out, so the shared
+items are never updated in place.
 """
 
-from copy import deepcopy
+from copy import copy
 
 
 def list_join(a, b):
@@ -28,12 +33,12 @@ def list_join(a, b):
         raise TypeError("{} is not a list".format(b))
 
     if a is None:
-        return deepcopy(b)
+        return copy(b)
 
     if b is not None:
-        return deepcopy(a + b)
+        return a + b
 
-    return deepcopy(a)
+    return copy(a)
 
 
 def dict_merge(a, b):
@@ -53,12 +58,12 @@ def dict_merge(a, b):
         raise TypeError("{} is not a dict".format(b))
 
     if a is None:
-        return deepcopy(b)
+        return copy(b)
 
     if b is not None:
-        return deepcopy({**a, **b})
+        return {**a, **b}
 
-    return deepcopy(a)
+    return copy(a)
 
 
 def child_wins(a, b):
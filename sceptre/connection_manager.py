@@ -13,6 +13,8 @@ import random
 import threading
 import time
 import warnings
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Tuple, Any
 
 import boto3
@@ -23,6 +25,38 @@ from botocore.exceptions import ClientError
 from sceptre.exceptions import InvalidAWSCredentialsError, RetryLimitExceededError
 from sceptre.helpers import mask_key, create_deprecated_alias_property
 
+# The observer notified of the outcome of every Boto3 call made with _retry_boto_call, or None.
+# Like the resolver placeholders toggle, it is global, so that the scheduler of a command can
+# observe the calls of every Stack without a reference to each Stack's ConnectionManager.
+_THROTTLING_OBSERVER = None
+
+_throttling_observer_lock = threading.Lock()
+
+
+@contextmanager
+def observe_throttling(observer):
+    """
+    A context manager that notifies the observer of the outcome of every Boto3 call made
+    inside it, from any thread. observer.throttled() is called whenever a call is throttled,
+    and observer.succeeded() whenever a call succeeds.
+
+    The observer replaces any observer already set until the context exits, and the
+    previous observer is then restored, so that a command run within an observed command,
+    such as the deletions of a pruning launch, does not stop the outer observation.
+
+    :param observer: The object to notify, such as sceptre.plan.concurrency.AdaptiveConcurrency.
+    """
+    global _THROTTLING_OBSERVER
+
+    with _throttling_observer_lock:
+        previous = _THROTTLING_OBSERVER
+        _THROTTLING_OBSERVER = observer
+    try:
+        yield observer
+    finally:
+        with _throttling_observer_lock:
+            _THROTTLING_OBSERVER = previous
+
 
 def _retry_boto_call(func):
     """
@@ -50,10 +84,13 @@ def _retry_boto_call(func):
         mdelay = 1
         delay_cap = 45
         while attempts < max_retries:
+            observer = _THROTTLING_OBSERVER
             try:
-                return func(*args, **kwargs)
+                response = func(*args, **kwargs)
             except ClientError as e:
                 if e.response["Error"]["Code"] == "Throttling":
+                    if observer is not None:
+                        observer.throttled()
                     logger.error("Request limit exceeded, pausing {}...".format(mdelay))
                     time.sleep(mdelay)
 
@@ -65,6 +102,10 @@ def _retry_boto_call(func):
                     attempts += 1
                 else:
                     raise
+            else:
+                if observer is not None:
+                    observer.succeeded()
+                return response
         raise RetryLimitExceededError(
             "Exceeded request limit {0} times. Aborting.".format(max_retries)
         )
@@ -88,11 +129,21 @@ class ConnectionManager(object):
     # contrast with passing None, which would mean "use no value".
     STACK_DEFAULT = "[STACK DEFAULT]"
 
-    _session_lock = threading.Lock()
-    _client_lock = threading.Lock()
+    logger = logging.getLogger(__name__)
+
+    # Sessions of assumed roles are created again once their credentials are this close to expiry.
+    SESSION_EXPIRY_MARGIN = timedelta(minutes=5)
+
+    # The sessions are dropped along with their clients, so whenever both locks are held,
+    # _client_lock is taken first. They are reentrant, as the methods holding them call
+    # each other.
+    _session_lock = threading.RLock()
+    _client_lock = threading.RLock()
     _boto_sessions = {}
     _clients = {}
     _stack_keys = {}
+    # When the credentials of the sessions of assumed roles expire, keyed as _boto_sessions.
+    _session_expirations = {}
 
     iam_role = create_deprecated_alias_property(
         "iam_role", "sceptre_role", "4.0.0", "5.0.0"
@@ -113,8 +164,6 @@ class ConnectionManager(object):
         session_class=boto3.Session,
         get_envs_func=lambda: os.environ,
     ):
-        self.logger = logging.getLogger(__name__)
-
         self.region = region
         self.profile = profile
         self.stack_name = stack_name
@@ -280,10 +329,13 @@ class ConnectionManager(object):
             self._emit_iam_role_deprecation_warning()
             sceptre_role = iam_role
 
-        with self._session_lock:
+        with self._client_lock, self._session_lock:
             self.logger.debug("Getting Boto3 session")
             key = (region, profile, sceptre_role)
 
+            if self._session_expires_soon(key):
+                self._drop_session(key)
+
             if self._boto_sessions.get(key) is None:
                 self.logger.debug("No Boto3 session found, creating one...")
                 self.logger.debug("Using cli credentials...")
@@ -322,6 +374,9 @@ class ConnectionManager(object):
                     sts_response = sts_client.assume_role(**assume_role_kwargs)
 
                     credentials = sts_response["Credentials"]
+                    expiration = credentials.get("Expiration")
+                    if isinstance(expiration, datetime):
+                        self._session_expirations[key] = expiration
                     session = self._session_class(
                         aws_access_key_id=credentials["AccessKeyId"],
                         aws_secret_access_key=credentials["SecretAccessKey"],
@@ -368,6 +423,8 @@ class ConnectionManager(object):
         """
         with self._client_lock:
             key = (service, region, profile, stack_name, sceptre_role)
+            if self._session_expires_soon((region, profile, sceptre_role)):
+                self._drop_session((region, profile, sceptre_role))
             if self._clients.get(key) is None:
                 self.logger.debug("No %s client found, creating one...", service)
                 self._clients[key] = self._get_session(
@@ -376,6 +433,43 @@ class ConnectionManager(object):
 
             return self._clients[key]
 
+    def _session_expires_soon(self, key: Tuple[str, str, str]) -> bool:
+        """
+        Returns whether the credentials of the session of an assumed role expire within
+        SESSION_EXPIRY_MARGIN, so that a long-lived process does not go on using them.
+        """
+        expiration = self._session_expirations.get(key)
+        if expiration is None:
+            return False
+        if expiration.tzinfo is None:
+            expiration = expiration.replace(tzinfo=timezone.utc)
+        return expiration - self.SESSION_EXPIRY_MARGIN <= datetime.now(timezone.utc)
+
+    def _drop_session(self, key: Tuple[str, str, str]):
+        """
+        Drops the session of an assumed role whose credentials expire soon, along with the
+        clients created from it.
+        """
+        self.logger.debug("Boto3 session credentials expire soon, dropping the session")
+        with self._client_lock, self._session_lock:
+            self._boto_sessions.pop(key, None)
+            self._session_expirations.pop(key, None)
+            for client_key in list(self._clients):
+                service, region, profile, stack_name, sceptre_role = client_key
+                if (region, profile, sceptre_role) == key:
+                    self._clients.pop(client_key, None)
+
+    @classmethod
+    def clear_sessions(cls):
+        """
+        Drops every Boto3 session and client held by the process, so that they are created
+        again with the credentials then found in the environment.
+        """
+        with cls._client_lock, cls._session_lock:
+            cls._clients.clear()
+            cls._boto_sessions.clear()
+            cls._session_expirations.clear()
+
     @_retry_boto_call
     def call(
         self,
@@ -49,6 +49,86 @@ class SceptreContext(object):
     :param max_concurrency: Specify maximum number of stacks to launch concurrently\
             Integer value with max number of concurrent stacks, or None for no limit
     :type max_concurrency: Optional[int]
+
+    :param max_concurrency_per_account_region: Specify maximum number of stacks to run\
+            concurrently for each account, identified by sceptre_role or profile, and region.\
+            None for no limit
+    :type max_concurrency_per_account_region: Optional[int]
+
+    :param scheduler: Specify how stacks are scheduled for execution\
+            "batch" to execute the launch order one batch at a time, or "stream" to start\
+            each stack as soon as its own dependencies have completed
+    :type scheduler: str
+
+    :param continue_on_failure: Specify whether a failed stack should only skip the\
+            stacks that depend on it, instead of stopping the whole execution
+    :type continue_on_failure: bool
+
+    :param engine: Specify how stacks are executed\
+            "threads" to run each stack in its own thread, or "asyncio" to run them as\
+            coroutines that do not hold a thread while waiting on CloudFormation
+    :type engine: str
+
+    :param render_processes: Specify the number of processes that render the\
+            templates of the stacks in parallel before a command that only reads\
+            them runs, or None to render each template when it is first used
+    :type render_processes: int
+
+    :param resume: Specify whether to resume the previous run of the command, skipping\
+            the stacks it completed
+    :type resume: bool
+
+    :param only_failed: Specify whether to only run the stacks that failed, or were\
+            skipped because a dependency failed, in the previous run of the command
+    :type only_failed: bool
+
+    :param journal: Specify whether to journal the status every stack completes with,\
+            so that the run can later be resumed
+    :type journal: bool
+
+    :param adaptive_concurrency: Specify whether to halve the number of stacks in\
+            flight whenever AWS throttles an API call, and to grow it back while calls\
+            succeed
+    :type adaptive_concurrency: bool
+
+    :param prefetch: Specify whether to prepare the templates and the resolvable\
+            values that do not depend on other stacks in the background, while the\
+            stacks wait for their dependencies
+    :type prefetch: bool
+
+    :param trace_file: Specify the path of a file to export a trace of the command's\
+            spans to, as Chrome trace events, or None to not trace the command
+    :type trace_file: str
+
+    :param deadline: Specify the number of minutes after which the command stops starting\
+            stacks and stops waiting on the stacks in flight, or None for no deadline
+    :type deadline: int
+
+    :param cancel_in_flight: Specify whether the stack updates still in progress when the\
+            deadline expires are cancelled, rather than left to complete
+    :type cancel_in_flight: bool
+
+    :param config_cache: Specify whether the configs read from config files are kept in\
+            the state directory, and reused while the files they are rendered from are\
+            unchanged
+    :type config_cache: bool
+
+    :param jinja_cache: Specify whether the Jinja templates compiled to render config\
+            files and templates are kept in the state directory, and reused while the\
+            templates are unchanged
+    :type jinja_cache: bool
+
+    :param config_processes: Specify the number of processes that read the config\
+            files of the stacks in parallel, or None to read them in this process
+    :type config_processes: int
+
+    :param var_files: The paths of the var files the user variables were read from
+    :type var_files: list
+
+    :param changed_files: Specify the paths of the files changed since the stacks were\
+            last launched, to only launch the stacks affected by them and the stacks that\
+            depend on those, or None to launch every stack
+    :type changed_files: list
     """
 
     def __init__(
@@ -63,6 +143,24 @@ class SceptreContext(object):
         ignore_dependencies=False,
         full_scan=False,
         max_concurrency=None,
+        max_concurrency_per_account_region=None,
+        scheduler="batch",
+        continue_on_failure=False,
+        engine="threads",
+        render_processes=None,
+        resume=False,
+        only_failed=False,
+        journal=False,
+        trace_file=None,
+        adaptive_concurrency=False,
+        prefetch=False,
+        deadline=None,
+        cancel_in_flight=False,
+        config_cache=False,
+        jinja_cache=False,
+        config_processes=None,
+        var_files=None,
+        changed_files=None,
     ):
         # project_path: absolute path to the base sceptre project folder
         # e.g. absolute_path/to/sceptre_directory
@@ -89,6 +187,11 @@ class SceptreContext(object):
         # e.g. {project_path/}templates
         self.templates_path = "templates"
 
+        # state_path: holds state Sceptre keeps between runs, such as the durations
+        # of previous stack executions.
+        # e.g. {project_path/}.sceptre
+        self.state_path = ".sceptre"
+
         self.user_variables = user_variables if user_variables else {}
         self.user_variables = user_variables if user_variables is not None else {}
         self.options = options if options else {}
@@ -100,6 +203,24 @@ class SceptreContext(object):
         self.full_scan = full_scan if full_scan is True else False
 
         self.max_concurrency = max_concurrency
+        self.max_concurrency_per_account_region = max_concurrency_per_account_region
+        self.scheduler = scheduler
+        self.continue_on_failure = continue_on_failure is True
+        self.engine = engine
+        self.render_processes = render_processes
+        self.resume = resume is True
+        self.only_failed = only_failed is True
+        self.journal = journal is True
+        self.trace_file = trace_file
+        self.adaptive_concurrency = adaptive_concurrency is True
+        self.prefetch = prefetch is True
+        self.deadline = deadline
+        self.cancel_in_flight = cancel_in_flight is True
+        self.config_cache = config_cache is True
+        self.jinja_cache = jinja_cache is True
+        self.config_processes = config_processes
+        self.var_files = var_files if var_files else []
+        self.changed_files = changed_files
 
     def full_config_path(self):
         """
@@ -129,6 +250,15 @@ class SceptreContext(object):
         """
         return path.join(self.project_path, self.templates_path)
 
+    def full_state_path(self):
+        """
+        Returns the state path in the format: project_path/state_path.
+
+        :returns: The absolute path to the state directory
+        :rtype: str
+        """
+        return path.join(self.project_path, self.state_path)
+
     def command_path_is_stack(self):
         """
         Returns True if the command path is a file.
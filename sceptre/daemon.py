@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+
+"""
+sceptre.daemon
+
+This module implements the Sceptre daemon, a long-lived process that runs the Sceptre
+commands sent to it over a UNIX socket, and the client that sends them. What a command
+loads once per process is kept warm between the commands the daemon runs: Sceptre's
+modules and plugins, the Jinja environments, the configs read from config files, and the
+Boto3 sessions and clients. The commands the daemon runs always use the config cache.
+
+Importing this module only imports the standard library and sceptre.exceptions, along
+with the sceptre package itself, so that the client starts without importing the rest of
+Sceptre.
+"""
+
+import contextlib
+import io
+import json
+import logging
+import os
+import socket
+import stat
+import sys
+import tempfile
+import threading
+import traceback
+from typing import Callable, Iterator, List, Optional
+
+from sceptre.exceptions import DaemonError
+
+# The environment variable that holds the path of the daemon's socket.
+SOCKET_PATH_ENV_VAR = "SCEPTRE_DAEMON_SOCKET"
+
+
+def socket_path() -> str:
+    """
+    Returns the path of the daemon's socket. This is SCEPTRE_DAEMON_SOCKET if it is set,
+    or else a socket in a directory of the user's own in the temporary directory.
+
+    :returns: The path of the socket.
+    """
+    path = os.environ.get(SOCKET_PATH_ENV_VAR)
+    if path:
+        return path
+    return os.path.join(tempfile.gettempdir(), f"sceptre-{os.getuid()}", "daemon.sock")
+
+
+class Daemon(object):
+    """
+    Daemon runs the Sceptre commands sent to it over a UNIX socket, one at a time, in this
+    process. Each command runs in the working directory and with the environment variables
+    of the client that sent it, and its output is streamed back to the client as it is
+    written. Commands cannot read from the client's stdin, so commands that would prompt
+    for confirmation must be sent with ``--yes``.
+
+    The commands always use the config cache, which is kept in memory between commands,
+    as if they were given ``--config-cache``. The configs read from config files are
+    checked against the files they were rendered from each time they are used, and the Jinja environments check the modification time
+    of each template they load, so changes to the project are picked up by the next
+    command. The Boto3 sessions and clients are created again when the AWS environment
+    variables of a client differ from those of the previous command.
+
+    :param path: The path of the socket, which defaults to ``socket_path()``.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.logger = logging.getLogger(__name__)
+        self.path = path or socket_path()
+        self._stopping = False
+        self._aws_environment = None
+
+    def serve(self, ready: Optional[threading.Event] = None):
+        """
+        Serves commands until the daemon is stopped.
+
+        :param ready: An event set once the daemon accepts commands.
+        :raises: sceptre.exceptions.DaemonError
+        """
+        # Imported here rather than at the top of the module, which the client imports.
+        import sceptre.cli  # noqa: F401
+        from sceptre.config import cache
+
+        server = self._bind()
+        cache.caches.keep = True
+        self.logger.info("Sceptre daemon listening on %s", self.path)
+        try:
+            if ready is not None:
+                ready.set()
+            while not self._stopping:
+                connection, _ = server.accept()
+                with connection:
+                    self._handle(connection)
+        finally:
+            server.close()
+            cache.caches.keep = False
+            cache.caches.clear()
+            with contextlib.suppress(OSError):
+                os.unlink(self.path)
+            self.logger.info("Sceptre daemon stopped")
+
+    def _bind(self) -> socket.socket:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        status = os.stat(directory)
+        if status.st_uid != os.getuid():
+            raise DaemonError(f"{directory} is owned by another user.")
+        if stat.S_IMODE(status.st_mode) & 0o077:
+            raise DaemonError(
+                f"{directory} can be accessed by other users. Only its owner may access "
+                "the directory of the daemon's socket (chmod 700)."
+            )
+
+        if os.path.exists(self.path):
+            try:
+                _connect(self.path).close()
+            except DaemonError:
+                # The socket of a daemon that did not stop cleanly.
+                os.unlink(self.path)
+            else:
+                raise DaemonError(
+                    f"A Sceptre daemon is already running at {self.path}."
+                )
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # The socket is created with the permissions the umask allows, so it is bound under
+        # a umask that keeps it from other users until the chmod.
+        umask = os.umask(0o077)
+        try:
+            server.bind(self.path)
+            os.chmod(self.path, 0o600)
+            server.listen()
+        except OSError as err:
+            server.close()
+            raise DaemonError(f"Cannot listen on {self.path}: {err}") from err
+        finally:
+            os.umask(umask)
+        return server
+
+    def _handle(self, connection: socket.socket):
+        """
+        Reads a request from a client, and runs the command it holds or stops the daemon.
+        """
+        with connection.makefile("rwb") as stream:
+            send = _sender(stream)
+            try:
+                request = json.loads(stream.readline())
+            except ValueError as err:
+                self.logger.debug("Ignoring an unreadable request: %s", err)
+                return
+
+            if request.get("stop"):
+                self._stopping = True
+                send({"exit_code": 0})
+            elif "argv" in request:
+                self.logger.info("Running sceptre %s", " ".join(request["argv"]))
+                send({"exit_code": self._run(request, send)})
+            else:
+                send({"exit_code": 0, "pid": os.getpid()})
+
+    def _run(self, request: dict, send: Callable[[dict], None]) -> int:
+        """
+        Runs a command as if it were run by the client that sent it.
+
+        :returns: The exit code of the command.
+        """
+        stdout_tty, stderr_tty = request.get("tty", [False, False])
+        stdout = _ClientStream(send, "stdout", stdout_tty)
+        stderr = _ClientStream(send, "stderr", stderr_tty)
+        try:
+            with self._client_environment(request), _isolated_logging():
+                with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(
+                    stderr
+                ):
+                    return _main(list(request["argv"]))
+        except Exception as err:
+            # The client's environment could not be set up, such as when its working
+            # directory no longer exists.
+            stderr.write(f"{err}\n")
+            return 1
+
+    @contextlib.contextmanager
+    def _client_environment(self, request: dict):
+        """
+        Runs a command in the working directory and with the environment variables of the
+        client, without any stdin.
+        """
+        from sceptre.connection_manager import ConnectionManager
+
+        cwd = os.getcwd()
+        environment = dict(os.environ)
+        stdin = sys.stdin
+
+        client_environment = request.get("env", {})
+        aws_environment = {
+            name: value
+            for name, value in client_environment.items()
+            if name.startswith("AWS_")
+        }
+        if aws_environment != self._aws_environment:
+            ConnectionManager.clear_sessions()
+            self._aws_environment = aws_environment
+
+        os.chdir(request.get("cwd", cwd))
+        os.environ.clear()
+        os.environ.update(client_environment)
+        sys.stdin = io.StringIO()
+        try:
+            yield
+        finally:
+            sys.stdin = stdin
+            os.environ.clear()
+            os.environ.update(environment)
+            os.chdir(cwd)
+
+
+@contextlib.contextmanager
+def _isolated_logging():
+    """
+    Restores the loggers each command configures once it completes, so that the log handlers
+    of one command do not write the log messages of the next.
+    """
+    loggers = [logging.getLogger("sceptre"), logging.getLogger("botocore")]
+    saved = [(logger, logger.handlers[:], logger.level) for logger in loggers]
+    for logger in loggers:
+        logger.handlers = []
+    try:
+        yield
+    finally:
+        for logger, handlers, level in saved:
+            logger.handlers = handlers
+            logger.setLevel(level)
+
+
+class _ClientStream(io.TextIOBase):
+    """
+    A text stream whose writes are sent to the client as the client's stdout or stderr.
+    """
+
+    encoding = "utf-8"
+
+    def __init__(self, send: Callable[[dict], None], name: str, tty: bool):
+        self._send = send
+        self._name = name
+        self._tty = tty
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self._tty
+
+    def write(self, text: str) -> int:
+        if isinstance(text, (bytes, bytearray)):
+            # Click writes bytes to a stream it cannot find a binary buffer for.
+            text = text.decode(self.encoding, "replace")
+        if text:
+            self._send({self._name: text})
+        return len(text)
+
+
+def _sender(stream) -> Callable[[dict], None]:
+    """
+    Returns a function that sends a message to the client. Once the client has gone, the
+    messages sent to it are dropped, and the command runs to completion.
+    """
+    lock = threading.Lock()
+    connected = [True]
+
+    def send(message: dict):
+        with lock:
+            if not connected[0]:
+                return
+            try:
+                stream.write(json.dumps(message).encode("utf-8") + b"\n")
+                stream.flush()
+            except (OSError, ValueError):
+                connected[0] = False
+
+    return send
+
+
+def _main(argv: List[str]) -> int:
+    """
+    Runs a Sceptre command in this process.
+
+    :returns: The exit code of the command.
+    """
+    from sceptre.cli import cli
+
+    try:
+        cli.main(args=argv, prog_name="sceptre")
+    except SystemExit as err:
+        return _exit_code(err.code)
+    except Exception:
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def _exit_code(code) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _connect(path: str) -> socket.socket:
+    """
+    Connects to the daemon listening on a socket.
+
+    :raises: sceptre.exceptions.DaemonError
+    """
+    try:
+        owner = os.stat(path).st_uid
+    except OSError as err:
+        raise DaemonError(f"No Sceptre daemon is running at {path}.") from err
+    if owner != os.getuid():
+        raise DaemonError(f"{path} is owned by another user.")
+
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(path)
+    except OSError as err:
+        connection.close()
+        raise DaemonError(f"No Sceptre daemon is running at {path}.") from err
+    return connection
+
+
+def _request(connection: socket.socket, request: dict) -> Iterator[dict]:
+    """
+    Sends a request to the daemon, and yields the messages it sends back.
+    """
+    with connection, connection.makefile("rwb") as stream:
+        stream.write(json.dumps(request).encode("utf-8") + b"\n")
+        stream.flush()
+        for line in stream:
+            yield json.loads(line)
+    raise DaemonError("The Sceptre daemon closed the connection.")
+
+
+def _run(connection: socket.socket, argv: List[str]) -> int:
+    request = {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+        "tty": [sys.stdout.isatty(), sys.stderr.isatty()],
+    }
+    for message in _request(connection, request):
+        if "stdout" in message:
+            sys.stdout.write(message["stdout"])
+            sys.stdout.flush()
+        elif "stderr" in message:
+            sys.stderr.write(message["stderr"])
+            sys.stderr.flush()
+        elif "exit_code" in message:
+            return message["exit_code"]
+
+
+def run(argv: List[str], path: Optional[str] = None) -> int:
+    """
+    Runs a Sceptre command in the daemon, writing its output to stdout and stderr.
+
+    :param argv: The arguments of the command, as they would be given to ``sceptre``.
+    :param path: The path of the daemon's socket, which defaults to ``socket_path()``.
+    :returns: The exit code of the command.
+    :raises: sceptre.exceptions.DaemonError
+    """
+    return _run(_connect(path or socket_path()), argv)
+
+
+def status(path: Optional[str] = None) -> int:
+    """
+    Returns the process id of the daemon.
+
+    :param path: The path of the daemon's socket, which defaults to ``socket_path()``.
+    :returns: The process id.
+    :raises: sceptre.exceptions.DaemonError
+    """
+    for message in _request(_connect(path or socket_path()), {}):
+        return message["pid"]
+
+
+def stop(path: Optional[str] = None):
+    """
+    Stops the daemon once the command it is running, if any, completes.
+
+    :param path: The path of the daemon's socket, which defaults to ``socket_path()``.
+    :raises: sceptre.exceptions.DaemonError
+    """
+    for _ in _request(_connect(path or socket_path()), {"stop": True}):
+        return
+
+
+def main():
+    """
+    Runs the Sceptre command given on the command line in the daemon, or in this process
+    if no daemon is running.
+    """
+    argv = sys.argv[1:]
+    try:
+        connection = _connect(socket_path())
+    except DaemonError:
+        from sceptre.cli import cli
+
+        cli.main(args=argv, prog_name="sceptre")
+    else:
+        sys.exit(_run(connection, argv))
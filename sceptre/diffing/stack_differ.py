@@ -213,7 +213,11 @@ class StackDiffer(Generic[DiffType]):
                     param["ParameterKey"]: param["ParameterValue"]
                     for param in stack.get("Parameters", [])
                 },
-                stack_tags={tag["Key"]: tag["Value"] for tag in stack["Tags"]},
+                stack_tags={
+                    tag["Key"]: tag["Value"]
+                    for tag in stack["Tags"]
+                    if tag["Key"] != StackActions.FINGERPRINT_TAG
+                },
                 stack_name=stack["StackName"],
                 notifications=stack["NotificationARNs"],
                 cloudformation_service_role=stack.get("RoleARN"),
@@ -225,3 +225,22 @@ class InvalidResolverArgumentError(SceptreException):
     """
     Indicates a resolver argument is invalid in some way.
     """
+
+
+class PlanCancelledError(SceptreException):
+    """
+    Error raised when the execution of a plan is cancelled, because its deadline
+    expired or it was interrupted, before every Stack completed.
+    """
+
+
+class ChangedFilesError(SceptreException):
+    """
+    Error raised when the files changed since a git ref cannot be listed.
+    """
+
+
+class DaemonError(SceptreException):
+    """
+    Error raised when the Sceptre daemon cannot be started, or cannot be reached.
+    """
@@ -117,6 +117,19 @@ def delete_keys_from_containers(keys_to_delete: List[Tuple[Container, Key]]):
         containing_list.remove(item)
 
 
+def copy_containers(obj):
+    """Returns a copy of the nested dicts and lists in obj, sharing the values they hold.
+
+    Config values read once are shared between the Stacks that inherit them, so a value is
+    copied with this before it is handed to code that may update it in place.
+    """
+    if isinstance(obj, list):
+        return [copy_containers(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: copy_containers(value) for key, value in obj.items()}
+    return obj
+
+
 def normalise_path(path):
     """
     Converts a path to use correct path separator.
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, List
 
 from sceptre.helpers import _call_func_on_values
 from sceptre.resolvers import CustomYamlTagBase
+from sceptre.tracing import span
 
 if TYPE_CHECKING:
     from sceptre.stack import Stack
@@ -15,7 +16,9 @@ class Hook(CustomYamlTagBase, metaclass=abc.ABCMeta):
     Hook is an abstract base class that should be subclassed by all hooks.
     """
 
-    logger = logging.getLogger(__name__)
+    __slots__ = ()
+
+    base_logger = logging.getLogger(__name__)
 
     @abc.abstractmethod
     def run(self):
@@ -78,7 +81,9 @@ def execute_hooks(hooks):
     if isinstance(hooks, list):
         for hook in hooks:
             if isinstance(hook, Hook):
-                hook.run()
+                stack = getattr(hook, "stack", None)
+                with span(type(hook).__name__, "hooks", stack and stack.name):
+                    hook.run()
 
 
 def add_stack_hooks(func):
@@ -14,6 +14,8 @@ class ASGScalingProcesses(Hook):
     autoscaling groups.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(ASGScalingProcesses, self).__init__(*args, **kwargs)
 
@@ -8,6 +8,8 @@ class Cmd(Hook):
     Cmd implements a Sceptre hook which can run arbitrary commands.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(Cmd, self).__init__(*args, **kwargs)
 
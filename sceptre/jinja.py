@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+"""
+sceptre.jinja
+
+This module implements an EnvironmentPool, which shares the Jinja environments
+config files and templates are rendered with across a process, so each file is
+only parsed and compiled once.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Iterable, Optional
+
+import jinja2
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    StrictUndefined,
+    select_autoescape,
+)
+
+from sceptre.config import strategies
+
+
+class EnvironmentPool(object):
+    """
+    EnvironmentPool keeps a Jinja environment for each directory templates are loaded
+    from and each ``j2_environment`` they are rendered with. A Jinja environment keeps
+    the templates it compiled, and compiles a template again when its file changes, so
+    a template rendered many times is only compiled once.
+
+    When ``bytecode_cache_path`` is set, compiled templates are also kept in that
+    directory, so later processes do not compile them again either.
+    """
+
+    def __init__(self):
+        self.bytecode_cache_path: Optional[str] = None
+        self._lock = threading.Lock()
+        self._environments: Dict[tuple, Environment] = {}
+
+    def get(
+        self,
+        loader_path: str,
+        j2_environment_config: dict,
+        unescaped_extensions: Iterable[str],
+    ) -> Environment:
+        """
+        Returns the Jinja environment to render the templates in a directory with. This
+        method is thread-safe.
+
+        :param loader_path: The directory templates are loaded from.
+        :param j2_environment_config: The j2_environment of the StackGroup config, which
+            overrides the default options of the environment.
+        :param unescaped_extensions: The extensions of the templates that are rendered
+            without autoescaping.
+        :returns: The Jinja environment.
+        """
+        unescaped_extensions = tuple(unescaped_extensions)
+        try:
+            # The options are read from YAML, so JSON gives a key that is the same for
+            # equal options, both within and across processes.
+            options = json.dumps(j2_environment_config, sort_keys=True)
+        except (TypeError, ValueError):
+            return self._create(
+                loader_path, j2_environment_config, unescaped_extensions
+            )
+
+        bytecode_cache_path = self.bytecode_cache_path
+        key = (loader_path, options, unescaped_extensions, bytecode_cache_path)
+        with self._lock:
+            if key not in self._environments:
+                bytecode_cache = None
+                if bytecode_cache_path is not None:
+                    bytecode_cache = _bytecode_cache(
+                        bytecode_cache_path, options, unescaped_extensions
+                    )
+                self._environments[key] = self._create(
+                    loader_path,
+                    j2_environment_config,
+                    unescaped_extensions,
+                    bytecode_cache,
+                )
+            return self._environments[key]
+
+    def clear(self):
+        """
+        Drops every environment in the pool.
+        """
+        with self._lock:
+            self._environments.clear()
+
+    @staticmethod
+    def _create(
+        loader_path, j2_environment_config, unescaped_extensions, bytecode_cache=None
+    ):
+        default_j2_environment_config = {
+            "autoescape": select_autoescape(
+                disabled_extensions=unescaped_extensions,
+                default=True,
+            ),
+            "loader": FileSystemLoader(loader_path),
+            "undefined": StrictUndefined,
+            "bytecode_cache": bytecode_cache,
+        }
+        return Environment(
+            **strategies.dict_merge(
+                default_j2_environment_config, j2_environment_config
+            )
+        )
+
+
+def _bytecode_cache(bytecode_cache_path, options, unescaped_extensions):
+    """
+    Returns the bytecode cache for environments with the given options. Templates are
+    compiled differently depending on the options of the environment, so environments
+    with different options, or from a different version of Jinja, keep their bytecode in
+    different directories.
+    """
+    digest = hashlib.sha256(
+        json.dumps([jinja2.__version__, options, unescaped_extensions]).encode("utf-8")
+    ).hexdigest()
+    directory = os.path.join(bytecode_cache_path, digest[:16])
+    os.makedirs(directory, exist_ok=True)
+    return FileSystemBytecodeCache(directory)
+
+
+# The environments shared by every config file and template rendered in the process.
+environments = EnvironmentPool()
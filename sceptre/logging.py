@@ -1,3 +1,4 @@
+from functools import lru_cache
 from logging import LoggerAdapter, Logger
 from typing import MutableMapping, Any, Tuple
 
@@ -18,3 +19,20 @@ class StackLoggerAdapter(LoggerAdapter):
     ) -> Tuple[Any, MutableMapping[str, Any]]:
         msg = f"{self.stack_name} - {msg}"
         return super().process(msg, kwargs)
+
+
+# The number of adapters kept. The cache is bounded so that a long-lived process, such as the
+# sceptre daemon, does not keep an adapter for every stack of every project it has run.
+STACK_LOGGER_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=STACK_LOGGER_CACHE_SIZE)
+def stack_logger(logger: Logger, stack_name: str) -> StackLoggerAdapter:
+    """Returns a StackLoggerAdapter for a logger and stack name. The adapter is shared by every
+    object that logs with the same logger for the same stack, rather than created for each of them.
+    The least recently used adapters are dropped once STACK_LOGGER_CACHE_SIZE are cached.
+
+    :param logger: The logger to wrap
+    :param stack_name: The name of the stack to prefix every log message with
+    """
+    return StackLoggerAdapter(logger, stack_name)
@@ -7,6 +7,7 @@ This module implements the StackActions class which provides the functionality
 available to a Stack.
 """
 
+import hashlib
 import json
 import logging
 import time
@@ -22,6 +23,7 @@ from sceptre.connection_manager import ConnectionManager
 
 from sceptre.exceptions import (
     CannotUpdateFailedStackError,
+    PlanCancelledError,
     ProtectedStackError,
     StackDoesNotExistError,
     UnknownStackChangeSetStatusError,
@@ -29,8 +31,10 @@ from sceptre.exceptions import (
 )
 from sceptre.helpers import extract_datetime_from_aws_response_headers
 from sceptre.hooks import add_stack_hooks, add_stack_hooks_with_aliases
+from sceptre.plan.cancellation import get_cancellation
 from sceptre.stack import Stack
 from sceptre.stack_status import StackChangeSetStatus, StackStatus
+from sceptre.tracing import span
 
 from typing import Dict, Optional, Tuple, Union
 
@@ -47,10 +51,16 @@ class StackActions:
     :type stack: sceptre.stack.Stack
     """
 
+    # The Stack tag holding the fingerprint of the configuration a Stack was last deployed
+    # with, when the Stack has skip_unchanged set.
+    FINGERPRINT_TAG = "sceptre:fingerprint"
+
     def __init__(self, stack: Stack):
         self.stack = stack
         self.name = self.stack.name
         self.logger = logging.getLogger(__name__)
+        self._description = None
+        self._fingerprint = None
         self.connection_manager = ConnectionManager(
             self.stack.region,
             self.stack.profile,
@@ -69,6 +79,41 @@ class StackActions:
         """
         self._protect_execution()
         self.logger.info("%s - Creating Stack", self.stack.name)
+        create_stack_kwargs = self._create_stack_kwargs()
+
+        try:
+            response = self.connection_manager.call(
+                service="cloudformation",
+                command="create_stack",
+                kwargs=create_stack_kwargs,
+            )
+
+            self.logger.debug(
+                "%s - Create stack response: %s", self.stack.name, response
+            )
+
+            status = self._wait_for_completion(boto_response=response)
+        except botocore.exceptions.ClientError as exp:
+            status = self._status_after_create_error(exp)
+
+        return status
+
+    def _status_after_create_error(
+        self, error: botocore.exceptions.ClientError
+    ) -> StackStatus:
+        """
+        Returns the Stack's status after its create_stack call raised ``error``, or
+        raises ``error`` if the Stack was not created.
+        """
+        if error.response["Error"]["Code"] == "AlreadyExistsException":
+            self.logger.info("%s - Stack already exists", self.stack.name)
+            return StackStatus.COMPLETE
+        raise error
+
+    def _create_stack_kwargs(self) -> dict:
+        """
+        Returns the arguments of the create_stack call for the Stack.
+        """
         create_stack_kwargs = {
             "StackName": self.stack.external_name,
             "Parameters": self._format_parameters(self.stack.parameters),
@@ -78,9 +123,7 @@ class StackActions:
                 "CAPABILITY_AUTO_EXPAND",
             ],
             "NotificationARNs": self.stack.notifications,
-            "Tags": [
-                {"Key": str(k), "Value": str(v)} for k, v in self.stack.tags.items()
-            ],
+            "Tags": self._get_stack_tags(),
         }
 
         # can specify either DisableRollback or OnFailure , but not both
@@ -92,28 +135,7 @@ class StackActions:
         create_stack_kwargs.update(self.stack.template.get_boto_call_parameter())
         create_stack_kwargs.update(self._get_role_arn())
         create_stack_kwargs.update(self._get_stack_timeout())
-
-        try:
-            response = self.connection_manager.call(
-                service="cloudformation",
-                command="create_stack",
-                kwargs=create_stack_kwargs,
-            )
-
-            self.logger.debug(
-                "%s - Create stack response: %s", self.stack.name, response
-            )
-
-            status = self._wait_for_completion(boto_response=response)
-        except botocore.exceptions.ClientError as exp:
-            if exp.response["Error"]["Code"] == "AlreadyExistsException":
-                self.logger.info("%s - Stack already exists", self.stack.name)
-
-                status = StackStatus.COMPLETE
-            else:
-                raise
-
-        return status
+        return create_stack_kwargs
 
     @add_stack_hooks
     def update(self):
@@ -126,35 +148,19 @@ class StackActions:
         self._protect_execution()
         self.logger.info("%s - Updating Stack", self.stack.name)
         try:
-            update_stack_kwargs = {
-                "StackName": self.stack.external_name,
-                "Parameters": self._format_parameters(self.stack.parameters),
-                "Capabilities": [
-                    "CAPABILITY_IAM",
-                    "CAPABILITY_NAMED_IAM",
-                    "CAPABILITY_AUTO_EXPAND",
-                ],
-                "NotificationARNs": self.stack.notifications,
-                "Tags": [
-                    {"Key": str(k), "Value": str(v)} for k, v in self.stack.tags.items()
-                ],
-            }
-
-            if self.stack.disable_rollback:
-                update_stack_kwargs.update(
-                    {"DisableRollback": self.stack.disable_rollback}
-                )
-
-            update_stack_kwargs.update(self.stack.template.get_boto_call_parameter())
-            update_stack_kwargs.update(self._get_role_arn())
+            update_stack_kwargs = self._update_stack_kwargs()
             response = self.connection_manager.call(
                 service="cloudformation",
                 command="update_stack",
                 kwargs=update_stack_kwargs,
             )
-            status = self._wait_for_completion(
-                self.stack.stack_timeout, boto_response=response
-            )
+            try:
+                status = self._wait_for_completion(
+                    self.stack.stack_timeout, boto_response=response
+                )
+            except PlanCancelledError:
+                self._cancel_update_in_flight()
+                raise
             self.logger.debug(
                 "%s - Update Stack response: %s", self.stack.name, response
             )
@@ -165,12 +171,42 @@ class StackActions:
 
             return status
         except botocore.exceptions.ClientError as exp:
-            error_message = exp.response["Error"]["Message"]
-            if error_message == "No updates are to be performed.":
-                self.logger.info("%s - No updates to perform.", self.stack.name)
-                return StackStatus.COMPLETE
-            else:
-                raise
+            return self._status_after_update_error(exp)
+
+    def _status_after_update_error(
+        self, error: botocore.exceptions.ClientError
+    ) -> StackStatus:
+        """
+        Returns the Stack's status after its update_stack call raised ``error``, or
+        raises ``error`` if the Stack was not updated.
+        """
+        if error.response["Error"]["Message"] == "No updates are to be performed.":
+            self.logger.info("%s - No updates to perform.", self.stack.name)
+            return StackStatus.COMPLETE
+        raise error
+
+    def _update_stack_kwargs(self) -> dict:
+        """
+        Returns the arguments of the update_stack call for the Stack.
+        """
+        update_stack_kwargs = {
+            "StackName": self.stack.external_name,
+            "Parameters": self._format_parameters(self.stack.parameters),
+            "Capabilities": [
+                "CAPABILITY_IAM",
+                "CAPABILITY_NAMED_IAM",
+                "CAPABILITY_AUTO_EXPAND",
+            ],
+            "NotificationARNs": self.stack.notifications,
+            "Tags": self._get_stack_tags(),
+        }
+
+        if self.stack.disable_rollback:
+            update_stack_kwargs.update({"DisableRollback": self.stack.disable_rollback})
+
+        update_stack_kwargs.update(self.stack.template.get_boto_call_parameter())
+        update_stack_kwargs.update(self._get_role_arn())
+        return update_stack_kwargs
 
     def cancel_stack_update(self):
         """
@@ -182,6 +218,25 @@ class StackActions:
         self.logger.warning(
             "%s - Update Stack time exceeded the specified timeout", self.stack.name
         )
+        response = self._request_update_cancellation()
+        return self._wait_for_completion(boto_response=response)
+
+    def _cancel_update_in_flight(self):
+        """
+        Cancels the Stack update in progress when the plan is cancelled, if the plan's
+        CancellationToken is set to cancel updates in flight. The rollback is not waited for.
+        """
+        cancellation = get_cancellation()
+        if cancellation is None or not cancellation.cancel_in_flight:
+            return
+        self.logger.warning(
+            "%s - Cancelling the update in progress, as %s",
+            self.stack.name,
+            cancellation.reason,
+        )
+        self._request_update_cancellation()
+
+    def _request_update_cancellation(self) -> dict:
         response = self.connection_manager.call(
             service="cloudformation",
             command="cancel_update_stack",
@@ -190,7 +245,7 @@ class StackActions:
         self.logger.debug(
             "%s - Cancel update Stack response: %s", self.stack.name, response
         )
-        return self._wait_for_completion(boto_response=response)
+        return response
 
     @add_stack_hooks
     def launch(self) -> StackStatus:
@@ -207,6 +262,29 @@ class StackActions:
         self._protect_execution()
         self.logger.info(f"{self.stack.name} - Launching Stack")
 
+        action = self._get_launch_action()
+        if action == "recreate":
+            self.delete()
+        if action in ["create", "recreate"]:
+            status = self.create()
+        elif action == "update":
+            status = self.update()
+        elif action == "skip":
+            status = StackStatus.COMPLETE
+        else:
+            status = StackStatus.IN_PROGRESS
+        return status
+
+    def _get_launch_action(self) -> str:
+        """
+        Returns the action that launches the Stack from the state it is in: "create" if
+        it does not exist, "recreate" if it must be deleted and created again, "update"
+        if it is complete, "skip" if it is also unchanged since it was last deployed, or
+        "wait" if an action is already in progress on it.
+
+        :raises: sceptre.exceptions.CannotUpdateFailedStackError
+        :raises: sceptre.exceptions.UnknownStackStatusError
+        """
         try:
             existing_status = self._get_status()
         except StackDoesNotExistError:
@@ -217,32 +295,30 @@ class StackActions:
         )
 
         if existing_status == "PENDING":
-            status = self.create()
+            return "create"
         elif existing_status in [
             "CREATE_FAILED",
             "ROLLBACK_COMPLETE",
             "REVIEW_IN_PROGRESS",
         ]:
-            self.delete()
-            status = self.create()
+            return "recreate"
         elif existing_status.endswith("COMPLETE"):
-            status = self.update()
+            return "skip" if self._is_unchanged() else "update"
         elif existing_status.endswith("IN_PROGRESS"):
             self.logger.info(
                 "%s - Stack action is already in progress state and cannot "
                 "be updated",
                 self.stack.name,
             )
-            status = StackStatus.IN_PROGRESS
+            return "wait"
         elif existing_status.endswith("FAILED"):
             raise CannotUpdateFailedStackError(
-                "'{0}' is in a the state '{1}' and cannot be updated".format(
+                "'{0}' is in the state '{1}' and cannot be updated".format(
                     self.stack.name, existing_status
                 )
             )
         else:
             raise UnknownStackStatusError("{0} is unknown".format(existing_status))
-        return status
 
     @add_stack_hooks
     def delete(self):
@@ -255,31 +331,54 @@ class StackActions:
         self._protect_execution()
 
         self.logger.info("%s - Deleting stack", self.stack.name)
-        try:
-            status = self._get_status()
-        except StackDoesNotExistError:
-            self.logger.info("%s - Does not exist.", self.stack.name)
-            status = StackStatus.COMPLETE
-            return status
+        if not self._exists():
+            return StackStatus.COMPLETE
 
-        delete_stack_kwargs = {"StackName": self.stack.external_name}
-        delete_stack_kwargs.update(self._get_role_arn())
         response = self.connection_manager.call(
-            service="cloudformation", command="delete_stack", kwargs=delete_stack_kwargs
+            service="cloudformation",
+            command="delete_stack",
+            kwargs=self._delete_stack_kwargs(),
         )
 
         try:
             status = self._wait_for_completion(boto_response=response)
-        except StackDoesNotExistError:
-            status = StackStatus.COMPLETE
-        except botocore.exceptions.ClientError as error:
-            if error.response["Error"]["Message"].endswith("does not exist"):
-                status = StackStatus.COMPLETE
-            else:
-                raise
+        except (StackDoesNotExistError, botocore.exceptions.ClientError) as error:
+            status = self._status_after_delete_error(error)
         self.logger.info("%s - delete %s", self.stack.name, status)
         return status
 
+    def _exists(self) -> bool:
+        """
+        Returns True if the Stack exists, logging that it does not otherwise.
+        """
+        try:
+            self._get_status()
+        except StackDoesNotExistError:
+            self.logger.info("%s - Does not exist.", self.stack.name)
+            return False
+        return True
+
+    def _delete_stack_kwargs(self) -> dict:
+        """
+        Returns the arguments of the delete_stack call for the Stack.
+        """
+        delete_stack_kwargs = {"StackName": self.stack.external_name}
+        delete_stack_kwargs.update(self._get_role_arn())
+        return delete_stack_kwargs
+
+    def _status_after_delete_error(
+        self, error: Union[StackDoesNotExistError, botocore.exceptions.ClientError]
+    ) -> StackStatus:
+        """
+        Returns the Stack's status after waiting for its deletion raised ``error``, or
+        raises ``error`` if the Stack may still exist.
+        """
+        if isinstance(error, StackDoesNotExistError):
+            return StackStatus.COMPLETE
+        if error.response["Error"]["Message"].endswith("does not exist"):
+            return StackStatus.COMPLETE
+        raise error
+
     def lock(self):
         """
         Locks the Stack by applying a deny-all updates Stack Policy.
@@ -467,9 +566,7 @@ class StackActions:
             "ChangeSetName": change_set_name,
             "ChangeSetType": change_set_type,
             "NotificationARNs": self.stack.notifications,
-            "Tags": [
-                {"Key": str(k), "Value": str(v)} for k, v in self.stack.tags.items()
-            ],
+            "Tags": self._get_stack_tags(),
         }
 
         create_change_set_kwargs.update(self.stack.template.get_boto_call_parameter())
@@ -587,48 +684,66 @@ class StackActions:
         """
         self._protect_execution()
         change_set = self.describe_change_set(change_set_name)
-        status = change_set.get("Status")
-        reason = change_set.get("StatusReason")
 
         return_val = 0
 
-        if status == "FAILED" and self._change_set_creation_failed_due_to_no_changes(
-            reason
-        ):
-            self.logger.info(
-                "Skipping ChangeSet on Stack: {} - there are no changes".format(
-                    change_set.get("StackName")
-                )
-            )
+        if self._change_set_has_no_changes(change_set):
             return return_val
 
         try:
             return_val = self._execute_change_set(change_set_name)
         except Exception as err:
-            self.logger.info(
-                "%s - Failed describing Change Set '%s'\n%s",
-                self.stack.name,
-                change_set_name,
-                err,
-            )
+            self._log_change_set_failure(change_set_name, err)
 
         return return_val
 
     def _execute_change_set(self, change_set_name):
-        self.logger.debug(
-            "%s - Executing Change Set '%s'", self.stack.name, change_set_name
-        )
         response = self.connection_manager.call(
             service="cloudformation",
             command="execute_change_set",
-            kwargs={
-                "ChangeSetName": change_set_name,
-                "StackName": self.stack.external_name,
-            },
+            kwargs=self._execute_change_set_kwargs(change_set_name),
         )
         status = self._wait_for_completion(boto_response=response)
         return status
 
+    def _execute_change_set_kwargs(self, change_set_name: str) -> dict:
+        """
+        Returns the arguments of the execute_change_set call for the Change Set
+        ``change_set_name``.
+        """
+        self.logger.debug(
+            "%s - Executing Change Set '%s'", self.stack.name, change_set_name
+        )
+        return {
+            "ChangeSetName": change_set_name,
+            "StackName": self.stack.external_name,
+        }
+
+    def _change_set_has_no_changes(self, change_set: dict) -> bool:
+        """
+        Returns True, and logs that it is skipped, if the described Change Set failed
+        to be created because it introduces no changes.
+        """
+        if change_set.get("Status") != "FAILED":
+            return False
+        reason = change_set.get("StatusReason")
+        if not self._change_set_creation_failed_due_to_no_changes(reason):
+            return False
+        self.logger.info(
+            "Skipping ChangeSet on Stack: {} - there are no changes".format(
+                change_set.get("StackName")
+            )
+        )
+        return True
+
+    def _log_change_set_failure(self, change_set_name: str, error: Exception):
+        self.logger.info(
+            "%s - Failed describing Change Set '%s'\n%s",
+            self.stack.name,
+            change_set_name,
+            error,
+        )
+
     def _change_set_creation_failed_due_to_no_changes(self, reason: str) -> bool:
         """
         Indicates the change set failed when it was created because there were actually
@@ -843,30 +958,107 @@ class StackActions:
 
         status = StackStatus.IN_PROGRESS
 
-        most_recent_event_datetime = extract_datetime_from_aws_response_headers(
-            boto_response
-        ) or (datetime.now(tzutc()) - timedelta(seconds=3))
+        most_recent_event_datetime = self._events_start_datetime(boto_response)
 
-        elapsed = 0
-        while status == StackStatus.IN_PROGRESS and not timed_out(elapsed):
-            status = self._get_simplified_status(self._get_status())
-            most_recent_event_datetime = self._log_new_events(
-                most_recent_event_datetime
-            )
-            time.sleep(4)
-            elapsed += 4
+        cancellation = get_cancellation()
 
+        elapsed = 0
+        with span("wait for CloudFormation", "cloudformation", self.stack.name):
+            while status == StackStatus.IN_PROGRESS and not timed_out(elapsed):
+                status, most_recent_event_datetime = self._poll_completion(
+                    most_recent_event_datetime
+                )
+                if cancellation is None:
+                    time.sleep(4)
+                elif cancellation.sleep(4):
+                    break
+                elapsed += 4
+
+        if status == StackStatus.IN_PROGRESS and cancellation is not None:
+            cancellation.raise_if_cancelled(self.stack.name)
         return status
 
+    @staticmethod
+    def _events_start_datetime(boto_response: Optional[dict]) -> datetime:
+        """
+        Returns the datetime after which the events of a Stack operation should be logged.
+
+        :param boto_response: Response from the boto call which initiated the stack change.
+        """
+        return extract_datetime_from_aws_response_headers(boto_response) or (
+            datetime.now(tzutc()) - timedelta(seconds=3)
+        )
+
+    def _poll_completion(
+        self, after_datetime: datetime
+    ) -> Tuple[StackStatus, datetime]:
+        """
+        Checks on a Stack operation once, logging any new events.
+
+        :param after_datetime: Only events after this datetime will be logged.
+        :returns: The simplified Stack status and the datetime of the last logged event.
+        """
+        status = self._get_simplified_status(self._get_status())
+        return status, self._log_new_events(after_datetime)
+
     def _get_status(self):
         try:
-            status = self.describe()["Stacks"][0]["StackStatus"]
+            description = self.describe()["Stacks"][0]
         except botocore.exceptions.ClientError as exp:
             if exp.response["Error"]["Message"].endswith("does not exist"):
                 raise StackDoesNotExistError(exp.response["Error"]["Message"])
             else:
                 raise exp
-        return status
+        # Kept so that launch can tell if the Stack is unchanged without describing it again.
+        self._description = description
+        return description["StackStatus"]
+
+    def _get_stack_tags(self) -> list:
+        """
+        Returns the Tags to deploy the Stack with, including the fingerprint tag if the
+        Stack has skip_unchanged set.
+        """
+        tags = [{"Key": str(k), "Value": str(v)} for k, v in self.stack.tags.items()]
+        if self.stack.skip_unchanged:
+            tags.append({"Key": self.FINGERPRINT_TAG, "Value": self._get_fingerprint()})
+        return tags
+
+    def _get_fingerprint(self) -> str:
+        """
+        Returns a fingerprint of everything an update of the Stack would send to
+        CloudFormation: the rendered template, the resolved parameters, the tags, the
+        notifications, the service role and the rollback setting.
+        """
+        if self._fingerprint is None:
+            configuration = {
+                "template": self.stack.template.body,
+                "parameters": self._format_parameters(self.stack.parameters),
+                "tags": {str(k): str(v) for k, v in self.stack.tags.items()},
+                "notifications": self.stack.notifications,
+                "cloudformation_service_role": self.stack.cloudformation_service_role,
+                "disable_rollback": self.stack.disable_rollback,
+            }
+            content = json.dumps(configuration, sort_keys=True, default=str)
+            self._fingerprint = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return self._fingerprint
+
+    def _is_unchanged(self) -> bool:
+        """
+        Returns True if the Stack has skip_unchanged set and the fingerprint tag of the Stack,
+        as described by the last _get_status() call, matches the Stack's current fingerprint.
+        """
+        if not self.stack.skip_unchanged or self._description is None:
+            return False
+
+        tags = {tag["Key"]: tag["Value"] for tag in self._description.get("Tags", [])}
+        if tags.get(self.FINGERPRINT_TAG) != self._get_fingerprint():
+            return False
+
+        self.logger.info(
+            "%s - Stack is unchanged since it was last deployed, skipping update",
+            self.stack.name,
+        )
+        return True
 
     @staticmethod
     def _get_simplified_status(status):
@@ -935,11 +1127,16 @@ class StackActions:
         :returns: The Change Set's status.
         :rtype: sceptre.stack_status.StackChangeSetStatus
         """
+        cancellation = get_cancellation()
+
         while True:
             status = self._get_cs_status(change_set_name)
             if status != StackChangeSetStatus.PENDING:
                 break
-            time.sleep(2)
+            if cancellation is None:
+                time.sleep(2)
+            elif cancellation.sleep(2):
+                cancellation.raise_if_cancelled(self.stack.name)
 
         return status
 
@@ -1138,6 +1335,7 @@ class StackActions:
         timeout = 300
         sleep_interval = 10
         elapsed = 0
+        cancellation = get_cancellation()
 
         while True:
             if elapsed >= timeout:
@@ -1150,7 +1348,10 @@ class StackActions:
             self._log_drift_status(response)
 
             if detection_status == "DETECTION_IN_PROGRESS":
-                time.sleep(sleep_interval)
+                if cancellation is None:
+                    time.sleep(sleep_interval)
+                elif cancellation.sleep(sleep_interval):
+                    cancellation.raise_if_cancelled(self.stack.name)
                 elapsed += sleep_interval
             else:
                 return response
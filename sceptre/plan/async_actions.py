@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+
+"""
+sceptre.plan.async_actions
+
+This module implements the AsyncStackActions class, which provides the long-running
+operations of a Stack as coroutines, so that many Stacks can wait on CloudFormation
+at once without holding a thread each.
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import Executor
+from typing import Optional
+
+import botocore
+
+from sceptre.exceptions import PlanCancelledError, StackDoesNotExistError
+from sceptre.hooks import execute_hooks
+from sceptre.plan.actions import StackActions
+from sceptre.plan.cancellation import get_cancellation
+from sceptre.stack import Stack
+from sceptre.stack_status import StackStatus
+from sceptre.tracing import span
+
+
+def add_async_stack_hooks(func):
+    """
+    A coroutine function decorator to trigger the before and after hooks, relative
+    to the decorated function's name. The hooks are run in the executor of the
+    AsyncStackActions, as they may block.
+
+    :param func: a coroutine function that operates on a stack
+    :type func: function
+    """
+
+    @functools.wraps(func)
+    async def decorated(self, *args, **kwargs):
+        await self._run(execute_hooks, self.stack.hooks.get("before_" + func.__name__))
+        response = await func(self, *args, **kwargs)
+        await self._run(execute_hooks, self.stack.hooks.get("after_" + func.__name__))
+
+        return response
+
+    return decorated
+
+
+class AsyncStackActions(object):
+    """
+    AsyncStackActions provides the operations of a Stack that wait for CloudFormation
+    as coroutines. Waits are cooperative, and each blocking call, such as a boto call,
+    rendering the template or running a hook, is run in the given executor.
+
+    Commands without a coroutine here are run as a whole in the executor with
+    StackActions, which is suitable for commands that do not wait.
+
+    :param stack: A Stack object
+    :type stack: sceptre.stack.Stack
+    :param executor: The executor that runs the blocking calls.
+    :type executor: concurrent.futures.Executor
+    """
+
+    # The same interval StackActions polls at, in seconds.
+    POLL_INTERVAL = 4
+
+    COROUTINE_COMMANDS = {
+        "create",
+        "update",
+        "launch",
+        "delete",
+        "execute_change_set",
+    }
+
+    def __init__(self, stack: Stack, executor: Executor):
+        self.stack = stack
+        self.name = self.stack.name
+        self.logger = logging.getLogger(__name__)
+        self.actions = StackActions(stack)
+        self.connection_manager = self.actions.connection_manager
+        self._executor = executor
+
+    async def run(self, command: str, *args):
+        """
+        Runs a command on the Stack.
+
+        :param command: The name of the StackActions command to run.
+        :param args: Any arguments that should be passed through to the command.
+        :returns: The response of the command.
+        """
+        if command in self.COROUTINE_COMMANDS:
+            return await getattr(self, command)(*args)
+        return await self._run(getattr(self.actions, command), *args)
+
+    @add_async_stack_hooks
+    async def create(self):
+        """
+        Creates a Stack, in the same way as StackActions.create().
+
+        :returns: The Stack's status.
+        :rtype: sceptre.stack_status.StackStatus
+        """
+        self.actions._protect_execution()
+        self.logger.info("%s - Creating Stack", self.stack.name)
+        create_stack_kwargs = await self._run(self.actions._create_stack_kwargs)
+
+        try:
+            response = await self._call("create_stack", create_stack_kwargs)
+
+            self.logger.debug(
+                "%s - Create stack response: %s", self.stack.name, response
+            )
+
+            status = await self._wait_for_completion(boto_response=response)
+        except botocore.exceptions.ClientError as exp:
+            status = self.actions._status_after_create_error(exp)
+
+        return status
+
+    @add_async_stack_hooks
+    async def update(self):
+        """
+        Updates the Stack, in the same way as StackActions.update().
+
+        :returns: The Stack's status.
+        :rtype: sceptre.stack_status.StackStatus
+        """
+        self.actions._protect_execution()
+        self.logger.info("%s - Updating Stack", self.stack.name)
+        try:
+            update_stack_kwargs = await self._run(self.actions._update_stack_kwargs)
+            response = await self._call("update_stack", update_stack_kwargs)
+            try:
+                status = await self._wait_for_completion(
+                    self.stack.stack_timeout, boto_response=response
+                )
+            except PlanCancelledError:
+                await self._run(self.actions._cancel_update_in_flight)
+                raise
+            self.logger.debug(
+                "%s - Update Stack response: %s", self.stack.name, response
+            )
+
+            # Cancel update after timeout
+            if status == StackStatus.IN_PROGRESS:
+                status = await self.cancel_stack_update()
+
+            return status
+        except botocore.exceptions.ClientError as exp:
+            return self.actions._status_after_update_error(exp)
+
+    async def cancel_stack_update(self):
+        """
+        Cancels a Stack update.
+
+        :returns: The cancelled Stack status.
+        :rtype: sceptre.stack_status.StackStatus
+        """
+        self.logger.warning(
+            "%s - Update Stack time exceeded the specified timeout", self.stack.name
+        )
+        response = await self._run(self.actions._request_update_cancellation)
+        return await self._wait_for_completion(boto_response=response)
+
+    @add_async_stack_hooks
+    async def launch(self) -> StackStatus:
+        """
+        Launches the Stack, in the same way as StackActions.launch().
+
+        :returns: The Stack's status.
+        """
+        self.actions._protect_execution()
+        self.logger.info(f"{self.stack.name} - Launching Stack")
+
+        action = await self._run(self.actions._get_launch_action)
+        if action == "recreate":
+            await self.delete()
+        if action in ["create", "recreate"]:
+            status = await self.create()
+        elif action == "update":
+            status = await self.update()
+        elif action == "skip":
+            status = StackStatus.COMPLETE
+        else:
+            status = StackStatus.IN_PROGRESS
+        return status
+
+    @add_async_stack_hooks
+    async def delete(self):
+        """
+        Deletes the Stack, in the same way as StackActions.delete().
+
+        :returns: The Stack's status.
+        :rtype: sceptre.stack_status.StackStatus
+        """
+        self.actions._protect_execution()
+
+        self.logger.info("%s - Deleting stack", self.stack.name)
+        if not await self._run(self.actions._exists):
+            return StackStatus.COMPLETE
+
+        delete_stack_kwargs = await self._run(self.actions._delete_stack_kwargs)
+        response = await self._call("delete_stack", delete_stack_kwargs)
+
+        try:
+            status = await self._wait_for_completion(boto_response=response)
+        except (StackDoesNotExistError, botocore.exceptions.ClientError) as error:
+            status = self.actions._status_after_delete_error(error)
+        self.logger.info("%s - delete %s", self.stack.name, status)
+        return status
+
+    @add_async_stack_hooks
+    async def execute_change_set(self, change_set_name):
+        """
+        Executes the Change Set ``change_set_name``, in the same way as
+        StackActions.execute_change_set().
+
+        :param change_set_name: The name of the Change Set.
+        :type change_set_name: str
+        :returns: The Stack status
+        :rtype: str
+        """
+        self.actions._protect_execution()
+        change_set = await self._run(self.actions.describe_change_set, change_set_name)
+
+        return_val = 0
+
+        if self.actions._change_set_has_no_changes(change_set):
+            return return_val
+
+        try:
+            response = await self._call(
+                "execute_change_set",
+                self.actions._execute_change_set_kwargs(change_set_name),
+            )
+            return_val = await self._wait_for_completion(boto_response=response)
+        except Exception as err:
+            self.actions._log_change_set_failure(change_set_name, err)
+
+        return return_val
+
+    async def _wait_for_completion(
+        self, timeout=0, boto_response: Optional[dict] = None
+    ) -> StackStatus:
+        """
+        Waits for a Stack operation to finish without blocking the event loop. Prints
+        CloudFormation events while it waits.
+
+        :param timeout: Timeout before returning, in minutes.
+        :param boto_response: Response from the boto call which initiated the stack change.
+
+        :returns: The final Stack status.
+        """
+        timeout = 60 * timeout
+
+        def timed_out(elapsed):
+            return elapsed >= timeout if timeout else False
+
+        status = StackStatus.IN_PROGRESS
+
+        most_recent_event_datetime = self.actions._events_start_datetime(boto_response)
+
+        cancellation = get_cancellation()
+
+        elapsed = 0
+        with span("wait for CloudFormation", "cloudformation", self.stack.name):
+            while status == StackStatus.IN_PROGRESS and not timed_out(elapsed):
+                status, most_recent_event_datetime = await self._run(
+                    self.actions._poll_completion, most_recent_event_datetime
+                )
+                if cancellation is None:
+                    await asyncio.sleep(self.POLL_INTERVAL)
+                else:
+                    await asyncio.sleep(cancellation.remaining(self.POLL_INTERVAL))
+                    if cancellation.cancelled:
+                        break
+                elapsed += self.POLL_INTERVAL
+
+        if status == StackStatus.IN_PROGRESS and cancellation is not None:
+            cancellation.raise_if_cancelled(self.stack.name)
+        return status
+
+    async def _call(self, command: str, kwargs: dict):
+        return await self._run(
+            functools.partial(
+                self.connection_manager.call,
+                service="cloudformation",
+                command=command,
+                kwargs=kwargs,
+            )
+        )
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+"""
+sceptre.plan.cancellation
+
+This module implements a CancellationToken, which stops the execution of a plan
+once its deadline expires or it is interrupted: Stacks that have not started are
+not started, and Stacks waiting on CloudFormation stop waiting.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterable, Optional
+
+from sceptre.exceptions import PlanCancelledError
+
+# The CancellationToken of the plan being executed, or None when no plan is executing. Like
+# the active Tracer, it is global, so that the wait loops of StackActions can check it from
+# any thread without a token being passed down to them.
+_CANCELLATION = None
+
+_cancellation_lock = threading.Lock()
+
+
+class CancellationToken(object):
+    """
+    CancellationToken is cancelled once its deadline expires, or once cancel() is called.
+    Waits made through it return as soon as it is cancelled. This class is thread-safe.
+
+    :param deadline: The number of seconds, from now, after which the token is cancelled,
+                     or None for no deadline.
+    :param cancel_in_flight: If True, the Stack updates still in progress when the token is
+                             cancelled are cancelled too, rather than left to complete in
+                             CloudFormation.
+    """
+
+    DEADLINE_EXPIRED = "the deadline expired"
+    INTERRUPTED = "the execution was interrupted"
+
+    def __init__(
+        self, deadline: Optional[float] = None, cancel_in_flight: bool = False
+    ):
+        self.deadline = None if deadline is None else time.monotonic() + deadline
+        self.cancel_in_flight = cancel_in_flight
+        self.reason: Optional[str] = None
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """True once the deadline has expired or the token was cancelled."""
+        if (
+            not self._event.is_set()
+            and self.deadline is not None
+            and time.monotonic() >= self.deadline
+        ):
+            self.cancel(self.DEADLINE_EXPIRED)
+        return self._event.is_set()
+
+    def cancel(self, reason: str):
+        """
+        Cancels the token, unless it is already cancelled.
+
+        :param reason: Why the token is cancelled, such as "the deadline expired".
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self.reason = reason
+                self._event.set()
+
+    def remaining(self, seconds: float) -> float:
+        """
+        Returns the given number of seconds, or the time left until the deadline if it is
+        sooner, which is never less than 0.
+
+        :param seconds: The number of seconds to wait for at most.
+        """
+        if self.deadline is None:
+            return seconds
+        return max(0.0, min(seconds, self.deadline - time.monotonic()))
+
+    def sleep(self, seconds: float) -> bool:
+        """
+        Sleeps for the given number of seconds, or until the token is cancelled.
+
+        :param seconds: The number of seconds to sleep for.
+        :returns: True if the token is cancelled.
+        """
+        self._event.wait(self.remaining(seconds))
+        return self.cancelled
+
+    def raise_if_cancelled(self, stack_name: str):
+        """
+        Raises a PlanCancelledError if the token is cancelled.
+
+        :param stack_name: The name of the Stack that stops waiting.
+        :raises: sceptre.exceptions.PlanCancelledError
+        """
+        if self.cancelled:
+            raise PlanCancelledError(
+                f"{stack_name} - Stopped waiting, as {self.reason}"
+            )
+
+
+@contextmanager
+def use_cancellation(token: CancellationToken):
+    """
+    A context manager that makes the token the one checked by everything run inside it.
+
+    :param token: The CancellationToken of the plan being executed.
+    """
+    global _CANCELLATION
+
+    with _cancellation_lock:
+        previous = _CANCELLATION
+        _CANCELLATION = token
+    try:
+        yield token
+    finally:
+        with _cancellation_lock:
+            _CANCELLATION = previous
+
+
+def get_cancellation() -> Optional[CancellationToken]:
+    """Returns the CancellationToken of the plan being executed, or None."""
+    return _CANCELLATION
+
+
+__all__: Iterable[str] = ("CancellationToken", "use_cancellation", "get_cancellation")
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+"""
+sceptre.plan.concurrency
+
+This module implements ConcurrencyLimits, which caps how many Stacks can be in
+flight at once for each account and region, and for each StackGroup, and
+AdaptiveConcurrency, which adapts how many Stacks can be in flight at once to
+the throttling of AWS API calls.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from sceptre.stack import Stack
+
+
+class ConcurrencyLimits(object):
+    """
+    ConcurrencyLimits tracks the Stacks in flight and decides whether another Stack can start
+    without exceeding any of the limits that apply to it.
+
+    A Stack's account is identified by its sceptre_role or, without one, by its profile. A
+    StackGroup limit applies to every Stack in the StackGroup, including the Stacks in the
+    StackGroups nested in it.
+
+    The limits are only checked once a Stack is ready to start, so a sceptre_role resolved
+    from the outputs of a dependency is only resolved after the dependency has completed.
+
+    :param account_region_limit: The maximum number of Stacks in flight for each account and
+                                 region, or None for no limit.
+    :param stack_group_limits: The maximum number of Stacks in flight in each StackGroup,
+                               keyed by the path of the StackGroup relative to the config
+                               directory ("" for the top-level StackGroup).
+    """
+
+    def __init__(
+        self,
+        account_region_limit: Optional[int] = None,
+        stack_group_limits: Optional[Dict[str, int]] = None,
+    ):
+        self.account_region_limit = account_region_limit
+        self.stack_group_limits = stack_group_limits or {}
+        self._in_flight = Counter()
+        self._keys: Dict[Stack, List[Tuple[Hashable, int]]] = {}
+
+    def __bool__(self):
+        return bool(self.account_region_limit or self.stack_group_limits)
+
+    def can_start(self, stack: Stack) -> bool:
+        """
+        Returns True if the Stack can start without exceeding any of its limits.
+
+        :param stack: The Stack to start.
+        """
+        return all(self._in_flight[key] < limit for key, limit in self._limits(stack))
+
+    def start(self, stack: Stack):
+        """
+        Counts a Stack as in flight.
+
+        :param stack: The Stack that started.
+        """
+        for key, _ in self._limits(stack):
+            self._in_flight[key] += 1
+
+    def finish(self, stack: Stack):
+        """
+        Stops counting a Stack as in flight.
+
+        :param stack: The Stack that completed.
+        """
+        for key, _ in self._limits(stack):
+            self._in_flight[key] -= 1
+
+    def _limits(self, stack: Stack) -> List[Tuple[Hashable, int]]:
+        if not self:
+            return []
+        if stack not in self._keys:
+            self._keys[stack] = self._limits_for(stack)
+        return self._keys[stack]
+
+    def _limits_for(self, stack: Stack) -> List[Tuple[Hashable, int]]:
+        limits = []
+        if self.account_region_limit:
+            account = stack.sceptre_role or stack.profile
+            limits.append(
+                (("account", account, stack.region), self.account_region_limit)
+            )
+        for group_path, limit in self.stack_group_limits.items():
+            if not group_path or stack.name.startswith(group_path.rstrip("/") + "/"):
+                limits.append((("stack_group", group_path), limit))
+        return limits
+
+
+class AdaptiveConcurrency(object):
+    """
+    AdaptiveConcurrency adapts the number of Stacks that can be in flight at once to the
+    throttling of AWS API calls, with additive increase, multiplicative decrease (AIMD): the
+    limit is halved whenever a call is throttled, and grows again by one for about every
+    limit calls that succeed, up to the maximum.
+
+    A burst of calls in flight when the API starts throttling is all throttled at once, so
+    the limit is halved at most once per cooldown. It is notified of the outcome of calls by
+    sceptre.connection_manager.observe_throttling, from any thread.
+
+    :param maximum: The largest number of Stacks in flight, which is also the initial limit.
+    :param minimum: The smallest number of Stacks in flight.
+    :param cooldown: The number of seconds after the limit is halved during which further
+                     throttled calls do not halve it again.
+    :param clock: The function returning the current time in seconds.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        minimum: int = 1,
+        cooldown: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.maximum = maximum
+        self.minimum = min(minimum, maximum)
+        self.cooldown = cooldown
+        self._clock = clock
+        self._limit = float(maximum)
+        self._last_decrease: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """The number of Stacks that can currently be in flight at once."""
+        return int(self._limit)
+
+    def throttled(self):
+        """
+        Halves the limit, unless it was halved less than cooldown seconds ago.
+        """
+        with self._lock:
+            now = self._clock()
+            if (
+                self._last_decrease is not None
+                and now - self._last_decrease < self.cooldown
+            ):
+                return
+            self._last_decrease = now
+            self._limit = max(self.minimum, self._limit / 2)
+            limit = self.limit
+        self.logger.info(
+            "AWS API calls are being throttled, reducing concurrency to %d", limit
+        )
+
+    def succeeded(self):
+        """
+        Grows the limit by the inverse of the limit, so that it grows by about one for every
+        limit successful calls.
+        """
+        with self._lock:
+            self._limit = min(self.maximum, self._limit + 1 / self._limit)
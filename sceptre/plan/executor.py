@@ -7,20 +7,63 @@ This module implements a SceptrePlanExecutor, which is responsible for
 executing the command specified in a SceptrePlan.
 """
 
+import asyncio
+import contextlib
+import heapq
+import itertools
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Set, Optional
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, List, Set, Optional
 
+from sceptre.config.graph import StackGraph
+from sceptre.connection_manager import observe_throttling
+from sceptre.exceptions import PlanCancelledError
 from sceptre.plan.actions import StackActions
+from sceptre.plan.async_actions import AsyncStackActions
+from sceptre.plan.cancellation import CancellationToken, use_cancellation
+from sceptre.plan.concurrency import AdaptiveConcurrency, ConcurrencyLimits
+from sceptre.plan.history import StackDurationHistory
+from sceptre.plan.journal import RunJournal
+from sceptre.plan.prefetch import StackPrefetcher
 from sceptre.stack import Stack
+from sceptre.stack_status import StackStatus
+from sceptre.tracing import Tracer, get_tracer, span
 
 
 class SceptrePlanExecutor(object):
+    BATCH = "batch"
+    STREAM = "stream"
+    SCHEDULERS = (BATCH, STREAM)
+
+    THREADS = "threads"
+    ASYNCIO = "asyncio"
+    ENGINES = (THREADS, ASYNCIO)
+
+    # The number of threads the asyncio engine runs blocking calls, such as boto calls and
+    # hooks, in. Waiting Stacks do not hold a thread, so this does not limit how many Stacks
+    # can be in flight.
+    ASYNC_IO_THREADS = 16
+
+    # The commands that upload templates and resolve parameters, and so can prepare the
+    # Stacks waiting on their dependencies.
+    PREFETCHED_COMMANDS = ("create", "update", "launch")
+
     def __init__(
         self,
         command: str,
         launch_order: List[Set[Stack]],
         max_concurrency: Optional[int],
+        scheduler: str = BATCH,
+        graph: Optional[StackGraph] = None,
+        history: Optional[StackDurationHistory] = None,
+        continue_on_failure: bool = False,
+        engine: str = THREADS,
+        limits: Optional[ConcurrencyLimits] = None,
+        journal: Optional[RunJournal] = None,
+        adaptive_concurrency: bool = False,
+        prefetch: bool = False,
+        cancellation: Optional[CancellationToken] = None,
     ):
         """
         Initialises a SceptrePlanExecutor, generates the launch order, threads
@@ -32,42 +75,574 @@ class SceptrePlanExecutor(object):
 
         :param max_concurrency: Maximum number of threads to use for concurrent execution.
                                 If None, uses the natural concurrency limit based on the largest batch.
+
+        :param scheduler: How Stacks are scheduled. "batch" executes the launch_order one set at
+                          a time, waiting for every Stack in a set before starting the next one.
+                          "stream" starts each Stack as soon as all of its own dependencies have
+                          completed.
+
+        :param graph: The StackGraph the launch_order was generated from, already filtered and
+                      oriented for the command. It is used to schedule Stacks by their own
+                      dependencies and to start the Stacks on the longest chains first; if None,
+                      Stacks are treated as having no dependencies on each other.
+
+        :param history: The durations of previous executions of the command. If given, the
+                        duration of each Stack execution is recorded to it, and the recorded
+                        durations weigh the chains when choosing which ready Stack starts first.
+
+        :param continue_on_failure: If True, a Stack that fails or raises an error does not stop
+                                    the execution. Only the Stacks that depend on it, directly
+                                    or transitively, are skipped; every other Stack still runs,
+                                    and a report of the succeeded, failed and skipped Stacks is
+                                    logged at the end.
+
+        :param engine: How Stacks are executed. "threads" runs each Stack in flight in its own
+                       thread. "asyncio" runs the Stacks as coroutines on an event loop, so that
+                       Stacks waiting on CloudFormation do not hold a thread, and runs the
+                       blocking calls in a small, shared pool of threads.
+
+        :param limits: Limits on the number of Stacks in flight for each account and region,
+                       and for each StackGroup. A ready Stack whose limits are reached waits,
+                       without holding a thread, while Stacks with free capacity start ahead
+                       of it.
+
+        :param journal: The journal of the run. If given, the status every Stack completes
+                        with, or is skipped with, is appended to it as soon as it is known.
+
+        :param adaptive_concurrency: If True, the number of Stacks in flight is halved whenever
+                                     an AWS API call is throttled, and grows back by one at a
+                                     time while calls succeed, up to the number of threads.
+
+        :param prefetch: If True, and the command is one of PREFETCHED_COMMANDS, the Stacks that
+                         are waiting for their dependencies are prepared in the background,
+                         in the order they are expected to start: their templates are rendered
+                         and uploaded, and their resolvers that do not depend on other Stacks
+                         are resolved.
+
+        :param cancellation: The CancellationToken of the execution. Once it is cancelled,
+                             because its deadline expired or the execution was interrupted,
+                             no more Stacks are started, the Stacks waiting on CloudFormation
+                             stop waiting, and a PlanCancelledError is raised. If None, the
+                             execution can only be cancelled by interrupting it.
         """
 
         self.logger = logging.getLogger(__name__)
         self.command = command
         self.launch_order = launch_order
-        # Select the number of threads based upon the max batch size,
-        # or use 1 if all batches are empty
-        natural_concurrency = len(max(launch_order, key=len)) or 1
+        if scheduler not in self.SCHEDULERS:
+            raise ValueError(
+                f"Unknown scheduler '{scheduler}'. Valid schedulers are: {self.SCHEDULERS}"
+            )
+        self.scheduler = scheduler
+        if engine not in self.ENGINES:
+            raise ValueError(
+                f"Unknown engine '{engine}'. Valid engines are: {self.ENGINES}"
+            )
+        self.engine = engine
+        self.graph = graph
+        self.history = history
+        self.continue_on_failure = continue_on_failure
+        self.limits = limits if limits is not None else ConcurrencyLimits()
+        self.journal = journal
+
+        if self.scheduler == self.STREAM:
+            # Without wave barriers, any number of Stacks without a path between them in the
+            # graph can be in flight at once, which can exceed the size of the largest batch.
+            natural_concurrency = sum(len(batch) for batch in launch_order) or 1
+        else:
+            # Select the number of threads based upon the max batch size,
+            # or use 1 if all batches are empty
+            natural_concurrency = len(max(launch_order, key=len)) or 1
         if max_concurrency is not None and max_concurrency > 0:
             self.num_threads = min(max_concurrency, natural_concurrency)
         else:
             self.num_threads = natural_concurrency
 
+        self.adaptive = None
+        if adaptive_concurrency:
+            self.adaptive = AdaptiveConcurrency(self.num_threads)
+
+        self.prefetch = prefetch and command in self.PREFETCHED_COMMANDS
+        self._prefetcher: Optional[StackPrefetcher] = None
+
+        self.cancellation = (
+            cancellation if cancellation is not None else CancellationToken()
+        )
+
     def execute(self, *args):
         """
         Execute is responsible executing the sets of Stacks in launch_order
         concurrently, in the correct order.
 
+        :param args: Any arguments that should be passed through to the
+                StackAction being called.
+        """
+        if self.scheduler == self.STREAM:
+            schedule = _StreamSchedule(self)
+        else:
+            schedule = _BatchSchedule(self)
+
+        # Every Stack's AWS API calls are observed, so that throttling reduces concurrency.
+        observer = self.adaptive
+        with contextlib.ExitStack() as contexts:
+            contexts.enter_context(use_cancellation(self.cancellation))
+            if observer:
+                contexts.enter_context(observe_throttling(observer))
+            if self.prefetch:
+                # The Stacks that are not ready yet are prepared while they wait.
+                self._prefetcher = contexts.enter_context(StackPrefetcher())
+                self._prefetcher.prefetch(schedule.waiting())
+            try:
+                if self.engine == self.ASYNCIO:
+                    responses = asyncio.run(self._execute_async(schedule, *args))
+                else:
+                    responses = self._execute_threads(schedule, *args)
+            finally:
+                self._prefetcher = None
+
+        if self.cancellation.cancelled:
+            self._skip_unstarted(responses)
+        if self.continue_on_failure:
+            self._log_report(responses)
+        if self.cancellation.cancelled:
+            raise PlanCancelledError(
+                f"{self.command} was cancelled, as {self.cancellation.reason}"
+            )
+        return responses
+
+    def _execute_threads(self, schedule: "_Schedule", *args):
+        """
+        Executes the Stacks in the schedule in a pool of num_threads threads, starting each
+        Stack as soon as the schedule allows it.
+
+        :param schedule: The schedule deciding which Stacks can start.
         :param args: Any arguments that should be passed through to the
                 StackAction being called.
         """
         responses = {}
 
         with ThreadPoolExecutor(max_workers=self.num_threads) as executor:
-            for batch in self.launch_order:
-                futures = [
-                    executor.submit(self._execute, stack, *args) for stack in batch
-                ]
+            in_flight = {}
+            try:
+                while self._can_start(schedule) or in_flight:
+                    while self._can_start(schedule) and (
+                        len(in_flight) < self._concurrency()
+                    ):
+                        stack = schedule.pop()
+                        if stack is None:
+                            break
+                        future = executor.submit(self._execute, stack, *args)
+                        in_flight[future] = stack
 
-                for future in as_completed(futures):
-                    stack, status = future.result()
-                    responses[stack] = status
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        del in_flight[future]
+                        stack, status = future.result()
+                        schedule.complete(stack, status, responses)
+            except KeyboardInterrupt:
+                # Leaving the ThreadPoolExecutor waits for its threads, so the Stacks in
+                # flight are told to stop waiting on CloudFormation first.
+                self.cancellation.cancel(CancellationToken.INTERRUPTED)
+                raise
 
         return responses
 
+    async def _execute_async(self, schedule: "_Schedule", *args):
+        """
+        Executes the Stacks in the schedule as coroutines, with the same scheduling as the
+        threads engine. At most num_threads Stacks are in flight at once.
+
+        :param schedule: The schedule deciding which Stacks can start.
+        :param args: Any arguments that should be passed through to the
+                StackAction being called.
+        """
+        responses = {}
+        io_threads = min(self.num_threads, self.ASYNC_IO_THREADS)
+
+        with ThreadPoolExecutor(max_workers=io_threads) as io_executor:
+            in_flight = set()
+            try:
+                while self._can_start(schedule) or in_flight:
+                    while self._can_start(schedule) and (
+                        len(in_flight) < self._concurrency()
+                    ):
+                        stack = schedule.pop()
+                        if stack is None:
+                            break
+                        coroutine = self._execute_coroutine(io_executor, stack, *args)
+                        in_flight.add(asyncio.ensure_future(coroutine))
+
+                    done, in_flight = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        stack, status = task.result()
+                        schedule.complete(stack, status, responses)
+            except (asyncio.CancelledError, KeyboardInterrupt):
+                self.cancellation.cancel(CancellationToken.INTERRUPTED)
+                raise
+            finally:
+                # Wait for the Stacks still in flight, like leaving a ThreadPoolExecutor does,
+                # so an error in one Stack does not abandon the others mid-update.
+                if in_flight:
+                    await asyncio.wait(in_flight)
+
+        return responses
+
+    def _can_start(self, schedule: "_Schedule") -> bool:
+        """
+        Returns True if the schedule has ready Stacks and the execution is not cancelled.
+        """
+        return bool(schedule) and not self.cancellation.cancelled
+
+    def _concurrency(self) -> int:
+        """
+        Returns the number of Stacks that can currently be in flight at once.
+        """
+        if self.adaptive is not None:
+            return self.adaptive.limit
+        return self.num_threads
+
+    def _critical_path_lengths(self) -> Dict[Stack, float]:
+        """
+        Returns, for every Stack, the expected duration of the longest chain of Stacks that
+        starts with it and continues through the Stacks waiting on it.
+
+        Each planned Stack is weighted by its duration in the history, or by the mean recorded
+        duration when it has none. Without a history, every planned Stack weighs the same and
+        the lengths are the number of planned Stacks on the longest chain.
+        """
+        planned = set(itertools.chain.from_iterable(self.launch_order))
+
+        def weight(stack: Stack) -> float:
+            if stack not in planned:
+                return 0.0
+            if self.history is None:
+                return 1.0
+            duration = self.history.duration(stack.name)
+            return duration if duration is not None else default_duration
+
+        default_duration = self.history.default_duration() if self.history else 1.0
+        lengths = {stack: weight(stack) for stack in planned}
+        if self.graph is None:
+            return lengths
+
+        # Walk the graph from the Stacks nothing waits on back to the Stacks they wait on, so
+        # every Stack is visited after all the Stacks that follow it.
+        remaining = {
+            stack: len(list(self.graph.successors(stack))) for stack in self.graph
+        }
+        to_visit = [stack for stack, count in remaining.items() if count == 0]
+        while to_visit:
+            stack = to_visit.pop()
+            longest_follower = max(
+                (lengths[dependent] for dependent in self.graph.successors(stack)),
+                default=0.0,
+            )
+            lengths[stack] = weight(stack) + longest_follower
+            for dependency in self.graph.predecessors(stack):
+                remaining[dependency] -= 1
+                if remaining[dependency] == 0:
+                    to_visit.append(dependency)
+
+        return lengths
+
+    def _pending_dependencies(self, planned: Set[Stack]) -> Dict[Stack, Set[Stack]]:
+        """
+        Returns, for every Stack that has to be scheduled, the set of Stacks it waits for.
+
+        :param planned: The Stacks in the launch_order.
+        """
+        waiting_on = {stack: set() for stack in planned}
+        if self.graph is not None:
+            for stack in self.graph:
+                waiting_on[stack] = set(self.graph.predecessors(stack))
+        return waiting_on
+
+    def _unblocked_by(
+        self, completed: Stack, waiting_on: Dict[Stack, Set[Stack]]
+    ) -> List[Stack]:
+        """
+        Marks a Stack as completed and returns the Stacks that no longer wait on anything.
+        """
+        unblocked = []
+        if self.graph is None or completed not in self.graph:
+            return unblocked
+
+        for dependent in self.graph.successors(completed):
+            pending = waiting_on[dependent]
+            pending.discard(completed)
+            if not pending:
+                unblocked.append(dependent)
+        return unblocked
+
+    def _ready_stacks(
+        self,
+        unblocked: List[Stack],
+        waiting_on: Dict[Stack, Set[Stack]],
+        planned: Set[Stack],
+    ) -> List[Stack]:
+        """
+        Returns the unblocked Stacks that should be executed.
+
+        Stacks that are in the graph but were removed from the launch_order after it was
+        generated (such as ignored or obsolete Stacks) are never executed. They complete as soon
+        as they are unblocked, so that the ordering of the Stacks around them is kept.
+        """
+        ready = []
+        while unblocked:
+            stack = unblocked.pop()
+            if stack in planned:
+                ready.append(stack)
+            else:
+                unblocked.extend(self._unblocked_by(stack, waiting_on))
+        return ready
+
+    def _has_failed(self, status) -> bool:
+        """
+        Returns True if the status of a Stack should stop the Stacks that depend on it.
+        """
+        return self.continue_on_failure and status == StackStatus.FAILED
+
+    def _skip_dependents(
+        self, failed: Stack, responses: Dict[Stack, str], planned: Set[Stack]
+    ):
+        """
+        Marks every planned Stack that depends on a failed Stack, directly or through other
+        Stacks, as skipped.
+        """
+        if self.graph is None or failed not in self.graph:
+            return
+
+        to_visit = list(self.graph.successors(failed))
+        visited = set()
+        while to_visit:
+            stack = to_visit.pop()
+            if stack in visited:
+                continue
+            visited.add(stack)
+            if stack in planned and stack not in responses:
+                self.logger.info(
+                    "%s - Skipping, as it depends on %s which failed",
+                    stack.name,
+                    failed.name,
+                )
+                responses[stack] = StackStatus.SKIPPED
+                self._record_outcome(stack, StackStatus.SKIPPED)
+            to_visit.extend(self.graph.successors(stack))
+
+    def _skip_unstarted(self, responses: Dict[Stack, str]):
+        """
+        Marks every planned Stack that was not started before the execution was cancelled
+        as skipped.
+        """
+        for stack in itertools.chain.from_iterable(self.launch_order):
+            if stack not in responses:
+                self.logger.info(
+                    "%s - Skipping, as %s", stack.name, self.cancellation.reason
+                )
+                responses[stack] = StackStatus.SKIPPED
+                self._record_outcome(stack, StackStatus.SKIPPED)
+
+    def _log_report(self, responses: Dict[Stack, str]):
+        """
+        Logs which Stacks succeeded, failed and were skipped.
+        """
+        outcomes = {"succeeded": [], "failed": [], "skipped": []}
+        for stack, status in responses.items():
+            if status == StackStatus.FAILED:
+                outcomes["failed"].append(stack.name)
+            elif status == StackStatus.SKIPPED:
+                outcomes["skipped"].append(stack.name)
+            else:
+                outcomes["succeeded"].append(stack.name)
+
+        self.logger.info(
+            "%s report: %d succeeded, %d failed, %d skipped",
+            self.command,
+            len(outcomes["succeeded"]),
+            len(outcomes["failed"]),
+            len(outcomes["skipped"]),
+        )
+        for outcome, names in outcomes.items():
+            for name in sorted(names):
+                self.logger.info("%s - %s", name, outcome)
+
     def _execute(self, stack, *args):
         actions = StackActions(stack)
-        result = getattr(actions, self.command)(*args)
+        start = time.monotonic()
+        try:
+            with span(self.command, Tracer.STACK, stack.name):
+                if self._prefetcher is not None:
+                    self._prefetcher.claim(stack)
+                result = getattr(actions, self.command)(*args)
+        except Exception as err:
+            if not self.continue_on_failure:
+                self._record_outcome(stack, StackStatus.FAILED)
+                raise
+            result = self._failed(stack, err)
+        self._record_duration(stack, start)
+        self._record_outcome(stack, result)
         return stack, result
+
+    async def _execute_coroutine(self, io_executor, stack, *args):
+        actions = AsyncStackActions(stack, io_executor)
+        start = time.monotonic()
+        try:
+            with span(self.command, Tracer.STACK, stack.name):
+                if self._prefetcher is not None:
+                    await asyncio.get_running_loop().run_in_executor(
+                        io_executor, self._prefetcher.claim, stack
+                    )
+                result = await actions.run(self.command, *args)
+        except Exception as err:
+            if not self.continue_on_failure:
+                self._record_outcome(stack, StackStatus.FAILED)
+                raise
+            result = self._failed(stack, err)
+        self._record_duration(stack, start)
+        self._record_outcome(stack, result)
+        return stack, result
+
+    def _failed(self, stack: Stack, err: Exception) -> str:
+        self.logger.error("%s - %s failed: %s", stack.name, self.command, err)
+        self.logger.debug("%s - %s failed", stack.name, self.command, exc_info=True)
+        return StackStatus.FAILED
+
+    def _record_duration(self, stack: Stack, start: float):
+        if self.history is not None:
+            self.history.record(stack.name, time.monotonic() - start)
+
+    def _record_outcome(self, stack: Stack, status: str):
+        if self.journal is not None:
+            self.journal.record(stack.name, status)
+
+
+class _Schedule(object):
+    """
+    Decides which Stack of an execution starts next. When more Stacks can start than there
+    are free slots, the Stacks heading the longest remaining chains start first, unless their
+    concurrency limits are reached.
+
+    :param executor: The SceptrePlanExecutor running the Stacks.
+    """
+
+    def __init__(self, executor: SceptrePlanExecutor):
+        self._executor = executor
+        self._limits = executor.limits
+        self._planned = set(itertools.chain.from_iterable(executor.launch_order))
+        self._priorities = executor._critical_path_lengths()
+        self._ready = []
+        self._ready_since: Dict[Stack, float] = {}
+        self._pushed: Set[Stack] = set()
+        self._counter = itertools.count()
+
+    def __bool__(self):
+        return bool(self._ready)
+
+    def pop(self) -> Optional[Stack]:
+        """
+        Returns the ready Stack with the highest priority that is within its concurrency
+        limits and counts it as in flight, or returns None if no ready Stack can start.
+        """
+        blocked = []
+        stack = None
+        while self._ready:
+            entry = heapq.heappop(self._ready)
+            if self._limits.can_start(entry[-1]):
+                stack = entry[-1]
+                break
+            blocked.append(entry)
+
+        for entry in blocked:
+            heapq.heappush(self._ready, entry)
+        if stack is not None:
+            self._limits.start(stack)
+            self._trace_queued(stack)
+        return stack
+
+    def waiting(self) -> List[Stack]:
+        """
+        Returns the planned Stacks that are not ready yet, the Stacks heading the longest
+        remaining chains first.
+        """
+        waiting = [stack for stack in self._planned if stack not in self._pushed]
+        return sorted(waiting, key=lambda stack: (-self._priorities[stack], stack.name))
+
+    def complete(self, stack: Stack, status: str, responses: Dict[Stack, str]):
+        """
+        Records the status of a completed Stack.
+        """
+        self._limits.finish(stack)
+        responses[stack] = status
+        if self._executor._has_failed(status):
+            self._executor._skip_dependents(stack, responses, self._planned)
+
+    def _push(self, stacks: Iterable[Stack]):
+        now = time.perf_counter()
+        for stack in stacks:
+            self._pushed.add(stack)
+            self._ready_since[stack] = now
+            heapq.heappush(
+                self._ready,
+                (-self._priorities[stack], stack.name, next(self._counter), stack),
+            )
+
+    def _trace_queued(self, stack: Stack):
+        # The time a Stack spent ready, but waiting for a free slot or for its limits.
+        ready_since = self._ready_since.pop(stack)
+        tracer = get_tracer()
+        if tracer is not None:
+            tracer.add("queued", "queue", ready_since, time.perf_counter(), stack.name)
+
+
+class _BatchSchedule(_Schedule):
+    """
+    Starts the sets of Stacks in launch_order one at a time, once every Stack in the previous
+    set has completed.
+    """
+
+    def __init__(self, executor: SceptrePlanExecutor):
+        super().__init__(executor)
+        self._batches = iter(executor.launch_order)
+        self._remaining = set()
+        self._next_batch({})
+
+    def complete(self, stack: Stack, status: str, responses: Dict[Stack, str]):
+        super().complete(stack, status, responses)
+        self._remaining.discard(stack)
+        self._next_batch(responses)
+
+    def _next_batch(self, responses: Dict[Stack, str]):
+        while not self._remaining:
+            batch = next(self._batches, None)
+            if batch is None:
+                return
+            # Stacks that were skipped because a dependency failed already have a response.
+            self._remaining = {stack for stack in batch if stack not in responses}
+            self._push(self._remaining)
+
+
+class _StreamSchedule(_Schedule):
+    """
+    Starts every Stack as soon as all of its predecessors in the graph have completed.
+    """
+
+    def __init__(self, executor: SceptrePlanExecutor):
+        super().__init__(executor)
+        self._waiting_on = executor._pending_dependencies(self._planned)
+
+        unblocked = [
+            stack for stack, pending in self._waiting_on.items() if not pending
+        ]
+        self._push(executor._ready_stacks(unblocked, self._waiting_on, self._planned))
+
+    def complete(self, stack: Stack, status: str, responses: Dict[Stack, str]):
+        super().complete(stack, status, responses)
+        if self._executor._has_failed(status):
+            # The Stacks waiting on a failed Stack are never unblocked.
+            return
+        unblocked = self._executor._unblocked_by(stack, self._waiting_on)
+        self._push(
+            self._executor._ready_stacks(unblocked, self._waiting_on, self._planned)
+        )
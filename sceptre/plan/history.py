@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+"""
+sceptre.plan.history
+
+This module implements a StackDurationHistory, which records how long Stacks
+took to execute a command so later runs can schedule the slowest chains first.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Dict, Optional
+
+
+class StackDurationHistory(object):
+    """
+    StackDurationHistory keeps the durations of Stack executions from previous
+    runs in a JSON file, keyed by command and Stack name.
+
+    Recorded durations are smoothed with the previously stored value so that a
+    single unusually slow or fast run does not dominate the schedule.
+
+    :param path: The path to the JSON file holding the history.
+    :param command: The command whose durations are read and recorded.
+    """
+
+    SMOOTHING = 0.5
+
+    def __init__(self, path: str, command: str):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.command = command
+
+        self._lock = threading.Lock()
+        self._history = self._load()
+        self._durations: Dict[str, float] = self._history.setdefault(command, {})
+        self._updated = False
+
+    def duration(self, stack_name: str) -> Optional[float]:
+        """
+        Returns the expected duration of the command for a Stack, in seconds.
+
+        :param stack_name: The name of the Stack.
+        :returns: The expected duration, or None if the Stack has no history.
+        """
+        return self._durations.get(stack_name)
+
+    def default_duration(self) -> float:
+        """
+        Returns the duration to assume for Stacks without any history, which is
+        the mean of all the recorded durations for the command.
+        """
+        if not self._durations:
+            return 1.0
+        return sum(self._durations.values()) / len(self._durations)
+
+    def record(self, stack_name: str, seconds: float):
+        """
+        Records how long the command took for a Stack. This method is thread-safe.
+
+        :param stack_name: The name of the Stack.
+        :param seconds: The duration of the command, in seconds.
+        """
+        with self._lock:
+            previous = self._durations.get(stack_name)
+            if previous is not None:
+                seconds = self.SMOOTHING * previous + (1 - self.SMOOTHING) * seconds
+            self._durations[stack_name] = round(seconds, 3)
+            self._updated = True
+
+    def save(self):
+        """
+        Writes the history back to its JSON file, creating the directory if needed.
+        Nothing is written if no durations were recorded.
+
+        The history only orders Stacks, so a history that cannot be written, such as in a
+        read-only checkout, is logged and otherwise ignored rather than failing the command.
+        """
+        if not self._updated:
+            return
+
+        with self._lock:
+            content = json.dumps(self._history, indent=2, sort_keys=True)
+
+        directory = os.path.dirname(self.path)
+        temp_name = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # Write to a temporary file first so a crash cannot leave a truncated history
+            # behind.
+            with tempfile.NamedTemporaryFile(
+                mode="w", dir=directory, delete=False, suffix=".tmp"
+            ) as temp_file:
+                temp_name = temp_file.name
+                temp_file.write(content)
+            os.replace(temp_name, self.path)
+        except OSError as err:
+            self.logger.warning(
+                "Could not save stack duration history %s: %s", self.path, err
+            )
+            if temp_name is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(temp_name)
+
+    def _load(self) -> dict:
+        if not os.path.isfile(self.path):
+            return {}
+        try:
+            with open(self.path) as f:
+                history = json.load(f)
+        except (OSError, ValueError) as err:
+            self.logger.debug(
+                "Ignoring unreadable stack duration history %s: %s", self.path, err
+            )
+            return {}
+        return history if isinstance(history, dict) else {}
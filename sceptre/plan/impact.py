@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+
+"""
+sceptre.plan.impact
+
+This module implements a ChangeImpact, which maps the files changed in a
+project to the Stacks that are read or rendered from them.
+"""
+
+import ast
+import logging
+import subprocess
+from os import path
+from typing import Dict, Iterable, List, Set, Tuple
+
+from jinja2 import Environment, meta
+
+from sceptre.config.reader import ConfigReader
+from sceptre.context import SceptreContext
+from sceptre.exceptions import ChangedFilesError
+from sceptre.resolvers import CustomYamlTagBase
+from sceptre.resolvers.file_contents import FileContents
+from sceptre.stack import Stack
+from sceptre.template_handlers import TemplateHandler
+
+JINJA = "jinja"
+PYTHON = "python"
+
+
+def changed_files_since(project_path: str, ref: str) -> List[str]:
+    """
+    Returns the files changed in the git repository of a project since a git ref,
+    including the changes in the working tree and the untracked files.
+
+    :param project_path: The path of the Sceptre project.
+    :param ref: The git ref to compare against, such as a branch, tag or commit.
+    :returns: The absolute paths of the changed files.
+    :raises: sceptre.exceptions.ChangedFilesError
+    """
+    top_level = _git(project_path, "rev-parse", "--show-toplevel").strip()
+    changed = _git(project_path, "diff", "--name-only", "-z", ref, "--")
+    untracked = _git(
+        project_path, "ls-files", "--others", "--exclude-standard", "--full-name", "-z"
+    )
+    return [
+        path.join(top_level, name) for name in (changed + untracked).split("\0") if name
+    ]
+
+
+def _git(project_path: str, *args: str) -> str:
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=project_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except FileNotFoundError as err:
+        raise ChangedFilesError(f"Cannot list the changed files: {err}") from err
+    except subprocess.CalledProcessError as err:
+        raise ChangedFilesError(
+            f"Cannot list the changed files: {err.stderr.strip()}"
+        ) from err
+    return result.stdout
+
+
+class ChangeImpact(object):
+    """
+    ChangeImpact finds the Stacks affected by a set of changed files. A Stack is
+    affected by a change to:
+
+    * its config file, or the config files it inherits from, including the config.yaml of
+      each of its StackGroups, and the templates these include or import,
+    * its template, if it uses the file template handler, the templates a Jinja template
+      includes or imports, and the modules of the project a Python template imports,
+    * the files read by its ``!file_contents`` resolvers,
+    * the var files the command was run with.
+
+    :param context: The context of the command.
+    :param config_reader: The ConfigReader that read the config of the Stacks.
+    """
+
+    def __init__(self, context: SceptreContext, config_reader: ConfigReader):
+        self.logger = logging.getLogger(__name__)
+        self.context = context
+        self.config_reader = config_reader
+        self._references: Dict[Tuple[str, str, str], Tuple[Set[str], Set[str]]] = {}
+
+    def affected_stacks(
+        self, stacks: Iterable[Stack], changed_files: Iterable[str]
+    ) -> Set[Stack]:
+        """
+        Returns the Stacks affected by the changed files.
+
+        :param stacks: The Stacks to check.
+        :param changed_files: The paths of the changed files, absolute or relative to the
+            current working directory.
+        :returns: The affected Stacks.
+        """
+        changed = {_absolute(changed_file) for changed_file in changed_files}
+        if changed & {_absolute(var_file) for var_file in self.context.var_files}:
+            return set(stacks)
+
+        affected = set()
+        for stack in stacks:
+            files, directories = self.stack_files(stack)
+            if changed & files or any(
+                changed_file.startswith(directory)
+                for changed_file in changed
+                for directory in directories
+            ):
+                self.logger.debug("%s is affected by the changed files", stack.name)
+                affected.add(stack)
+        return affected
+
+    def stack_files(self, stack: Stack) -> Tuple[Set[str], Set[str]]:
+        """
+        Returns the files a Stack is read or rendered from.
+
+        :param stack: The Stack.
+        :returns: The absolute paths of the files, and of the directories every file of
+            which the Stack may be rendered from, each ending with a separator.
+        """
+        files, directories = set(), set()
+        config_path = self.context.full_config_path()
+        for rel_path in self.config_reader.config_file_paths(stack.name + ".yaml"):
+            config_file = path.join(config_path, rel_path)
+            files.add(config_file)
+            self._add_referenced_files(config_file, JINJA, files, directories)
+
+        template_file = self._template_file(stack)
+        if template_file is not None:
+            files.add(template_file)
+            extension = path.splitext(template_file)[1]
+            if extension in TemplateHandler.jinja_template_extensions:
+                self._add_referenced_files(template_file, JINJA, files, directories)
+            elif extension in TemplateHandler.python_template_extensions:
+                self._add_referenced_files(template_file, PYTHON, files, directories)
+
+        for config in (stack.config, stack.stack_group_config):
+            files.update(_absolute(file) for file in _file_contents_paths(config))
+        return files, directories
+
+    def _template_file(self, stack: Stack):
+        handler_config = stack.config.get("template")
+        if handler_config is None and stack.config.get("template_path") is not None:
+            handler_config = {"path": stack.config["template_path"]}
+        if not isinstance(handler_config, dict):
+            return None
+        if handler_config.get("type", "file") != "file":
+            return None
+        template_path = handler_config.get("path")
+        if not isinstance(template_path, str):
+            return None
+        return path.normpath(
+            path.join(self.context.full_templates_path(), template_path)
+        )
+
+    def _add_referenced_files(
+        self, file_path: str, kind: str, files: Set[str], directories: Set[str]
+    ):
+        """
+        Adds the files a Jinja template includes or imports, or the modules a Python
+        template imports, directly or through the files it references. The templates a
+        Jinja template references are all looked up in the directory of that template.
+        """
+        root = path.dirname(file_path)
+        to_visit = [file_path]
+        visited = set()
+        while to_visit:
+            current = to_visit.pop()
+            if current in visited:
+                continue
+            visited.add(current)
+            referenced, referenced_directories = self._referenced_files(
+                current, kind, root
+            )
+            files.update(referenced)
+            directories.update(referenced_directories)
+            to_visit.extend(referenced)
+
+    def _referenced_files(
+        self, file_path: str, kind: str, root: str
+    ) -> Tuple[Set[str], Set[str]]:
+        key = (file_path, kind, root)
+        if key not in self._references:
+            if not path.isfile(file_path):
+                references = (set(), set())
+            elif kind == PYTHON:
+                references = (self._python_imports(file_path), set())
+            else:
+                references = _jinja_references(file_path, root)
+            self._references[key] = references
+        return self._references[key]
+
+    def _python_imports(self, file_path: str) -> Set[str]:
+        """
+        Returns the modules of the project a Python template imports. A template is run
+        with every directory between the current working directory and the template on
+        the Python path, so its imports are looked up in each of those directories.
+        """
+        try:
+            with open(file_path) as python_file:
+                tree = ast.parse(python_file.read(), filename=file_path)
+        except (OSError, SyntaxError, ValueError) as err:
+            self.logger.debug("Cannot read the imports of %s: %s", file_path, err)
+            return set()
+
+        search_paths = _directories_between(path.dirname(file_path), path.abspath("."))
+        imports = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+                roots = search_paths
+            elif isinstance(node, ast.ImportFrom):
+                module = (node.module or "").replace(".", path.sep)
+                if node.level:
+                    base = path.dirname(file_path)
+                    for _ in range(node.level - 1):
+                        base = path.dirname(base)
+                    roots = [base]
+                else:
+                    roots = search_paths
+                names = [module] + [
+                    path.join(module, alias.name) for alias in node.names
+                ]
+            else:
+                continue
+            for name in names:
+                module_path = name.replace(".", path.sep)
+                for root in roots:
+                    for candidate in (
+                        path.join(root, module_path + ".py"),
+                        path.join(root, module_path, "__init__.py"),
+                    ):
+                        if path.isfile(candidate):
+                            imports.add(path.normpath(candidate))
+        return imports
+
+
+def _jinja_references(file_path: str, directory: str) -> Tuple[Set[str], Set[str]]:
+    """
+    Returns the templates a Jinja template includes, imports or extends, which are
+    looked up in the given directory. If a template is only known once the template is
+    rendered, any file in that directory may be used.
+    """
+    try:
+        with open(file_path) as template_file:
+            source = template_file.read()
+        names = list(meta.find_referenced_templates(Environment().parse(source)))
+    except Exception:
+        # Config files and templates that are not Jinja templates reference nothing.
+        return set(), set()
+
+    files, directories = set(), set()
+    for name in names:
+        if name is None:
+            directories.add(path.join(directory, ""))
+        else:
+            files.add(path.normpath(path.join(directory, name)))
+    return files, directories
+
+
+def _file_contents_paths(value) -> Iterable[str]:
+    """
+    Yields the paths read by the ``!file_contents`` resolvers in a config, including
+    those nested in the arguments of other resolvers.
+    """
+    if isinstance(value, FileContents) and isinstance(value.argument, str):
+        yield value.argument
+    elif isinstance(value, CustomYamlTagBase):
+        yield from _file_contents_paths(value.argument)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _file_contents_paths(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _file_contents_paths(item)
+
+
+def _directories_between(directory: str, top: str) -> List[str]:
+    """
+    Returns a directory and each of the directories above it, up to and including the
+    top directory. Only the directory itself is returned if it is not below the top.
+    """
+    directories = [directory]
+    while directory != top and path.dirname(directory) != directory:
+        directory = path.dirname(directory)
+        if not directory.startswith(top):
+            return directories[:1]
+        directories.append(directory)
+    return directories
+
+
+def _absolute(file_path: str) -> str:
+    return path.normpath(path.abspath(file_path))
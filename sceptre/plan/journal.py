@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+"""
+sceptre.plan.journal
+
+This module implements a RunJournal, which records the outcome of every Stack in a
+run of a command as it completes, so that an interrupted or failed run can be
+resumed without running the Stacks that already completed again.
+"""
+
+import datetime
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional
+
+from sceptre.stack_status import StackStatus
+
+
+class RunJournal(object):
+    """
+    RunJournal keeps an append-only file of JSON lines for the latest run of a command.
+    The first line describes the run, and every following line records the status a
+    Stack completed with. A run that is resumed appends to the journal of the run it
+    resumes, so the journal always holds the latest status of every Stack of the run.
+
+    Each line is flushed as soon as it is written, so the journal survives a crash or
+    a killed process.
+
+    :param path: The path to the journal file.
+    :param command: The command the journal records.
+    :param command_path: The command path of the run.
+    """
+
+    # The statuses that --only-failed runs again.
+    FAILED_STATUSES = {StackStatus.FAILED, StackStatus.SKIPPED}
+
+    def __init__(self, path: str, command: str, command_path: str):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.command = command
+        self.command_path = command_path
+
+        self._lock = threading.Lock()
+        self._file = None
+
+    def outcomes(self) -> Dict[str, str]:
+        """
+        Returns the latest status of every Stack recorded in the journal, keyed by Stack
+        name. The journal is ignored if it records a run with another command path.
+        """
+        lines = self._load()
+        if not lines or not self._same_run(lines[0]):
+            return {}
+        return {
+            line["stack"]: line["status"]
+            for line in lines[1:]
+            if "stack" in line and "status" in line
+        }
+
+    def start(self, resume: bool = False):
+        """
+        Opens the journal for a run. A new run replaces the journal of the previous run,
+        while a resumed run appends to it. If the journal cannot be opened, a warning is
+        logged and nothing is recorded.
+
+        :param resume: True to append to the journal of the previous run, if it has the
+                       same command path.
+        """
+        lines = self._load() if resume else []
+        resume = bool(lines) and self._same_run(lines[0])
+        if not resume and lines:
+            self.logger.warning(
+                "The previous %s run was for '%s', so there is nothing to resume",
+                self.command,
+                lines[0].get("command_path"),
+            )
+
+        # The journal only makes resuming possible, so a journal that cannot be written,
+        # such as in a read-only checkout, is not kept rather than failing the command.
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file = open(self.path, "a" if resume else "w")
+        except OSError as err:
+            self.logger.warning(
+                "Could not open journal %s, so this run cannot be resumed: %s",
+                self.path,
+                err,
+            )
+            return
+        self._write(
+            {
+                "command": self.command,
+                "command_path": self.command_path,
+                "started": self._now(),
+                "resumed": resume,
+            }
+        )
+
+    def record(self, stack_name: str, status: str):
+        """
+        Appends the status a Stack completed with. This method is thread-safe.
+
+        :param stack_name: The name of the Stack.
+        :param status: The status the Stack completed with.
+        """
+        self._write({"stack": stack_name, "status": status, "time": self._now()})
+
+    def close(self):
+        """
+        Closes the journal file.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _write(self, line: dict):
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(json.dumps(line) + "\n")
+            self._file.flush()
+
+    def _same_run(self, header: dict) -> bool:
+        return (
+            header.get("command") == self.command
+            and header.get("command_path") == self.command_path
+        )
+
+    def _load(self) -> List[dict]:
+        if not os.path.isfile(self.path):
+            return []
+        lines = []
+        try:
+            with open(self.path) as f:
+                for text in f:
+                    line = self._parse(text)
+                    if line is not None:
+                        lines.append(line)
+        except OSError as err:
+            self.logger.debug("Ignoring unreadable journal %s: %s", self.path, err)
+            return []
+        return lines
+
+    @staticmethod
+    def _parse(text: str) -> Optional[dict]:
+        # A crash can leave the last line half written.
+        try:
+            line = json.loads(text)
+        except ValueError:
+            return None
+        return line if isinstance(line, dict) else None
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.datetime.now(datetime.timezone.utc).isoformat()
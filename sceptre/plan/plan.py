@@ -7,9 +7,13 @@ This module implements a SceptrePlan, which is responsible for holding all
 nessessary information for a command to execute.
 """
 
+import contextlib
 import functools
+import hashlib
 import itertools
+import logging
 import pathlib
+import re
 
 from os import path, walk
 from typing import Dict, List, Set, Callable, Iterable, Optional
@@ -19,9 +23,18 @@ from sceptre.config.reader import ConfigReader
 from sceptre.context import SceptreContext
 from sceptre.diffing.stack_differ import StackDiff
 from sceptre.exceptions import ConfigFileNotFoundError
-from sceptre.helpers import sceptreise_path
+from sceptre.helpers import _call_func_on_values, sceptreise_path
+from sceptre.plan.cancellation import CancellationToken, get_cancellation
+from sceptre.plan.concurrency import ConcurrencyLimits
 from sceptre.plan.executor import SceptrePlanExecutor
+from sceptre.plan.history import StackDurationHistory
+from sceptre.plan.impact import ChangeImpact
+from sceptre.plan.journal import RunJournal
+from sceptre.plan.rendering import TemplateRenderer
+from sceptre.resolvers import Resolver
 from sceptre.stack import Stack
+from sceptre.stack_status import StackStatus
+from sceptre.tracing import Tracer, get_tracer, use_tracer
 
 
 def require_resolved(func) -> Callable:
@@ -35,6 +48,37 @@ def require_resolved(func) -> Callable:
 
 
 class SceptrePlan(object):
+    # The commands whose Stack durations are recorded, so that later runs of the same command
+    # can start the Stacks on the slowest chains first. They are only recorded while the
+    # concurrency is limited, as otherwise every ready Stack starts at once whatever the order.
+    TIMED_COMMANDS = {"create", "update", "launch", "delete", "execute_change_set"}
+
+    # The commands whose runs can be resumed, and so are journaled when the context asks
+    # for a journal or resumes a run.
+    JOURNALED_COMMANDS = {"launch"}
+
+    # The commands that read, but never deploy, the templates of every Stack, so that the
+    # templates can all be rendered up front when render_processes is set. Commands that
+    # deploy Stacks are left out, as the templates of dependent Stacks may use outputs that
+    # the deployment changes.
+    RENDERED_COMMANDS = {
+        "validate",
+        "estimate_cost",
+        "generate",
+        "diff",
+        "dump_template",
+        "fetch_local_template_summary",
+    }
+
+    # The Stack config keys a template is rendered from.
+    TEMPLATE_CONFIG_KEYS = (
+        "template",
+        "template_path",
+        "sceptre_user_data",
+        "template_bucket_name",
+        "template_key_prefix",
+    )
+
     def __init__(self, context: SceptreContext):
         """
         Intialises a SceptrePlan and generates the Stacks, StackGraph and
@@ -43,22 +87,131 @@ class SceptrePlan(object):
         :param context: A SceptreContext
         """
         self.context = context
+        self.logger = logging.getLogger(__name__)
         self.command = None
         self.reverse = None
         self.launch_order: Optional[List[Set[Stack]]] = None
+        self._batch_index: Optional[Dict[Stack, int]] = None
 
         self.config_reader = ConfigReader(context)
         all_stacks, command_stacks = self.config_reader.construct_stacks()
         self.graph = StackGraph(all_stacks)
         self.command_stacks = command_stacks
         self.max_concurrency = self.context.max_concurrency
+        self.scheduler = self.context.scheduler
+        self.continue_on_failure = self.context.continue_on_failure
+        self.engine = self.context.engine
+        self.render_processes = self.context.render_processes
 
     @require_resolved
     def _execute(self, *args):
+        if self.render_processes and self.command in self.RENDERED_COMMANDS:
+            TemplateRenderer(self.render_processes).render(
+                itertools.chain.from_iterable(self.launch_order)
+            )
+        limits = ConcurrencyLimits(
+            self.context.max_concurrency_per_account_region,
+            self.config_reader.stack_group_concurrency_limits(),
+        )
+        history = None
+        if self.command in self.TIMED_COMMANDS and self._limits_concurrency(limits):
+            history = StackDurationHistory(
+                path.join(self.context.full_state_path(), "durations.json"),
+                self.command,
+            )
+        journal = None
+        resume = self.context.resume or self.context.only_failed
+        if self.command in self.JOURNALED_COMMANDS and (self.context.journal or resume):
+            journal = self._journal()
+            journal.start(resume=resume)
+        graph = self._generate_execution_graph(self.reverse)
         executor = SceptrePlanExecutor(
-            self.command, self.launch_order, max_concurrency=self.max_concurrency
+            self.command,
+            self.launch_order,
+            max_concurrency=self.max_concurrency,
+            scheduler=self.scheduler,
+            graph=graph,
+            history=history,
+            continue_on_failure=self.continue_on_failure,
+            engine=self.engine,
+            limits=limits,
+            journal=journal,
+            adaptive_concurrency=self.context.adaptive_concurrency,
+            prefetch=self.context.prefetch,
+            # A command run within a command with a deadline, such as the deletions of a
+            # pruning launch, shares the deadline of that command.
+            cancellation=get_cancellation() or self.cancellation_token(),
+        )
+        # A command run within a traced command, such as the deletions of a pruning
+        # launch, records its spans to the Tracer of that command.
+        tracer = None
+        if self.context.trace_file and get_tracer() is None:
+            tracer = Tracer(self.command)
+        try:
+            with use_tracer(tracer) if tracer else contextlib.nullcontext():
+                return executor.execute(*args)
+        finally:
+            if history is not None:
+                history.save()
+            if journal is not None:
+                journal.close()
+            if tracer is not None:
+                self.export_trace(tracer, graph)
+
+    def export_trace(self, tracer: Tracer, graph: Optional[StackGraph]):
+        """
+        Writes the spans of the tracer to the trace_file of the context, and logs the
+        critical path and the slowest Stacks of the run.
+
+        :param tracer: The Tracer the command was run with.
+        :param graph: The StackGraph the command was run with, if any.
+        """
+        tracer.write(self.context.trace_file)
+        for line in tracer.summary(graph):
+            self.logger.info(line)
+
+    def _limits_concurrency(self, limits: ConcurrencyLimits) -> bool:
+        """
+        Returns True if fewer Stacks may be in flight than are ready, so that the order in
+        which ready Stacks start matters.
+        """
+        return bool(self.max_concurrency or self.context.adaptive_concurrency or limits)
+
+    def cancellation_token(self) -> CancellationToken:
+        """
+        Returns a new CancellationToken for the deadline of the context, which starts now.
+        """
+        deadline = self.context.deadline
+        return CancellationToken(
+            deadline=60 * deadline if deadline else None,
+            cancel_in_flight=self.context.cancel_in_flight,
+        )
+
+    def _journal(self) -> RunJournal:
+        # Runs of a command on different command paths keep separate journals, so that one
+        # does not replace the journal another would resume. The digest tells apart command
+        # paths that only differ in the characters replaced in the readable part.
+        command_path = self.context.command_path
+        readable = re.sub(r"[^A-Za-z0-9_.-]+", "_", command_path).strip("_") or "all"
+        digest = hashlib.sha1(command_path.encode("utf-8")).hexdigest()[:8]
+        return RunJournal(
+            path.join(
+                self.context.full_state_path(),
+                "journal",
+                f"{self.command}-{readable}-{digest}.jsonl",
+            ),
+            self.command,
+            command_path,
         )
-        return executor.execute(*args)
+
+    def _generate_execution_graph(self, reverse=False) -> Optional[StackGraph]:
+        """
+        Returns the StackGraph the executor should follow when scheduling Stacks
+        by their own dependencies, or None when dependencies are ignored.
+        """
+        if self.context.ignore_dependencies:
+            return None
+        return self.graph.filtered(self.command_stacks, reverse)
 
     def _raise_no_launch_order_error(self):
         MAX_VALID_STACK_PATH_COUNT = 10
@@ -84,18 +237,7 @@ class SceptrePlan(object):
         if self.context.ignore_dependencies:
             return [self.command_stacks]
 
-        graph = self.graph.filtered(self.command_stacks, reverse)
-
-        launch_order = []
-        while graph.graph:
-            batch = set()
-            for stack in graph:
-                if graph.count_dependencies(stack) == 0:
-                    batch.add(stack)
-            launch_order.append(batch)
-
-            for stack in batch:
-                graph.remove_stack(stack)
+        launch_order = self.graph.filtered(self.command_stacks, reverse).generations()
 
         if not launch_order:
             self._raise_no_launch_order_error()
@@ -111,10 +253,31 @@ class SceptrePlan(object):
 
     @require_resolved
     def remove_stack_from_plan(self, stack: Stack):
-        for batch in self.launch_order:
-            if stack in batch:
-                batch.remove(stack)
-                return
+        batch = self._batch_of(stack)
+        if batch is not None:
+            batch.remove(stack)
+            del self._batch_index[stack]
+
+    def _batch_of(self, stack: Stack) -> Optional[Set[Stack]]:
+        """
+        Returns the set of the launch_order holding the given Stack, or None if the Stack is
+        not in the launch_order.
+
+        The set is looked up in an index from each Stack to its set, which is rebuilt if the
+        launch_order was changed without it.
+        """
+        index = (self._batch_index or {}).get(stack)
+        if index is None or not self._in_batch(stack, index):
+            self._batch_index = {
+                planned: index
+                for index, batch in enumerate(self.launch_order)
+                for planned in batch
+            }
+            index = self._batch_index.get(stack)
+        return self.launch_order[index] if index is not None else None
+
+    def _in_batch(self, stack: Stack, index: int) -> bool:
+        return index < len(self.launch_order) and stack in self.launch_order[index]
 
     @require_resolved
     def filter(self, predicate: Callable[[Stack], bool]):
@@ -127,6 +290,90 @@ class SceptrePlan(object):
             if not predicate(stack):
                 self.remove_stack_from_plan(stack)
 
+    @require_resolved
+    def filter_by_journal(self, only_failed: bool = False) -> List[Stack]:
+        """Removes the Stacks that do not need to run again from the plan's resolved
+        launch_order, according to the journal of the previous run of the command.
+
+        :param only_failed: If True, only the Stacks that failed or were skipped because a
+            dependency failed are kept. Otherwise, every Stack that did not complete is kept,
+            including the Stacks the previous run never reached.
+        :returns: The Stacks removed from the plan.
+        """
+        outcomes = self._journal().outcomes()
+        if only_failed:
+
+            def keep(stack: Stack) -> bool:
+                return outcomes.get(stack.name) in RunJournal.FAILED_STATUSES
+
+        else:
+
+            def keep(stack: Stack) -> bool:
+                return outcomes.get(stack.name) != StackStatus.COMPLETE
+
+        removed = [stack for stack in self if not keep(stack)]
+        for stack in removed:
+            self.remove_stack_from_plan(stack)
+        return removed
+
+    def filter_by_changes(self, changed_files: Iterable[str]) -> List[Stack]:
+        """Removes the Stacks that are not affected by the changed files from the plan's
+        resolved launch_order. The Stacks read or rendered from the changed files are kept,
+        along with every Stack that depends on them, directly or not.
+
+        :param changed_files: The paths of the changed files.
+        :returns: The Stacks removed from the plan.
+        """
+        planned = list(self)
+        changed = ChangeImpact(self.context, self.config_reader).affected_stacks(
+            planned, changed_files
+        )
+        affected = set(self.graph.filtered(changed, reverse=True)) if changed else set()
+
+        removed = [stack for stack in planned if stack not in affected]
+        for stack in removed:
+            self.remove_stack_from_plan(stack)
+        return removed
+
+    def refresh(self):
+        """
+        Replaces the Stacks of the plan with Stacks constructed again from the config that was
+        already read, so that the next command resolves every resolver again. The values
+        resolved by earlier commands may be placeholders, or outputs of Stacks that the next
+        command changes. Templates that were rendered without any resolvers are kept, rather
+        than rendered again.
+        """
+        previous_stacks = {stack.name: stack for stack in self.graph}
+        command_stack_names = {stack.name for stack in self.command_stacks}
+
+        stacks = self.config_reader.reconstruct_stacks(previous_stacks.values())
+        for stack in stacks:
+            self._reuse_template(previous_stacks[stack.name], stack)
+
+        self.graph = StackGraph(stacks)
+        self.command_stacks = {
+            stack for stack in stacks if stack.name in command_stack_names
+        }
+        self.command = None
+        self.reverse = None
+        self.launch_order = None
+        self._batch_index = None
+
+    def _reuse_template(self, previous_stack: Stack, stack: Stack):
+        previous_template = previous_stack._template
+        if previous_template is None or previous_template._body is None:
+            return
+
+        resolvers = []
+        _call_func_on_values(
+            lambda attr, key, value: resolvers.append(value),
+            [stack.stack_group_config]
+            + [stack.config.get(key) for key in self.TEMPLATE_CONFIG_KEYS],
+            Resolver,
+        )
+        if not resolvers:
+            stack.template._body = previous_template._body
+
     def resolve(self, command, reverse=False):
         if command == self.command and reverse == self.reverse:
             return
@@ -134,6 +381,7 @@ class SceptrePlan(object):
         self.command = command
         self.reverse = reverse
         self.launch_order = self._generate_launch_order(reverse)
+        self._batch_index = None
 
     def template(self, *args):
         """
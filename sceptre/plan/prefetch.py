@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+"""
+sceptre.plan.prefetch
+
+This module implements a StackPrefetcher, which prepares the templates and
+resolvable values of Stacks in the background while they wait for the Stacks
+they depend on.
+"""
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable
+
+from sceptre.helpers import _call_func_on_values
+from sceptre.resolvers import Resolver
+from sceptre.resolvers.stack_attr import StackAttr
+from sceptre.resolvers.stack_output import StackOutput
+from sceptre.stack import Stack
+from sceptre.tracing import span
+
+
+class StackPrefetcher(object):
+    """
+    StackPrefetcher resolves, in a small pool of threads, every resolver of a waiting Stack
+    that does not depend on the outputs of other Stacks, then renders its template and
+    uploads it to S3, so that once the Stack is ready only the values bound to its
+    dependencies are left to resolve.
+
+    A Stack whose template depends on the outputs of other Stacks, through its
+    sceptre_user_data, template config, template bucket or sceptre_role, only has its
+    independent resolvers resolved. A Stack with "before" hooks is not prepared at all, as its
+    hooks may create the files its template and resolvers read. Errors are not raised by the
+    prefetcher: whatever fails is left to be prepared, and to raise the error, when the Stack
+    starts.
+
+    :param threads: The number of threads to prepare the Stacks in.
+    """
+
+    # The resolvers that read the outputs of other Stacks, or other fields of the same Stack
+    # which may contain such resolvers, and so must wait for the Stacks they depend on.
+    DEPENDENT_RESOLVERS = (StackOutput, StackAttr)
+
+    RESOLVABLE_PROPERTIES = (
+        "sceptre_role",
+        "template_bucket_name",
+        "s3_details",
+        "template_handler_config",
+        "sceptre_user_data",
+        "parameters",
+        "notifications",
+        "tags",
+        "cloudformation_service_role",
+    )
+
+    # The properties the template, and the connection used to upload it, are built from.
+    TEMPLATE_PROPERTIES = (
+        "sceptre_role",
+        "template_bucket_name",
+        "s3_details",
+        "template_handler_config",
+        "sceptre_user_data",
+    )
+
+    def __init__(self, threads: int = 2):
+        self.logger = logging.getLogger(__name__)
+        self._pool = ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix="sceptre-prefetch"
+        )
+        self._futures: Dict[Stack, Future] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def prefetch(self, stacks: Iterable[Stack]):
+        """
+        Queues Stacks to be prepared, in the order given.
+
+        :param stacks: The Stacks to prepare.
+        """
+        for stack in stacks:
+            self._futures[stack] = self._pool.submit(self._prepare, stack)
+
+    def claim(self, stack: Stack):
+        """
+        Hands a Stack over to the caller, so that it is never prepared while it executes. A
+        Stack that is still queued is no longer prepared; a Stack that is being prepared is
+        waited for.
+
+        :param stack: The Stack that is starting.
+        """
+        future = self._futures.pop(stack, None)
+        if future is not None and not future.cancel():
+            future.result()
+
+    def shutdown(self):
+        """
+        Stops preparing Stacks, waiting for the Stacks being prepared.
+        """
+        self._pool.shutdown(cancel_futures=True)
+
+    def _prepare(self, stack: Stack):
+        # Whatever fails is prepared again, and raises its error, when the Stack starts, so
+        # an error here must never reach the Stack through claim().
+        try:
+            self._prepare_stack(stack)
+        except Exception:
+            self.logger.debug(
+                "%s - Could not prepare the Stack ahead of its start",
+                stack.name,
+                exc_info=True,
+            )
+
+    def _prepare_stack(self, stack: Stack):
+        if any(
+            name.startswith("before_") and hooks for name, hooks in stack.hooks.items()
+        ):
+            return
+        with span("prefetch", "prefetch", stack.name):
+            for name in self.RESOLVABLE_PROPERTIES:
+                getattr(type(stack), name).resolve_where(stack, self._is_independent)
+
+            if any(
+                self._has_resolvers(stack, name) for name in self.TEMPLATE_PROPERTIES
+            ):
+                return
+            stack.template.get_boto_call_parameter()
+
+    def _is_independent(self, resolver: Resolver) -> bool:
+        """
+        Returns True if neither the resolver nor any of the resolvers in its argument depend
+        on other Stacks.
+        """
+        if isinstance(resolver, self.DEPENDENT_RESOLVERS):
+            return False
+        dependent = []
+        _call_func_on_values(
+            lambda attr, key, value: dependent.append(not self._is_independent(value)),
+            resolver._argument,
+            Resolver,
+        )
+        return not any(dependent)
+
+    def _has_resolvers(self, stack: Stack, name: str) -> bool:
+        """
+        Returns True if the property still has resolvers left to resolve.
+        """
+        raw_value = getattr(stack, "_" + name, None)
+        if isinstance(raw_value, Resolver):
+            return True
+        found = []
+        _call_func_on_values(
+            lambda attr, key, value: found.append(value), raw_value, Resolver
+        )
+        return bool(found)
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+"""
+sceptre.plan.rendering
+
+This module implements the TemplateRenderer, which renders the templates of many
+Stacks in parallel in a pool of processes, so that CPU-bound templates, such as
+Troposphere templates, are not rendered one at a time behind the GIL.
+"""
+
+import logging
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
+
+from sceptre.stack import Stack
+from sceptre.template import Template
+
+logger = logging.getLogger(__name__)
+
+
+def _render(name: str, handler_config: dict, sceptre_user_data, stack_group_config):
+    """
+    Renders a template in a worker process.
+
+    :returns: The body of the template.
+    """
+    template = Template(
+        name=name,
+        handler_config=handler_config,
+        sceptre_user_data=sceptre_user_data,
+        stack_group_config=stack_group_config,
+    )
+    return template.body
+
+
+class TemplateRenderer(object):
+    """
+    TemplateRenderer renders the bodies of the templates of Stacks in a pool of processes,
+    and stores each body on the Stack's Template, as if it had been rendered in this process.
+
+    Only templates of the file handler are rendered out of process, as the other handlers
+    fetch their templates over the network and gain nothing from it. A template whose
+    arguments cannot be sent to a worker, or which fails to render there, is left to be
+    rendered in this process when it is first used, so that any error is raised and
+    reported just as it would be without the TemplateRenderer.
+
+    :param processes: The number of worker processes.
+    """
+
+    # The handler types rendered in the worker processes.
+    HANDLER_TYPES = {"file"}
+
+    # The modules the forkserver imports once, so that every worker it forks starts with them
+    # already loaded. Modules that are not installed are skipped.
+    PRELOAD_MODULES = [
+        "troposphere",
+        "jinja2",
+        "yaml",
+        "sceptre.template",
+        "sceptre.template_handlers.file",
+        "sceptre.template_handlers.helper",
+    ]
+
+    def __init__(self, processes: int):
+        self.processes = processes
+
+    def render(self, stacks: Iterable[Stack]) -> Dict[Stack, str]:
+        """
+        Renders the templates of the Stacks that have not been rendered yet.
+
+        :param stacks: The Stacks whose templates to render.
+        :returns: The rendered template bodies, keyed by Stack.
+        """
+        jobs = {}
+        for stack in stacks:
+            arguments = self._arguments(stack)
+            if arguments is not None:
+                jobs[stack] = arguments
+
+        if len(jobs) < 2:
+            return {}
+
+        bodies = {}
+        workers = min(self.processes, len(jobs))
+        with ProcessPoolExecutor(workers, mp_context=self._mp_context()) as pool:
+            futures = {
+                stack: pool.submit(_render, *arguments)
+                for stack, arguments in jobs.items()
+            }
+            for stack, future in futures.items():
+                try:
+                    body = future.result()
+                except Exception as exp:
+                    logger.debug(
+                        "%s - Template could not be rendered out of process: %s",
+                        stack.name,
+                        exp,
+                    )
+                    continue
+                stack.template._body = body
+                bodies[stack] = body
+
+        logger.debug(
+            "Rendered %d of %d templates in %d processes",
+            len(bodies),
+            len(jobs),
+            workers,
+        )
+        return bodies
+
+    def _arguments(self, stack: Stack) -> Optional[Tuple]:
+        try:
+            template = stack.template
+            if template._body is not None:
+                return None
+            handler_config = dict(template.handler_config or {})
+            if handler_config.get("type", "file") not in self.HANDLER_TYPES:
+                return None
+            arguments = (
+                template.name,
+                handler_config,
+                template.sceptre_user_data,
+                template.stack_group_config,
+            )
+            pickle.dumps(arguments)
+        except Exception as exp:
+            logger.debug(
+                "%s - Template will be rendered in process: %s", stack.name, exp
+            )
+            return None
+        return arguments
+
+    def _mp_context(self):
+        try:
+            context = multiprocessing.get_context("forkserver")
+        except ValueError:
+            return multiprocessing.get_context("spawn")
+        context.set_forkserver_preload(self.PRELOAD_MODULES)
+        return context
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+"""
+sceptre.plugins
+
+This module implements a PluginRegistry, which finds the hooks, resolvers and
+template handlers registered at Sceptre's entry point groups once per process,
+and only imports each of them when it is first used.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+from collections.abc import Mapping
+from importlib.metadata import EntryPoint, entry_points
+from typing import Dict, Iterator, List, Optional
+
+HOOKS = "sceptre.hooks"
+RESOLVERS = "sceptre.resolvers"
+TEMPLATE_HANDLERS = "sceptre.template_handlers"
+
+GROUPS = [HOOKS, RESOLVERS, TEMPLATE_HANDLERS]
+
+
+class PluginRegistry(object):
+    """
+    PluginRegistry holds the plugins registered at Sceptre's entry point groups. The
+    entry points are found the first time a plugin is looked up, and the class of a
+    plugin is only imported the first time it is used.
+
+    Finding the entry points means reading the metadata of every installed distribution.
+    When ``cache_path`` is set before the first lookup, the entry points found are kept
+    in that file, and are read back from it for as long as the installed distributions
+    are unchanged.
+    """
+
+    VERSION = 1
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self.cache_path: Optional[str] = None
+        self._lock = threading.RLock()
+        self._entry_points: Optional[Dict[str, Dict[str, str]]] = None
+        self._classes: Dict[tuple, type] = {}
+
+    def names(self, group: str) -> List[str]:
+        """
+        Returns the names of the plugins registered at an entry point group.
+
+        :param group: The entry point group.
+        :returns: The names of the plugins.
+        """
+        return list(self._discover().get(group, {}))
+
+    def get(self, group: str, name: str) -> Optional[type]:
+        """
+        Returns the class of a plugin, importing it the first time it is used. This
+        method is thread-safe.
+
+        :param group: The entry point group of the plugin.
+        :param name: The name of the plugin.
+        :returns: The class of the plugin, or None if no plugin has the name.
+        """
+        key = (group, name)
+        node_class = self._classes.get(key)
+        if node_class is not None:
+            return node_class
+
+        with self._lock:
+            if key not in self._classes:
+                value = self._discover().get(group, {}).get(name)
+                if value is None:
+                    return None
+                self._classes[key] = EntryPoint(name, value, group).load()
+            return self._classes[key]
+
+    def register(self, group: str, name: str, node_class: type):
+        """
+        Registers the class of a plugin, in addition to those found at the entry points.
+
+        :param group: The entry point group of the plugin.
+        :param name: The name of the plugin.
+        :param node_class: The class of the plugin.
+        """
+        with self._lock:
+            self._discover().setdefault(group, {})[
+                name
+            ] = f"{node_class.__module__}:{node_class.__qualname__}"
+            self._classes[(group, name)] = node_class
+
+    def classes(self, *groups: str) -> "PluginClasses":
+        """
+        Returns the classes of the plugins registered at entry point groups, keyed by
+        name, which are only imported when they are looked up. A plugin of a later group
+        takes the place of a plugin of the same name in an earlier group.
+
+        :param groups: The entry point groups.
+        :returns: The classes of the plugins.
+        """
+        return PluginClasses(self, groups)
+
+    def _discover(self) -> Dict[str, Dict[str, str]]:
+        if self._entry_points is not None:
+            return self._entry_points
+
+        with self._lock:
+            if self._entry_points is None:
+                key = _distributions_key() if self.cache_path else None
+                found = self._load_cache(key) if key else None
+                if found is None:
+                    found = {
+                        group: {
+                            entry_point.name: entry_point.value
+                            for entry_point in entry_points(group=group)
+                        }
+                        for group in GROUPS
+                    }
+                    if key:
+                        self._save_cache(key, found)
+                self._entry_points = found
+            return self._entry_points
+
+    def _load_cache(self, key):
+        try:
+            with open(self.cache_path) as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(cache, dict)
+            or cache.get("version") != self.VERSION
+            or cache.get("key") != key
+            or not isinstance(cache.get("entry_points"), dict)
+        ):
+            return None
+        return cache["entry_points"]
+
+    def _save_cache(self, key, found):
+        directory = os.path.dirname(self.cache_path)
+        content = json.dumps(
+            {"version": self.VERSION, "key": key, "entry_points": found}
+        )
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # Write to a temporary file first so a crash cannot leave a truncated cache.
+            with tempfile.NamedTemporaryFile(
+                mode="w", dir=directory, delete=False, suffix=".tmp"
+            ) as temp_file:
+                temp_file.write(content)
+            os.replace(temp_file.name, self.cache_path)
+        except OSError as err:
+            self.logger.debug("Cannot write %s: %s", self.cache_path, err)
+
+
+class PluginClasses(Mapping):
+    """
+    PluginClasses maps the names of the plugins of entry point groups to their classes,
+    importing each class when it is first looked up.
+
+    :param registry: The registry of the plugins.
+    :param groups: The entry point groups, the plugins of later groups taking the place
+        of those of earlier groups with the same name.
+    """
+
+    def __init__(self, registry: PluginRegistry, groups):
+        self.registry = registry
+        self.groups = list(groups)
+
+    def __getitem__(self, name: str) -> type:
+        for group in reversed(self.groups):
+            node_class = self.registry.get(group, name)
+            if node_class is not None:
+                return node_class
+        raise KeyError(name)
+
+    def __iter__(self) -> Iterator[str]:
+        names = {}
+        for group in self.groups:
+            names.update(dict.fromkeys(self.registry.names(group)))
+        return iter(names)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+def _distributions_key() -> str:
+    """
+    Returns a key that changes whenever a distribution is installed, removed, upgraded
+    or has its entry points changed, without reading the metadata of each distribution.
+    """
+    distributions = []
+    for directory in sys.path:
+        try:
+            names = sorted(os.listdir(directory or "."))
+        except OSError:
+            continue
+        for name in names:
+            if not name.endswith((".dist-info", ".egg-info")):
+                continue
+            try:
+                mtime = os.stat(
+                    os.path.join(directory, name, "entry_points.txt")
+                ).st_mtime_ns
+            except OSError:
+                mtime = None
+            distributions.append([directory, name, mtime])
+    content = json.dumps([sys.version, distributions])
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+# The plugins of the process.
+registry = PluginRegistry()
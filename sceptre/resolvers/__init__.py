@@ -3,11 +3,17 @@ import abc
 import logging
 from contextlib import contextmanager
 from threading import RLock
-from typing import Any, TYPE_CHECKING, Type, Union, TypeVar
+from weakref import WeakSet
+from typing import Any, Callable, TYPE_CHECKING, Type, Union, TypeVar
 
 from sceptre.exceptions import InvalidResolverArgumentError
-from sceptre.helpers import _call_func_on_values, delete_keys_from_containers
-from sceptre.logging import StackLoggerAdapter
+from sceptre.helpers import (
+    _call_func_on_values,
+    copy_containers,
+    delete_keys_from_containers,
+)
+from sceptre.logging import stack_logger
+from sceptre.tracing import span
 from sceptre.resolvers.placeholders import (
     create_placeholder_value,
     are_placeholders_enabled,
@@ -38,7 +44,10 @@ class CustomYamlTagBase:
 
     """
 
-    logger = logging.getLogger(__name__)
+    __slots__ = ("stack", "_argument", "_argument_is_resolved", "_logger")
+
+    # The logger that log messages are written to, prefixed with the name of the stack.
+    base_logger = logging.getLogger(__name__)
 
     def __init__(self, argument: Any = None, stack: "stack.Stack" = None):
         """Initializes a custom yaml tag object.
@@ -51,14 +60,28 @@ class CustomYamlTagBase:
             the instance when "clone_for_stack" is invoked when the tag is associated with a specific
             stack.
         """
-        if stack is not None:
-            self.logger = StackLoggerAdapter(self.logger, stack.name)
-
         self.stack = stack
+        self._logger = None
 
         self._argument = argument
         self._argument_is_resolved = False
 
+    @property
+    def logger(self) -> Union[logging.Logger, logging.LoggerAdapter]:
+        """The logger of the instance. Once the instance is associated with a Stack, log messages
+        are prefixed with the name of the Stack, using an adapter shared by every instance that logs
+        for that Stack.
+        """
+        if self._logger is not None:
+            return self._logger
+        if self.stack is None:
+            return self.base_logger
+        return stack_logger(self.base_logger, self.stack.name)
+
+    @logger.setter
+    def logger(self, value: Union[logging.Logger, logging.LoggerAdapter]):
+        self._logger = value
+
     @property
     def argument(self) -> Any:
         """This is the resolver or hook's argument.
@@ -182,6 +205,8 @@ class Resolver(CustomYamlTagBase, metaclass=abc.ABCMeta):
     Resolver is an abstract base class that should be subclassed by all Resolvers.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def resolve(self):
         """
@@ -215,6 +240,8 @@ class ResolvableProperty(abc.ABC):
         self.placeholder_type = placeholder_type
 
         self._lock = RLock()
+        # The ids of the stacks this property is being retrieved for.
+        self._gets_in_progress = set()
 
     def __get__(self, stack: "stack.Stack", stack_class: Type["stack.Stack"]) -> Any:
         """
@@ -222,9 +249,12 @@ class ResolvableProperty(abc.ABC):
 
         :param stack: The Stack instance the property is being retrieved for
         :param stack_class: The class of the stack that the property is being retrieved for.
-        :return: The attribute stored with the suffix ``name`` in the instance.
+        :return: The attribute stored with the suffix ``name`` in the instance, or the property
+            itself when it is retrieved from the class.
         :rtype: The obtained value, as resolved by the property
         """
+        if stack is None:
+            return self
         with self._lock, self._no_recursive_get(stack):
             if hasattr(stack, self.name):
                 return self.get_resolved_value(stack, stack_class)
@@ -246,18 +276,19 @@ class ResolvableProperty(abc.ABC):
         # only recursive gets on the same stack. Some Resolvers access the same property on OTHER
         # stacks and that actually shouldn't be a problem. Remember, these descriptor instances are
         # set on the CLASS and so instance variables on them are shared across all classes that
-        # access them. Thus, we set this "get_in_progress" attribute on the stack instance rather
-        # than the descriptor instance.
-        get_status_name = f"_{self.name}_get_in_progress"
-        if getattr(stack, get_status_name, False):
+        # access them. Thus, we keep the id of each stack with a get in progress rather than a
+        # single flag. The lock is held while a get is in progress, so the set is not shared
+        # between threads.
+        stack_id = id(stack)
+        if stack_id in self._gets_in_progress:
             raise RecursiveResolve(
                 f"Resolving Stack.{self.name[1:]} required resolving itself"
             )
-        setattr(stack, get_status_name, True)
+        self._gets_in_progress.add(stack_id)
         try:
             yield
         finally:
-            setattr(stack, get_status_name, False)
+            self._gets_in_progress.discard(stack_id)
 
     @abc.abstractmethod
     def get_resolved_value(
@@ -271,6 +302,41 @@ class ResolvableProperty(abc.ABC):
         """Implement this method to assign the value to the resolvable property."""
         pass
 
+    def resolve_where(
+        self, stack: "stack.Stack", predicate: Callable[["Resolver"], bool]
+    ):
+        """Resolves only the resolvers of the property for which the predicate returns True,
+        replacing them on the stack with their resolved values, as if the property had been
+        accessed. Resolvers that raise an error are left in place, to be resolved (and raise the
+        error) when the property is accessed.
+
+        :param stack: The Stack instance to resolve the property of
+        :param predicate: A function returning True for the resolvers that can be resolved
+        """
+        with self._lock, self._no_recursive_get(stack):
+            if hasattr(stack, self.name):
+                self.resolve_matching_resolvers(stack, predicate)
+
+    @abc.abstractmethod
+    def resolve_matching_resolvers(
+        self, stack: "stack.Stack", predicate: Callable[["Resolver"], bool]
+    ):
+        """Implement this method to resolve the resolvers matching the predicate in place."""
+        pass
+
+    def _try_resolve(self, resolver: "Resolver") -> Any:
+        """Returns the resolved value of the resolver, or the resolver itself if it raises an
+        error.
+        """
+        try:
+            return self.resolve_resolver_value(resolver)
+        except Exception:
+            self.logger.debug(
+                f"Could not resolve {resolver!r} yet. It will be resolved on access.",
+                exc_info=True,
+            )
+            return resolver
+
     def resolve_resolver_value(self, resolver: "Resolver") -> Any:
         """Returns the resolved parameter value.
 
@@ -280,8 +346,10 @@ class ResolvableProperty(abc.ABC):
         :param resolver: The resolver to resolve.
         :return: The resolved value (or placeholder, in certain circumstances)
         """
+        stack = getattr(resolver, "stack", None)
         try:
-            return resolver.resolve()
+            with span(type(resolver).__name__, "resolvers", stack and stack.name):
+                return resolver.resolve()
         except RecursiveResolve:
             # Recursive resolve issues shouldn't be masked by a placeholder.
             raise
@@ -315,10 +383,19 @@ class ResolvableContainerProperty(ResolvableProperty):
     :type name: str
     """
 
+    def __init__(self, name: str, placeholder_type=PlaceholderType.explicit):
+        super().__init__(name, placeholder_type)
+        # The stacks whose deferred resolvers have been resolved.
+        self._resolved_stacks = WeakSet()
+        # The stacks whose container has been copied for them alone.
+        self._copied_stacks = WeakSet()
+
     def __get__(
         self, stack: "stack.Stack", stack_class: Type["stack.Stack"]
     ) -> T_Container:
         container = super().__get__(stack, stack_class)
+        if stack is None:
+            return container
 
         with self._lock:
             # Resolve any deferred resolvers, now that the recursive get lock has been released.
@@ -368,11 +445,41 @@ class ResolvableContainerProperty(ResolvableProperty):
                 )
 
         container = getattr(stack, self.name)
+        if stack not in self._copied_stacks:
+            # The nested containers without resolvers are shared with other stacks until the
+            # container is first handed out, so that templates, hooks and resolvers updating
+            # it in place cannot change the values of other stacks.
+            container = copy_containers(container)
+            setattr(stack, self.name, container)
+            self._copied_stacks.add(stack)
         _call_func_on_values(resolve, container, Resolver)
         delete_keys_from_containers(keys_to_delete)
 
         return container
 
+    def resolve_matching_resolvers(
+        self, stack: "stack.Stack", predicate: Callable[["Resolver"], bool]
+    ):
+        """Resolves the resolvers in the container for which the predicate returns True. Like
+        get_resolved_value, resolvers that resolve to None have their key/index removed.
+
+        :param stack: The Stack instance to resolve the container of
+        :param predicate: A function returning True for the resolvers that can be resolved
+        """
+        keys_to_delete = []
+
+        def resolve(attr: Union[dict, list], key: Union[int, str], value: Resolver):
+            if not predicate(value):
+                return
+            result = self._try_resolve(value)
+            if result is None:
+                keys_to_delete.append((attr, key))
+            else:
+                attr[key] = result
+
+        _call_func_on_values(resolve, getattr(stack, self.name), Resolver)
+        delete_keys_from_containers(keys_to_delete)
+
     def assign_value_to_stack(self, stack: "stack.Stack", value: Union[dict, list]):
         """Assigns a COPY of the specified value to the stack instance. This method copies the value
         rather than directly assigns it to avoid bugs related to shared objects in memory.
@@ -382,28 +489,46 @@ class ResolvableContainerProperty(ResolvableProperty):
         """
         cloned = self._clone_container_with_resolvers(value, stack)
         setattr(stack, self.name, cloned)
+        self._copied_stacks.discard(stack)
 
     def _clone_container_with_resolvers(
         self, container: T_Container, stack: "stack.Stack"
     ) -> T_Container:
-        """Recurses into the container, cloning and setting up resolvers and creating a copy of all
-        nested containers.
+        """Recurses into the container, cloning and setting up resolvers and creating a copy of the
+        container and of the nested containers that hold resolvers. Resolved values are set in
+        those copies, so nested containers without resolvers are shared with the config the
+        container came from until the container is first accessed, when get_resolved_value
+        copies them for the stack.
 
         :param container: The container being recursed into and cloned
         :param stack: The stack the container is being copied for
-        :return: The fully copied container with resolvers fully set up.
+        :return: The copied container with resolvers fully set up.
         """
 
-        def recurse(obj):
+        holds_resolvers = {}
+
+        def holds_resolver(obj):
+            if isinstance(obj, Resolver):
+                return True
+            if not isinstance(obj, (list, dict)):
+                return False
+            if id(obj) not in holds_resolvers:
+                values = obj.values() if isinstance(obj, dict) else obj
+                holds_resolvers[id(obj)] = any(holds_resolver(val) for val in values)
+            return holds_resolvers[id(obj)]
+
+        def recurse(obj, copy=False):
             if isinstance(obj, Resolver):
                 return obj.clone_for_stack(stack)
+            if not copy and not holds_resolver(obj):
+                return obj
             if isinstance(obj, list):
                 return [recurse(item) for item in obj]
             elif isinstance(obj, dict):
                 return {key: recurse(val) for key, val in obj.items()}
             return obj
 
-        return recurse(container)
+        return recurse(container, copy=True)
 
     def _resolve_deferred_resolvers(self, stack: "stack.Stack", container: T_Container):
         def raise_if_not_resolved(attr, key, value):
@@ -417,11 +542,10 @@ class ResolvableContainerProperty(ResolvableProperty):
                 f"Resolving Stack.{self.name[1:]} required resolving itself"
             )
 
-        has_been_resolved_attr_name = f"{self.name}_is_resolved"
-        if not getattr(stack, has_been_resolved_attr_name, False):
-            # We set it first rather than after to avoid entering this block again on this property
+        if stack not in self._resolved_stacks:
+            # We add it first rather than after to avoid entering this block again on this property
             # for this stack.
-            setattr(stack, has_been_resolved_attr_name, True)
+            self._resolved_stacks.add(stack)
             _call_func_on_values(
                 lambda attr, key, value: value(), container, self.ResolveLater
             )
@@ -483,6 +607,18 @@ class ResolvableValueProperty(ResolvableProperty):
 
         return value
 
+    def resolve_matching_resolvers(
+        self, stack: "stack.Stack", predicate: Callable[["Resolver"], bool]
+    ):
+        """Resolves the value if it is a resolver for which the predicate returns True.
+
+        :param stack: The Stack instance to resolve the value of
+        :param predicate: A function returning True for the resolvers that can be resolved
+        """
+        raw_value = getattr(stack, self.name)
+        if isinstance(raw_value, Resolver) and predicate(raw_value):
+            setattr(stack, self.name, self._try_resolve(raw_value))
+
     def assign_value_to_stack(self, stack: "stack.Stack", value: Any):
         """Assigns the value to the Stack instance passed, setting up and cloning the value if it
         is a Resolver.
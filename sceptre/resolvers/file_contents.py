@@ -11,6 +11,8 @@ class FileContents(Resolver):
     :type argument: str
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(FileContents, self).__init__(*args, **kwargs)
 
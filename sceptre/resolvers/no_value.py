@@ -10,5 +10,7 @@ class NoValue(Resolver):
     where, if a certain condition is met, a value is passed, otherwise it's not passed at all.
     """
 
+    __slots__ = ()
+
     def resolve(self) -> None:
         return None
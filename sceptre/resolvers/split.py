@@ -17,6 +17,8 @@ class Split(Resolver):
          - !stack_output my/sns/topics.yaml::SemicolonDelimitedArns
     """
 
+    __slots__ = ()
+
     def resolve(self):
         error_message = (
             "The argument to !split must be a two-element list, where the first element is the "
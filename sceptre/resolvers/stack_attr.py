@@ -19,6 +19,8 @@ class StackAttr(Resolver):
     Using "!stack_attr sceptre_user_data.nested_list.1" on your stack would resolve to "second".
     """
 
+    __slots__ = ()
+
     # These are all the attributes on Stack Configs whose names are changed when they are assigned
     # to the Stack instance.
     STACK_ATTR_MAP = {
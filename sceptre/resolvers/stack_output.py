@@ -23,9 +23,9 @@ class StackOutputBase(Resolver):
     A abstract base class which provides methods for getting Stack outputs.
     """
 
-    def __init__(self, *args, **kwargs):
-        self.logger = logging.getLogger(__name__)
-        super(StackOutputBase, self).__init__(*args, **kwargs)
+    __slots__ = ()
+
+    base_logger = logging.getLogger(__name__)
 
     def _get_output_value(
         self, stack_name, output_key, profile=None, region=None, sceptre_role=None
@@ -106,6 +106,8 @@ class StackOutput(StackOutputBase):
     :type argument: str in the format ``"<stack name>::<output key>"``
     """
 
+    __slots__ = ("output_key", "dependency_stack_name")
+
     def __init__(self, *args, **kwargs):
         super(StackOutput, self).__init__(*args, **kwargs)
 
@@ -161,6 +163,8 @@ class StackOutputExternal(StackOutputBase):
     :type argument: str in the format ``"<full stack name>::<output key>"``
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(StackOutputExternal, self).__init__(*args, **kwargs)
 
@@ -16,6 +16,7 @@ from sceptre import __version__
 from sceptre.connection_manager import ConnectionManager
 from sceptre.exceptions import InvalidConfigFileError
 from sceptre.helpers import (
+    copy_containers,
     get_external_stack_name,
     sceptreise_path,
     create_deprecated_alias_property,
@@ -120,6 +121,9 @@ class Stack:
             also be deleted if the prune command is invoked or the --prune option is used with the
             launch command.
 
+    :param skip_unchanged: If True, launch tags the stack with a fingerprint of its template\
+            and configuration, and skips updating it while the fingerprint is unchanged.
+
     :param sceptre_role_session_duration: The session duration when Scetre assumes a role.\
            If not supplied, Sceptre uses default value (3600 seconds)
 
@@ -128,6 +132,47 @@ class Stack:
     :param config: The complete config for the stack. Used by dump config.
     """
 
+    # A project holds many Stacks, so their attributes are kept in slots rather than a dict.
+    # The __dict__ slot still lets hooks and resolvers set attributes of their own on a Stack;
+    # it costs a pointer until such an attribute is first set.
+    __slots__ = (
+        "name",
+        "project_code",
+        "region",
+        "required_version",
+        "external_name",
+        "dependencies",
+        "protected",
+        "on_failure",
+        "disable_rollback",
+        "stack_group_config",
+        "config",
+        "stack_timeout",
+        "profile",
+        "template_key_prefix",
+        "sceptre_role_session_duration",
+        "ignore",
+        "obsolete",
+        "skip_unchanged",
+        "_template",
+        "_connection_manager",
+        # The values of the resolvable properties and hooks below.
+        "_parameters",
+        "_sceptre_user_data",
+        "_notifications",
+        "_tags",
+        "_s3_details",
+        "_template_handler_config",
+        "_template_bucket_name",
+        "_sceptre_role",
+        "_cloudformation_service_role",
+        "_hooks",
+        "__dict__",
+        "__weakref__",
+    )
+
+    logger = logging.getLogger(__name__)
+
     parameters = ResolvableContainerProperty("parameters")
     sceptre_user_data = ResolvableContainerProperty(
         "sceptre_user_data", PlaceholderType.alphanum
@@ -166,7 +211,6 @@ class Stack:
         deprecated_in="4.0.0",
         removed_in=None,
     )
-    sceptre_role_session_duration = None
     iam_role_session_duration = create_deprecated_alias_property(
         "iam_role_session_duration",
         "sceptre_role_session_duration",
@@ -205,11 +249,10 @@ class Stack:
         iam_role_session_duration: Optional[int] = None,
         ignore=False,
         obsolete=False,
+        skip_unchanged=False,
         stack_group_config: dict = None,
         config: dict = None,
     ):
-        self.logger = logging.getLogger(__name__)
-
         self.name = sceptreise_path(name)
         self.project_code = project_code
         self.region = region
@@ -236,6 +279,7 @@ class Stack:
         )
         self.ignore = self._ensure_boolean("ignore", ignore)
         self.obsolete = self._ensure_boolean("obsolete", obsolete)
+        self.skip_unchanged = self._ensure_boolean("skip_unchanged", skip_unchanged)
 
         self._template = None
         self._connection_manager = None
@@ -409,7 +453,8 @@ class Stack:
                 name=self.name,
                 handler_config=self.template_handler_config,
                 sceptre_user_data=self.sceptre_user_data,
-                stack_group_config=self.stack_group_config,
+                # The StackGroup config is shared by the Stacks of the StackGroup.
+                stack_group_config=copy_containers(self.stack_group_config),
                 s3_details=self.s3_details,
                 connection_manager=self.connection_manager,
             )
@@ -10,12 +10,13 @@ and implements methods for uploading it to S3.
 import logging
 import threading
 import botocore
-import sys
 
 import sceptre.helpers
 
+from sceptre import plugins
 from sceptre.exceptions import TemplateHandlerNotFoundError
-from sceptre.logging import StackLoggerAdapter
+from sceptre.logging import stack_logger
+from sceptre.tracing import span
 
 
 class Template(object):
@@ -44,6 +45,17 @@ class Template(object):
     :type s3_details: dict
     """
 
+    __slots__ = (
+        "name",
+        "handler_config",
+        "sceptre_user_data",
+        "stack_group_config",
+        "connection_manager",
+        "s3_details",
+        "_body",
+        "_url",
+    )
+
     _boto_s3_lock = threading.Lock()
 
     def __init__(
@@ -55,7 +67,6 @@ class Template(object):
         connection_manager=None,
         s3_details=None,
     ):
-        self.logger = StackLoggerAdapter(logging.getLogger(__name__), name)
         self.name = name
         self.handler_config = handler_config
         if self.handler_config is not None and self.handler_config.get("type") is None:
@@ -65,8 +76,12 @@ class Template(object):
         self.connection_manager = connection_manager
         self.s3_details = s3_details
 
-        self._registry = None
         self._body = None
+        self._url = None
+
+    @property
+    def logger(self):
+        return stack_logger(logging.getLogger(__name__), self.name)
 
     def __repr__(self):
         return sceptre.helpers.gen_repr(
@@ -84,22 +99,25 @@ class Template(object):
         :rtype: str
         """
         if self._body is None:
-            type = self.handler_config.get("type")
-            handler_class = self._get_handler_of_type(type)
-            handler = handler_class(
-                name=self.name,
-                arguments={k: v for k, v in self.handler_config.items() if k != "type"},
-                sceptre_user_data=self.sceptre_user_data,
-                connection_manager=self.connection_manager,
-                stack_group_config=self.stack_group_config,
-            )
-            handler.validate()
-            body = handler.handle()
-            if isinstance(body, bytes):
-                body = body.decode("utf-8")
-            if not str(body).startswith("---"):
-                body = "---\n{}".format(body)
-            self._body = body
+            with span("render", "template", self.name):
+                type = self.handler_config.get("type")
+                handler_class = self._get_handler_of_type(type)
+                handler = handler_class(
+                    name=self.name,
+                    arguments={
+                        k: v for k, v in self.handler_config.items() if k != "type"
+                    },
+                    sceptre_user_data=self.sceptre_user_data,
+                    connection_manager=self.connection_manager,
+                    stack_group_config=self.stack_group_config,
+                )
+                handler.validate()
+                body = handler.handle()
+                if isinstance(body, bytes):
+                    body = body.decode("utf-8")
+                if not str(body).startswith("---"):
+                    body = "---\n{}".format(body)
+                self._body = body
 
         return self._body
 
@@ -116,31 +134,32 @@ class Template(object):
         """
         self.logger.debug("%s - Uploading template to S3...", self.name)
 
-        with self._boto_s3_lock:
-            if not self._bucket_exists():
-                self._create_bucket()
-
-        # Remove any leading or trailing slashes the user may have added.
-        bucket_name = self.s3_details["bucket_name"]
-        bucket_key = self.s3_details["bucket_key"]
-        bucket_region = self._bucket_region(bucket_name)
-
-        self.logger.debug(
-            "%s - Uploading template to: 's3://%s/%s'",
-            self.name,
-            bucket_name,
-            bucket_key,
-        )
-        self.connection_manager.call(
-            service="s3",
-            command="put_object",
-            kwargs={
-                "Bucket": bucket_name,
-                "Key": bucket_key,
-                "Body": self.body,
-                "ServerSideEncryption": "AES256",
-            },
-        )
+        with span("upload to S3", "template", self.name):
+            with self._boto_s3_lock:
+                if not self._bucket_exists():
+                    self._create_bucket()
+
+            # Remove any leading or trailing slashes the user may have added.
+            bucket_name = self.s3_details["bucket_name"]
+            bucket_key = self.s3_details["bucket_key"]
+            bucket_region = self._bucket_region(bucket_name)
+
+            self.logger.debug(
+                "%s - Uploading template to: 's3://%s/%s'",
+                self.name,
+                bucket_name,
+                bucket_key,
+            )
+            self.connection_manager.call(
+                service="s3",
+                command="put_object",
+                kwargs={
+                    "Bucket": bucket_name,
+                    "Key": bucket_key,
+                    "Body": self.body,
+                    "ServerSideEncryption": "AES256",
+                },
+            )
 
         url = "https://{}.s3.{}.amazonaws.{}/{}".format(
             bucket_name,
@@ -211,15 +230,17 @@ class Template(object):
         Returns the CloudFormation template location.
 
         Uploads the template to S3 and returns the object's URL, or returns
-        the template itself.
+        the template itself. The template is only uploaded once, as its body
+        does not change once rendered.
 
         :returns: The boto call parameter for the template.
         :rtype: dict
         """
         # If bucket_name is set to None, it should be ignored and not uploaded.
         if self.s3_details and self.s3_details.get("bucket_name"):
-            url = self.upload_to_s3()
-            return {"TemplateURL": url}
+            if self._url is None:
+                self._url = self.upload_to_s3()
+            return {"TemplateURL": self._url}
         else:
             return {"TemplateBody": self.body}
 
@@ -233,21 +254,6 @@ class Template(object):
     def _domain_from_region(region):
         return "com.cn" if region.startswith("cn-") else "com"
 
-    @staticmethod
-    def _iterate_entry_points(group, name):
-        """
-        Helper to determine whether to use pkg_resources or importlib.metadata.
-        https://docs.python.org/3/library/importlib.metadata.html
-        """
-        if sys.version_info < (3, 10):
-            from pkg_resources import iter_entry_points
-
-            return iter_entry_points(group, name)
-        else:
-            from importlib.metadata import entry_points
-
-            return entry_points(group=group, name=name)
-
     def _get_handler_of_type(self, type):
         """
         Gets a TemplateHandler type from the registry that can be used to get a string
@@ -257,17 +263,10 @@ class Template(object):
         :return: Instantiated TemplateHandler
         :rtype: class
         """
-        if not self._registry:
-            self._registry = {}
-
-            for entry_point in self._iterate_entry_points(
-                "sceptre.template_handlers", type
-            ):
-                self._registry[entry_point.name] = entry_point.load()
-
-        if type not in self._registry:
+        handler_class = plugins.registry.get(plugins.TEMPLATE_HANDLERS, type)
+        if handler_class is None:
             raise TemplateHandlerNotFoundError(
                 'Handler of type "{0}" not found'.format(type)
             )
 
-        return self._registry[type]
+        return handler_class
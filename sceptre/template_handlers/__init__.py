@@ -1,12 +1,14 @@
 # -*- coding: utf-8 -*-
 import abc
+import json
 import logging
 
 import six
-from jsonschema import validate, ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 from sceptre.exceptions import TemplateHandlerArgumentsInvalidError
-from sceptre.logging import StackLoggerAdapter
+from sceptre.logging import stack_logger
 
 
 @six.add_metaclass(abc.ABCMeta)
@@ -42,6 +44,10 @@ class TemplateHandler:
         + python_template_extensions
     )
 
+    # The validators of the schemas of Template Handlers, keyed by the class of the
+    # Template Handler and its schema.
+    _validators = {}
+
     def __init__(
         self,
         name,
@@ -50,7 +56,7 @@ class TemplateHandler:
         connection_manager=None,
         stack_group_config=None,
     ):
-        self.logger = StackLoggerAdapter(logging.getLogger(__name__), name)
+        self.logger = stack_logger(logging.getLogger(__name__), name)
         self.name = name
         self.arguments = arguments
         self.sceptre_user_data = sceptre_user_data
@@ -86,7 +92,21 @@ class TemplateHandler:
         Validates if the current arguments are correct according to the schema. If this
         does not raise an exception, the template handler's arguments are valid.
         """
-        try:
-            validate(instance=self.arguments, schema=self.schema())
-        except ValidationError as e:
-            raise TemplateHandlerArgumentsInvalidError(e)
+        error = best_match(self._validator().iter_errors(self.arguments))
+        if error is not None:
+            raise TemplateHandlerArgumentsInvalidError(error)
+
+    def _validator(self):
+        """
+        Returns the validator of the schema of this Template Handler. The schema is only
+        checked and compiled once, and its validator is shared by every Template Handler
+        with the same schema.
+        """
+        schema = self.schema()
+        key = (type(self), json.dumps(schema, sort_keys=True, default=repr))
+        validator = self._validators.get(key)
+        if validator is None:
+            validator_class = validator_for(schema)
+            validator_class.check_schema(schema)
+            validator = self._validators[key] = validator_class(schema)
+        return validator
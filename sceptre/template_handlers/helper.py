@@ -5,16 +5,15 @@ import traceback
 import json
 
 from importlib.machinery import SourceFileLoader
-from jinja2 import Environment, select_autoescape, FileSystemLoader, StrictUndefined
 from pathlib import Path
 
+from sceptre import jinja
 from sceptre.helpers import logging_level, write_debug_file
 from sceptre.exceptions import (
     TemplateSceptreHandlerError,
     TemplateNotFoundError,
     SceptreException,
 )
-from sceptre.config import strategies
 
 logger = logging.getLogger(__name__)
 
@@ -134,18 +133,9 @@ def render_jinja_template(path, jinja_vars, j2_environment):
         raise TemplateNotFoundError("No such template file: '%s'", path)
 
     logger.debug("%s Rendering CloudFormation template", path)
-    default_j2_environment_config = {
-        "autoescape": select_autoescape(
-            disabled_extensions=("j2",),
-            default=True,
-        ),
-        "loader": FileSystemLoader(path.parent),
-        "undefined": StrictUndefined,
-    }
-    j2_environment_config = strategies.dict_merge(
-        default_j2_environment_config, j2_environment
+    j2_environment = jinja.environments.get(
+        str(path.parent), j2_environment, unescaped_extensions=("j2",)
     )
-    j2_environment = Environment(**j2_environment_config)
 
     template = j2_environment.get_template(path.name)
 
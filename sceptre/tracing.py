@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+
+"""
+sceptre.tracing
+
+This module implements a Tracer, which records how long each phase of a command
+takes for each Stack, such as waiting for a free slot, running hooks, resolving
+resolvers, rendering and uploading templates and waiting on CloudFormation, and
+exports the spans as Chrome trace events and as OTLP JSON.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
+
+# The Tracer that spans are recorded to, or None when no command is being traced. Like the
+# resolver placeholders toggle, it is global, so that Stacks, Templates, hooks and resolvers
+# can record spans from any thread without a Tracer being passed down to them.
+_TRACER = None
+
+_tracer_lock = threading.Lock()
+
+Span = namedtuple("Span", "name category stack start end thread")
+
+
+class Tracer(object):
+    """
+    Tracer collects the spans recorded while a command runs. Spans are recorded with
+    time.perf_counter() and are exported relative to the time the Tracer was created.
+    This class is thread-safe.
+
+    :param name: The name of the traced run, such as the command.
+    """
+
+    # The category of the span covering the whole execution of a command on a Stack.
+    STACK = "stack"
+
+    def __init__(self, name: str):
+        self.name = name
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._epoch_ns = time.time_ns() - int(self._start * 1e9)
+
+    def add(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        stack: Optional[str] = None,
+    ):
+        """
+        Records a span.
+
+        :param name: The name of the span.
+        :param category: The phase the span belongs to, such as "hooks" or "template".
+        :param start: The time the span started, from time.perf_counter().
+        :param end: The time the span ended, from time.perf_counter().
+        :param stack: The name of the Stack the span belongs to, if any.
+        """
+        span = Span(name, category, stack, start, end, threading.get_ident())
+        with self._lock:
+            self.spans.append(span)
+
+    def stack_durations(self) -> Dict[str, float]:
+        """
+        Returns the duration of the command for every traced Stack, in seconds.
+        """
+        return {
+            span.stack: span.end - span.start
+            for span in self._spans()
+            if span.category == self.STACK
+        }
+
+    def critical_path(self, graph) -> List[str]:
+        """
+        Returns the names of the Stacks on the critical path of the run: the chain of Stacks
+        that ends with the Stack that finished last, where each Stack is preceded by the
+        dependency that finished last, which is the dependency it waited for longest.
+
+        :param graph: The StackGraph the command was executed with, or None.
+        """
+        ends = {
+            span.stack: span.end
+            for span in self._spans()
+            if span.category == self.STACK
+        }
+        if not ends:
+            return []
+
+        stacks = {stack.name: stack for stack in graph} if graph is not None else {}
+        name = max(ends, key=ends.get)
+        path = [name]
+        while name in stacks:
+            traced = [
+                dependency.name
+                for dependency in graph.predecessors(stacks[name])
+                if dependency.name in ends
+            ]
+            if not traced:
+                break
+            name = max(traced, key=ends.get)
+            path.append(name)
+        return list(reversed(path))
+
+    def summary(self, graph, top: int = 10) -> List[str]:
+        """
+        Returns the lines of a summary of the run: the critical path, and the slowest Stacks.
+
+        :param graph: The StackGraph the command was executed with, or None.
+        :param top: The number of slowest Stacks to list.
+        """
+        durations = self.stack_durations()
+        if not durations:
+            return []
+
+        path = self.critical_path(graph)
+        lines = [
+            "%s critical path (%.1fs): %s"
+            % (
+                self.name,
+                sum(durations[name] for name in path),
+                " -> ".join("%s (%.1fs)" % (name, durations[name]) for name in path),
+            ),
+            "%s slowest stacks:" % self.name,
+        ]
+        slowest = sorted(durations.items(), key=lambda item: item[1], reverse=True)
+        for name, duration in slowest[:top]:
+            lines.append("%s - %.1fs" % (name, duration))
+        return lines
+
+    def write(self, path: str):
+        """
+        Writes the spans as a Chrome trace-event JSON file to path, and as an OTLP JSON
+        file next to it.
+
+        :param path: The path of the Chrome trace file.
+        """
+        self.write_chrome_trace(path)
+        self.write_otlp(otlp_path(path))
+
+    def write_chrome_trace(self, path: str):
+        """
+        Writes the spans as a Chrome trace-event JSON file, which can be opened in
+        chrome://tracing or Perfetto. Each Stack is shown on its own row.
+
+        :param path: The path of the file to write.
+        """
+        rows = {None: 0}
+        events = []
+        for span in self._spans():
+            if span.stack not in rows:
+                rows[span.stack] = len(rows)
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": round((span.start - self._start) * 1e6, 3),
+                    "dur": round((span.end - span.start) * 1e6, 3),
+                    "pid": 1,
+                    "tid": rows[span.stack],
+                    "args": {"stack": span.stack, "thread": span.thread},
+                }
+            )
+        for stack, row in rows.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": row,
+                    "args": {"name": stack or "sceptre"},
+                }
+            )
+
+        self._write(path, {"traceEvents": events, "displayTimeUnit": "ms"})
+
+    def write_otlp(self, path: str):
+        """
+        Writes the spans as an OTLP JSON file, in the format of an OpenTelemetry
+        ExportTraceServiceRequest. Each span's parent is the innermost span of the same
+        Stack that encloses it, and the spans of every Stack are children of a root span
+        covering the whole run.
+
+        :param path: The path of the file to write.
+        """
+        spans = self._spans()
+        trace_id = os.urandom(16).hex()
+        root_id = os.urandom(8).hex()
+        start = min((span.start for span in spans), default=self._start)
+        end = max((span.end for span in spans), default=self._start)
+
+        otlp_spans = [self._otlp_span(trace_id, root_id, "", self.name, start, end)]
+        open_spans = {}
+        for span in sorted(spans, key=lambda span: (span.start, -span.end)):
+            enclosing = open_spans.setdefault(span.stack, [])
+            while enclosing and enclosing[-1][0].end < span.end:
+                enclosing.pop()
+            parent_id = enclosing[-1][1] if enclosing else root_id
+            span_id = os.urandom(8).hex()
+            enclosing.append((span, span_id))
+            otlp_spans.append(
+                self._otlp_span(
+                    trace_id,
+                    span_id,
+                    parent_id,
+                    span.name,
+                    span.start,
+                    span.end,
+                    {"sceptre.category": span.category, "sceptre.stack": span.stack},
+                )
+            )
+
+        self._write(
+            path,
+            {
+                "resourceSpans": [
+                    {
+                        "resource": {
+                            "attributes": [
+                                {
+                                    "key": "service.name",
+                                    "value": {"stringValue": "sceptre"},
+                                }
+                            ]
+                        },
+                        "scopeSpans": [
+                            {"scope": {"name": "sceptre"}, "spans": otlp_spans}
+                        ],
+                    }
+                ]
+            },
+        )
+
+    def _otlp_span(
+        self,
+        trace_id: str,
+        span_id: str,
+        parent_id: str,
+        name: str,
+        start: float,
+        end: float,
+        attributes: Optional[dict] = None,
+    ) -> dict:
+        return {
+            "traceId": trace_id,
+            "spanId": span_id,
+            "parentSpanId": parent_id,
+            "name": name,
+            "kind": 1,
+            "startTimeUnixNano": str(self._epoch_ns + int(start * 1e9)),
+            "endTimeUnixNano": str(self._epoch_ns + int(end * 1e9)),
+            "attributes": [
+                {"key": key, "value": {"stringValue": str(value)}}
+                for key, value in (attributes or {}).items()
+                if value is not None
+            ],
+        }
+
+    def _spans(self) -> List[Span]:
+        with self._lock:
+            return list(self.spans)
+
+    @staticmethod
+    def _write(path: str, content: dict):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(content, f)
+
+
+@contextmanager
+def use_tracer(tracer: Tracer):
+    """
+    A context manager that records the spans of everything run inside it to the tracer.
+
+    :param tracer: The Tracer to record spans to.
+    """
+    global _TRACER
+
+    try:
+        with _tracer_lock:
+            _TRACER = tracer
+        yield tracer
+    finally:
+        with _tracer_lock:
+            _TRACER = None
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Returns the Tracer spans are being recorded to, or None if tracing is off."""
+    return _TRACER
+
+
+@contextmanager
+def span(name: str, category: str, stack: Optional[str] = None):
+    """
+    A context manager that records a span around the code run inside it, if tracing is on.
+
+    :param name: The name of the span.
+    :param category: The phase the span belongs to.
+    :param stack: The name of the Stack the span belongs to, if any.
+    """
+    tracer = _TRACER
+    if tracer is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        tracer.add(name, category, start, time.perf_counter(), stack)
+
+
+def otlp_path(path: str) -> str:
+    """
+    Returns the path of the OTLP JSON file written next to a Chrome trace file.
+
+    :param path: The path of the Chrome trace file.
+    """
+    root, extension = os.path.splitext(path)
+    return root + ".otlp" + (extension or ".json")
+
+
+__all__: Iterable[str] = ("Tracer", "use_tracer", "get_tracer", "span", "otlp_path")
@@ -10,12 +10,14 @@ from dateutil.tz import tzutc
 
 from sceptre.exceptions import (
     CannotUpdateFailedStackError,
+    PlanCancelledError,
     ProtectedStackError,
     StackDoesNotExistError,
     UnknownStackChangeSetStatusError,
     UnknownStackStatusError,
 )
 from sceptre.plan.actions import StackActions
+from sceptre.plan.cancellation import CancellationToken, use_cancellation
 from sceptre.stack import Stack
 from sceptre.stack_status import StackChangeSetStatus, StackStatus
 from sceptre.template import Template
@@ -459,6 +461,75 @@ class TestStackActions(object):
         mock_update.assert_called_once_with()
         assert response == sentinel.launch_response
 
+    def _describe_stack_with_tags(self, tags):
+        self.actions.connection_manager.call.return_value = {
+            "Stacks": [
+                {
+                    "StackStatus": "UPDATE_COMPLETE",
+                    "Tags": [{"Key": k, "Value": v} for k, v in tags.items()],
+                }
+            ]
+        }
+
+    @patch("sceptre.plan.actions.StackActions.update")
+    def test_launch_with_unchanged_fingerprint_skips_update(self, mock_update):
+        self.stack.skip_unchanged = True
+        self._describe_stack_with_tags(
+            {StackActions.FINGERPRINT_TAG: self.actions._get_fingerprint()}
+        )
+
+        response = self.actions.launch()
+
+        assert response == StackStatus.COMPLETE
+        mock_update.assert_not_called()
+        self.actions.connection_manager.call.assert_called_once_with(
+            service="cloudformation",
+            command="describe_stacks",
+            kwargs={"StackName": sentinel.external_name},
+        )
+
+    @patch("sceptre.plan.actions.StackActions.update")
+    def test_launch_with_changed_fingerprint_updates(self, mock_update):
+        self.stack.skip_unchanged = True
+        self._describe_stack_with_tags(
+            {StackActions.FINGERPRINT_TAG: self.actions._get_fingerprint()}
+        )
+        self.stack.parameters = {"key1": "val2"}
+
+        self.actions = StackActions(self.stack)
+        self.actions.launch()
+
+        mock_update.assert_called_once_with()
+
+    @patch("sceptre.plan.actions.StackActions.update")
+    def test_launch_without_skip_unchanged_ignores_fingerprint(self, mock_update):
+        self._describe_stack_with_tags(
+            {StackActions.FINGERPRINT_TAG: self.actions._get_fingerprint()}
+        )
+
+        self.actions.launch()
+
+        mock_update.assert_called_once_with()
+
+    def test_fingerprint_changes_with_template(self):
+        fingerprint = self.actions._get_fingerprint()
+        self.template._body = "---\nResources: {}"
+
+        assert StackActions(self.stack)._get_fingerprint() != fingerprint
+
+    def test_stack_tags_include_fingerprint_with_skip_unchanged(self):
+        assert self.actions._get_stack_tags() == [{"Key": "tag1", "Value": "val1"}]
+
+        self.stack.skip_unchanged = True
+
+        assert self.actions._get_stack_tags() == [
+            {"Key": "tag1", "Value": "val1"},
+            {
+                "Key": StackActions.FINGERPRINT_TAG,
+                "Value": self.actions._get_fingerprint(),
+            },
+        ]
+
     @patch("sceptre.plan.actions.StackActions.update")
     @patch("sceptre.plan.actions.StackActions._get_status")
     def test_launch_with_complete_stack_with_no_updates_to_perform(
@@ -1175,6 +1246,68 @@ class TestStackActions(object):
         self.actions.wait_for_cs_completion(sentinel.change_set_name)
         mock_get_cs_status.assert_called_with(sentinel.change_set_name)
 
+    @patch("sceptre.plan.actions.StackActions._get_cs_status")
+    def test_wait_for_cs_completion_raises_when_plan_is_cancelled(
+        self, mock_get_cs_status
+    ):
+        mock_get_cs_status.return_value = StackChangeSetStatus.PENDING
+        cancellation = CancellationToken()
+        cancellation.cancel("the deadline expired")
+
+        with use_cancellation(cancellation), pytest.raises(PlanCancelledError):
+            self.actions.wait_for_cs_completion(sentinel.change_set_name)
+        mock_get_cs_status.assert_called_once_with(sentinel.change_set_name)
+
+    @patch("sceptre.plan.actions.StackActions._log_new_events")
+    @patch("sceptre.plan.actions.StackActions._get_status")
+    def test_wait_for_completion_raises_when_plan_is_cancelled(
+        self, mock_get_status, mock_log_new_events
+    ):
+        mock_get_status.return_value = "UPDATE_IN_PROGRESS"
+        cancellation = CancellationToken(deadline=0)
+
+        with use_cancellation(cancellation), pytest.raises(PlanCancelledError):
+            self.actions._wait_for_completion()
+        assert cancellation.reason == CancellationToken.DEADLINE_EXPIRED
+
+    @patch("sceptre.plan.actions.StackActions._log_new_events")
+    @patch("sceptre.plan.actions.StackActions._get_status")
+    def test_wait_for_completion_returns_status_completed_before_cancellation(
+        self, mock_get_status, mock_log_new_events
+    ):
+        mock_get_status.return_value = "UPDATE_COMPLETE"
+        cancellation = CancellationToken()
+        cancellation.cancel("the deadline expired")
+
+        with use_cancellation(cancellation):
+            status = self.actions._wait_for_completion()
+        assert status == StackStatus.COMPLETE
+
+    @pytest.mark.parametrize("cancel_in_flight", [True, False])
+    @patch("sceptre.plan.actions.StackActions._wait_for_completion")
+    def test_update_in_flight_is_cancelled_only_with_cancel_in_flight(
+        self, mock_wait_for_completion, cancel_in_flight
+    ):
+        self.actions.stack._template = Mock(spec=Template)
+        self.actions.stack._template.get_boto_call_parameter.return_value = {
+            "Template": sentinel.template
+        }
+        mock_wait_for_completion.side_effect = PlanCancelledError()
+        cancellation = CancellationToken(cancel_in_flight=cancel_in_flight)
+        cancellation.cancel("the deadline expired")
+
+        with use_cancellation(cancellation), pytest.raises(PlanCancelledError):
+            self.actions.update()
+        commands = [
+            c.kwargs["command"]
+            for c in self.actions.connection_manager.call.call_args_list
+        ]
+        if cancel_in_flight:
+            assert commands == ["update_stack", "cancel_update_stack"]
+        else:
+            assert commands == ["update_stack"]
+        mock_wait_for_completion.assert_called_once()
+
     @patch("sceptre.plan.actions.StackActions.describe_change_set")
     def test_get_cs_status_handles_all_statuses(self, mock_describe_change_set):
         scss = StackChangeSetStatus
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, sentinel, AsyncMock, Mock, call
+
+import pytest
+from botocore.exceptions import ClientError
+
+from sceptre.exceptions import CannotUpdateFailedStackError, StackDoesNotExistError
+from sceptre.plan.async_actions import AsyncStackActions
+from sceptre.stack import Stack
+from sceptre.stack_status import StackStatus
+
+
+class TestAsyncStackActions(object):
+    def setup_method(self, test_method):
+        self.patcher_connection_manager = patch(
+            "sceptre.plan.actions.ConnectionManager"
+        )
+        self.mock_ConnectionManager = self.patcher_connection_manager.start()
+        self.stack = Stack(
+            name="prod/app/stack",
+            project_code=sentinel.project_code,
+            template_path=sentinel.template_path,
+            region=sentinel.region,
+            profile=sentinel.profile,
+            hooks={},
+            external_name=sentinel.external_name,
+            stack_timeout=0,
+        )
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.async_actions = AsyncStackActions(self.stack, self.executor)
+        self.async_actions.POLL_INTERVAL = 0
+        self.actions = self.async_actions.actions
+        self.actions._create_stack_kwargs = Mock(
+            return_value={"StackName": sentinel.external_name}
+        )
+        self.actions._update_stack_kwargs = Mock(
+            return_value={"StackName": sentinel.external_name}
+        )
+        self.actions._log_new_events = Mock(return_value=sentinel.event_datetime)
+        self.actions._get_status = Mock(return_value="CREATE_COMPLETE")
+        self.actions.connection_manager.call.return_value = {}
+
+    def teardown_method(self, test_method):
+        self.executor.shutdown()
+        self.patcher_connection_manager.stop()
+
+    def _run(self, command, *args):
+        return asyncio.run(self.async_actions.run(command, *args))
+
+    def test_create_sends_request_and_waits_for_completion(self):
+        self.actions._get_status.side_effect = [
+            "CREATE_IN_PROGRESS",
+            "CREATE_IN_PROGRESS",
+            "CREATE_COMPLETE",
+        ]
+
+        status = self._run("create")
+
+        assert status == StackStatus.COMPLETE
+        self.actions.connection_manager.call.assert_called_once_with(
+            service="cloudformation",
+            command="create_stack",
+            kwargs={"StackName": sentinel.external_name},
+        )
+        assert self.actions._get_status.call_count == 3
+
+    def test_create_stack_already_exists(self):
+        self.actions.connection_manager.call.side_effect = ClientError(
+            {
+                "Error": {
+                    "Code": "AlreadyExistsException",
+                    "Message": "Stack already exists",
+                }
+            },
+            sentinel.operation,
+        )
+
+        assert self._run("create") == StackStatus.COMPLETE
+
+    def test_update_with_no_updates_is_complete(self):
+        self.actions.connection_manager.call.side_effect = ClientError(
+            {
+                "Error": {
+                    "Code": "NoUpdateToPerformError",
+                    "Message": "No updates are to be performed.",
+                }
+            },
+            sentinel.operation,
+        )
+
+        assert self._run("update") == StackStatus.COMPLETE
+
+    def test_update_cancels_after_timeout(self):
+        self.stack.stack_timeout = 1
+        self.async_actions.POLL_INTERVAL = 60
+        self.actions._get_status.side_effect = [
+            "UPDATE_IN_PROGRESS",
+            "UPDATE_ROLLBACK_COMPLETE",
+        ]
+
+        with patch("sceptre.plan.async_actions.asyncio.sleep", new_callable=AsyncMock):
+            status = self._run("update")
+
+        assert status == StackStatus.FAILED
+        commands = [
+            c.kwargs["command"]
+            for c in self.actions.connection_manager.call.call_args_list
+        ]
+        assert commands == ["update_stack", "cancel_update_stack"]
+
+    def test_launch_creates_stack_that_does_not_exist(self):
+        self.actions._get_status.side_effect = [
+            StackDoesNotExistError(),
+            "CREATE_COMPLETE",
+        ]
+
+        status = self._run("launch")
+
+        assert status == StackStatus.COMPLETE
+        self.actions.connection_manager.call.assert_called_once_with(
+            service="cloudformation",
+            command="create_stack",
+            kwargs={"StackName": sentinel.external_name},
+        )
+
+    def test_launch_updates_complete_stack(self):
+        self.actions._get_status.side_effect = ["CREATE_COMPLETE", "UPDATE_COMPLETE"]
+
+        assert self._run("launch") == StackStatus.COMPLETE
+        assert (
+            self.actions.connection_manager.call.call_args.kwargs["command"]
+            == "update_stack"
+        )
+
+    def test_launch_skips_unchanged_stack(self):
+        self.actions._is_unchanged = Mock(return_value=True)
+
+        assert self._run("launch") == StackStatus.COMPLETE
+        self.actions.connection_manager.call.assert_not_called()
+
+    def test_launch_failed_stack_raises(self):
+        self.actions._get_status.return_value = "UPDATE_FAILED"
+
+        with pytest.raises(CannotUpdateFailedStackError):
+            self._run("launch")
+
+    def test_delete_stack_that_does_not_exist_is_complete(self):
+        self.actions._get_status.side_effect = StackDoesNotExistError()
+
+        assert self._run("delete") == StackStatus.COMPLETE
+        self.actions.connection_manager.call.assert_not_called()
+
+    def test_delete_completes_when_stack_disappears(self):
+        self.actions._get_status.side_effect = [
+            "CREATE_COMPLETE",
+            StackDoesNotExistError(),
+        ]
+
+        assert self._run("delete") == StackStatus.COMPLETE
+
+    @patch("sceptre.plan.async_actions.execute_hooks")
+    def test_launch_runs_hooks_around_launch_and_create(self, mock_execute_hooks):
+        self.stack.hooks = {
+            "before_launch": sentinel.before_launch,
+            "after_launch": sentinel.after_launch,
+            "before_create": sentinel.before_create,
+            "after_create": sentinel.after_create,
+        }
+        self.actions._get_status.side_effect = [
+            StackDoesNotExistError(),
+            "CREATE_COMPLETE",
+        ]
+
+        self._run("launch")
+
+        assert mock_execute_hooks.call_args_list == [
+            call(sentinel.before_launch),
+            call(sentinel.before_create),
+            call(sentinel.after_create),
+            call(sentinel.after_launch),
+        ]
+
+    def test_commands_without_coroutine_run_in_executor(self):
+        self.actions.describe_outputs = Mock(return_value=sentinel.outputs)
+
+        assert self._run("describe_outputs") == sentinel.outputs
+
+    def test_waits_do_not_hold_a_thread(self):
+        stacks = [
+            Stack(
+                name=f"stack{i}",
+                project_code="project",
+                template_path=sentinel.template_path,
+                region=sentinel.region,
+            )
+            for i in range(50)
+        ]
+
+        async def launch_all():
+            results = []
+            for stack in stacks:
+                async_actions = AsyncStackActions(stack, self.executor)
+                async_actions.POLL_INTERVAL = 0.01
+                async_actions.actions._create_stack_kwargs = Mock(return_value={})
+                async_actions.actions.connection_manager.call.return_value = {}
+                async_actions.actions._log_new_events = Mock()
+                async_actions.actions._get_status = Mock(
+                    side_effect=["CREATE_IN_PROGRESS"] * 5 + ["CREATE_COMPLETE"]
+                )
+                results.append(async_actions.run("create"))
+            return await asyncio.gather(*results)
+
+        # 50 Stacks polling at once, with only the two threads of the executor.
+        assert asyncio.run(launch_all()) == [StackStatus.COMPLETE] * 50
@@ -43,9 +43,15 @@ class TestCli:
     def setup_method(self, test_method):
         self.patcher_ConfigReader = patch("sceptre.plan.plan.ConfigReader")
         self.patcher_StackActions = patch("sceptre.plan.executor.StackActions")
+        self.patcher_StackDurationHistory = patch(
+            "sceptre.plan.plan.StackDurationHistory"
+        )
+        self.patcher_RunJournal = patch("sceptre.plan.plan.RunJournal")
 
         self.mock_ConfigReader = self.patcher_ConfigReader.start()
         self.mock_StackActions = self.patcher_StackActions.start()
+        self.patcher_StackDurationHistory.start()
+        self.patcher_RunJournal.start()
 
         self.mock_config_reader = MagicMock(spec=ConfigReader)
         self.mock_stack_actions = MagicMock(spec=StackActions)
@@ -76,6 +82,8 @@ class TestCli:
     def teardown_method(self, test_method):
         self.patcher_ConfigReader.stop()
         self.patcher_StackActions.stop()
+        self.patcher_StackDurationHistory.stop()
+        self.patcher_RunJournal.stop()
 
     @patch("sys.exit")
     def test_catch_exceptions(self, mock_exit):
@@ -356,6 +364,23 @@ class TestCli:
             )
         )
 
+    @patch("sceptre.plan.plan.TemplateRenderer")
+    def test_validate_template_renders_templates_in_processes(
+        self, mock_TemplateRenderer
+    ):
+        self.mock_stack_actions.validate.return_value = {
+            "ResponseMetadata": {"HTTPStatusCode": 200},
+        }
+
+        result = self.runner.invoke(
+            cli, ["validate", "--render-processes", "4", "dev/vpc.yaml"]
+        )
+
+        assert result.exit_code == 0
+        mock_TemplateRenderer.assert_called_once_with(4)
+        rendered_stacks = mock_TemplateRenderer.return_value.render.call_args.args[0]
+        assert list(rendered_stacks) == [self.mock_stack]
+
     def test_validate_template_with_invalid_template(self):
         client_error = ClientError(
             {
@@ -831,6 +856,16 @@ class TestCli:
 
             assert config == defaults
 
+    def test_new_project_ignores_sceptre_state_directory(self):
+        with self.runner.isolated_filesystem():
+            result = self.runner.invoke(
+                cli, ["new", "project", "example"], input="\n\n"
+            )
+            assert not result.exception
+
+            with open(os.path.join("example", ".gitignore")) as gitignore_file:
+                assert gitignore_file.read() == ".sceptre/\n"
+
     def test_new_project_already_exist(self):
         with self.runner.isolated_filesystem():
             project_path = os.path.abspath("./example")
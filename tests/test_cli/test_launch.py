@@ -2,7 +2,7 @@ import functools
 import itertools
 from collections import defaultdict
 from typing import Optional, List, Set
-from unittest.mock import create_autospec, Mock
+from unittest.mock import create_autospec, Mock, patch
 
 import pytest
 
@@ -10,9 +10,12 @@ from sceptre.cli.launch import Launcher
 from sceptre.cli.prune import Pruner
 from sceptre.context import SceptreContext
 from sceptre.exceptions import DependencyDoesNotExistError
+from sceptre.plan.journal import RunJournal
 from sceptre.plan.plan import SceptrePlan
 from sceptre.stack import Stack
 from sceptre.stack_status import StackStatus
+from sceptre.plan.cancellation import get_cancellation
+from sceptre.tracing import get_tracer
 
 
 class FakePlan(SceptrePlan):
@@ -83,7 +86,17 @@ class TestLauncher:
         # clone without some hijinks.
         self.context = Mock(
             wraps=self.context,
-            **{"clone.return_value": self.cloned_context, "ignore_dependencies": False},
+            **{
+                "clone.return_value": self.cloned_context,
+                "command_path": "my-test-group",
+                "ignore_dependencies": False,
+                "resume": False,
+                "only_failed": False,
+                "trace_file": None,
+                "deadline": None,
+                "cancel_in_flight": False,
+                "changed_files": None,
+            },
         )
 
         self.all_stacks = [
@@ -172,6 +185,88 @@ class TestLauncher:
         assert expected_stacks == launched_stacks
         assert self.plans[0].executions[0][0] == "launch"
 
+    @patch("sceptre.plan.plan.RunJournal")
+    def test_launch__resume__does_not_launch_stacks_completed_in_previous_launch(
+        self, mock_RunJournal
+    ):
+        mock_RunJournal.FAILED_STATUSES = RunJournal.FAILED_STATUSES
+        mock_RunJournal.return_value.outcomes.return_value = {
+            self.all_stacks[0].name: StackStatus.COMPLETE,
+            self.all_stacks[1].name: StackStatus.FAILED,
+            self.all_stacks[2].name: StackStatus.SKIPPED,
+        }
+        self.context.resume = True
+
+        self.launcher.launch(False)
+
+        launched_stacks = set(self.get_executed_stacks(0))
+        assert launched_stacks == set(self.all_stacks[1:])
+
+    @patch("sceptre.plan.plan.RunJournal")
+    def test_launch__only_failed__only_launches_failed_and_skipped_stacks(
+        self, mock_RunJournal
+    ):
+        mock_RunJournal.FAILED_STATUSES = RunJournal.FAILED_STATUSES
+        mock_RunJournal.return_value.outcomes.return_value = {
+            self.all_stacks[0].name: StackStatus.COMPLETE,
+            self.all_stacks[1].name: StackStatus.FAILED,
+            self.all_stacks[2].name: StackStatus.SKIPPED,
+        }
+        self.context.only_failed = True
+
+        self.launcher.launch(False)
+
+        launched_stacks = set(self.get_executed_stacks(0))
+        assert launched_stacks == {self.all_stacks[1], self.all_stacks[2]}
+
+    def test_launch__changed_files__only_launches_affected_stacks(self):
+        self.context.changed_files = ["config/stacks/stack-1.yaml"]
+
+        def filter_by_changes(plan, changed_files):
+            removed = [stack for stack in plan if stack is not self.all_stacks[1]]
+            for stack in removed:
+                plan.remove_stack_from_plan(stack)
+            return removed
+
+        with patch.object(
+            FakePlan, "filter_by_changes", autospec=True, side_effect=filter_by_changes
+        ) as mock_filter_by_changes:
+            self.launcher.launch(False)
+
+        mock_filter_by_changes.assert_called_once_with(
+            self.plans[0], ["config/stacks/stack-1.yaml"]
+        )
+        assert set(self.get_executed_stacks(0)) == {self.all_stacks[1]}
+
+    @patch.object(FakePlan, "graph", None, create=True)
+    @patch.object(FakePlan, "export_trace")
+    def test_launch__trace_file__traces_pruning_and_launch_as_one_run(
+        self, mock_export_trace
+    ):
+        self.context.trace_file = "trace.json"
+        tracers = []
+        self.fake_pruner.prune.side_effect = lambda: tracers.append(get_tracer()) or 0
+
+        self.launcher.launch(True)
+
+        tracer, graph = mock_export_trace.call_args.args
+        assert tracers == [tracer]
+        assert tracer.name == "launch"
+        assert get_tracer() is None
+
+    def test_launch__deadline__is_shared_by_pruning_and_launch(self):
+        self.context.deadline = 30
+        cancellations = []
+        self.fake_pruner.prune.side_effect = (
+            lambda: cancellations.append(get_cancellation()) or 0
+        )
+
+        self.launcher.launch(True)
+
+        (cancellation,) = cancellations
+        assert 29 * 60 < cancellation.remaining(3600) <= 30 * 60
+        assert get_cancellation() is None
+
     def test_launch__prune__stack_with_dependency_marked_obsolete__raises_dependency_does_not_exist_error(
         self,
     ):
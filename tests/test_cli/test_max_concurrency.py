@@ -184,3 +184,128 @@ class TestMaxConcurrencyValidation:
             mock_context.assert_called_once()
             call_kwargs = mock_context.call_args[1]
             assert call_kwargs["max_concurrency"] == 7
+
+    def test_scheduler_passed_to_context(self):
+        """Test that the scheduler option is passed to SceptreContext"""
+        with patch("sceptre.cli.launch.SceptreContext") as mock_context, patch(
+            "sceptre.cli.launch.Launcher"
+        ) as mock_launcher:
+            mock_launcher.return_value.launch.return_value = 0
+
+            mock_ctx_obj = {
+                "project_path": "/fake/path",
+                "user_variables": {},
+                "options": {},
+                "ignore_dependencies": False,
+            }
+
+            self.runner.invoke(
+                launch_command,
+                ["test-stack", "--scheduler", "stream", "--yes"],
+                obj=mock_ctx_obj,
+            )
+
+            call_kwargs = mock_context.call_args[1]
+            assert call_kwargs["scheduler"] == "stream"
+
+    def test_continue_on_failure_passed_to_context(self):
+        """Test that the continue-on-failure flag is passed to SceptreContext"""
+        with patch("sceptre.cli.launch.SceptreContext") as mock_context, patch(
+            "sceptre.cli.launch.Launcher"
+        ) as mock_launcher:
+            mock_launcher.return_value.launch.return_value = 0
+
+            mock_ctx_obj = {
+                "project_path": "/fake/path",
+                "user_variables": {},
+                "options": {},
+                "ignore_dependencies": False,
+            }
+
+            self.runner.invoke(
+                launch_command,
+                ["test-stack", "--continue-on-failure", "--yes"],
+                obj=mock_ctx_obj,
+            )
+
+            call_kwargs = mock_context.call_args[1]
+            assert call_kwargs["continue_on_failure"] is True
+
+    def test_engine_passed_to_context(self):
+        """Test that the engine option is passed to SceptreContext"""
+        with patch("sceptre.cli.launch.SceptreContext") as mock_context, patch(
+            "sceptre.cli.launch.Launcher"
+        ) as mock_launcher:
+            mock_launcher.return_value.launch.return_value = 0
+
+            mock_ctx_obj = {
+                "project_path": "/fake/path",
+                "user_variables": {},
+                "options": {},
+                "ignore_dependencies": False,
+            }
+
+            self.runner.invoke(
+                launch_command,
+                ["test-stack", "--engine", "asyncio", "--yes"],
+                obj=mock_ctx_obj,
+            )
+
+            call_kwargs = mock_context.call_args[1]
+            assert call_kwargs["engine"] == "asyncio"
+
+    def test_resume_and_only_failed_passed_to_context(self):
+        """Test that the resume and only_failed flags are passed to SceptreContext"""
+        with patch("sceptre.cli.launch.SceptreContext") as mock_context, patch(
+            "sceptre.cli.launch.Launcher"
+        ) as mock_launcher:
+            mock_launcher.return_value.launch.return_value = 0
+
+            mock_ctx_obj = {
+                "project_path": "/fake/path",
+                "user_variables": {},
+                "options": {},
+                "ignore_dependencies": False,
+            }
+
+            self.runner.invoke(
+                launch_command,
+                ["test-stack", "--resume", "--only-failed", "--yes"],
+                obj=mock_ctx_obj,
+            )
+
+            call_kwargs = mock_context.call_args[1]
+            assert call_kwargs["resume"] is True
+            assert call_kwargs["only_failed"] is True
+
+    def test_trace_file_passed_to_context(self):
+        """Test that the trace file option is passed to SceptreContext"""
+        with patch("sceptre.cli.launch.SceptreContext") as mock_context, patch(
+            "sceptre.cli.launch.Launcher"
+        ) as mock_launcher:
+            mock_launcher.return_value.launch.return_value = 0
+
+            mock_ctx_obj = {
+                "project_path": "/fake/path",
+                "user_variables": {},
+                "options": {},
+                "ignore_dependencies": False,
+            }
+
+            self.runner.invoke(
+                launch_command,
+                ["test-stack", "--trace-file", "trace.json", "--yes"],
+                obj=mock_ctx_obj,
+            )
+
+            call_kwargs = mock_context.call_args[1]
+            assert call_kwargs["trace_file"] == "trace.json"
+
+    def test_launch_command_rejects_unknown_scheduler(self):
+        """Test that launch command rejects an unknown scheduler"""
+        result = self.runner.invoke(
+            launch_command, ["test-stack", "--scheduler", "waves"]
+        )
+
+        assert result.exit_code != 0
+        assert "Invalid value" in result.output
@@ -0,0 +1,98 @@
+from unittest.mock import Mock, call, patch, sentinel
+
+import pytest
+from click.testing import CliRunner
+
+from sceptre.cli.run import run_command
+
+
+class TestRunCommand:
+    def setup_method(self, method):
+        self.runner = CliRunner()
+        self.ctx_obj = {
+            "project_path": "/fake/path",
+            "user_variables": {},
+            "options": {},
+            "ignore_dependencies": False,
+            "output_format": "text",
+            "no_colour": True,
+        }
+        self.steps = Mock()
+        self.patchers = {
+            "SceptrePlan": patch("sceptre.cli.run.SceptrePlan"),
+            "validate_plan": patch(
+                "sceptre.cli.run.validate_plan", self.steps.validate_plan
+            ),
+            "diff_plan": patch("sceptre.cli.run.diff_plan", self.steps.diff_plan),
+            "Launcher": patch("sceptre.cli.run.Launcher", self.steps.Launcher),
+        }
+        self.mock_SceptrePlan = self.patchers["SceptrePlan"].start()
+        for name in ("validate_plan", "diff_plan", "Launcher"):
+            self.patchers[name].start()
+        self.plan = self.mock_SceptrePlan.return_value
+        self.plan.refresh = self.steps.refresh
+        self.steps.Launcher.return_value.launch.return_value = 0
+
+    def teardown_method(self, method):
+        for patcher in self.patchers.values():
+            patcher.stop()
+
+    def invoke(self, *args):
+        return self.runner.invoke(run_command, list(args), obj=self.ctx_obj)
+
+    def test_commands_run_in_order_with_one_plan(self):
+        result = self.invoke("validate,diff,launch", "dev", "--yes")
+
+        assert result.exit_code == 0
+        self.mock_SceptrePlan.assert_called_once()
+        assert [name for name, _, _ in self.steps.mock_calls][:4] == [
+            "validate_plan",
+            "diff_plan",
+            "refresh",
+            "Launcher",
+        ]
+        self.steps.validate_plan.assert_called_once_with(self.plan, False)
+        self.steps.diff_plan.assert_called_once_with(
+            self.plan, "deepdiff", False, False, False
+        )
+        launcher_factory = self.steps.Launcher.call_args.kwargs["plan_factory"]
+        assert launcher_factory(sentinel.context) is self.plan
+        self.steps.Launcher.return_value.launch.assert_called_once_with(False)
+
+    def test_validate_and_diff_share_the_plan_without_refreshing_it(self):
+        self.invoke("validate,diff", "dev")
+
+        self.steps.refresh.assert_not_called()
+
+    def test_commands_after_launch_refresh_the_plan(self):
+        self.invoke("launch,diff", "dev", "--yes")
+
+        assert [name for name, _, _ in self.steps.mock_calls][-2:] == [
+            "refresh",
+            "diff_plan",
+        ]
+
+    def test_failed_launch_stops_following_commands(self):
+        self.steps.Launcher.return_value.launch.return_value = 1
+
+        result = self.invoke("launch,diff", "dev", "--yes")
+
+        assert result.exit_code == 1
+        self.steps.diff_plan.assert_not_called()
+
+    def test_launch_asks_for_confirmation_without_yes(self):
+        self.invoke("launch", "dev")
+
+        assert self.steps.Launcher.return_value.mock_calls[:3] == [
+            call.print_operations(False),
+            call.confirm(False),
+            call.launch(False),
+        ]
+
+    @pytest.mark.parametrize("commands", ["validate,deploy", ",", ""])
+    def test_unknown_commands_are_rejected(self, commands):
+        result = self.invoke(commands, "dev")
+
+        assert result.exit_code == 2
+        assert "must be a comma-separated list of" in result.output
+        self.mock_SceptrePlan.assert_not_called()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+import os
+
+from sceptre.config.cache import ConfigCache, ConfigCachePool
+from sceptre.hooks.cmd import Cmd
+from sceptre.resolvers.stack_output import StackOutput
+
+NODE_CLASSES = {"cmd": Cmd, "stack_output": StackOutput}
+
+
+class TestConfigCache(object):
+    def test_saved_config_is_read_back_with_its_resolvers_and_hooks(self, tmp_path):
+        path = str(tmp_path / "cache" / "config.json")
+        cache = ConfigCache(path, NODE_CLASSES)
+        cache.put(
+            "A/1.yaml",
+            "fingerprint",
+            {
+                "parameters": {"Vpc": StackOutput("A/vpc.yaml::VpcId")},
+                "hooks": {"before_create": [Cmd("echo hi")]},
+                "stack_tags": {"Count": 1},
+            },
+            {"A": 2},
+        )
+        cache.save()
+
+        config, max_concurrency = ConfigCache(path, NODE_CLASSES).get(
+            "A/1.yaml", "fingerprint"
+        )
+
+        assert isinstance(config["parameters"]["Vpc"], StackOutput)
+        assert config["parameters"]["Vpc"].argument == "A/vpc.yaml::VpcId"
+        assert isinstance(config["hooks"]["before_create"][0], Cmd)
+        assert config["stack_tags"] == {"Count": 1}
+        assert max_concurrency == {"A": 2}
+
+    def test_get__changed_fingerprint__returns_none(self, tmp_path):
+        cache = ConfigCache(str(tmp_path / "config.json"), NODE_CLASSES)
+        cache.put("A/1.yaml", "fingerprint", {"region": "eu-west-1"}, {})
+
+        assert cache.get("A/1.yaml", "other fingerprint") is None
+
+    def test_put__unsupported_value__is_not_stored(self, tmp_path):
+        cache = ConfigCache(str(tmp_path / "config.json"), NODE_CLASSES)
+        cache.put("A/1.yaml", "fingerprint", {"date": datetime.date.today()}, {})
+
+        assert cache.get("A/1.yaml", "fingerprint") is None
+
+    def test_unreadable_cache_file_is_ignored(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text("{not json")
+
+        assert ConfigCache(str(path), NODE_CLASSES).get("A/1.yaml", "x") is None
+
+    def test_prune_drops_entries_of_removed_files(self, tmp_path):
+        os.makedirs(tmp_path / "config" / "A")
+        (tmp_path / "config" / "A" / "1.yaml").write_text("")
+        cache = ConfigCache(str(tmp_path / "config.json"), NODE_CLASSES)
+        for rel_path in ["A/1.yaml", "A/2.yaml", "A/config.yaml", "B/config.yaml"]:
+            cache.put(rel_path, "fingerprint", {}, {})
+
+        cache.prune(str(tmp_path / "config"), "config.yaml")
+
+        assert cache.get("A/1.yaml", "fingerprint") is not None
+        assert cache.get("A/config.yaml", "fingerprint") is not None
+        assert cache.get("A/2.yaml", "fingerprint") is None
+        assert cache.get("B/config.yaml", "fingerprint") is None
+
+
+class TestConfigCachePool(object):
+    def test_open__not_keeping__reads_cache_each_time(self, tmp_path):
+        pool = ConfigCachePool()
+        path = str(tmp_path / "config.json")
+
+        assert pool.open(path, NODE_CLASSES) is not pool.open(path, NODE_CLASSES)
+
+    def test_open__keeping__returns_same_cache_until_cleared(self, tmp_path):
+        pool = ConfigCachePool()
+        pool.keep = True
+        path = str(tmp_path / "config.json")
+        cache = pool.open(path, NODE_CLASSES)
+
+        assert pool.open(path, NODE_CLASSES) is cache
+        pool.clear()
+        assert pool.open(path, NODE_CLASSES) is not cache
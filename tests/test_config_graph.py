@@ -0,0 +1,141 @@
+from unittest.mock import patch
+
+import pytest
+
+from sceptre.config.graph import StackGraph
+from sceptre.exceptions import CircularDependenciesError
+
+
+class Node(object):
+    def __init__(self, name, *dependencies):
+        self.name = name
+        self.dependencies = list(dependencies)
+
+    def __str__(self):
+        return self.name
+
+
+class TestStackGraph(object):
+    def test_graph_has_an_edge_from_each_dependency(self):
+        vpc = Node("dev/vpc")
+        subnets = Node("dev/subnets", vpc)
+        dns = Node("dev/dns")
+
+        graph = StackGraph({vpc, subnets, dns})
+
+        assert set(graph) == {vpc, subnets, dns}
+        assert list(graph.successors(vpc)) == [subnets]
+        assert list(graph.predecessors(subnets)) == [vpc]
+        assert graph.count_dependencies(dns) == 0
+
+    def test_cycle_is_reported(self):
+        a = Node("dev/a")
+        b = Node("dev/b", a)
+        a.dependencies.append(b)
+
+        with pytest.raises(CircularDependenciesError) as error:
+            StackGraph({a, b})
+
+        assert "dev/a -> dev/b -> dev/a" in str(error.value)
+
+    def test_stack_depending_on_itself_is_reported(self):
+        a = Node("dev/a")
+        a.dependencies.append(a)
+
+        with pytest.raises(CircularDependenciesError, match="dev/a -> dev/a"):
+            StackGraph({a})
+
+    def test_every_cycle_is_reported(self):
+        a, b = Node("dev/a"), Node("dev/b")
+        c, d, e = Node("dev/c"), Node("dev/d"), Node("dev/e")
+        a.dependencies.append(b)
+        b.dependencies.append(a)
+        c.dependencies.append(d)
+        d.dependencies.extend([c, e])
+        e.dependencies.append(d)
+        independent = Node("dev/independent", a)
+
+        with pytest.raises(CircularDependenciesError) as error:
+            StackGraph({a, b, c, d, e, independent})
+
+        message = str(error.value)
+        assert "dev/a -> dev/b -> dev/a" in message
+        assert "dev/c -> dev/d -> dev/c (also involving dev/e)" in message
+        assert "dev/independent" not in message
+
+    def test_graph_of_20000_stacks_is_built_in_linear_work(self):
+        nodes = [Node("stack-0")]
+        for i in range(1, 20000):
+            nodes.append(Node(f"stack-{i}", nodes[i // 2], nodes[i - 1]))
+
+        # Cycles are checked once, after every edge is added, reading each adjacency list
+        # a bounded number of times rather than once per edge.
+        with patch.object(
+            StackGraph, "_adjacent", autospec=True, side_effect=StackGraph._adjacent
+        ) as mock_adjacent:
+            graph = StackGraph(set(nodes))
+
+        assert len(list(graph)) == 20000
+        assert mock_adjacent.call_count <= 2 * len(nodes)
+
+    def test_chain_of_20000_stacks_is_checked_without_recursion(self):
+        nodes = [Node("stack-0")]
+        for i in range(1, 20000):
+            nodes.append(Node(f"stack-{i}", nodes[i - 1]))
+
+        graph = StackGraph(set(nodes))
+
+        assert list(graph.successors(nodes[0])) == [nodes[1]]
+        assert len(graph.generations()) == 20000
+
+    def test_cycle_in_graph_of_20000_stacks_is_reported(self):
+        nodes = [Node("stack-0")]
+        for i in range(1, 20000):
+            nodes.append(Node(f"stack-{i}", nodes[i - 1]))
+        nodes[0].dependencies.append(nodes[-1])
+
+        with pytest.raises(
+            CircularDependenciesError, match="stack-0 -> stack-1 -> stack-2 "
+        ):
+            StackGraph(set(nodes))
+
+
+class TestStackGraphFiltering(object):
+    def setup_method(self, test_method):
+        self.vpc = Node("dev/vpc")
+        self.subnets = Node("dev/subnets", self.vpc)
+        self.sg = Node("dev/sg", self.vpc)
+        self.app = Node("dev/app", self.subnets, self.sg)
+        self.dns = Node("dev/dns")
+        self.graph = StackGraph({self.vpc, self.subnets, self.sg, self.app, self.dns})
+
+    def test_filtered_holds_sources_and_their_dependencies(self):
+        filtered = self.graph.filtered({self.subnets, self.dns})
+
+        assert set(filtered) == {self.vpc, self.subnets, self.dns}
+        assert list(filtered.successors(self.vpc)) == [self.subnets]
+        assert filtered.generations() == [{self.vpc, self.dns}, {self.subnets}]
+
+    def test_filtered_reverse_holds_dependents_with_edges_reversed(self):
+        filtered = self.graph.filtered({self.subnets}, reverse=True)
+
+        assert set(filtered) == {self.subnets, self.app}
+        assert list(filtered.successors(self.app)) == [self.subnets]
+        assert filtered.generations() == [{self.app}, {self.subnets}]
+
+    def test_reversed_view_swaps_edges(self):
+        reversed_graph = self.graph.reversed()
+
+        assert set(reversed_graph.successors(self.vpc)) == set()
+        assert set(reversed_graph.predecessors(self.vpc)) == {self.subnets, self.sg}
+        assert reversed_graph.generations()[0] == {self.app, self.dns}
+
+    def test_remove_stack_removes_its_edges(self):
+        self.graph.remove_stack(self.subnets)
+
+        assert self.subnets not in self.graph
+        assert set(self.graph.successors(self.vpc)) == {self.sg}
+        assert list(self.graph.predecessors(self.app)) == [self.sg]
+        assert self.graph.count_dependencies(self.app) == 1
+        with pytest.raises(KeyError):
+            self.graph.successors(self.subnets)
@@ -12,6 +12,7 @@ from click.testing import CliRunner
 from freezegun import freeze_time
 from glob import glob
 
+from sceptre import jinja
 from sceptre.config.reader import ConfigReader
 from sceptre.context import SceptreContext
 from sceptre.resolvers.stack_attr import StackAttr
@@ -316,6 +317,7 @@ class TestConfigReader(object):
             template_key_prefix=None,
             ignore=False,
             obsolete=False,
+            skip_unchanged=False,
             stack_group_config={
                 "project_path": self.context.project_path,
                 "custom_key": "custom_value",
@@ -442,6 +444,82 @@ class TestConfigReader(object):
         all_stacks, command_stacks = config_reader.construct_stacks()
         assert list(all_stacks)[0].disable_rollback
 
+    def test_construct_stacks_with_skip_unchanged_command_param(self):
+        project_path, config_dir = self.create_project()
+
+        rel_path = "A/1.yaml"
+        config = {
+            "region": "region",
+            "project_code": "project_code",
+            "template": {"path": rel_path},
+            "skip_unchanged": True,
+        }
+
+        abs_path = os.path.join(config_dir, rel_path)
+        self.write_config(abs_path, config)
+        self.context.project_path = project_path
+        self.context.command_params["skip_unchanged"] = False
+        config_reader = ConfigReader(self.context)
+        all_stacks, command_stacks = config_reader.construct_stacks()
+        assert list(all_stacks)[0].skip_unchanged is False
+
+    def test_construct_stacks_with_skip_unchanged_in_stack_config(self):
+        project_path, config_dir = self.create_project()
+
+        rel_path = "A/1.yaml"
+        config = {
+            "region": "region",
+            "project_code": "project_code",
+            "template": {"path": rel_path},
+            "skip_unchanged": True,
+        }
+
+        abs_path = os.path.join(config_dir, rel_path)
+        self.write_config(abs_path, config)
+        self.context.project_path = project_path
+        config_reader = ConfigReader(self.context)
+        all_stacks, command_stacks = config_reader.construct_stacks()
+        assert list(all_stacks)[0].skip_unchanged is True
+
+    def test_reconstruct_stacks_constructs_unresolved_copies(self, monkeypatch):
+        project_path, config_dir = self.create_project()
+        self.write_config(
+            os.path.join(config_dir, "A/1.yaml"),
+            {
+                "region": "region",
+                "project_code": "project_code",
+                "template": {"path": "A/1.yaml"},
+            },
+        )
+        abs_path = os.path.join(config_dir, "A/2.yaml")
+        with open(abs_path, "w") as config_file:
+            config_file.write(
+                "region: region\n"
+                "project_code: project_code\n"
+                "template:\n"
+                "  path: A/2.yaml\n"
+                "dependencies:\n"
+                "  - A/1.yaml\n"
+                "parameters:\n"
+                "  Name: !environment_variable SCEPTRE_TEST_NAME\n"
+            )
+        self.context.project_path = project_path
+        config_reader = ConfigReader(self.context)
+        all_stacks, _ = config_reader.construct_stacks()
+        stacks = {stack.name: stack for stack in all_stacks}
+        monkeypatch.setenv("SCEPTRE_TEST_NAME", "first")
+        assert stacks["A/2"].parameters == {"Name": "first"}
+
+        monkeypatch.setenv("SCEPTRE_TEST_NAME", "second")
+        reconstructed = {
+            stack.name: stack for stack in config_reader.reconstruct_stacks(all_stacks)
+        }
+
+        assert set(reconstructed) == {"A/1", "A/2"}
+        assert reconstructed["A/1"] is not stacks["A/1"]
+        assert reconstructed["A/2"].dependencies == [reconstructed["A/1"]]
+        assert reconstructed["A/2"].parameters == {"Name": "second"}
+
     @pytest.mark.parametrize(
         "filepaths, del_key",
         [
@@ -892,3 +970,321 @@ class TestConfigReader(object):
         config_reader = ConfigReader(self.context)
         with pytest.raises(SceptreException):
             config_reader.construct_stacks()
+
+    def test_stack_group_concurrency_limits_are_recorded_per_stack_group(self):
+        project_path, config_dir = self.create_project()
+        self.write_config(
+            os.path.join(config_dir, "config.yaml"),
+            {"region": "region", "project_code": "project_code"},
+        )
+        self.write_config(
+            os.path.join(config_dir, "A", "config.yaml"), {"max_concurrency": 2}
+        )
+        self.write_config(
+            os.path.join(config_dir, "A", "B", "config.yaml"), {"max_concurrency": 1}
+        )
+        self.write_config(
+            os.path.join(config_dir, "A", "B", "1.yaml"), {"template": {"path": "1"}}
+        )
+
+        self.context.project_path = project_path
+        self.context.command_path = "A"
+        config_reader = ConfigReader(self.context)
+        all_stacks, _ = config_reader.construct_stacks()
+
+        assert config_reader.stack_group_concurrency_limits() == {"A": 2, "A/B": 1}
+        assert "max_concurrency" not in list(all_stacks)[0].stack_group_config
+
+    @pytest.mark.parametrize("max_concurrency", [0, -1, "two", True])
+    def test_invalid_stack_group_max_concurrency_raises(self, max_concurrency):
+        project_path, config_dir = self.create_project()
+        self.write_config(
+            os.path.join(config_dir, "A", "config.yaml"),
+            {"max_concurrency": max_concurrency},
+        )
+
+        self.context.project_path = project_path
+        config_reader = ConfigReader(self.context)
+
+        with pytest.raises(InvalidConfigFileError):
+            config_reader._read("A/config.yaml")
+
+    def create_cached_project(self):
+        project_path, config_dir = self.create_project()
+        self.write_config(
+            os.path.join(config_dir, "config.yaml"),
+            {"region": "region", "project_code": "project_code", "max_concurrency": 2},
+        )
+        os.makedirs(os.path.join(config_dir, "A"))
+        with open(os.path.join(config_dir, "A", "1.yaml"), "w") as config_file:
+            config_file.write(
+                "template:\n"
+                "  path: {{ var.template_path }}\n"
+                "parameters:\n"
+                "  Output: !stack_attr template_bucket_name\n"
+            )
+        self.context.project_path = project_path
+        self.context.command_path = "A"
+        self.context.user_variables = {"template_path": "1.yaml"}
+        self.context.config_cache = True
+        return config_dir
+
+    def construct_cached_stacks(self):
+        config_reader = ConfigReader(self.context)
+        all_stacks, _ = config_reader.construct_stacks()
+        return config_reader, {stack.name: stack for stack in all_stacks}
+
+    def test_construct_stacks_with_config_cache__unchanged_files__does_not_render(
+        self,
+    ):
+        self.create_cached_project()
+        _, first_stacks = self.construct_cached_stacks()
+
+        with patch.object(ConfigReader, "_render") as mock_render:
+            config_reader, stacks = self.construct_cached_stacks()
+
+        mock_render.assert_not_called()
+        assert stacks["A/1"].template_handler_config == {"path": "1.yaml"}
+        assert repr(stacks["A/1"].config) == repr(first_stacks["A/1"].config)
+        assert isinstance(stacks["A/1"].config["parameters"]["Output"], StackAttr)
+        assert config_reader.stack_group_concurrency_limits() == {"": 2}
+
+    def test_construct_stacks_with_config_cache__changed_file__renders_again(self):
+        config_dir = self.create_cached_project()
+        self.construct_cached_stacks()
+
+        self.write_config(
+            os.path.join(config_dir, "config.yaml"),
+            {"region": "other_region", "project_code": "project_code"},
+        )
+        _, stacks = self.construct_cached_stacks()
+
+        assert stacks["A/1"].region == "other_region"
+
+    def test_construct_stacks_with_config_cache__changed_var__renders_again(self):
+        self.create_cached_project()
+        self.construct_cached_stacks()
+
+        self.context.user_variables = {"template_path": "2.yaml"}
+        _, stacks = self.construct_cached_stacks()
+
+        assert stacks["A/1"].template_handler_config == {"path": "2.yaml"}
+
+    def test_construct_stacks_with_config_cache__included_template__is_not_cached(
+        self,
+    ):
+        config_dir = self.create_cached_project()
+        with open(os.path.join(config_dir, "A", "2.yaml"), "w") as config_file:
+            config_file.write('{% include "1.yaml" %}\n')
+        self.construct_cached_stacks()
+
+        with patch.object(
+            ConfigReader, "_render", side_effect=ConfigReader._render, autospec=True
+        ) as mock_render:
+            self.construct_cached_stacks()
+
+        rendered = {call.args[2] for call in mock_render.call_args_list}
+        assert rendered == {"2.yaml"}
+
+    def test_construct_stacks__stack_group_config_is_rendered_once_per_inputs(self):
+        project_path, config_dir = self.create_project()
+        self.write_config(
+            os.path.join(config_dir, "config.yaml"),
+            {"region": "region", "project_code": "project_code"},
+        )
+        with open(os.path.join(config_dir, "config.yaml"), "a") as config_file:
+            config_file.write("template_bucket_name: '{{ stack_group_path }}'\n")
+        for group in ["A", "B"]:
+            self.write_config(
+                os.path.join(config_dir, "Team", group, "config.yaml"),
+                {"stack_tags": {"Group": group}},
+            )
+            self.write_config(
+                os.path.join(config_dir, "Team", group, "1.yaml"),
+                {"template": {"path": "1.yaml"}},
+            )
+        self.write_config(
+            os.path.join(config_dir, "Team", "config.yaml"),
+            {"sceptre_user_data": {"team": "team"}},
+        )
+
+        self.context.project_path = project_path
+        self.context.command_path = "Team"
+        with patch.object(
+            ConfigReader,
+            "_render_template",
+            side_effect=ConfigReader._render_template,
+            autospec=True,
+        ) as mock_render_template:
+            all_stacks, _ = ConfigReader(self.context).construct_stacks()
+
+        rendered = [
+            os.path.join(call.args[1], call.args[2])
+            for call in mock_render_template.call_args_list
+            if call.args[2] == "config.yaml"
+        ]
+        # The root config file references the path of the StackGroup being read, so it is
+        # rendered for each of them, but the Team config file is only rendered once.
+        assert sorted(rendered) == [
+            "Team/A/config.yaml",
+            "Team/B/config.yaml",
+            "Team/config.yaml",
+            "config.yaml",
+            "config.yaml",
+        ]
+        stacks = {stack.name: stack for stack in all_stacks}
+        assert stacks["Team/A/1"].template_bucket_name == "Team/A"
+        assert stacks["Team/B/1"].template_bucket_name == "Team/B"
+        assert stacks["Team/B/1"].tags == {"Group": "B"}
+        assert stacks["Team/B/1"].sceptre_user_data == {"team": "team"}
+
+    def test_construct_stacks_with_jinja_cache__keeps_compiled_config_files(self):
+        self.create_cached_project()
+        self.context.config_cache = False
+        self.context.jinja_cache = True
+
+        try:
+            self.construct_cached_stacks()
+        finally:
+            jinja.environments.bytecode_cache_path = None
+
+        jinja_cache_path = os.path.join(
+            self.context.full_state_path(), "cache", "jinja"
+        )
+        cached_files = [
+            name for _, _, names in os.walk(jinja_cache_path) for name in names
+        ]
+        assert len(cached_files) == 2
+
+    def test_construct_stacks_with_config_processes__reads_the_same_stacks(self):
+        project_path, config_dir = self.create_project()
+        self.write_config(
+            os.path.join(config_dir, "config.yaml"),
+            {"region": "region", "project_code": "project_code"},
+        )
+        self.write_config(
+            os.path.join(config_dir, "A", "config.yaml"),
+            {"stack_tags": {"Group": "{{ stack_group_path }}"}},
+        )
+        for rel_path, dependencies in [
+            ("A/1.yaml", ["A/2.yaml", "B/1.yaml"]),
+            ("A/2.yaml", []),
+            ("B/1.yaml", ["B/2.yaml"]),
+            ("B/2.yaml", []),
+        ]:
+            self.write_config(
+                os.path.join(config_dir, rel_path),
+                {
+                    "template": {"path": rel_path},
+                    "dependencies": dependencies,
+                },
+            )
+        self.context.project_path = project_path
+        self.context.command_path = "A"
+        in_process, _ = ConfigReader(self.context).construct_stacks()
+
+        self.context.config_processes = 2
+        in_workers, command_stacks = ConfigReader(self.context).construct_stacks()
+
+        def describe(stacks):
+            return {
+                stack.name: (
+                    repr(stack.config),
+                    sorted(dependency.name for dependency in stack.dependencies),
+                )
+                for stack in stacks
+            }
+
+        assert describe(in_workers) == describe(in_process)
+        assert {stack.name for stack in command_stacks} == {"A/1", "A/2"}
+
+    def test_construct_stacks_with_config_processes__invalid_config__raises(self):
+        project_path, config_dir = self.create_project()
+        self.write_config(
+            os.path.join(config_dir, "config.yaml"),
+            {"region": "region", "project_code": "project_code"},
+        )
+        self.write_config(
+            os.path.join(config_dir, "A", "1.yaml"), {"template": {"path": "1.yaml"}}
+        )
+        with open(os.path.join(config_dir, "A", "2.yaml"), "w") as config_file:
+            config_file.write("parameters: {{ undefined_variable }}\n")
+        self.context.project_path = project_path
+        self.context.command_path = "A"
+        self.context.config_processes = 2
+
+        with pytest.raises(SceptreException, match="A/2.yaml"):
+            ConfigReader(self.context).construct_stacks()
+
+    def test_construct_stacks__stacks_share_inherited_values(self):
+        project_path, config_dir = self.create_project()
+        self.write_config(
+            os.path.join(config_dir, "config.yaml"),
+            {
+                "region": "region",
+                "project_code": "project_code",
+                "sceptre_user_data": {"subnets": ["a", "b"]},
+                "stack_tags": {"Owners": ["team"]},
+                "custom": {"nested": ["value"]},
+            },
+        )
+        for name in ("1", "2"):
+            self.write_config(
+                os.path.join(config_dir, "A", f"{name}.yaml"),
+                {
+                    "template": {"path": f"{name}.yaml"},
+                    "stack_tags": {"Name": name},
+                    "stack_tags_inheritance": "merge",
+                },
+            )
+        self.context.project_path = project_path
+
+        stacks = ConfigReader(self.context).construct_stacks()[0]
+        stack_1, stack_2 = sorted(stacks, key=lambda stack: stack.name)
+
+        assert stack_1._tags["Owners"] is stack_2._tags["Owners"]
+        assert (
+            stack_1._sceptre_user_data["subnets"]
+            is stack_2._sceptre_user_data["subnets"]
+        )
+        assert stack_1.tags == {"Owners": ["team"], "Name": "1"}
+        assert stack_2.tags == {"Owners": ["team"], "Name": "2"}
+        assert (
+            stack_1.stack_group_config["custom"] is stack_2.stack_group_config["custom"]
+        )
+        assert stack_1.stack_group_config["custom"] == {"nested": ["value"]}
+
+    def test_construct_stacks__mutating_inherited_values__other_stacks_are_unchanged(
+        self,
+    ):
+        project_path, config_dir = self.create_project()
+        self.write_config(
+            os.path.join(config_dir, "config.yaml"),
+            {
+                "region": "region",
+                "project_code": "project_code",
+                "sceptre_user_data": {"network": {"subnets": ["a", "b"]}},
+                "custom": {"nested": ["value"]},
+            },
+        )
+        for name in ("1", "2"):
+            self.write_config(
+                os.path.join(config_dir, "A", f"{name}.yaml"),
+                {"template": {"path": f"{name}.yaml"}},
+            )
+        self.context.project_path = project_path
+
+        stacks = ConfigReader(self.context).construct_stacks()[0]
+        stack_1, stack_2 = sorted(stacks, key=lambda stack: stack.name)
+
+        stack_1.sceptre_user_data["network"]["subnets"].append("c")
+        stack_1.sceptre_user_data["network"]["vpc"] = "vpc-1"
+        stack_1.template.stack_group_config["custom"]["nested"].append("other")
+        stack_1.stack_group_config["new"] = 1
+
+        assert stack_1.sceptre_user_data == {
+            "network": {"subnets": ["a", "b", "c"], "vpc": "vpc-1"}
+        }
+        assert stack_2.sceptre_user_data == {"network": {"subnets": ["a", "b"]}}
+        assert stack_2.template.stack_group_config["custom"] == {"nested": ["value"]}
+        assert "new" not in stack_2.stack_group_config
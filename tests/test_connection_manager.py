@@ -3,8 +3,9 @@ import warnings
 import pytest
 
 from collections import defaultdict
+from datetime import datetime, timedelta, timezone
 from typing import Union
-from unittest.mock import Mock, patch, sentinel, create_autospec
+from unittest.mock import MagicMock, Mock, call, patch, sentinel, create_autospec
 from deprecation import fail_if_not_removed
 
 from boto3.session import Session
@@ -13,6 +14,7 @@ from botocore.exceptions import ClientError
 from sceptre.connection_manager import (
     ConnectionManager,
     _retry_boto_call,
+    observe_throttling,
 )
 from sceptre.exceptions import RetryLimitExceededError, InvalidAWSCredentialsError
 
@@ -35,6 +37,7 @@ class TestConnectionManager(object):
         ConnectionManager._boto_sessions = {}
         ConnectionManager._clients = {}
         ConnectionManager._stack_keys = {}
+        ConnectionManager._session_expirations = {}
 
         self.connection_manager = ConnectionManager(
             region=self.region,
@@ -258,6 +261,68 @@ class TestConnectionManager(object):
                 self.profile, self.region, self.connection_manager.sceptre_role
             )
 
+    def test_get_session__sceptre_role_credentials_expire_soon__assumes_role_again(
+        self,
+    ):
+        self.connection_manager.sceptre_role = "sceptre_role"
+        assume_role = self.mock_session.client.return_value.assume_role
+        assume_role.return_value = {
+            "Credentials": {
+                "AccessKeyId": "id",
+                "SecretAccessKey": "key",
+                "SessionToken": "token",
+                "Expiration": datetime.now(timezone.utc) + timedelta(minutes=1),
+            }
+        }
+
+        self.connection_manager.get_session()
+        self.connection_manager.get_session()
+
+        assert assume_role.call_count == 2
+
+    def test_drop_session__holds_session_and_client_locks(self):
+        key = (self.region, self.profile, "sceptre_role")
+        self.connection_manager._boto_sessions[key] = sentinel.boto_session
+        locks = MagicMock()
+
+        with patch.object(
+            ConnectionManager, "_client_lock", locks.client_lock
+        ), patch.object(ConnectionManager, "_session_lock", locks.session_lock):
+            self.connection_manager._drop_session(key)
+
+        assert locks.mock_calls[:2] == [
+            call.client_lock.__enter__(),
+            call.session_lock.__enter__(),
+        ]
+        assert key not in self.connection_manager._boto_sessions
+
+    def test_get_session__sceptre_role_credentials_do_not_expire_soon__reuses_session(
+        self,
+    ):
+        self.connection_manager.sceptre_role = "sceptre_role"
+        assume_role = self.mock_session.client.return_value.assume_role
+        assume_role.return_value = {
+            "Credentials": {
+                "AccessKeyId": "id",
+                "SecretAccessKey": "key",
+                "SessionToken": "token",
+                "Expiration": datetime.now(timezone.utc) + timedelta(hours=1),
+            }
+        }
+
+        self.connection_manager.get_session()
+        self.connection_manager.get_session()
+
+        assert assume_role.call_count == 1
+
+    def test_clear_sessions__drops_sessions_and_clients(self):
+        self.connection_manager._get_client("s3", self.region, None, None, None)
+
+        ConnectionManager.clear_sessions()
+
+        assert ConnectionManager._boto_sessions == {}
+        assert ConnectionManager._clients == {}
+
     def test_get_client_with_no_pre_existing_clients(self):
         service = "s3"
         region = "eu-west-1"
@@ -842,6 +907,48 @@ class TestRetry:
         assert e.value.response["Error"]["Code"] == 500
         assert e.value.response["Error"]["Message"] == "Boom!"
 
+    @patch("sceptre.connection_manager.time.sleep")
+    def test_retry_boto_call_notifies_throttling_observer(self, mock_sleep):
+        mock_func = Mock()
+        mock_func.side_effect = [
+            ClientError(
+                {"Error": {"Code": "Throttling", "Message": "Request limit hit"}},
+                sentinel.operation,
+            ),
+            sentinel.response,
+        ]
+        # The attribute function.__name__ is required by the decorator @wraps.
+        mock_func.__name__ = "mock_func"
+        observer = Mock()
+
+        with observe_throttling(observer):
+            _retry_boto_call(mock_func)()
+
+        assert observer.method_calls == [call.throttled(), call.succeeded()]
+
+    def test_retry_boto_call_does_not_notify_after_observing_stops(self):
+        observer = Mock()
+
+        with observe_throttling(observer):
+            pass
+        _retry_boto_call(lambda: sentinel.response)()
+
+        observer.succeeded.assert_not_called()
+
+    def test_retry_boto_call_notifies_outer_observer_after_nested_observing_stops(
+        self,
+    ):
+        outer_observer = Mock()
+        inner_observer = Mock()
+
+        with observe_throttling(outer_observer):
+            with observe_throttling(inner_observer):
+                pass
+            _retry_boto_call(lambda: sentinel.response)()
+
+        outer_observer.succeeded.assert_called_once_with()
+        inner_observer.succeeded.assert_not_called()
+
     @patch("sceptre.connection_manager.time.sleep")
     def test_retry_boto_call_raises_retry_limit_exceeded_exception(self, mock_sleep):
         mock_func = Mock()
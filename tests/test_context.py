@@ -100,6 +100,14 @@ class TestSceptreContext(object):
         full_templates_path = path.join(f"{getcwd()}/project_path", self.templates_path)
         assert context.full_templates_path() == full_templates_path
 
+    def test_full_state_path_returns_correct_path(self):
+        context = SceptreContext(
+            project_path="project_path",
+            command_path="command",
+        )
+        full_state_path = path.join(f"{getcwd()}/project_path", ".sceptre")
+        assert context.full_state_path() == full_state_path
+
     def test_clone__returns_full_clone_of_context(self):
         context = SceptreContext(
             project_path="project_path",
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+import os
+import stat
+import tempfile
+import threading
+
+import pytest
+
+from sceptre import daemon
+from sceptre.exceptions import DaemonError
+
+
+@pytest.fixture
+def socket_path():
+    # UNIX socket paths are limited in length, so they are kept short.
+    with tempfile.TemporaryDirectory(prefix="sd") as directory:
+        yield os.path.join(directory, "daemon", "d.sock")
+
+
+@pytest.fixture
+def running_daemon(socket_path):
+    ready = threading.Event()
+    thread = threading.Thread(target=daemon.Daemon(socket_path).serve, args=(ready,))
+    thread.start()
+    assert ready.wait(10)
+    yield thread
+    if thread.is_alive():
+        daemon.stop(socket_path)
+    thread.join(10)
+
+
+class TestDaemon(object):
+    def test_run__writes_output_of_command(self, running_daemon, socket_path, capsys):
+        exit_code = daemon.run(["--version"], socket_path)
+
+        assert exit_code == 0
+        assert capsys.readouterr().out.startswith("Sceptre, version")
+
+    def test_run__unknown_command__returns_usage_error(
+        self, running_daemon, socket_path, capsys
+    ):
+        exit_code = daemon.run(["no-such-command"], socket_path)
+
+        assert exit_code == 2
+        assert "No such command" in capsys.readouterr().err
+
+    def test_run__runs_command_in_working_directory_of_client(
+        self, running_daemon, socket_path, tmp_path, monkeypatch, capsys
+    ):
+        (tmp_path / "config" / "dev").mkdir(parents=True)
+        (tmp_path / "config" / "config.yaml").write_text(
+            "project_code: prj\nregion: eu-west-1\n"
+        )
+        (tmp_path / "config" / "dev" / "vpc.yaml").write_text(
+            "template_path: vpc.yaml\n"
+        )
+        monkeypatch.chdir(tmp_path)
+
+        exit_code = daemon.run(["list", "stacks", "dev"], socket_path)
+
+        assert exit_code == 0
+        assert "dev/vpc.yaml: prj-dev-vpc" in capsys.readouterr().out
+
+    def test_run__uses_config_cache(
+        self, running_daemon, socket_path, tmp_path, monkeypatch
+    ):
+        (tmp_path / "config" / "dev").mkdir(parents=True)
+        (tmp_path / "config" / "config.yaml").write_text(
+            "project_code: prj\nregion: eu-west-1\n"
+        )
+        (tmp_path / "config" / "dev" / "vpc.yaml").write_text(
+            "template_path: vpc.yaml\n"
+        )
+        monkeypatch.chdir(tmp_path)
+
+        exit_code = daemon.run(["list", "stacks", "dev"], socket_path)
+
+        assert exit_code == 0
+        assert (tmp_path / ".sceptre" / "cache" / "config.json").is_file()
+
+    def test_status__returns_pid(self, running_daemon, socket_path):
+        assert daemon.status(socket_path) == os.getpid()
+
+    def test_stop__stops_daemon_and_removes_socket(self, running_daemon, socket_path):
+        daemon.stop(socket_path)
+        running_daemon.join(10)
+
+        assert not running_daemon.is_alive()
+        assert not os.path.exists(socket_path)
+
+    def test_serve__daemon_already_running__raises_daemon_error(
+        self, running_daemon, socket_path
+    ):
+        with pytest.raises(DaemonError):
+            daemon.Daemon(socket_path).serve()
+
+    def test_serve__socket_and_directory__only_accessible_to_owner(
+        self, running_daemon, socket_path
+    ):
+        directory = os.path.dirname(socket_path)
+
+        assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+        assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+
+    def test_serve__directory_accessible_to_other_users__raises_daemon_error(
+        self, socket_path
+    ):
+        directory = os.path.dirname(socket_path)
+        os.makedirs(directory)
+        os.chmod(directory, 0o755)
+
+        with pytest.raises(DaemonError, match="can be accessed by other users"):
+            daemon.Daemon(socket_path).serve()
+
+        assert not os.path.exists(socket_path)
+
+    def test_status__no_daemon_running__raises_daemon_error(self, socket_path):
+        with pytest.raises(DaemonError):
+            daemon.status(socket_path)
+
+    def test_socket_path__env_var_set__returns_env_var(self, monkeypatch):
+        monkeypatch.setenv(daemon.SOCKET_PATH_ENV_VAR, "/tmp/sceptre.sock")
+
+        assert daemon.socket_path() == "/tmp/sceptre.sock"
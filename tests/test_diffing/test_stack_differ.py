@@ -201,6 +201,16 @@ class TestStackDiffer:
             self.expected_deployed_config, self.expected_generated_config
         )
 
+    def test_diff__ignores_deployed_fingerprint_tag(self):
+        expected_deployed_config = self.expected_deployed_config
+        self.deployed_tags[StackActions.FINGERPRINT_TAG] = "fingerprint"
+
+        self.differ.diff(self.actions)
+
+        self.command_capturer.compare_stack_configurations.assert_called_with(
+            expected_deployed_config, self.expected_generated_config
+        )
+
     def test_diff__config_diff_is_value_returned_by_implemented_differ(self):
         diff = self.differ.diff(self.actions)
 
@@ -4,6 +4,7 @@ Integration tests for max_concurrency feature
 
 from unittest.mock import Mock, patch, MagicMock
 
+from sceptre.config.graph import StackGraph
 from sceptre.context import SceptreContext
 from sceptre.plan.plan import SceptrePlan
 from sceptre.plan.executor import SceptrePlanExecutor
@@ -43,6 +44,7 @@ class TestMaxConcurrencyIntegration:
 
             mock_stack_graph_instance = Mock()
             mock_stack_graph.return_value = mock_stack_graph_instance
+            mock_stack_graph_instance.filtered.return_value = StackGraph(set())
 
             # Create plan
             plan = SceptrePlan(context)
@@ -71,7 +73,7 @@ class TestMaxConcurrencyIntegration:
         # Mock the config reader and dependencies
         with patch("sceptre.plan.plan.ConfigReader") as mock_config_reader, patch(
             "sceptre.plan.plan.StackGraph"
-        ) as mock_stack_graph:
+        ) as mock_stack_graph, patch("sceptre.plan.plan.RunJournal"):
 
             mock_config_reader_instance = Mock()
             mock_config_reader.return_value = mock_config_reader_instance
@@ -79,9 +81,11 @@ class TestMaxConcurrencyIntegration:
                 [self.stack1, self.stack2, self.stack3],
                 [self.stack1, self.stack2, self.stack3],
             )
+            mock_config_reader_instance.stack_group_concurrency_limits.return_value = {}
 
             mock_stack_graph_instance = Mock()
             mock_stack_graph.return_value = mock_stack_graph_instance
+            mock_stack_graph_instance.filtered.return_value = StackGraph(set())
 
             # Mock ThreadPoolExecutor
             mock_executor_instance = MagicMock()
@@ -101,7 +105,8 @@ class TestMaxConcurrencyIntegration:
             plan.launch_order = [{self.stack1, self.stack2, self.stack3}]
 
             with patch(
-                "sceptre.plan.executor.as_completed", return_value=[mock_future] * 3
+                "sceptre.plan.executor.wait",
+                side_effect=lambda futures, return_when: (set(futures), set()),
             ):
                 plan._execute()
 
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+from sceptre.jinja import EnvironmentPool
+
+
+class TestEnvironmentPool(object):
+    def setup_method(self, test_method):
+        self.pool = EnvironmentPool()
+
+    def test_get__same_directory_and_options__returns_the_same_environment(
+        self, tmp_path
+    ):
+        first = self.pool.get(str(tmp_path), {"lstrip_blocks": True}, ["j2"])
+        second = self.pool.get(str(tmp_path), {"lstrip_blocks": True}, ["j2"])
+
+        assert first is second
+        assert first.lstrip_blocks is True
+
+    def test_get__different_options__returns_different_environments(self, tmp_path):
+        environment = self.pool.get(str(tmp_path), {}, ["j2"])
+
+        assert self.pool.get(str(tmp_path), {"trim_blocks": True}, ["j2"]) is not (
+            environment
+        )
+        assert self.pool.get(str(tmp_path), {}, ["yaml"]) is not environment
+        assert self.pool.get(str(tmp_path / "other"), {}, ["j2"]) is not environment
+
+    def test_get__options_not_read_from_yaml__returns_a_new_environment(self, tmp_path):
+        options = {"finalize": str}
+
+        assert self.pool.get(str(tmp_path), options, ["j2"]) is not self.pool.get(
+            str(tmp_path), options, ["j2"]
+        )
+
+    def test_get__changed_template__is_compiled_again(self, tmp_path):
+        template_path = tmp_path / "template.j2"
+        template_path.write_text("{{ a }}")
+        environment = self.pool.get(str(tmp_path), {}, ["j2"])
+        assert environment.get_template("template.j2").render(a=1) == "1"
+
+        template_path.write_text("{{ a }}{{ a }}")
+        os.utime(template_path, (0, 0))
+
+        assert environment.get_template("template.j2").render(a=1) == "11"
+
+    def test_get__bytecode_cache_path__keeps_compiled_templates(self, tmp_path):
+        (tmp_path / "template.j2").write_text("{{ a }}")
+        self.pool.bytecode_cache_path = str(tmp_path / "cache")
+        self.pool.get(str(tmp_path), {}, ["j2"]).get_template("template.j2")
+
+        other_pool = EnvironmentPool()
+        other_pool.bytecode_cache_path = str(tmp_path / "cache")
+        environment = other_pool.get(str(tmp_path), {}, ["j2"])
+        bucket = environment.bytecode_cache.get_bucket(
+            environment, "template.j2", str(tmp_path / "template.j2"), "{{ a }}"
+        )
+
+        assert bucket.code is not None
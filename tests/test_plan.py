@@ -1,10 +1,12 @@
 import pytest
 from unittest.mock import MagicMock, patch, sentinel
 
+from sceptre.config.graph import StackGraph
 from sceptre.context import SceptreContext
 from sceptre.stack import Stack
 from sceptre.config.reader import ConfigReader
 from sceptre.plan.plan import SceptrePlan
+from sceptre.resolvers import Resolver
 
 
 class TestSceptrePlan(object):
@@ -61,3 +63,244 @@ class TestSceptrePlan(object):
             plan = MagicMock(spec=SceptrePlan)
             plan.context = self.mock_context
             plan.invalid_command()
+
+
+class TestSceptrePlanLaunchOrder(object):
+    def setup_method(self, test_method):
+        self.patcher_ConfigReader = patch("sceptre.plan.plan.ConfigReader")
+        self.mock_ConfigReader = self.patcher_ConfigReader.start()
+        self.context = SceptreContext(
+            project_path="project", command_path="dev", ignore_dependencies=False
+        )
+
+        self.vpc = self._make_stack("dev/vpc")
+        self.subnets = self._make_stack("dev/subnets", self.vpc)
+        self.sg = self._make_stack("dev/sg", self.vpc)
+        self.app = self._make_stack("dev/app", self.subnets, self.sg)
+        self.dns = self._make_stack("dev/dns")
+        self.stacks = {self.vpc, self.subnets, self.sg, self.app, self.dns}
+
+    def teardown_method(self, test_method):
+        self.patcher_ConfigReader.stop()
+
+    @staticmethod
+    def _make_stack(name, *dependencies):
+        stack = MagicMock(spec=Stack)
+        stack.name = name
+        stack.dependencies = list(dependencies)
+        return stack
+
+    def _make_plan(self, command_stacks=None):
+        self.mock_ConfigReader.return_value.construct_stacks.return_value = (
+            self.stacks,
+            command_stacks or self.stacks,
+        )
+        return SceptrePlan(self.context)
+
+    def test_launch_order_is_generations_of_dependencies(self):
+        plan = self._make_plan()
+
+        plan.resolve("launch")
+
+        assert plan.launch_order == [
+            {self.vpc, self.dns},
+            {self.subnets, self.sg},
+            {self.app},
+        ]
+
+    def test_reverse_launch_order(self):
+        plan = self._make_plan()
+
+        plan.resolve("delete", reverse=True)
+
+        assert plan.launch_order == [
+            {self.app, self.dns},
+            {self.subnets, self.sg},
+            {self.vpc},
+        ]
+
+    def test_launch_order_includes_dependencies_of_command_stacks(self):
+        plan = self._make_plan(command_stacks={self.sg})
+
+        plan.resolve("launch")
+
+        assert plan.launch_order == [{self.vpc}, {self.sg}]
+
+    def test_remove_stack_from_plan(self):
+        plan = self._make_plan()
+        plan.resolve("launch")
+
+        plan.remove_stack_from_plan(self.sg)
+        plan.remove_stack_from_plan(self.sg)
+
+        assert plan.launch_order == [
+            {self.vpc, self.dns},
+            {self.subnets},
+            {self.app},
+        ]
+
+    def test_remove_stack_from_launch_order_changed_after_resolve(self):
+        plan = self._make_plan()
+        plan.resolve("launch")
+        plan.remove_stack_from_plan(self.dns)
+
+        plan.launch_order = [{self.app}, {self.vpc, self.dns}]
+        plan.remove_stack_from_plan(self.dns)
+
+        assert plan.launch_order == [{self.app}, {self.vpc}]
+
+    def test_filter(self):
+        plan = self._make_plan()
+        plan.resolve("launch")
+
+        plan.filter(lambda stack: stack.name != "dev/subnets")
+
+        assert set(plan) == self.stacks - {self.subnets}
+
+    def test_refresh_replaces_stacks_with_reconstructed_stacks(self):
+        plan = self._make_plan(command_stacks={self.sg})
+        plan.resolve("diff")
+        new_vpc = self._make_stack("dev/vpc")
+        new_sg = self._make_stack("dev/sg", new_vpc)
+        self.mock_ConfigReader.return_value.reconstruct_stacks.return_value = {
+            new_vpc,
+            new_sg,
+        }
+        for stack in self.stacks:
+            stack._template = None
+
+        plan.refresh()
+        plan.resolve("launch")
+
+        assert plan.command_stacks == {new_sg}
+        assert plan.launch_order == [{new_vpc}, {new_sg}]
+
+    @pytest.mark.parametrize(
+        "sceptre_user_data, reused",
+        [
+            pytest.param({"Name": "app"}, True, id="without resolvers"),
+            pytest.param({"Name": MagicMock(spec=Resolver)}, False, id="resolvers"),
+        ],
+    )
+    def test_refresh_reuses_templates_rendered_without_resolvers(
+        self, sceptre_user_data, reused
+    ):
+        self.stacks = {self.dns}
+        plan = self._make_plan()
+        self.dns._template = MagicMock(_body="rendered")
+        new_dns = self._make_stack("dev/dns")
+        new_dns.stack_group_config = {}
+        new_dns.config = {"sceptre_user_data": sceptre_user_data}
+        new_dns.template._body = None
+        self.mock_ConfigReader.return_value.reconstruct_stacks.return_value = {new_dns}
+
+        plan.refresh()
+
+        assert (new_dns.template._body == "rendered") is reused
+
+    @pytest.mark.parametrize(
+        "max_concurrency, recorded",
+        [
+            pytest.param(None, False, id="unlimited"),
+            pytest.param(2, True, id="max concurrency"),
+        ],
+    )
+    @patch("sceptre.plan.plan.SceptrePlanExecutor")
+    @patch("sceptre.plan.plan.StackDurationHistory")
+    def test_durations_are_only_recorded_while_concurrency_is_limited(
+        self,
+        mock_StackDurationHistory,
+        mock_SceptrePlanExecutor,
+        max_concurrency,
+        recorded,
+    ):
+        self.mock_ConfigReader.return_value.stack_group_concurrency_limits.return_value = (
+            {}
+        )
+        plan = self._make_plan()
+        plan.max_concurrency = max_concurrency
+
+        plan.create()
+
+        assert mock_StackDurationHistory.called is recorded
+        history = mock_SceptrePlanExecutor.call_args.kwargs["history"]
+        assert (history is not None) is recorded
+
+    @pytest.mark.parametrize(
+        "command, journal, resume, journaled",
+        [
+            pytest.param("launch", False, False, False, id="launch"),
+            pytest.param("launch", True, False, True, id="launch --journal"),
+            pytest.param("launch", False, True, True, id="launch --resume"),
+            pytest.param("delete", True, False, False, id="delete"),
+        ],
+    )
+    @patch("sceptre.plan.plan.SceptrePlanExecutor")
+    @patch("sceptre.plan.plan.RunJournal")
+    def test_runs_are_only_journaled_when_asked_for(
+        self,
+        mock_RunJournal,
+        mock_SceptrePlanExecutor,
+        command,
+        journal,
+        resume,
+        journaled,
+    ):
+        self.mock_ConfigReader.return_value.stack_group_concurrency_limits.return_value = (
+            {}
+        )
+        self.context.journal = journal
+        self.context.resume = resume
+        plan = self._make_plan()
+
+        getattr(plan, command)()
+
+        assert mock_RunJournal.called is journaled
+        run_journal = mock_SceptrePlanExecutor.call_args.kwargs["journal"]
+        assert (run_journal is not None) is journaled
+
+    def test_journals_are_kept_per_command_path(self):
+        plan = self._make_plan()
+        plan.resolve("launch")
+        dev_journal = plan._journal()
+        self.context.command_path = "prod"
+
+        prod_journal = plan._journal()
+
+        assert dev_journal.path != prod_journal.path
+        assert dev_journal.path.endswith(".jsonl")
+        assert "launch-dev-" in dev_journal.path
+
+    def test_launch_order_of_20000_stacks_is_resolved_and_filtered_in_linear_work(
+        self,
+    ):
+        class Node(object):
+            def __init__(self, name, *dependencies):
+                self.name = name
+                self.dependencies = list(dependencies)
+
+        nodes = [Node("stack-0")]
+        for i in range(1, 20000):
+            nodes.append(Node(f"stack-{i}", nodes[i // 2], nodes[i - 1]))
+
+        plan = self._make_plan()
+        plan.graph = StackGraph(set(nodes))
+        plan.command_stacks = set(nodes)
+
+        # Every adjacency list is read a bounded number of times however many Stacks there
+        # are, rather than once per Stack for every Stack.
+        with patch.object(
+            StackGraph, "_adjacent", autospec=True, side_effect=StackGraph._adjacent
+        ) as mock_adjacent:
+            plan.resolve("launch")
+        assert mock_adjacent.call_count <= 4 * len(nodes)
+
+        plan.remove_stack_from_plan(nodes[1])
+        batch_index = plan._batch_index
+        plan.filter(lambda node: int(node.name.split("-")[1]) % 2 == 0)
+
+        # Removing Stacks looks them up in the index built by the first removal, rather
+        # than scanning the launch order for each of them.
+        assert plan._batch_index is batch_index
+        assert len(plan.launch_order) == 20000
+        assert len(list(plan)) == 10000
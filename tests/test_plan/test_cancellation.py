@@ -0,0 +1,81 @@
+import threading
+import time
+
+import pytest
+
+from sceptre.exceptions import PlanCancelledError
+from sceptre.plan.cancellation import (
+    CancellationToken,
+    get_cancellation,
+    use_cancellation,
+)
+
+
+class TestCancellationToken:
+    def test_token_without_deadline_is_not_cancelled(self):
+        cancellation = CancellationToken()
+
+        assert not cancellation.cancelled
+        assert cancellation.remaining(10) == 10
+
+    def test_cancel_keeps_the_first_reason(self):
+        cancellation = CancellationToken()
+
+        cancellation.cancel("first")
+        cancellation.cancel("second")
+
+        assert cancellation.cancelled
+        assert cancellation.reason == "first"
+
+    def test_expired_deadline_cancels_token(self):
+        cancellation = CancellationToken(deadline=0)
+
+        assert cancellation.cancelled
+        assert cancellation.reason == CancellationToken.DEADLINE_EXPIRED
+        assert cancellation.remaining(10) == 0
+
+    def test_remaining_is_capped_by_deadline(self):
+        cancellation = CancellationToken(deadline=60)
+
+        assert cancellation.remaining(4) == 4
+        assert 0 < cancellation.remaining(600) <= 60
+
+    def test_sleep_returns_when_token_is_cancelled(self):
+        cancellation = CancellationToken()
+        threading.Timer(0.05, cancellation.cancel, ["interrupted"]).start()
+
+        start = time.monotonic()
+        assert cancellation.sleep(30)
+        assert time.monotonic() - start < 10
+
+    def test_sleep_returns_at_deadline(self):
+        cancellation = CancellationToken(deadline=0.05)
+
+        assert cancellation.sleep(30)
+
+    def test_raise_if_cancelled(self):
+        cancellation = CancellationToken()
+        cancellation.raise_if_cancelled("dev/vpc")
+
+        cancellation.cancel("the deadline expired")
+
+        with pytest.raises(PlanCancelledError, match="dev/vpc.*the deadline expired"):
+            cancellation.raise_if_cancelled("dev/vpc")
+
+
+class TestUseCancellation:
+    def test_token_is_active_inside_context_only(self):
+        cancellation = CancellationToken()
+
+        with use_cancellation(cancellation):
+            assert get_cancellation() is cancellation
+        assert get_cancellation() is None
+
+    def test_nested_token_restores_outer_token(self):
+        outer = CancellationToken()
+        inner = CancellationToken()
+
+        with use_cancellation(outer):
+            with use_cancellation(inner):
+                assert get_cancellation() is inner
+            assert get_cancellation() is outer
@@ -0,0 +1,112 @@
+from unittest.mock import Mock
+
+from sceptre.plan.concurrency import AdaptiveConcurrency, ConcurrencyLimits
+from sceptre.stack import Stack
+
+
+def make_stack(name, region="eu-west-1", profile=None, sceptre_role=None):
+    stack = Mock(spec=Stack)
+    stack.name = name
+    stack.region = region
+    stack.profile = profile
+    stack.sceptre_role = sceptre_role
+    return stack
+
+
+class TestConcurrencyLimits:
+    def test_without_limits_every_stack_can_start(self):
+        limits = ConcurrencyLimits()
+        stack = make_stack("dev/a")
+
+        for _ in range(100):
+            assert limits.can_start(stack)
+            limits.start(stack)
+
+        assert not limits
+
+    def test_account_region_limit(self):
+        limits = ConcurrencyLimits(account_region_limit=1)
+        stack_a = make_stack("dev/a", sceptre_role="role-1")
+        stack_b = make_stack("dev/b", sceptre_role="role-1")
+
+        limits.start(stack_a)
+
+        assert not limits.can_start(stack_b)
+        limits.finish(stack_a)
+        assert limits.can_start(stack_b)
+
+    def test_account_region_limit_is_separate_per_account_and_region(self):
+        limits = ConcurrencyLimits(account_region_limit=1)
+        limits.start(make_stack("dev/a", sceptre_role="role-1"))
+
+        assert limits.can_start(make_stack("dev/b", sceptre_role="role-2"))
+        assert limits.can_start(
+            make_stack("dev/c", region="us-east-1", sceptre_role="role-1")
+        )
+
+    def test_profile_identifies_account_without_sceptre_role(self):
+        limits = ConcurrencyLimits(account_region_limit=1)
+        limits.start(make_stack("dev/a", profile="prod"))
+
+        assert not limits.can_start(make_stack("dev/b", profile="prod"))
+        assert limits.can_start(make_stack("dev/c", profile="test"))
+
+    def test_stack_group_limit_applies_to_nested_stack_groups(self):
+        limits = ConcurrencyLimits(stack_group_limits={"dev": 1})
+        limits.start(make_stack("dev/app/a"))
+
+        assert not limits.can_start(make_stack("dev/b"))
+        assert limits.can_start(make_stack("development/c"))
+        assert limits.can_start(make_stack("prod/d"))
+
+    def test_top_level_stack_group_limit_applies_to_every_stack(self):
+        limits = ConcurrencyLimits(stack_group_limits={"": 1})
+        limits.start(make_stack("dev/a"))
+
+        assert not limits.can_start(make_stack("prod/b"))
+
+
+class TestAdaptiveConcurrency:
+    def setup_method(self, method):
+        self.now = 0.0
+        self.adaptive = AdaptiveConcurrency(16, cooldown=5, clock=lambda: self.now)
+
+    def test_limit_starts_at_maximum(self):
+        assert self.adaptive.limit == 16
+
+    def test_throttling_halves_limit(self):
+        self.adaptive.throttled()
+        assert self.adaptive.limit == 8
+
+        self.now = 5
+        self.adaptive.throttled()
+        assert self.adaptive.limit == 4
+
+    def test_throttling_within_cooldown_halves_limit_once(self):
+        for _ in range(10):
+            self.adaptive.throttled()
+
+        assert self.adaptive.limit == 8
+
+    def test_limit_is_not_halved_below_minimum(self):
+        for second in range(0, 100, 5):
+            self.now = second
+            self.adaptive.throttled()
+
+        assert self.adaptive.limit == 1
+
+    def test_limit_grows_by_one_for_about_every_limit_successes(self):
+        self.adaptive.throttled()
+
+        for _ in range(8):
+            self.adaptive.succeeded()
+        assert self.adaptive.limit == 8
+
+        self.adaptive.succeeded()
+        assert self.adaptive.limit == 9
+
+    def test_limit_does_not_grow_above_maximum(self):
+        for _ in range(1000):
+            self.adaptive.succeeded()
+
+        assert self.adaptive.limit == 16
@@ -1,7 +1,23 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import Counter
 from unittest.mock import Mock, patch, MagicMock
 
+import pytest
+from botocore.exceptions import ClientError
+
+from sceptre.config.graph import StackGraph
+from sceptre.connection_manager import _retry_boto_call
+from sceptre.exceptions import PlanCancelledError
+from sceptre.plan.cancellation import CancellationToken, get_cancellation
+from sceptre.plan.concurrency import ConcurrencyLimits
+from sceptre.plan.journal import RunJournal
 from sceptre.plan.executor import SceptrePlanExecutor
 from sceptre.stack import Stack
+from sceptre.stack_status import StackStatus
+from sceptre.tracing import Tracer, use_tracer
 
 
 class TestSceptrePlanExecutor:
@@ -103,10 +119,10 @@ class TestSceptrePlanExecutor:
         mock_future.result.return_value = (self.stack1, "SUCCESS")
         mock_executor_instance.submit.return_value = mock_future
 
-        # Mock as_completed to return the futures
+        # Mock wait to return the futures as completed
         with patch(
-            "sceptre.plan.executor.as_completed",
-            return_value=[mock_future, mock_future],
+            "sceptre.plan.executor.wait",
+            side_effect=lambda futures, return_when: (set(futures), set()),
         ):
             executor = SceptrePlanExecutor(self.command, launch_order, max_concurrency)
             executor.execute()
@@ -131,3 +147,705 @@ class TestSceptrePlanExecutor:
 
         # Should use natural concurrency (3) since negative is treated as "no limit"
         assert executor.num_threads == 3
+
+
+class TestSceptrePlanExecutorStreamScheduler:
+    def setup_method(self, method):
+        self.stack1 = self._make_stack("stack1")
+        self.stack2 = self._make_stack("stack2", self.stack1)
+        self.stack3 = self._make_stack("stack3")
+
+        self.executed = []
+        self.patcher_actions = patch("sceptre.plan.executor.StackActions")
+        self.mock_actions = self.patcher_actions.start()
+        self.mock_actions.side_effect = self._make_actions
+
+    def teardown_method(self, method):
+        self.patcher_actions.stop()
+
+    @staticmethod
+    def _make_stack(name, *dependencies):
+        stack = Mock(spec=Stack)
+        stack.name = name
+        stack.dependencies = list(dependencies)
+        return stack
+
+    def _make_actions(self, stack):
+        actions = Mock()
+
+        def launch(*args):
+            self.executed.append(stack)
+            return "complete"
+
+        actions.launch.side_effect = launch
+        return actions
+
+    def _make_executor(self, launch_order, stacks, max_concurrency=None):
+        return SceptrePlanExecutor(
+            "launch",
+            launch_order,
+            max_concurrency=max_concurrency,
+            scheduler=SceptrePlanExecutor.STREAM,
+            graph=StackGraph(stacks),
+        )
+
+    def test_unknown_scheduler_raises_value_error(self):
+        with pytest.raises(ValueError):
+            SceptrePlanExecutor("launch", [{self.stack1}], None, scheduler="waves")
+
+    def test_natural_concurrency_is_number_of_stacks(self):
+        launch_order = [{self.stack1, self.stack3}, {self.stack2}]
+
+        executor = self._make_executor(
+            launch_order, {self.stack1, self.stack2, self.stack3}
+        )
+
+        assert executor.num_threads == 3
+
+    def test_max_concurrency_limits_threads(self):
+        launch_order = [{self.stack1, self.stack3}, {self.stack2}]
+
+        executor = self._make_executor(
+            launch_order, {self.stack1, self.stack2, self.stack3}, max_concurrency=2
+        )
+
+        assert executor.num_threads == 2
+
+    def test_execute_returns_response_for_every_stack(self):
+        launch_order = [{self.stack1, self.stack3}, {self.stack2}]
+        executor = self._make_executor(
+            launch_order, {self.stack1, self.stack2, self.stack3}
+        )
+
+        responses = executor.execute()
+
+        assert responses == {
+            self.stack1: "complete",
+            self.stack2: "complete",
+            self.stack3: "complete",
+        }
+
+    def test_dependent_stack_does_not_wait_for_unrelated_stack_in_same_batch(self):
+        stack2_done = threading.Event()
+
+        def make_actions(stack):
+            actions = Mock()
+
+            def launch(*args):
+                if stack is self.stack3:
+                    # stack3 only finishes once stack2 has run; a batch scheduler would wait on
+                    # stack3 before starting stack2 and time out here.
+                    assert stack2_done.wait(timeout=5)
+                if stack is self.stack2:
+                    stack2_done.set()
+                return "complete"
+
+            actions.launch.side_effect = launch
+            return actions
+
+        self.mock_actions.side_effect = make_actions
+        launch_order = [{self.stack1, self.stack3}, {self.stack2}]
+        executor = self._make_executor(
+            launch_order, {self.stack1, self.stack2, self.stack3}
+        )
+
+        responses = executor.execute()
+
+        assert responses[self.stack3] == "complete"
+
+    def test_dependency_order_is_kept_with_one_thread(self):
+        launch_order = [{self.stack1}, {self.stack2}]
+        executor = self._make_executor(
+            launch_order, {self.stack1, self.stack2}, max_concurrency=1
+        )
+
+        executor.execute()
+
+        assert self.executed == [self.stack1, self.stack2]
+
+    def test_stack_removed_from_plan_keeps_ordering_around_it(self):
+        stack4 = self._make_stack("stack4", self.stack2)
+        launch_order = [{self.stack1}, set(), {stack4}]
+        executor = self._make_executor(launch_order, {self.stack1, self.stack2, stack4})
+
+        responses = executor.execute()
+
+        assert self.executed == [self.stack1, stack4]
+        assert self.stack2 not in responses
+
+    def test_without_graph_all_stacks_are_independent(self):
+        executor = SceptrePlanExecutor(
+            "launch",
+            [{self.stack1, self.stack2}],
+            max_concurrency=None,
+            scheduler=SceptrePlanExecutor.STREAM,
+        )
+
+        responses = executor.execute()
+
+        assert set(responses) == {self.stack1, self.stack2}
+
+    def test_longest_chain_starts_first_with_one_thread(self):
+        stack4 = self._make_stack("stack4", self.stack2)
+        launch_order = [{self.stack1, self.stack3}, {self.stack2}, {stack4}]
+        executor = self._make_executor(
+            launch_order, {self.stack1, self.stack2, self.stack3, stack4}, 1
+        )
+
+        executor.execute()
+
+        assert self.executed[0] is self.stack1
+
+    def test_history_durations_weight_the_critical_path(self):
+        history = Mock()
+        history.duration.side_effect = {"stack3": 60.0}.get
+        history.default_duration.return_value = 5.0
+        launch_order = [{self.stack1, self.stack3}, {self.stack2}]
+        executor = SceptrePlanExecutor(
+            "launch",
+            launch_order,
+            max_concurrency=1,
+            scheduler=SceptrePlanExecutor.STREAM,
+            graph=StackGraph({self.stack1, self.stack2, self.stack3}),
+            history=history,
+        )
+
+        executor.execute()
+
+        assert self.executed[0] is self.stack3
+        recorded = {call.args[0] for call in history.record.call_args_list}
+        assert recorded == {"stack1", "stack2", "stack3"}
+
+    def test_batch_scheduler_submits_longest_chain_first(self):
+        launch_order = [{self.stack1, self.stack3}, {self.stack2}]
+        executor = SceptrePlanExecutor(
+            "launch",
+            launch_order,
+            max_concurrency=1,
+            graph=StackGraph({self.stack1, self.stack2, self.stack3}),
+        )
+
+        executor.execute()
+
+        assert self.executed == [self.stack1, self.stack3, self.stack2]
+
+
+class TestSceptrePlanExecutorContinueOnFailure:
+    def setup_method(self, method):
+        self.stack1 = self._make_stack("stack1")
+        self.stack2 = self._make_stack("stack2", self.stack1)
+        self.stack3 = self._make_stack("stack3", self.stack2)
+        self.stack4 = self._make_stack("stack4")
+        self.stacks = {self.stack1, self.stack2, self.stack3, self.stack4}
+        self.launch_order = [{self.stack1, self.stack4}, {self.stack2}, {self.stack3}]
+
+        self.failures = {}
+        self.executed = []
+        self.patcher_actions = patch("sceptre.plan.executor.StackActions")
+        self.mock_actions = self.patcher_actions.start()
+        self.mock_actions.side_effect = self._make_actions
+
+    def teardown_method(self, method):
+        self.patcher_actions.stop()
+
+    @staticmethod
+    def _make_stack(name, *dependencies):
+        stack = Mock(spec=Stack)
+        stack.name = name
+        stack.dependencies = list(dependencies)
+        return stack
+
+    def _make_actions(self, stack):
+        actions = Mock()
+
+        def launch(*args):
+            self.executed.append(stack)
+            failure = self.failures.get(stack)
+            if isinstance(failure, Exception):
+                raise failure
+            return failure or StackStatus.COMPLETE
+
+        actions.launch.side_effect = launch
+        return actions
+
+    def _make_executor(self, scheduler, continue_on_failure=True, journal=None):
+        return SceptrePlanExecutor(
+            "launch",
+            self.launch_order,
+            max_concurrency=None,
+            scheduler=scheduler,
+            graph=StackGraph(self.stacks),
+            continue_on_failure=continue_on_failure,
+            journal=journal,
+        )
+
+    @pytest.mark.parametrize("scheduler", SceptrePlanExecutor.SCHEDULERS)
+    def test_failed_status_skips_transitive_dependents(self, scheduler):
+        self.failures[self.stack1] = StackStatus.FAILED
+
+        responses = self._make_executor(scheduler).execute()
+
+        assert responses == {
+            self.stack1: StackStatus.FAILED,
+            self.stack2: StackStatus.SKIPPED,
+            self.stack3: StackStatus.SKIPPED,
+            self.stack4: StackStatus.COMPLETE,
+        }
+        assert set(self.executed) == {self.stack1, self.stack4}
+
+    @pytest.mark.parametrize("scheduler", SceptrePlanExecutor.SCHEDULERS)
+    def test_error_is_reported_as_failed_and_other_branches_complete(self, scheduler):
+        self.failures[self.stack2] = RuntimeError("boom")
+
+        responses = self._make_executor(scheduler).execute()
+
+        assert responses == {
+            self.stack1: StackStatus.COMPLETE,
+            self.stack2: StackStatus.FAILED,
+            self.stack3: StackStatus.SKIPPED,
+            self.stack4: StackStatus.COMPLETE,
+        }
+
+    @pytest.mark.parametrize("scheduler", SceptrePlanExecutor.SCHEDULERS)
+    def test_error_is_raised_without_continue_on_failure(self, scheduler):
+        self.failures[self.stack2] = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            self._make_executor(scheduler, continue_on_failure=False).execute()
+
+    def test_failed_status_does_not_skip_dependents_without_continue_on_failure(
+        self,
+    ):
+        self.failures[self.stack1] = StackStatus.FAILED
+
+        responses = self._make_executor(
+            SceptrePlanExecutor.BATCH, continue_on_failure=False
+        ).execute()
+
+        assert responses[self.stack3] == StackStatus.COMPLETE
+
+    def test_report_is_logged(self, caplog):
+        self.failures[self.stack1] = StackStatus.FAILED
+
+        with caplog.at_level(logging.INFO, logger="sceptre.plan.executor"):
+            self._make_executor(SceptrePlanExecutor.STREAM).execute()
+
+        assert "launch report: 1 succeeded, 1 failed, 2 skipped" in caplog.messages
+        assert "stack3 - skipped" in caplog.messages
+
+    @pytest.mark.parametrize("scheduler", SceptrePlanExecutor.SCHEDULERS)
+    def test_outcomes_are_recorded_to_journal(self, scheduler):
+        self.failures[self.stack1] = StackStatus.FAILED
+        journal = Mock(spec=RunJournal)
+
+        self._make_executor(scheduler, journal=journal).execute()
+
+        assert sorted(c.args for c in journal.record.call_args_list) == [
+            ("stack1", StackStatus.FAILED),
+            ("stack2", StackStatus.SKIPPED),
+            ("stack3", StackStatus.SKIPPED),
+            ("stack4", StackStatus.COMPLETE),
+        ]
+
+    def test_error_is_recorded_to_journal_before_it_is_raised(self):
+        self.failures[self.stack1] = RuntimeError("boom")
+        journal = Mock(spec=RunJournal)
+
+        with pytest.raises(RuntimeError):
+            self._make_executor(
+                SceptrePlanExecutor.STREAM, continue_on_failure=False, journal=journal
+            ).execute()
+
+        journal.record.assert_any_call("stack1", StackStatus.FAILED)
+
+    @pytest.mark.parametrize("continue_on_failure", [True, False])
+    @pytest.mark.parametrize("scheduler", SceptrePlanExecutor.SCHEDULERS)
+    def test_cancellation_skips_stacks_not_started(
+        self, scheduler, continue_on_failure
+    ):
+        cancellation = CancellationToken()
+        journal = Mock(spec=RunJournal)
+
+        def launch(*args):
+            self.executed.append(self.stack1)
+            cancellation.cancel("the deadline expired")
+            return StackStatus.COMPLETE
+
+        def make_actions(stack):
+            actions = self._make_actions(stack)
+            if stack is self.stack1:
+                actions.launch.side_effect = launch
+            return actions
+
+        self.mock_actions.side_effect = make_actions
+        executor = SceptrePlanExecutor(
+            "launch",
+            self.launch_order,
+            max_concurrency=1,
+            scheduler=scheduler,
+            graph=StackGraph(self.stacks),
+            continue_on_failure=continue_on_failure,
+            journal=journal,
+            cancellation=cancellation,
+        )
+
+        with pytest.raises(PlanCancelledError, match="the deadline expired"):
+            executor.execute()
+
+        assert self.executed == [self.stack1]
+        assert sorted(c.args for c in journal.record.call_args_list) == [
+            ("stack1", StackStatus.COMPLETE),
+            ("stack2", StackStatus.SKIPPED),
+            ("stack3", StackStatus.SKIPPED),
+            ("stack4", StackStatus.SKIPPED),
+        ]
+
+    def test_cancellation_is_active_while_stacks_execute(self):
+        cancellation = CancellationToken()
+        active = []
+        self.mock_actions.side_effect = None
+        self.mock_actions.return_value.launch.side_effect = lambda: active.append(
+            get_cancellation()
+        )
+
+        SceptrePlanExecutor(
+            "launch",
+            self.launch_order,
+            max_concurrency=None,
+            graph=StackGraph(self.stacks),
+            cancellation=cancellation,
+        ).execute()
+
+        assert active == [cancellation] * 4
+        assert get_cancellation() is None
+
+    @pytest.mark.parametrize("engine", SceptrePlanExecutor.ENGINES)
+    def test_stacks_are_traced(self, engine):
+        executor = self._make_executor(SceptrePlanExecutor.STREAM)
+        executor.engine = engine
+        with patch("sceptre.plan.executor.AsyncStackActions") as mock_async_actions:
+            mock_async_actions.return_value.run.side_effect = self._run_async
+            with use_tracer(Tracer("launch")) as tracer:
+                executor.execute()
+
+        stack_spans = [span for span in tracer.spans if span.category == Tracer.STACK]
+        queued_spans = [span for span in tracer.spans if span.category == "queue"]
+        assert sorted(span.stack for span in stack_spans) == [
+            "stack1",
+            "stack2",
+            "stack3",
+            "stack4",
+        ]
+        assert {span.name for span in stack_spans} == {"launch"}
+        assert sorted(span.stack for span in queued_spans) == [
+            "stack1",
+            "stack2",
+            "stack3",
+            "stack4",
+        ]
+
+    @pytest.mark.parametrize("engine", SceptrePlanExecutor.ENGINES)
+    @pytest.mark.parametrize("scheduler", SceptrePlanExecutor.SCHEDULERS)
+    @patch("sceptre.plan.executor.StackPrefetcher")
+    def test_waiting_stacks_are_prefetched_and_claimed_before_execution(
+        self, mock_StackPrefetcher, scheduler, engine
+    ):
+        prefetcher = mock_StackPrefetcher.return_value.__enter__.return_value
+        prefetcher.claim.side_effect = lambda stack: self.executed.append(
+            ("claim", stack)
+        )
+        executor = SceptrePlanExecutor(
+            "launch",
+            self.launch_order,
+            max_concurrency=None,
+            scheduler=scheduler,
+            graph=StackGraph(self.stacks),
+            engine=engine,
+            prefetch=True,
+        )
+        with patch("sceptre.plan.executor.AsyncStackActions") as mock_async_actions:
+            mock_async_actions.return_value.run.side_effect = self._run_async
+            executor.execute()
+
+        prefetcher.prefetch.assert_called_once_with([self.stack2, self.stack3])
+        claimed = [entry[1] for entry in self.executed if isinstance(entry, tuple)]
+        assert sorted(claimed, key=lambda stack: stack.name) == [
+            self.stack1,
+            self.stack2,
+            self.stack3,
+            self.stack4,
+        ]
+        if engine == SceptrePlanExecutor.THREADS:
+            for stack in self.stacks:
+                assert self.executed.index(("claim", stack)) < self.executed.index(
+                    stack
+                )
+
+    @patch("sceptre.plan.executor.StackPrefetcher")
+    def test_prefetch__command_without_templates__does_not_prefetch(
+        self, mock_StackPrefetcher
+    ):
+        SceptrePlanExecutor(
+            "delete", self.launch_order, max_concurrency=None, prefetch=True
+        ).execute()
+
+        mock_StackPrefetcher.assert_not_called()
+
+    async def _run_async(self, command, *args):
+        return StackStatus.COMPLETE
+
+
+class TestSceptrePlanExecutorAsyncioEngine:
+    def setup_method(self, method):
+        self.stack1 = self._make_stack("stack1")
+        self.stack2 = self._make_stack("stack2", self.stack1)
+        self.stack3 = self._make_stack("stack3")
+        self.stacks = {self.stack1, self.stack2, self.stack3}
+        self.launch_order = [{self.stack1, self.stack3}, {self.stack2}]
+
+        self.failures = {}
+        self.executed = []
+        self.patcher_actions = patch("sceptre.plan.executor.AsyncStackActions")
+        self.mock_actions = self.patcher_actions.start()
+        self.mock_actions.side_effect = self._make_actions
+
+    def teardown_method(self, method):
+        self.patcher_actions.stop()
+
+    @staticmethod
+    def _make_stack(name, *dependencies):
+        stack = Mock(spec=Stack)
+        stack.name = name
+        stack.dependencies = list(dependencies)
+        return stack
+
+    def _make_actions(self, stack, io_executor):
+        actions = Mock()
+
+        async def run(command, *args):
+            await asyncio.sleep(0.01)
+            self.executed.append(stack)
+            failure = self.failures.get(stack)
+            if isinstance(failure, Exception):
+                raise failure
+            return failure or StackStatus.COMPLETE
+
+        actions.run.side_effect = run
+        return actions
+
+    def _make_executor(self, scheduler, **kwargs):
+        return SceptrePlanExecutor(
+            "launch",
+            self.launch_order,
+            max_concurrency=kwargs.pop("max_concurrency", None),
+            scheduler=scheduler,
+            graph=StackGraph(self.stacks),
+            engine=SceptrePlanExecutor.ASYNCIO,
+            **kwargs,
+        )
+
+    def test_unknown_engine_raises_value_error(self):
+        with pytest.raises(ValueError):
+            SceptrePlanExecutor("launch", [{self.stack1}], None, engine="fibers")
+
+    @pytest.mark.parametrize("scheduler", SceptrePlanExecutor.SCHEDULERS)
+    def test_execute_returns_response_for_every_stack(self, scheduler):
+        responses = self._make_executor(scheduler).execute()
+
+        assert responses == {
+            self.stack1: StackStatus.COMPLETE,
+            self.stack2: StackStatus.COMPLETE,
+            self.stack3: StackStatus.COMPLETE,
+        }
+
+    @pytest.mark.parametrize("scheduler", SceptrePlanExecutor.SCHEDULERS)
+    def test_dependency_order_is_kept_with_one_stack_in_flight(self, scheduler):
+        self._make_executor(scheduler, max_concurrency=1).execute()
+
+        assert len(self.executed) == 3
+        assert self.executed.index(self.stack1) < self.executed.index(self.stack2)
+
+    @pytest.mark.parametrize("scheduler", SceptrePlanExecutor.SCHEDULERS)
+    def test_error_is_raised_after_stacks_in_flight_finish(self, scheduler):
+        self.failures[self.stack1] = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            self._make_executor(scheduler).execute()
+        assert self.stack3 in self.executed
+
+    @pytest.mark.parametrize("scheduler", SceptrePlanExecutor.SCHEDULERS)
+    def test_continue_on_failure_skips_dependents(self, scheduler):
+        self.failures[self.stack1] = RuntimeError("boom")
+
+        responses = self._make_executor(scheduler, continue_on_failure=True).execute()
+
+        assert responses == {
+            self.stack1: StackStatus.FAILED,
+            self.stack2: StackStatus.SKIPPED,
+            self.stack3: StackStatus.COMPLETE,
+        }
+
+    @pytest.mark.parametrize("scheduler", SceptrePlanExecutor.SCHEDULERS)
+    def test_expired_deadline_starts_no_stacks(self, scheduler):
+        executor = self._make_executor(
+            scheduler,
+            continue_on_failure=True,
+            cancellation=CancellationToken(deadline=0),
+        )
+
+        with pytest.raises(PlanCancelledError):
+            executor.execute()
+        assert self.executed == []
+
+    def test_waiting_stacks_do_not_hold_threads(self):
+        stacks = {self._make_stack(f"stack{i}") for i in range(1000)}
+        thread_counts = []
+
+        async def run(command, *args):
+            await asyncio.sleep(0.05)
+            thread_counts.append(threading.active_count())
+            return StackStatus.COMPLETE
+
+        self.mock_actions.side_effect = None
+        self.mock_actions.return_value.run.side_effect = run
+        executor = SceptrePlanExecutor(
+            "launch",
+            [stacks],
+            max_concurrency=None,
+            scheduler=SceptrePlanExecutor.STREAM,
+            graph=StackGraph(stacks),
+            engine=SceptrePlanExecutor.ASYNCIO,
+        )
+
+        responses = executor.execute()
+
+        assert len(responses) == 1000
+        assert max(thread_counts) <= threading.active_count() + (
+            SceptrePlanExecutor.ASYNC_IO_THREADS
+        )
+
+
+class TestSceptrePlanExecutorConcurrencyLimits:
+    def setup_method(self, method):
+        self.lock = threading.Lock()
+        self.in_flight = Counter()
+        self.max_in_flight = Counter()
+        self.patcher_actions = patch("sceptre.plan.executor.StackActions")
+        self.mock_actions = self.patcher_actions.start()
+        self.mock_actions.side_effect = self._make_actions
+
+    def teardown_method(self, method):
+        self.patcher_actions.stop()
+
+    @staticmethod
+    def _make_stack(name, sceptre_role):
+        stack = Mock(spec=Stack)
+        stack.name = name
+        stack.dependencies = []
+        stack.region = "eu-west-1"
+        stack.profile = None
+        stack.sceptre_role = sceptre_role
+        return stack
+
+    def _make_actions(self, stack):
+        actions = Mock()
+
+        def launch(*args):
+            with self.lock:
+                self.in_flight[stack.sceptre_role] += 1
+                self.max_in_flight[stack.sceptre_role] = max(
+                    self.max_in_flight[stack.sceptre_role],
+                    self.in_flight[stack.sceptre_role],
+                )
+            time.sleep(0.02)
+            with self.lock:
+                self.in_flight[stack.sceptre_role] -= 1
+            return StackStatus.COMPLETE
+
+        actions.launch.side_effect = launch
+        return actions
+
+    @pytest.mark.parametrize("scheduler", SceptrePlanExecutor.SCHEDULERS)
+    def test_account_region_limit_caps_stacks_in_flight_per_account(self, scheduler):
+        stacks = {
+            self._make_stack(f"{role}/stack{i}", role)
+            for role in ("role-1", "role-2")
+            for i in range(4)
+        }
+        executor = SceptrePlanExecutor(
+            "launch",
+            [stacks],
+            max_concurrency=None,
+            scheduler=scheduler,
+            graph=StackGraph(stacks),
+            limits=ConcurrencyLimits(account_region_limit=2),
+        )
+
+        responses = executor.execute()
+
+        assert len(responses) == 8
+        assert self.max_in_flight == {"role-1": 2, "role-2": 2}
+
+    def test_blocked_stack_does_not_hold_back_other_accounts(self):
+        busy = [self._make_stack(f"busy/stack{i}", "role-1") for i in range(4)]
+        other = self._make_stack("other/stack", "role-2")
+        stacks = set(busy) | {other}
+        executor = SceptrePlanExecutor(
+            "launch",
+            [stacks],
+            max_concurrency=2,
+            scheduler=SceptrePlanExecutor.STREAM,
+            graph=StackGraph(stacks),
+            limits=ConcurrencyLimits(account_region_limit=1),
+        )
+        started = []
+        self.mock_actions.side_effect = lambda stack: Mock(
+            launch=Mock(side_effect=lambda: started.append(stack))
+        )
+
+        executor.execute()
+
+        # Only one role-1 stack can run at a time, so the second free slot goes to role-2.
+        assert other in started[:2]
+
+    @patch("sceptre.connection_manager.time.sleep")
+    def test_throttling_reduces_stacks_in_flight(self, mock_sleep):
+        first = self._make_stack("first", "first")
+        rest = [self._make_stack(f"rest/stack{i}", "rest") for i in range(6)]
+        for stack in rest:
+            stack.dependencies = [first]
+        stacks = {first, *rest}
+        throttled_call = Mock(
+            __name__="describe_stacks",
+            side_effect=[
+                ClientError({"Error": {"Code": "Throttling"}}, "DescribeStacks"),
+                {},
+            ],
+        )
+        launch = self._make_actions(first).launch.side_effect
+
+        def launch_first(*args):
+            _retry_boto_call(throttled_call)()
+            return launch(*args)
+
+        def make_actions(stack):
+            actions = self._make_actions(stack)
+            if stack is first:
+                actions.launch.side_effect = launch_first
+            return actions
+
+        self.mock_actions.side_effect = make_actions
+        executor = SceptrePlanExecutor(
+            "launch",
+            [{first}, set(rest)],
+            max_concurrency=None,
+            scheduler=SceptrePlanExecutor.STREAM,
+            graph=StackGraph(stacks),
+            adaptive_concurrency=True,
+        )
+
+        responses = executor.execute()
+
+        assert len(responses) == 7
+        assert executor.adaptive.limit == 3
+        assert self.max_in_flight["rest"] <= 3
@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+from sceptre.plan.history import StackDurationHistory
+
+
+class TestStackDurationHistory:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.path = str(tmp_path / ".sceptre" / "durations.json")
+        self.history = StackDurationHistory(self.path, "launch")
+
+    def test_duration_is_none_without_history(self):
+        assert self.history.duration("stack") is None
+
+    def test_default_duration_without_history(self):
+        assert self.history.default_duration() == 1.0
+
+    def test_record_stores_first_duration(self):
+        self.history.record("stack", 10.0)
+
+        assert self.history.duration("stack") == 10.0
+
+    def test_record_smooths_with_previous_duration(self):
+        self.history.record("stack", 10.0)
+        self.history.record("stack", 20.0)
+
+        assert self.history.duration("stack") == 15.0
+
+    def test_default_duration_is_mean_of_recorded_durations(self):
+        self.history.record("stack1", 10.0)
+        self.history.record("stack2", 30.0)
+
+        assert self.history.default_duration() == 20.0
+
+    def test_save_and_load_round_trip(self):
+        self.history.record("stack", 12.5)
+        self.history.save()
+
+        loaded = StackDurationHistory(self.path, "launch")
+
+        assert loaded.duration("stack") == 12.5
+
+    def test_durations_are_kept_per_command(self):
+        self.history.record("stack", 12.5)
+        self.history.save()
+
+        loaded = StackDurationHistory(self.path, "delete")
+
+        assert loaded.duration("stack") is None
+
+    def test_save_without_records_writes_nothing(self, tmp_path):
+        self.history.save()
+
+        assert not (tmp_path / ".sceptre").exists()
+
+    def test_unreadable_history_is_ignored(self, tmp_path):
+        (tmp_path / ".sceptre").mkdir()
+        (tmp_path / ".sceptre" / "durations.json").write_text("{not json")
+
+        history = StackDurationHistory(self.path, "launch")
+
+        assert history.duration("stack") is None
+
+    def test_save_writes_json(self):
+        self.history.record("stack", 3.0)
+        self.history.save()
+
+        with open(self.path) as f:
+            assert json.load(f) == {"launch": {"stack": 3.0}}
+
+    def test_save_to_unwritable_path_logs_warning(self, tmp_path, caplog):
+        # A file where the directory should be makes the directory impossible to create.
+        (tmp_path / ".sceptre").write_text("")
+        self.history.record("stack", 3.0)
+
+        self.history.save()
+
+        assert "Could not save stack duration history" in caplog.text
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+import os
+import subprocess
+
+import pytest
+
+from sceptre.context import SceptreContext
+from sceptre.exceptions import ChangedFilesError
+from sceptre.plan.impact import changed_files_since
+from sceptre.plan.plan import SceptrePlan
+
+FILES = {
+    "config/config.yaml": "project_code: prj\nregion: eu-west-1\n",
+    "config/dev/vpc.yaml": (
+        "template:\n"
+        "  path: vpc.j2\n"
+        "parameters:\n"
+        "  Policy: !file_contents {project}/data/policy.json\n"
+    ),
+    "config/dev/subnets.yaml": (
+        "template:\n  path: python/subnets.py\ndependencies:\n  - dev/vpc.yaml\n"
+    ),
+    "config/dev/dns.yaml": "template:\n  path: dns.yaml\n",
+    "templates/vpc.j2": '{% include "parts/outputs.j2" %}\n',
+    "templates/parts/outputs.j2": '{% import "macros.j2" as macros %}\n',
+    "templates/macros.j2": "{% macro tag() %}{% endmacro %}\n",
+    "templates/python/subnets.py": "from lib import naming\n",
+    "templates/python/lib/__init__.py": "",
+    "templates/python/lib/naming.py": "",
+    "templates/dns.yaml": "Resources: {}\n",
+    "data/policy.json": "{}\n",
+    "vars/dev.yaml": "environment: dev\n",
+}
+
+
+class TestChangeImpact(object):
+    @pytest.fixture(autouse=True)
+    def project(self, tmp_path):
+        self.project_path = str(tmp_path)
+        for name, content in FILES.items():
+            file_path = tmp_path / name
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(content.replace("{project}", self.project_path))
+
+    def launched_stacks(self, *changed_files):
+        context = SceptreContext(
+            project_path=self.project_path,
+            command_path="dev",
+            var_files=[os.path.join(self.project_path, "vars", "dev.yaml")],
+        )
+        plan = SceptrePlan(context)
+        plan.resolve("launch")
+        plan.filter_by_changes(
+            [os.path.join(self.project_path, name) for name in changed_files]
+        )
+        return sorted(stack.name for stack in plan)
+
+    @pytest.mark.parametrize(
+        "changed_file, expected",
+        [
+            ("config/dev/dns.yaml", ["dev/dns"]),
+            ("config/dev/subnets.yaml", ["dev/subnets"]),
+            ("config/dev/vpc.yaml", ["dev/subnets", "dev/vpc"]),
+            ("config/config.yaml", ["dev/dns", "dev/subnets", "dev/vpc"]),
+            ("templates/dns.yaml", ["dev/dns"]),
+            ("templates/macros.j2", ["dev/subnets", "dev/vpc"]),
+            ("templates/python/lib/naming.py", ["dev/subnets"]),
+            ("data/policy.json", ["dev/subnets", "dev/vpc"]),
+            ("vars/dev.yaml", ["dev/dns", "dev/subnets", "dev/vpc"]),
+            ("README.md", []),
+        ],
+    )
+    def test_only_affected_stacks_and_their_dependents_are_launched(
+        self, changed_file, expected
+    ):
+        assert self.launched_stacks(changed_file) == expected
+
+    def test_changed_files_since__lists_changed_and_untracked_files(self):
+        def git(*args):
+            subprocess.run(
+                ["git", "-c", "user.name=a", "-c", "user.email=a@b", *args],
+                cwd=self.project_path,
+                check=True,
+                capture_output=True,
+            )
+
+        git("init")
+        git("add", "-A")
+        git("commit", "-m", "initial")
+        with open(os.path.join(self.project_path, "templates", "dns.yaml"), "a") as f:
+            f.write("Outputs: {}\n")
+        with open(os.path.join(self.project_path, "templates", "new.yaml"), "w") as f:
+            f.write("Resources: {}\n")
+
+        changed = changed_files_since(self.project_path, "HEAD")
+
+        assert sorted(os.path.relpath(f, self.project_path) for f in changed) == [
+            os.path.join("templates", "dns.yaml"),
+            os.path.join("templates", "new.yaml"),
+        ]
+
+    def test_changed_files_since__unknown_ref__raises(self):
+        with pytest.raises(ChangedFilesError):
+            changed_files_since(self.project_path, "no-such-ref")
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from sceptre.plan.journal import RunJournal
+from sceptre.stack_status import StackStatus
+
+
+class TestRunJournal:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.path = str(tmp_path / ".sceptre" / "journal" / "launch.jsonl")
+
+    def _journal(self, command_path="dev"):
+        return RunJournal(self.path, "launch", command_path)
+
+    def _run(self, outcomes, resume=False, command_path="dev"):
+        journal = self._journal(command_path)
+        journal.start(resume=resume)
+        for stack_name, status in outcomes.items():
+            journal.record(stack_name, status)
+        journal.close()
+
+    def test_outcomes_are_empty_without_journal(self):
+        assert self._journal().outcomes() == {}
+
+    def test_outcomes_of_previous_run(self):
+        self._run({"dev/a": StackStatus.COMPLETE, "dev/b": StackStatus.FAILED})
+
+        assert self._journal().outcomes() == {
+            "dev/a": StackStatus.COMPLETE,
+            "dev/b": StackStatus.FAILED,
+        }
+
+    def test_records_are_written_as_they_happen(self):
+        journal = self._journal()
+        journal.start()
+        journal.record("dev/a", StackStatus.COMPLETE)
+
+        assert self._journal().outcomes() == {"dev/a": StackStatus.COMPLETE}
+        journal.close()
+
+    def test_new_run_replaces_previous_run(self):
+        self._run({"dev/a": StackStatus.COMPLETE})
+        self._run({"dev/b": StackStatus.FAILED})
+
+        assert self._journal().outcomes() == {"dev/b": StackStatus.FAILED}
+
+    def test_resumed_run_appends_to_previous_run(self):
+        self._run({"dev/a": StackStatus.COMPLETE, "dev/b": StackStatus.FAILED})
+        self._run({"dev/b": StackStatus.COMPLETE}, resume=True)
+
+        assert self._journal().outcomes() == {
+            "dev/a": StackStatus.COMPLETE,
+            "dev/b": StackStatus.COMPLETE,
+        }
+        with open(self.path) as f:
+            headers = [line for line in map(json.loads, f) if "stack" not in line]
+        assert [header["resumed"] for header in headers] == [False, True]
+
+    def test_run_with_another_command_path_is_not_resumed(self):
+        self._run({"dev/a": StackStatus.COMPLETE})
+
+        assert self._journal("prod").outcomes() == {}
+
+        self._run({"prod/a": StackStatus.FAILED}, resume=True, command_path="prod")
+
+        assert self._journal("prod").outcomes() == {"prod/a": StackStatus.FAILED}
+        assert self._journal().outcomes() == {}
+
+    def test_half_written_line_is_ignored(self):
+        self._run({"dev/a": StackStatus.COMPLETE})
+        with open(self.path, "a") as f:
+            f.write('{"stack": "dev/b", "sta')
+
+        assert self._journal().outcomes() == {"dev/a": StackStatus.COMPLETE}
+
+    def test_unwritable_journal_logs_warning_and_records_nothing(
+        self, tmp_path, caplog
+    ):
+        # A file where the directory should be makes the directory impossible to create.
+        (tmp_path / ".sceptre").write_text("")
+        journal = self._journal()
+
+        journal.start()
+        journal.record("dev/a", StackStatus.COMPLETE)
+        journal.close()
+
+        assert "Could not open journal" in caplog.text
+        assert self._journal().outcomes() == {}
@@ -0,0 +1,113 @@
+from unittest.mock import PropertyMock, patch
+
+from sceptre.hooks import Hook
+from sceptre.plan.prefetch import StackPrefetcher
+from sceptre.resolvers import Resolver
+from sceptre.resolvers.stack_output import StackOutput
+from sceptre.stack import Stack
+
+
+class ValueResolver(Resolver):
+    def resolve(self):
+        return "resolved"
+
+
+class NoopHook(Hook):
+    def run(self):
+        pass
+
+
+class TestStackPrefetcher:
+    def setup_method(self, test_method):
+        self.patcher_template = patch("sceptre.stack.Template")
+        self.mock_Template = self.patcher_template.start()
+        self.prefetcher = StackPrefetcher(threads=1)
+
+    def teardown_method(self, test_method):
+        self.prefetcher.shutdown()
+        self.patcher_template.stop()
+
+    def make_stack(self, **kwargs):
+        return Stack(
+            name="dev/app",
+            project_code="prj",
+            region="eu-west-1",
+            template_handler_config={"type": "file", "path": "app.yaml"},
+            **kwargs,
+        )
+
+    def prepare(self, stack):
+        self.prefetcher.prefetch([stack])
+        self.prefetcher.claim(stack)
+
+    def test_prepare__resolves_independent_resolvers_and_uploads_template(self):
+        stack = self.make_stack(
+            parameters={
+                "Independent": ValueResolver(),
+                "Nested": ValueResolver([ValueResolver()]),
+            }
+        )
+
+        self.prepare(stack)
+
+        assert stack._parameters == {"Independent": "resolved", "Nested": "resolved"}
+        template = self.mock_Template.return_value
+        template.get_boto_call_parameter.assert_called_once_with()
+
+    def test_prepare__leaves_resolvers_depending_on_other_stacks(self):
+        stack_output = StackOutput("dev/vpc.yaml::VpcId")
+        nested = ValueResolver([StackOutput("dev/vpc.yaml::SubnetId")])
+        stack = self.make_stack(parameters={"Vpc": stack_output, "Subnet": nested})
+
+        self.prepare(stack)
+
+        assert isinstance(stack._parameters["Vpc"], StackOutput)
+        assert isinstance(stack._parameters["Subnet"], ValueResolver)
+
+    def test_prepare__template_depends_on_other_stack__does_not_render_template(self):
+        stack = self.make_stack(
+            sceptre_user_data={"Vpc": StackOutput("dev/vpc.yaml::VpcId")},
+            parameters={"Independent": ValueResolver()},
+        )
+
+        self.prepare(stack)
+
+        assert stack._parameters == {"Independent": "resolved"}
+        self.mock_Template.assert_not_called()
+
+    def test_prepare__stack_with_before_hooks__is_not_prepared(self):
+        stack = self.make_stack(
+            parameters={"Independent": ValueResolver()},
+            hooks={"before_create": [NoopHook()]},
+        )
+
+        self.prepare(stack)
+
+        assert isinstance(stack._parameters["Independent"], ValueResolver)
+        self.mock_Template.assert_not_called()
+
+    def test_prepare__template_raises_error__error_is_not_raised(self):
+        self.mock_Template.return_value.get_boto_call_parameter.side_effect = (
+            RuntimeError("boom")
+        )
+        stack = self.make_stack()
+
+        self.prepare(stack)
+
+    def test_prepare__hooks_raise_error__error_is_not_raised(self):
+        stack = self.make_stack(parameters={"Independent": ValueResolver()})
+
+        with patch.object(
+            Stack, "hooks", new_callable=PropertyMock, side_effect=RuntimeError("boom")
+        ):
+            self.prepare(stack)
+
+        assert isinstance(stack._parameters["Independent"], ValueResolver)
+
+    def test_claim__queued_stack__is_not_prepared(self):
+        stack = self.make_stack(parameters={"Independent": ValueResolver()})
+        with patch.object(self.prefetcher, "_pool") as mock_pool:
+            self.prefetcher.prefetch([stack])
+            self.prefetcher.claim(stack)
+
+        mock_pool.submit.return_value.cancel.assert_called_once_with()
@@ -0,0 +1,73 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from sceptre.plan.rendering import TemplateRenderer
+from sceptre.stack import Stack
+
+
+class TestTemplateRenderer(object):
+    @pytest.fixture(autouse=True)
+    def project(self, tmp_path):
+        templates = tmp_path / "templates"
+        templates.mkdir()
+        (templates / "plain.json").write_text('{"Resources": {}}')
+        (templates / "rendered.j2").write_text(
+            "Description: {{ sceptre_user_data.description }}"
+        )
+        (templates / "broken.j2").write_text("{{ sceptre_user_data.missing.key }}")
+        self.project_path = str(tmp_path)
+
+    def _stack(self, name, template_handler_config, sceptre_user_data=None):
+        return Stack(
+            name=name,
+            project_code="project",
+            region="eu-west-1",
+            template_handler_config=template_handler_config,
+            sceptre_user_data=sceptre_user_data,
+            stack_group_config={"project_path": self.project_path},
+        )
+
+    def test_render_stores_bodies_on_the_templates(self):
+        plain = self._stack("plain", {"type": "file", "path": "plain.json"})
+        rendered = self._stack(
+            "rendered",
+            {"path": "rendered.j2"},
+            sceptre_user_data={"description": "rendered"},
+        )
+
+        bodies = TemplateRenderer(2).render([plain, rendered])
+
+        assert bodies == {
+            plain: '---\n{"Resources": {}}',
+            rendered: "---\nDescription: rendered",
+        }
+        assert plain.template._body == bodies[plain]
+        assert rendered.template.body == bodies[rendered]
+
+    def test_template_that_fails_is_left_to_render_in_process(self):
+        plain = self._stack("plain", {"type": "file", "path": "plain.json"})
+        broken = self._stack("broken", {"type": "file", "path": "broken.j2"})
+
+        bodies = TemplateRenderer(2).render([plain, broken])
+
+        assert list(bodies) == [plain]
+        assert broken.template._body is None
+
+    @patch("sceptre.plan.rendering.ProcessPoolExecutor")
+    def test_only_templates_that_can_be_sent_to_a_worker_are_rendered(
+        self, mock_ProcessPoolExecutor
+    ):
+        stacks = [
+            self._stack("plain", {"type": "file", "path": "plain.json"}),
+            self._stack("s3", {"type": "s3", "path": "bucket/template.json"}),
+            self._stack(
+                "unpicklable",
+                {"type": "file", "path": "rendered.j2"},
+                sceptre_user_data={"lock": threading.Lock()},
+            ),
+        ]
+
+        assert TemplateRenderer(2).render(stacks) == {}
+        mock_ProcessPoolExecutor.assert_not_called()
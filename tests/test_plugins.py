@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+from importlib.metadata import EntryPoint
+from unittest.mock import patch
+
+import pytest
+
+from sceptre.plugins import HOOKS, RESOLVERS, PluginRegistry
+
+ENTRY_POINTS = {
+    HOOKS: [
+        EntryPoint("cmd", "sceptre.hooks.cmd:Cmd", HOOKS),
+        EntryPoint("broken", "sceptre.no_such_module:Broken", HOOKS),
+    ],
+    RESOLVERS: [
+        EntryPoint("cmd", "sceptre.resolvers.no_value:NoValue", RESOLVERS),
+        EntryPoint("sub", "sceptre.resolvers.sub:Sub", RESOLVERS),
+    ],
+}
+
+
+def fake_entry_points(group):
+    return ENTRY_POINTS.get(group, [])
+
+
+@patch("sceptre.plugins.entry_points", side_effect=fake_entry_points)
+class TestPluginRegistry(object):
+    def test_get__imports_only_the_plugins_used(self, mock_entry_points):
+        registry = PluginRegistry()
+
+        assert registry.get(RESOLVERS, "sub").__name__ == "Sub"
+        assert registry.get(HOOKS, "missing") is None
+        with pytest.raises(ModuleNotFoundError):
+            registry.get(HOOKS, "broken")
+
+    def test_entry_points_are_only_found_once(self, mock_entry_points):
+        registry = PluginRegistry()
+        registry.get(RESOLVERS, "sub")
+        registry.get(HOOKS, "cmd")
+
+        assert registry.names(HOOKS) == ["cmd", "broken"]
+        assert mock_entry_points.call_count == 3
+
+    def test_classes__later_groups_take_the_place_of_earlier_ones(
+        self, mock_entry_points
+    ):
+        classes = PluginRegistry().classes(HOOKS, RESOLVERS)
+
+        assert list(classes) == ["cmd", "broken", "sub"]
+        assert classes["cmd"].__name__ == "NoValue"
+        with pytest.raises(KeyError):
+            classes["missing"]
+
+    def test_cache_path__entry_points_are_read_back_from_the_cache(
+        self, mock_entry_points, tmp_path
+    ):
+        registry = PluginRegistry()
+        registry.cache_path = str(tmp_path / "plugins.json")
+        registry.names(HOOKS)
+        mock_entry_points.reset_mock()
+
+        other_registry = PluginRegistry()
+        other_registry.cache_path = str(tmp_path / "plugins.json")
+
+        assert other_registry.names(RESOLVERS) == ["cmd", "sub"]
+        mock_entry_points.assert_not_called()
+
+    def test_cache_path__changed_distributions__finds_entry_points_again(
+        self, mock_entry_points, tmp_path
+    ):
+        registry = PluginRegistry()
+        registry.cache_path = str(tmp_path / "plugins.json")
+        registry.names(HOOKS)
+        mock_entry_points.reset_mock()
+
+        other_registry = PluginRegistry()
+        other_registry.cache_path = str(tmp_path / "plugins.json")
+        with patch("sceptre.plugins._distributions_key", return_value="changed"):
+            other_registry.names(HOOKS)
+
+        assert mock_entry_points.call_count == 3
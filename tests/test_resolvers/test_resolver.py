@@ -260,6 +260,33 @@ class TestResolvableContainerPropertyDescriptor:
         expected_calls = [call(self.mock_object)] * 4
         mock_resolver.clone_for_stack.assert_has_calls(expected_calls)
 
+    def test_setting_resolvable_property__only_containers_with_resolvers_are_copied(
+        self,
+    ):
+        mock_resolver = MagicMock(spec=MockResolver)
+        without_resolvers = {"subnets": ["a", "b"]}
+        with_resolvers = {"subnet": mock_resolver}
+        value = {"plain": without_resolvers, "resolved": with_resolvers}
+
+        self.mock_object.resolvable_container_property = value
+        cloned = self.mock_object._resolvable_container_property
+
+        assert cloned is not value
+        assert cloned["plain"] is without_resolvers
+        assert cloned["resolved"] is not with_resolvers
+        assert with_resolvers["subnet"] is mock_resolver
+
+    def test_getting_resolvable_property__shared_containers_are_copied(self):
+        shared = {"subnets": ["a", "b"]}
+        self.mock_object.resolvable_container_property = {"plain": shared}
+
+        resolved = self.mock_object.resolvable_container_property
+        resolved["plain"]["subnets"].append("c")
+
+        assert resolved["plain"] is not shared
+        assert shared == {"subnets": ["a", "b"]}
+        assert self.mock_object.resolvable_container_property is resolved
+
     def test_getting_resolvable_property_with_none(self):
         self.mock_object._resolvable_container_property = None
         assert self.mock_object.resolvable_container_property is None
@@ -607,6 +634,42 @@ class TestResolvableContainerPropertyDescriptor:
             "resolver": create_placeholder_value(resolver, PlaceholderType.alphanum)
         }
 
+    def test_resolve_where__resolves_only_matching_resolvers(self):
+        self.mock_object.resolvable_container_property = {
+            "matching": NestedResolver("resolved"),
+            "other": MockResolver(),
+            "nested": [NestedResolver(None)],
+        }
+
+        MockClass.resolvable_container_property.resolve_where(
+            self.mock_object, lambda resolver: isinstance(resolver, NestedResolver)
+        )
+
+        container = self.mock_object._resolvable_container_property
+        assert container["matching"] == "resolved"
+        assert isinstance(container["other"], MockResolver)
+        assert container["nested"] == []
+
+    def test_resolve_where__resolver_raises_error__leaves_resolver_to_raise_on_get(
+        self,
+    ):
+        class ErroringResolver(Resolver):
+            def resolve(self):
+                raise ValueError()
+
+        self.mock_object.resolvable_container_property = {
+            "resolver": ErroringResolver(),
+            "other": NestedResolver("resolved"),
+        }
+
+        MockClass.resolvable_container_property.resolve_where(
+            self.mock_object, lambda resolver: True
+        )
+
+        assert self.mock_object._resolvable_container_property["other"] == "resolved"
+        with pytest.raises(ValueError):
+            self.mock_object.resolvable_container_property
+
 
 class TestResolvableValueProperty:
     def setup_method(self, test_method):
@@ -725,3 +788,15 @@ class TestResolvableValueProperty:
             result = self.mock_object.value_with_none_placeholder
 
         assert result == create_placeholder_value(resolver, PlaceholderType.none)
+
+    @pytest.mark.parametrize("matches", [True, False])
+    def test_resolve_where__resolves_value_if_it_matches(self, matches):
+        resolver = Mock(spec=MockResolver)
+        self.mock_object._resolvable_value_property = resolver
+
+        MockClass.resolvable_value_property.resolve_where(
+            self.mock_object, lambda resolver: matches
+        )
+
+        expected = resolver.resolve.return_value if matches else resolver
+        assert self.mock_object._resolvable_value_property == expected
@@ -1,12 +1,17 @@
 # -*- coding: utf-8 -*-
 
+import gc
+import tracemalloc
 from unittest.mock import MagicMock, sentinel
 from deprecation import fail_if_not_removed
 
 import pytest
 
 from sceptre.exceptions import InvalidConfigFileError
+from sceptre.hooks.cmd import Cmd
 from sceptre.resolvers import Resolver
+from sceptre.resolvers.stack_attr import StackAttr
+from sceptre.resolvers.sub import Sub
 from sceptre.stack import Stack
 from sceptre.template import Template
 
@@ -376,3 +381,70 @@ class TestStackSceptreUserData(object):
             "resolved": TestResolver(stack=stack),
         }
         assert stack.sceptre_user_data["resolved"] == sentinel.primitive_value
+
+
+class DictStack(object):
+    """An object that keeps the attributes of a Stack in an instance dict."""
+
+
+class TestStackMemory(object):
+    def construct_stack(self):
+        return stack_factory(
+            template_path=None,
+            template_handler_config={"type": "file", "path": "stack.yaml"},
+            role_arn=None,
+            parameters={
+                "Name": Sub(["{name}", {"name": "app"}]),
+                "Region": StackAttr("region"),
+                "Size": "1",
+            },
+            sceptre_user_data={"subnets": ["a", "b"]},
+            hooks={"before_create": [Cmd("echo hello")]},
+        )
+
+    @staticmethod
+    def allocated_memory(cls, attributes, count):
+        """
+        Returns the memory allocated to create count instances of cls holding the given
+        attributes. The values of the attributes are shared, so only the memory of the
+        instances themselves is counted.
+        """
+        gc.collect()
+        tracemalloc.start()
+        try:
+            instances = []
+            for _ in range(count):
+                instance = cls.__new__(cls)
+                for name, value in attributes.items():
+                    object.__setattr__(instance, name, value)
+                instances.append(instance)
+            allocated, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return allocated
+
+    def test_stack__declared_attributes_are_kept_in_slots(self):
+        stack = stack_factory()
+
+        assert "name" in Stack.__slots__
+        assert "name" not in vars(stack)
+
+    def test_stack__undeclared_attribute__can_be_set(self):
+        stack = stack_factory()
+
+        stack.undeclared_attribute = "value"
+
+        assert stack.undeclared_attribute == "value"
+
+    def test_stacks__use_less_than_half_the_memory_of_objects_with_instance_dicts(self):
+        stack = self.construct_stack()
+        attributes = {
+            name: getattr(stack, name)
+            for name in Stack.__slots__
+            if name not in ("__dict__", "__weakref__") and hasattr(stack, name)
+        }
+
+        slotted = self.allocated_memory(Stack, attributes, 1000)
+        with_dict = self.allocated_memory(DictStack, attributes, 1000)
+
+        assert slotted < with_dict / 2
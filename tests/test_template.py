@@ -11,6 +11,7 @@ from unittest.mock import patch, sentinel, Mock
 from freezegun import freeze_time
 from botocore.exceptions import ClientError
 
+from sceptre.plugins import TEMPLATE_HANDLERS, PluginRegistry
 from sceptre.template import Template
 from sceptre.connection_manager import ConnectionManager
 from sceptre.exceptions import UnsupportedTemplateFileTypeError
@@ -192,6 +193,22 @@ class TestTemplate(object):
 
         assert boto_parameter == {"TemplateURL": sentinel.template_url}
 
+    @patch("sceptre.template.Template.upload_to_s3")
+    def test_get_boto_call_parameter_with_s3_details_uploads_once(
+        self, mock_upload_to_s3
+    ):
+        mock_upload_to_s3.return_value = sentinel.template_url
+        self.template.s3_details = {
+            "bucket_name": sentinel.bucket_name,
+            "bucket_key": sentinel.bucket_key,
+        }
+
+        self.template.get_boto_call_parameter()
+        boto_parameter = self.template.get_boto_call_parameter()
+
+        assert boto_parameter == {"TemplateURL": sentinel.template_url}
+        mock_upload_to_s3.assert_called_once_with()
+
     def test_get_boto_call_parameter__has_s3_details_but_bucket_name_is_none__gets_template_body_dict(
         self,
     ):
@@ -358,7 +375,9 @@ class TestTemplate(object):
             "argument": sentinel.template_handler_argument,
         }
 
-        self.template._registry = {"test": MockTemplateHandler}
+        registry = PluginRegistry()
+        registry.register(TEMPLATE_HANDLERS, "test", MockTemplateHandler)
 
-        result = self.template.body
+        with patch("sceptre.plugins.registry", registry):
+            result = self.template.body
         assert result == "---\n" + str(sentinel.template_handler_argument)
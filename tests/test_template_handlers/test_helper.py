@@ -4,6 +4,7 @@ import yaml
 
 import sceptre.template_handlers.helper as helper
 from sceptre.exceptions import TemplateNotFoundError
+from sceptre.jinja import EnvironmentPool
 from unittest.mock import patch
 
 
@@ -74,21 +75,29 @@ def test_render_jinja_template(mock_pathlib, filename, sceptre_user_data, expect
 @pytest.mark.parametrize(
     "j2_environment,expected_keys",
     [
-        ({}, ["autoescape", "loader", "undefined"]),
+        ({}, ["autoescape", "loader", "undefined", "bytecode_cache"]),
         (
             {"lstrip_blocks": True},
-            ["autoescape", "loader", "undefined", "lstrip_blocks"],
+            ["autoescape", "loader", "undefined", "bytecode_cache", "lstrip_blocks"],
         ),
         (
             {"lstrip_blocks": True, "extensions": ["test-ext"]},
-            ["autoescape", "loader", "undefined", "lstrip_blocks", "extensions"],
+            [
+                "autoescape",
+                "loader",
+                "undefined",
+                "bytecode_cache",
+                "lstrip_blocks",
+                "extensions",
+            ],
         ),
     ],
 )
-@patch("sceptre.template_handlers.helper.Environment")
+@patch("sceptre.jinja.environments", new_callable=EnvironmentPool)
+@patch("sceptre.jinja.Environment")
 @patch("pathlib.Path.exists")
 def test_render_jinja_template_j2_environment_config(
-    mock_pathlib, mock_environment, j2_environment, expected_keys
+    mock_pathlib, mock_environment, mock_environments, j2_environment, expected_keys
 ):
     mock_pathlib.return_value = True
     filename = "vpc.j2"
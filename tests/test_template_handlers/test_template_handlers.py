@@ -1,5 +1,6 @@
 import logging
 from unittest import TestCase
+from unittest.mock import patch
 
 import pytest
 
@@ -34,6 +35,14 @@ class TestTemplateHandlers(TestCase):
             )
             handler.validate()
 
+    def test_validate__schema_is_only_checked_once(self):
+        MockTemplateHandler(name="mock", arguments={"argument": "test"}).validate()
+
+        with patch("jsonschema.Draft7Validator.check_schema") as mock_check_schema:
+            MockTemplateHandler(name="other", arguments={"argument": "a"}).validate()
+
+        mock_check_schema.assert_not_called()
+
     def test_logger__logs_have_stack_name_prefix(self):
         template_handler = MockTemplateHandler(
             name="mock", arguments={"argument": "test"}
@@ -0,0 +1,174 @@
+import json
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from sceptre.config.graph import StackGraph
+from sceptre.stack import Stack
+from sceptre.tracing import Tracer, get_tracer, otlp_path, span, use_tracer
+
+
+class TestTracer:
+    def setup_method(self, method):
+        self.tracer = Tracer("launch")
+        self.stack1 = self._make_stack("stack1")
+        self.stack2 = self._make_stack("stack2", self.stack1)
+        self.stack3 = self._make_stack("stack3")
+        self.stack4 = self._make_stack("stack4", self.stack2, self.stack3)
+        self.graph = StackGraph({self.stack1, self.stack2, self.stack3, self.stack4})
+
+        start = self.tracer._start
+        self.tracer.add("queued", "queue", start, start + 1, "stack1")
+        self.tracer.add("launch", Tracer.STACK, start + 1, start + 11, "stack1")
+        self.tracer.add("launch", Tracer.STACK, start, start + 2, "stack3")
+        self.tracer.add("launch", Tracer.STACK, start + 11, start + 14, "stack2")
+        self.tracer.add("launch", Tracer.STACK, start + 14, start + 15, "stack4")
+        self.tracer.add(
+            "wait for CloudFormation", "cloudformation", start + 2, start + 10, "stack1"
+        )
+        self.tracer.add("render", "template", start + 1, start + 2, "stack1")
+
+    @staticmethod
+    def _make_stack(name, *dependencies):
+        stack = Mock(spec=Stack)
+        stack.name = name
+        stack.dependencies = list(dependencies)
+        return stack
+
+    def test_stack_durations(self):
+        assert self.tracer.stack_durations() == pytest.approx(
+            {"stack1": 10, "stack2": 3, "stack3": 2, "stack4": 1}
+        )
+
+    def test_critical_path_follows_dependencies_that_finished_last(self):
+        assert self.tracer.critical_path(self.graph) == ["stack1", "stack2", "stack4"]
+
+    def test_critical_path_without_graph_is_stack_that_finished_last(self):
+        assert self.tracer.critical_path(None) == ["stack4"]
+
+    def test_critical_path_of_empty_trace(self):
+        assert Tracer("launch").critical_path(self.graph) == []
+
+    def test_summary(self):
+        assert self.tracer.summary(self.graph, top=2) == [
+            "launch critical path (14.0s): "
+            "stack1 (10.0s) -> stack2 (3.0s) -> stack4 (1.0s)",
+            "launch slowest stacks:",
+            "stack1 - 10.0s",
+            "stack2 - 3.0s",
+        ]
+
+    def test_write_chrome_trace(self, tmp_path):
+        path = str(tmp_path / "trace.json")
+
+        self.tracer.write_chrome_trace(path)
+
+        with open(path) as f:
+            trace = json.load(f)
+        events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+        rows = {
+            event["args"]["name"]: event["tid"]
+            for event in trace["traceEvents"]
+            if event["ph"] == "M"
+        }
+        wait = next(event for event in events if event["cat"] == "cloudformation")
+        assert len(events) == 7
+        assert wait["ts"] == pytest.approx(2e6)
+        assert wait["dur"] == pytest.approx(8e6)
+        assert wait["tid"] == rows["stack1"]
+
+    def test_write_otlp_nests_spans_under_enclosing_spans(self, tmp_path):
+        path = str(tmp_path / "trace.otlp.json")
+
+        self.tracer.write_otlp(path)
+
+        with open(path) as f:
+            trace = json.load(f)
+        spans = trace["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        by_name = {}
+        for otlp_span in spans:
+            attributes = {
+                attribute["key"]: attribute["value"]["stringValue"]
+                for attribute in otlp_span["attributes"]
+            }
+            key = (otlp_span["name"], attributes.get("sceptre.stack"))
+            by_name[key] = otlp_span
+        root = by_name[("launch", None)]
+        launch = by_name[("launch", "stack1")]
+        assert len(spans) == 8
+        assert len({otlp_span["traceId"] for otlp_span in spans}) == 1
+        assert root["parentSpanId"] == ""
+        assert launch["parentSpanId"] == root["spanId"]
+        assert by_name[("render", "stack1")]["parentSpanId"] == launch["spanId"]
+        assert (
+            by_name[("wait for CloudFormation", "stack1")]["parentSpanId"]
+            == launch["spanId"]
+        )
+        assert by_name[("queued", "stack1")]["parentSpanId"] == root["spanId"]
+        assert int(launch["endTimeUnixNano"]) - int(
+            launch["startTimeUnixNano"]
+        ) == pytest.approx(10e9, rel=1e-6)
+
+    def test_write_writes_chrome_trace_and_otlp(self, tmp_path):
+        path = str(tmp_path / "traces" / "launch.json")
+
+        self.tracer.write(path)
+
+        assert (tmp_path / "traces" / "launch.json").exists()
+        assert (tmp_path / "traces" / "launch.otlp.json").exists()
+
+
+class TestSpan:
+    def test_span_is_not_recorded_without_tracer(self):
+        with span("render", "template", "stack1"):
+            pass
+
+        assert get_tracer() is None
+
+    def test_span_is_recorded_to_tracer(self):
+        with use_tracer(Tracer("launch")) as tracer:
+            with span("render", "template", "stack1"):
+                pass
+
+        assert get_tracer() is None
+        assert [(s.name, s.category, s.stack) for s in tracer.spans] == [
+            ("render", "template", "stack1")
+        ]
+        assert tracer.spans[0].end >= tracer.spans[0].start
+
+    def test_span_is_recorded_when_code_raises(self):
+        with use_tracer(Tracer("launch")) as tracer:
+            with pytest.raises(RuntimeError):
+                with span("render", "template", "stack1"):
+                    raise RuntimeError("boom")
+
+        assert len(tracer.spans) == 1
+
+    def test_spans_are_recorded_from_other_threads(self):
+        def render(name):
+            with span("render", "template", name):
+                pass
+
+        with use_tracer(Tracer("launch")) as tracer:
+            threads = [
+                threading.Thread(target=render, args=(f"stack{index}",))
+                for index in range(10)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(tracer.spans) == 10
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("trace.json", "trace.otlp.json"),
+        ("out/trace", "out/trace.otlp.json"),
+    ],
+)
+def test_otlp_path(path, expected):
+    assert otlp_path(path) == expected